@@ -0,0 +1,3 @@
+__all__ = [
+    'indicator_benchmarks'
+]
@@ -0,0 +1,484 @@
+"""
+Micro-benchmarks of every function in `indicators/` and `smoothings/`.
+
+Every function is timed on synthetic OHLCV data of several sizes. The results (calls per second and
+peak memory) are compared with a stored baseline, so a change making an indicator much slower or
+much more memory hungry is reported. If `pandas_ta` is installed, the indicators with an equivalent in
+`pandas_ta` are also compared with it in speed and output.
+
+Run from the repository root:
+
+    python -m benchmarks.indicator_benchmarks                     # compare with benchmarks/baseline.json
+    python -m benchmarks.indicator_benchmarks --update-baseline   # store new baseline
+    python -m benchmarks.indicator_benchmarks --sizes 1000 10000 --functions rsi cci --pandas-ta
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pandas_ta
+except ImportError:  # pragma: no cover - depends on the environment
+    pandas_ta = None
+
+from trading_strategy_tester import indicators
+from trading_strategy_tester.download.synthetic_data import generate_ohlcv_arrays
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.smoothings.ema_smoothing import ema_smoothing
+from trading_strategy_tester.smoothings.rma_smoothing import rma_smoothing
+from trading_strategy_tester.smoothings.sma_smoothing import sma_smoothing
+from trading_strategy_tester.smoothings.smooth import smooth
+from trading_strategy_tester.smoothings.wma_smoothing import wma_smoothing
+
+BENCHMARK_SIZES = [1_000, 10_000, 100_000, 1_000_000]  # Number of bars of the synthetic data
+DEFAULT_BASELINE = Path(__file__).parent / 'baseline.json'
+MAX_SLOWDOWN = 2.0  # A function is reported when it runs more than 2 times slower than in the baseline
+MAX_MEMORY_GROWTH = 1.5  # A function is reported when its peak memory grows more than 1.5 times
+PANDAS_TA_TOLERANCE = 1e-6  # Largest difference from pandas_ta, relative to the largest absolute value
+SWEEP_LENGTHS = list(range(5, 55, 5))  # Lengths of the batch functions
+
+# Every benchmarked function, called with the columns of the synthetic data and default parameters
+INDICATOR_BENCHMARKS: dict[str, Callable[[pd.DataFrame], object]] = {
+    # Candlestick patterns
+    'hammer': lambda df: indicators.hammer(df['High'], df['Low'], df['Open'], df['Close']),
+    'candlestick_pattern': lambda df: indicators.candlestick_pattern(df['High'], df['Low'], df['Open'], df['Close'],
+                                                                     CandlestickPattern.MORNING_STAR),
+    'scan_candlestick_patterns': lambda df: indicators.scan_candlestick_patterns(df['High'], df['Low'],
+                                                                                 df['Open'], df['Close']),
+    # Momentum
+    'bbp': lambda df: indicators.bbp(df['High'], df['Low'], df['Close']),
+    'cci': lambda df: indicators.cci(df['Close']),
+    'cmo': lambda df: indicators.cmo(df['Close']),
+    'cop': lambda df: indicators.cop(df['Close']),
+    'di_plus': lambda df: indicators.di_plus(df['High'], df['Low'], df['Close']),
+    'di_minus': lambda df: indicators.di_minus(df['High'], df['Low'], df['Close']),
+    'kst': lambda df: indicators.kst(df['Close']),
+    'kst_signal': lambda df: indicators.kst_signal(df['Close']),
+    'macd': lambda df: indicators.macd(df['Close']),
+    'macd_signal': lambda df: indicators.macd_signal(df['Close']),
+    'momentum': lambda df: indicators.momentum(df['Close']),
+    'roc': lambda df: indicators.roc(df['Close']),
+    'rsi': lambda df: indicators.rsi(df['Close']),
+    'rsi_batch': lambda df: indicators.rsi_batch(df['Close'], SWEEP_LENGTHS),
+    'percent_k': lambda df: indicators.percent_k(df['Close'], df['Low'], df['High']),
+    'percent_d': lambda df: indicators.percent_d(df['Close'], df['Low'], df['High']),
+    'trix': lambda df: indicators.trix(df['Close']),
+    'uo': lambda df: indicators.uo(df['Close'], df['Low'], df['High']),
+    'willr': lambda df: indicators.willr(df['Close'], df['High'], df['Low']),
+    # Overlap
+    'ema': lambda df: indicators.ema(df['Close']),
+    'base_line': lambda df: indicators.base_line(df['High'], df['Low']),
+    'conversion_line': lambda df: indicators.conversion_line(df['High'], df['Low']),
+    'leading_span_a': lambda df: indicators.leading_span_a(df['High'], df['Low']),
+    'leading_span_b': lambda df: indicators.leading_span_b(df['High'], df['Low']),
+    'lagging_span': lambda df: indicators.lagging_span(df['Close']),
+    'sma': lambda df: indicators.sma(df['Close']),
+    'sma_batch': lambda df: indicators.sma_batch(df['Close'], SWEEP_LENGTHS),
+    # Trend
+    'adx': lambda df: indicators.adx(df['High'], df['Low'], df['Close']),
+    'aroon_up': lambda df: indicators.aroon_up(df['High']),
+    'aroon_down': lambda df: indicators.aroon_down(df['Low']),
+    'dpo': lambda df: indicators.dpo(df['Close']),
+    'mass_index': lambda df: indicators.mass_index(df['High'], df['Low']),
+    # Volatility
+    'atr': lambda df: indicators.atr(df['High'], df['Low'], df['Close']),
+    'bb_lower': lambda df: indicators.bb_lower(df['Close']),
+    'bb_upper': lambda df: indicators.bb_upper(df['Close']),
+    'bb_middle': lambda df: indicators.bb_middle(df['Close']),
+    'bb_lower_batch': lambda df: indicators.bb_lower_batch(df['Close'], SWEEP_LENGTHS),
+    'bb_upper_batch': lambda df: indicators.bb_upper_batch(df['Close'], SWEEP_LENGTHS),
+    'bb_middle_batch': lambda df: indicators.bb_middle_batch(df['Close'], SWEEP_LENGTHS),
+    'chop': lambda df: indicators.chop(df['High'], df['Low'], df['Close']),
+    'dc_lower': lambda df: indicators.dc_lower(df['Low']),
+    'dc_upper': lambda df: indicators.dc_upper(df['High']),
+    'dc_basis': lambda df: indicators.dc_basis(df['High'], df['Low']),
+    'kc': lambda df: indicators.kc(df['High'], df['Low'], df['Close'], df['Close']),
+    # Volume
+    'chaikin_osc': lambda df: indicators.chaikin_osc(df['High'], df['Low'], df['Close'], df['Volume']),
+    'cmf': lambda df: indicators.cmf(df['High'], df['Low'], df['Close'], df['Volume']),
+    'efi': lambda df: indicators.efi(df['Close'], df['Volume']),
+    'eom': lambda df: indicators.eom(df['High'], df['Low'], df['Volume']),
+    'mfi': lambda df: indicators.mfi((df['High'] + df['Low'] + df['Close']) / 3, df['Volume']),
+    'obv': lambda df: indicators.obv(df['Close'], df['Volume']),
+    'pvi': lambda df: indicators.pvi(df['Close'], df['Volume']),
+    'pvt': lambda df: indicators.pvt(df['Close'], df['Volume']),
+    # Smoothings
+    'ema_smoothing': lambda df: ema_smoothing(df['Close'], 14),
+    'rma_smoothing': lambda df: rma_smoothing(df['Close'], 14),
+    'sma_smoothing': lambda df: sma_smoothing(df['Close'], 14),
+    'wma_smoothing': lambda df: wma_smoothing(df['Close'], 14),
+    'smooth': lambda df: smooth(df['Close'], 14, SmoothingType.RMA),
+}
+
+# Indicators with the same definition in pandas_ta, called with the same parameters as in INDICATOR_BENCHMARKS
+PANDAS_TA_EQUIVALENTS: dict[str, Callable[[object, pd.DataFrame], object]] = {
+    'sma': lambda ta, df: ta.sma(df['Close'], length=9),
+    'ema': lambda ta, df: ta.ema(df['Close'], length=9, presma=False),
+    'rsi': lambda ta, df: ta.rsi(df['Close'], length=14),
+    'atr': lambda ta, df: ta.atr(df['High'], df['Low'], df['Close'], length=14),
+    'macd': lambda ta, df: ta.macd(df['Close'], fast=12, slow=26).iloc[:, 0],
+    'roc': lambda ta, df: ta.roc(df['Close'], length=9),
+    'momentum': lambda ta, df: ta.mom(df['Close'], length=10),
+    'willr': lambda ta, df: ta.willr(df['High'], df['Low'], df['Close'], length=14),
+}
+
+
+class BenchmarkResult:
+    """
+    The speed and peak memory of one function on data of one size.
+    """
+
+    def __init__(self, name: str, n_bars: int, ops_per_sec: float, peak_memory: int):
+        """
+        :param name: The name of the benchmarked function.
+        :type name: str
+        :param n_bars: The number of bars of the data.
+        :type n_bars: int
+        :param ops_per_sec: The number of calls per second, measured on the fastest call.
+        :type ops_per_sec: float
+        :param peak_memory: The peak memory allocated by one call in bytes.
+        :type peak_memory: int
+        """
+        self.name = name
+        self.n_bars = n_bars
+        self.ops_per_sec = ops_per_sec
+        self.peak_memory = peak_memory
+
+    def to_dict(self) -> dict:
+        """
+        Returns the measurements as a dictionary stored in the baseline JSON.
+
+        :return: The calls per second and the peak memory.
+        :rtype: dict
+        """
+        return {'ops_per_sec': round(self.ops_per_sec, 2), 'peak_memory': self.peak_memory}
+
+
+def benchmark_data(n_bars: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Generates the synthetic OHLCV data the functions are benchmarked on.
+
+    The data is detrended, so prices of a million bars neither overflow nor vanish, and it has a plain
+    integer index, since a million daily dates do not fit into the range of pandas timestamps.
+
+    :param n_bars: The number of bars.
+    :type n_bars: int
+    :param seed: The seed of the random generator. Default is 0.
+    :type seed: int, optional
+    :return: The OHLCV data.
+    :rtype: pd.DataFrame
+    """
+    return pd.DataFrame(generate_ohlcv_arrays(n_bars, seed=seed, detrend=True))
+
+
+def time_function(function: Callable, df: pd.DataFrame, min_time: float = 0.2, min_repeats: int = 3) -> float:
+    """
+    Measures the fastest call of a function on the data.
+
+    After one warm-up call, the function is called until both `min_time` seconds and `min_repeats` calls
+    have passed. The fastest call is the least disturbed by other processes.
+
+    :param function: The benchmarked function taking the data.
+    :type function: Callable
+    :param df: The data.
+    :type df: pd.DataFrame
+    :param min_time: The minimal total time of the measured calls in seconds. Default is 0.2.
+    :type min_time: float, optional
+    :param min_repeats: The minimal number of measured calls. Default is 3.
+    :type min_repeats: int, optional
+    :return: The duration of the fastest call in seconds.
+    :rtype: float
+    """
+    function(df)
+
+    durations = []
+    while sum(durations) < min_time or len(durations) < min_repeats:
+        start = time.perf_counter()
+        function(df)
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def peak_memory(function: Callable, df: pd.DataFrame) -> int:
+    """
+    Measures the peak memory allocated by one call of a function, including NumPy and pandas buffers.
+
+    :param function: The benchmarked function taking the data.
+    :type function: Callable
+    :param df: The data.
+    :type df: pd.DataFrame
+    :return: The peak memory in bytes.
+    :rtype: int
+    """
+    tracemalloc.start()
+    try:
+        function(df)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(names: list[str] = None, sizes: list[int] = None, min_time: float = 0.2,
+                   min_repeats: int = 3, seed: int = 0) -> list[BenchmarkResult]:
+    """
+    Benchmarks the functions on data of every size.
+
+    :param names: The names of the functions from `INDICATOR_BENCHMARKS`. All functions if None.
+    :type names: list[str], optional
+    :param sizes: The numbers of bars of the data. `BENCHMARK_SIZES` if None.
+    :type sizes: list[int], optional
+    :param min_time: The minimal total time of the measured calls of one function in seconds. Default is 0.2.
+    :type min_time: float, optional
+    :param min_repeats: The minimal number of measured calls of one function. Default is 3.
+    :type min_repeats: int, optional
+    :param seed: The seed of the synthetic data. Default is 0.
+    :type seed: int, optional
+    :return: The results of every function and size.
+    :rtype: list[BenchmarkResult]
+    """
+    names = list(INDICATOR_BENCHMARKS) if names is None else names
+    sizes = BENCHMARK_SIZES if sizes is None else sizes
+
+    unknown = [name for name in names if name not in INDICATOR_BENCHMARKS]
+    if unknown:
+        raise ValueError(f'Unknown benchmarks: {", ".join(unknown)}')
+
+    results = []
+    for n_bars in sizes:
+        df = benchmark_data(n_bars, seed=seed)
+
+        for name in names:
+            function = INDICATOR_BENCHMARKS[name]
+            duration = time_function(function, df, min_time=min_time, min_repeats=min_repeats)
+            results.append(BenchmarkResult(name, n_bars, 1 / duration, peak_memory(function, df)))
+
+    return results
+
+
+def results_to_json(results: list[BenchmarkResult]) -> dict:
+    """
+    Converts benchmark results to the structure of the baseline JSON.
+
+    The measurements are stored per function and number of bars, together with the versions the
+    baseline was measured with, since timings are only comparable on the same machine and versions.
+
+    :param results: The benchmark results.
+    :type results: list[BenchmarkResult]
+    :return: The baseline structure.
+    :rtype: dict
+    """
+    benchmarks = {}
+    for result in results:
+        benchmarks.setdefault(result.name, {})[str(result.n_bars)] = result.to_dict()
+
+    return {
+        'metadata': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'machine': platform.machine(),
+        },
+        'benchmarks': benchmarks,
+    }
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> dict:
+    """
+    Loads a stored baseline.
+
+    :param path: The path of the baseline JSON. Default is `DEFAULT_BASELINE`.
+    :type path: Path, optional
+    :return: The baseline structure.
+    :rtype: dict
+    """
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+def save_baseline(results: list[BenchmarkResult], path: Path = DEFAULT_BASELINE):
+    """
+    Stores benchmark results as the baseline. Functions and sizes of an existing baseline that were
+    not benchmarked again are kept.
+
+    :param results: The benchmark results.
+    :type results: list[BenchmarkResult]
+    :param path: The path of the baseline JSON. Default is `DEFAULT_BASELINE`.
+    :type path: Path, optional
+    """
+    baseline = results_to_json(results)
+
+    if Path(path).exists():
+        benchmarks = load_baseline(path)['benchmarks']
+        for name, sizes in baseline['benchmarks'].items():
+            benchmarks.setdefault(name, {}).update(sizes)
+        baseline['benchmarks'] = benchmarks
+
+    with open(path, 'w') as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+        file.write('\n')
+
+
+def compare_with_baseline(results: list[BenchmarkResult], baseline: dict, max_slowdown: float = MAX_SLOWDOWN,
+                          max_memory_growth: float = MAX_MEMORY_GROWTH) -> list[str]:
+    """
+    Compares benchmark results with a baseline.
+
+    Results without a baseline measurement are not compared.
+
+    :param results: The benchmark results.
+    :type results: list[BenchmarkResult]
+    :param baseline: The baseline structure.
+    :type baseline: dict
+    :param max_slowdown: The allowed ratio of the baseline speed to the current speed. Default is `MAX_SLOWDOWN`.
+    :type max_slowdown: float, optional
+    :param max_memory_growth: The allowed ratio of the current peak memory to the baseline peak memory.
+        Default is `MAX_MEMORY_GROWTH`.
+    :type max_memory_growth: float, optional
+    :return: A description of every regression, empty if there is none.
+    :rtype: list[str]
+    """
+    regressions = []
+
+    for result in results:
+        expected = baseline['benchmarks'].get(result.name, {}).get(str(result.n_bars))
+        if expected is None:
+            continue
+
+        slowdown = expected['ops_per_sec'] / result.ops_per_sec
+        if slowdown > max_slowdown:
+            regressions.append(f'{result.name} ({result.n_bars} bars): {slowdown:.1f}x slower '
+                               f'({result.ops_per_sec:.1f} ops/sec, baseline {expected["ops_per_sec"]:.1f})')
+
+        memory_growth = result.peak_memory / max(expected['peak_memory'], 1)
+        if memory_growth > max_memory_growth:
+            regressions.append(f'{result.name} ({result.n_bars} bars): {memory_growth:.1f}x more peak memory '
+                               f'({result.peak_memory} B, baseline {expected["peak_memory"]} B)')
+
+    return regressions
+
+
+def compare_with_pandas_ta(names: list[str] = None, sizes: list[int] = None, min_time: float = 0.2,
+                           min_repeats: int = 3, seed: int = 0, ta=None) -> list[dict]:
+    """
+    Compares the indicators with their `pandas_ta` equivalents in speed and output.
+
+    The outputs are compared on the second half of the data only, because some `pandas_ta` indicators
+    start their smoothings differently, and the difference fades out over the first bars.
+
+    :param names: The names of the indicators from `PANDAS_TA_EQUIVALENTS`. All of them if None.
+    :type names: list[str], optional
+    :param sizes: The numbers of bars of the data. `BENCHMARK_SIZES` if None.
+    :type sizes: list[int], optional
+    :param min_time: The minimal total time of the measured calls of one function in seconds. Default is 0.2.
+    :type min_time: float, optional
+    :param min_repeats: The minimal number of measured calls of one function. Default is 3.
+    :type min_repeats: int, optional
+    :param seed: The seed of the synthetic data. Default is 0.
+    :type seed: int, optional
+    :param ta: The `pandas_ta` module. The installed module if None.
+    :type ta: module, optional
+    :return: For every indicator and size, the speedup over `pandas_ta`, the largest relative
+        difference of the outputs and whether it is within `PANDAS_TA_TOLERANCE`.
+    :rtype: list[dict]
+    """
+    ta = pandas_ta if ta is None else ta
+    if ta is None:
+        raise ImportError('pandas_ta is not installed')
+
+    names = [name for name in PANDAS_TA_EQUIVALENTS if names is None or name in names]
+    sizes = BENCHMARK_SIZES if sizes is None else sizes
+
+    comparisons = []
+    for n_bars in sizes:
+        df = benchmark_data(n_bars, seed=seed)
+
+        for name in names:
+            function = INDICATOR_BENCHMARKS[name]
+            equivalent = PANDAS_TA_EQUIVALENTS[name]
+
+            duration = time_function(function, df, min_time=min_time, min_repeats=min_repeats)
+            ta_duration = time_function(lambda data: equivalent(ta, data), df,
+                                        min_time=min_time, min_repeats=min_repeats)
+
+            result = np.asarray(function(df), dtype=float)[n_bars // 2:]
+            expected = np.asarray(equivalent(ta, df), dtype=float)[n_bars // 2:]
+            difference = np.nanmax(np.abs(result - expected)) / np.nanmax(np.abs(expected))
+
+            comparisons.append({
+                'name': name,
+                'n_bars': n_bars,
+                'speedup': ta_duration / duration,
+                'difference': float(difference),
+                'matches': bool(difference <= PANDAS_TA_TOLERANCE),
+            })
+
+    return comparisons
+
+
+def main(argv: list[str] = None) -> int:
+    """
+    Runs the benchmarks from the command line.
+
+    :param argv: The command line arguments. `sys.argv` if None.
+    :type argv: list[str], optional
+    :return: The exit code, 1 if a regression or a difference from `pandas_ta` was found, otherwise 0.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the indicators and smoothings.')
+    parser.add_argument('--functions', nargs='+', help='Names of the benchmarked functions, all by default.')
+    parser.add_argument('--sizes', nargs='+', type=int, default=BENCHMARK_SIZES, help='Numbers of bars.')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Path of the baseline JSON.')
+    parser.add_argument('--update-baseline', action='store_true', help='Store the results as the baseline.')
+    parser.add_argument('--max-slowdown', type=float, default=MAX_SLOWDOWN)
+    parser.add_argument('--max-memory-growth', type=float, default=MAX_MEMORY_GROWTH)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimal measured time per function.')
+    parser.add_argument('--pandas-ta', action='store_true', help='Also compare with pandas_ta.')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.functions, args.sizes, min_time=args.min_time)
+
+    print(f'{"function":<28}{"bars":>10}{"ops/sec":>14}{"peak memory":>16}')
+    for result in results:
+        print(f'{result.name:<28}{result.n_bars:>10}{result.ops_per_sec:>14.1f}{result.peak_memory:>14} B')
+
+    exit_code = 0
+
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        print(f'Baseline stored in {args.baseline}')
+    elif args.baseline.exists():
+        regressions = compare_with_baseline(results, load_baseline(args.baseline),
+                                            args.max_slowdown, args.max_memory_growth)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        exit_code = 1 if regressions else 0
+    else:
+        print(f'No baseline found in {args.baseline}')
+
+    if args.pandas_ta:
+        if pandas_ta is None:
+            print('pandas_ta is not installed, the comparison is skipped')
+        else:
+            for comparison in compare_with_pandas_ta(args.functions, args.sizes, min_time=args.min_time):
+                status = 'OK' if comparison['matches'] else 'DIFFERENT'
+                print(f'{status:<10}{comparison["name"]:<18}{comparison["n_bars"]:>10} bars  '
+                      f'{comparison["speedup"]:.2f}x faster than pandas_ta, '
+                      f'relative difference {comparison["difference"]:.2e}')
+                if not comparison['matches']:
+                    exit_code = 1
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
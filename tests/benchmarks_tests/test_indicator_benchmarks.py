@@ -0,0 +1,93 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.indicator_benchmarks import (
+    BenchmarkResult,
+    INDICATOR_BENCHMARKS,
+    PANDAS_TA_EQUIVALENTS,
+    compare_with_baseline,
+    compare_with_pandas_ta,
+    load_baseline,
+    pandas_ta,
+    results_to_json,
+    run_benchmarks,
+    save_baseline
+)
+from trading_strategy_tester import indicators, smoothings
+
+
+class TestIndicatorBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = results_to_json([
+            BenchmarkResult('rsi', 1000, ops_per_sec=1000.0, peak_memory=100_000),
+            BenchmarkResult('sma', 1000, ops_per_sec=2000.0, peak_memory=50_000),
+        ])
+
+    def test_every_indicator_and_smoothing_is_benchmarked(self):
+        # Arrange
+        expected = set(indicators.__all__) | set(smoothings.__all__) | {'smooth'}
+
+        # Assert
+        self.assertEqual(set(INDICATOR_BENCHMARKS), expected)
+        self.assertTrue(set(PANDAS_TA_EQUIVALENTS) <= set(INDICATOR_BENCHMARKS))
+
+    def test_run_benchmarks_measures_every_function(self):
+        # Act
+        results = run_benchmarks(sizes=[300], min_time=0, min_repeats=1)
+
+        # Assert
+        self.assertEqual([result.name for result in results], list(INDICATOR_BENCHMARKS))
+        for result in results:
+            self.assertEqual(result.n_bars, 300)
+            self.assertGreater(result.ops_per_sec, 0)
+            self.assertGreater(result.peak_memory, 0)
+
+    def test_run_benchmarks_rejects_unknown_names(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(['rsi', 'unknown'], sizes=[300])
+
+    def test_compare_with_baseline_reports_regressions(self):
+        # Arrange
+        results = [
+            BenchmarkResult('rsi', 1000, ops_per_sec=400.0, peak_memory=100_000),
+            BenchmarkResult('sma', 1000, ops_per_sec=1900.0, peak_memory=80_000),
+            BenchmarkResult('sma', 10_000, ops_per_sec=1.0, peak_memory=10_000_000),
+        ]
+
+        # Act
+        regressions = compare_with_baseline(results, self.baseline)
+
+        # Assert
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith('rsi (1000 bars): 2.5x slower'))
+        self.assertTrue(regressions[1].startswith('sma (1000 bars): 1.6x more peak memory'))
+
+    def test_save_baseline_keeps_other_measurements(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Arrange
+            path = Path(tmp_dir) / 'baseline.json'
+            save_baseline([BenchmarkResult('rsi', 1000, 1000.0, 100_000),
+                           BenchmarkResult('sma', 1000, 2000.0, 50_000)], path)
+
+            # Act
+            save_baseline([BenchmarkResult('rsi', 1000, 1500.0, 90_000)], path)
+            baseline = load_baseline(path)
+
+        # Assert
+        self.assertEqual(baseline['benchmarks']['rsi']['1000'], {'ops_per_sec': 1500.0, 'peak_memory': 90_000})
+        self.assertEqual(baseline['benchmarks']['sma']['1000'], {'ops_per_sec': 2000.0, 'peak_memory': 50_000})
+
+    @unittest.skipUnless(pandas_ta is not None, 'pandas_ta is not installed')
+    def test_indicators_match_pandas_ta(self):
+        # Act
+        comparisons = compare_with_pandas_ta(sizes=[2000], min_time=0, min_repeats=1)
+
+        # Assert
+        for comparison in comparisons:
+            self.assertTrue(comparison['matches'], comparison)
+
+
+if __name__ == '__main__':
+    unittest.main()
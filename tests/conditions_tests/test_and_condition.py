@@ -1,12 +1,17 @@
 import random
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 
+from trading_strategy_tester.conditions.fibonacci_retracement_levels_conditions import uptrend_fib_retracement_level
+from trading_strategy_tester.conditions.fibonacci_retracement_levels_conditions.uptrend_fib_retracement_level import UptrendFibRetracementLevelCondition
 from trading_strategy_tester.conditions.logical_conditions.and_condition import AND
 from trading_strategy_tester.conditions.test_condition import TestCondition
 from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.enums.fibonacci_levels_enum import FibonacciLevels
+from trading_strategy_tester.enums.source_enum import SourceType
 from trading_strategy_tester.trading_series.testing_series import TestingSeries
 
 
@@ -112,6 +117,70 @@ class TestAndCondition(unittest.TestCase):
         pd.testing.assert_series_equal(and_condition, expected_and)
         pd.testing.assert_series_equal(signal_series, expected_signal_series)
 
+    def test_and_condition_skips_conditions_after_no_row_is_left(self):
+        # Arrange
+        ticker = 'AAPL'
+        never = TestCondition(TestingSeries(ticker, pd.Series([False] * 5), 1))
+        later = TestCondition(TestingSeries(ticker, pd.Series([True] * 5), 2))
+        and_condition = AND(never, later)
+
+        # Act
+        with mock.patch.object(later, 'evaluate_candidates', wraps=later.evaluate_candidates) as evaluate_candidates:
+            result, signal_series = and_condition.evaluate(self.downloader, self.df)
+
+        # Assert
+        evaluate_candidates.assert_not_called()
+        pd.testing.assert_series_equal(result, pd.Series([False] * 5))
+        pd.testing.assert_series_equal(signal_series, pd.Series([None] * 5))
+
+    def test_and_condition_evaluates_cheap_conditions_first(self):
+        # Arrange
+        rng = np.random.default_rng(4)
+        close = 100 + np.cumsum(rng.standard_normal(200))
+        df = pd.DataFrame({SourceType.HIGH.value: close + 1, SourceType.LOW.value: close - 1})
+        fib = UptrendFibRetracementLevelCondition(FibonacciLevels.LEVEL_50, 14)
+        never = TestCondition(TestingSeries('AAPL', pd.Series([False] * 200), 1))
+
+        # Act
+        with mock.patch.object(uptrend_fib_retracement_level, 'fib_retracement_mask') as fib_retracement_mask, \
+                mock.patch.object(uptrend_fib_retracement_level, 'fib_retracement_mask_at') as fib_retracement_mask_at:
+            result, _ = AND(fib, never).evaluate(self.downloader, df)
+
+        # Assert
+        self.assertGreater(fib.evaluation_cost(), never.evaluation_cost())
+        fib_retracement_mask.assert_not_called()
+        fib_retracement_mask_at.assert_not_called()
+        self.assertFalse(result.any())
+
+    def test_and_condition_evaluates_sparse_candidates_at_their_rows(self):
+        # Arrange
+        rng = np.random.default_rng(4)
+        close = np.round(100 + np.cumsum(rng.standard_normal(200)))
+        df = pd.DataFrame({SourceType.HIGH.value: close + 1, SourceType.LOW.value: close - 1})
+        fib = UptrendFibRetracementLevelCondition(FibonacciLevels.LEVEL_50, 14)
+        expected_fib, _ = fib.evaluate(self.downloader, df)
+
+        sparse = np.zeros(200, dtype=bool)
+        sparse[np.flatnonzero(expected_fib.to_numpy())[:3]] = True  # Rows where the fib condition is met
+        sparse[[5, 100, 150]] = True
+        rare = TestCondition(TestingSeries('AAPL', pd.Series(sparse), 1))
+        expected = expected_fib & sparse
+        expected_signal = f'And(UptrendFibRetracementLevelSignal(50, 14), {rare.to_string()})'
+
+        # Act
+        with mock.patch.object(uptrend_fib_retracement_level, 'fib_retracement_mask',
+                               wraps=uptrend_fib_retracement_level.fib_retracement_mask) as fib_retracement_mask, \
+                mock.patch.object(uptrend_fib_retracement_level, 'fib_retracement_mask_at',
+                                  wraps=uptrend_fib_retracement_level.fib_retracement_mask_at) as fib_retracement_mask_at:
+            result, signal_series = AND(fib, rare).evaluate(self.downloader, df)
+
+        # Assert
+        fib_retracement_mask.assert_not_called()
+        np.testing.assert_array_equal(fib_retracement_mask_at.call_args.kwargs['rows'], np.flatnonzero(sparse))
+        self.assertTrue(result.any())
+        pd.testing.assert_series_equal(result, expected)
+        pd.testing.assert_series_equal(signal_series, expected.map({True: expected_signal, False: None}))
+
 
     def test_to_string(self):
         # Arrange
@@ -238,5 +238,37 @@ class TestChangeOfXPercentPerYDays(unittest.TestCase):
         # Assert
         self.assertEqual(condition.to_string(), expected_string)
 
+    def test_zero_and_missing_previous_values_never_match(self):
+        # Arrange
+        ticker = 'AAPL'
+        test_parameter = random.randint(1, 100)
+        series = TestingSeries(ticker, pd.Series([0, 100, np.nan, 120, 0, 50]), test_parameter)
+
+        expected_result = pd.Series([False, False, False, False, False, False])
+
+        # Act
+        result_positive, _ = ChangeOfXPercentPerYDaysCondition(series, 10, 1).evaluate(self.downloader, self.df)
+        result_negative, _ = ChangeOfXPercentPerYDaysCondition(series, -10, 1).evaluate(self.downloader, self.df)
+
+        # Assert
+        pd.testing.assert_series_equal(result_positive, expected_result)
+        pd.testing.assert_series_equal(result_negative, pd.Series([False, False, False, False, True, False]))
+
+    def test_evaluate_batch_equals_evaluate(self):
+        # Arrange
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame(index=np.arange(500))
+        series = TestingSeries('AAPL', pd.Series(100 + np.cumsum(rng.standard_normal(500))), 1)
+        parameters = [(1, 1), (-1, 1), (2.5, 5), (-2.5, 5), (5, 20), (0, 3)]
+
+        # Act
+        results = ChangeOfXPercentPerYDaysCondition.evaluate_batch(self.downloader, df, series, parameters)
+
+        # Assert
+        self.assertEqual(list(results.columns), parameters)
+        for percent, number_of_days in parameters:
+            expected, _ = ChangeOfXPercentPerYDaysCondition(series, percent, number_of_days).evaluate(self.downloader, df)
+            np.testing.assert_array_equal(results[(percent, number_of_days)].to_numpy(), expected.to_numpy())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
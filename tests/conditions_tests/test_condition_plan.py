@@ -0,0 +1,147 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.condition_plan import ConditionPlan
+from trading_strategy_tester.conditions.logical_conditions.and_condition import AND
+from trading_strategy_tester.conditions.logical_conditions.if_then_else_condition import IfThenElse
+from trading_strategy_tester.conditions.logical_conditions.or_condition import OR
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
+
+
+class CountingCondition(Condition):
+    """
+    A condition returning fixed values and counting its evaluations.
+    """
+
+    evaluations = {}
+
+    def __init__(self, name: str, values: list[bool]):
+        self.name = name
+        self.values = values
+
+    def evaluate(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, pd.Series):
+        CountingCondition.evaluations[self.name] = CountingCondition.evaluations.get(self.name, 0) + 1
+        result = pd.Series(self.values, index=df.index)
+        return result, result.apply(lambda x: f'CountingSignal({self.name})' if x else None)
+
+    def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
+        return []
+
+    def to_string(self) -> str:
+        return f'CountingCondition({self.name})'
+
+    def to_dict(self) -> dict:
+        return {'type': 'CountingCondition', 'name': self.name}
+
+
+class TestConditionPlan(unittest.TestCase):
+
+    def setUp(self):
+        CountingCondition.evaluations = {}
+        self.downloader = DownloadModule()
+        self.df = pd.DataFrame(index=np.arange(4))
+
+        # Equal conditions are separate objects in both trees
+        self.buy = AND(CountingCondition('a', [True, True, False, True]),
+                       IfThenElse(CountingCondition('b', [False, True, True, False]),
+                                  CountingCondition('a', [True, True, False, True])))
+        self.sell = OR(CountingCondition('b', [False, True, True, False]),
+                       CountingCondition('c', [False, False, False, True]))
+
+    def test_compile_merges_equal_nodes(self):
+        # Act
+        plan = ConditionPlan({'BUY': self.buy, 'SELL': self.sell})
+
+        # Assert
+        self.assertEqual(len(plan.nodes), 6)
+        self.assertEqual(sorted(node.label for node in plan.shared_nodes()),
+                         ['CountingCondition(a)', 'CountingCondition(b)'])
+        self.assertEqual(list(plan.roots), ['BUY', 'SELL'])
+
+        # Every node comes after its children
+        order = list(plan.nodes)
+        for position, node in enumerate(plan.nodes.values()):
+            for child in node.children:
+                self.assertLess(order.index(child), position)
+
+    def test_evaluation_order_lists_shared_conditions_before_roots(self):
+        # Arrange
+        plan = ConditionPlan({'BUY': self.buy, 'SELL': self.sell})
+
+        # Act
+        order = [node.label for node in plan.evaluation_order()]
+        sell_order = [node.label for node in plan.evaluation_order(['SELL'])]
+
+        # Assert
+        self.assertEqual(order, ['CountingCondition(a)', 'CountingCondition(b)',
+                                 self.buy.to_string(), self.sell.to_string()])
+        self.assertEqual(sell_order, ['CountingCondition(b)', self.sell.to_string()])
+
+    def test_evaluate_evaluates_every_unique_node_once(self):
+        # Arrange
+        plan = ConditionPlan({'BUY': self.buy, 'SELL': self.sell})
+        expected_buy = self.buy.evaluate(self.downloader, self.df)
+        expected_sell = self.sell.evaluate(self.downloader, self.df)
+        CountingCondition.evaluations = {}
+
+        # Act
+        results = plan.evaluate(self.downloader, self.df)
+
+        # Assert
+        self.assertEqual(CountingCondition.evaluations, {'a': 1, 'b': 1, 'c': 1})
+        for (result, signal_series), (expected, expected_signal_series) in [(results['BUY'], expected_buy),
+                                                                            (results['SELL'], expected_sell)]:
+            pd.testing.assert_series_equal(result, expected)
+            pd.testing.assert_series_equal(signal_series, expected_signal_series)
+
+    def test_evaluate_reuses_the_plan_on_other_frames(self):
+        # Arrange
+        plan = ConditionPlan({'BUY': self.buy, 'SELL': self.sell})
+
+        # Act
+        first = plan.evaluate_masks(self.downloader, self.df)
+        second = plan.evaluate_masks(self.downloader, self.df.copy())
+
+        # Assert
+        self.assertEqual(CountingCondition.evaluations, {'a': 2, 'b': 2, 'c': 2})
+        np.testing.assert_array_equal(first['BUY'], [True, True, False, True])
+        np.testing.assert_array_equal(first['SELL'], [False, True, True, True])
+        np.testing.assert_array_equal(second['BUY'], first['BUY'])
+
+    def test_evaluate_leaves_skipped_conditions_to_their_parent(self):
+        # Arrange
+        plan = ConditionPlan({'BUY': AND(CountingCondition('never', [False] * 4),
+                                         CountingCondition('skipped', [True] * 4)),
+                              'SELL': CountingCondition('never', [False] * 4)})
+
+        # Act
+        masks = plan.evaluate_masks(self.downloader, self.df)
+
+        # Assert
+        self.assertEqual(CountingCondition.evaluations, {'never': 1})
+        self.assertFalse(masks['BUY'].any())
+        self.assertFalse(masks['SELL'].any())
+
+    def test_conditions_outside_plan_are_not_shared(self):
+        # Act
+        self.buy.evaluate(self.downloader, self.df)
+
+        # Assert
+        self.assertEqual(CountingCondition.evaluations, {'a': 2, 'b': 1})
+
+    def test_describe_lists_nodes_and_roots(self):
+        # Act
+        description = ConditionPlan({'BUY': self.buy, 'SELL': self.sell}).describe()
+
+        # Assert
+        self.assertTrue(description.startswith('ConditionPlan with 6 unique nodes, 2 shared'))
+        self.assertIn('#0 condition x2: CountingCondition(a)', description)
+        self.assertTrue(description.endswith('BUY = #3\nSELL = #5'))
+
+
+if __name__ == '__main__':
+    unittest.main()
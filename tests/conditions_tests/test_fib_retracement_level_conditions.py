@@ -0,0 +1,129 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.conditions.fibonacci_retracement_levels_conditions.downtrend_fib_retracement_level import DowntrendFibRetracementLevelCondition
+from trading_strategy_tester.conditions.fibonacci_retracement_levels_conditions.uptrend_fib_retracement_level import UptrendFibRetracementLevelCondition
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.enums.fibonacci_levels_enum import FibonacciLevels
+from trading_strategy_tester.enums.source_enum import SourceType
+from trading_strategy_tester.utils.fib_utils import is_in_fib_interval
+
+
+def per_row_fib_retracement(df: pd.DataFrame, fib_level: FibonacciLevels, length: int, uptrend: bool) -> pd.Series:
+    """
+    The per-row evaluation of the Fibonacci retracement level conditions, used as the reference.
+    """
+    low_column, high_column = df[SourceType.LOW.value], df[SourceType.HIGH.value]
+    result = pd.Series([False] * len(df), index=df.index)
+
+    for index in range(length, len(df)):
+        if uptrend:
+            first_index = low_column[index - length:index].argmin()
+            second_index = high_column[index - length + first_index:index].argmax() + first_index
+            low, high = low_column.iloc[first_index], high_column.iloc[second_index]
+        else:
+            first_index = high_column[index - length:index].argmax()
+            second_index = low_column[index - length + first_index:index].argmin() + first_index
+            high, low = low_column.iloc[second_index], high_column.iloc[first_index]
+
+        if first_index < second_index:
+            result.iloc[index] = is_in_fib_interval(high, low, df.iloc[index], fib_level, uptrend)
+
+    return result
+
+
+class TestFibRetracementLevelConditions(unittest.TestCase):
+
+    def setUp(self):
+        self.downloader = DownloadModule()
+
+        script_dir = os.path.dirname(__file__)
+        self.df = pd.read_csv(os.path.join(script_dir, '..', 'indicators_tests', 'testing_data',
+                                           'AAPL_testing_data.csv'), index_col=0)
+
+        # Rounded prices with many equal highs and lows
+        rng = np.random.default_rng(2)
+        close = np.round(100 + np.cumsum(rng.standard_normal(300)))
+        self.ties_df = pd.DataFrame({
+            SourceType.HIGH.value: close + np.round(2 * rng.random(300)),
+            SourceType.LOW.value: close - np.round(2 * rng.random(300)),
+        })
+
+    def test_uptrend_equals_per_row_evaluation(self):
+        for df in [self.df, self.ties_df]:
+            for fib_level in FibonacciLevels:
+                with self.subTest(fib_level=fib_level, rows=len(df)):
+                    # Arrange
+                    expected = per_row_fib_retracement(df, fib_level, 14, uptrend=True)
+
+                    # Act
+                    result, signal_series = UptrendFibRetracementLevelCondition(fib_level, 14).evaluate(self.downloader, df)
+
+                    # Assert
+                    pd.testing.assert_series_equal(result, expected)
+                    pd.testing.assert_series_equal(signal_series, expected.apply(
+                        lambda x: f'UptrendFibRetracementLevelSignal({fib_level.value}, 14)' if x else None
+                    ))
+
+    def test_downtrend_equals_per_row_evaluation(self):
+        for df in [self.df, self.ties_df]:
+            for fib_level in FibonacciLevels:
+                with self.subTest(fib_level=fib_level, rows=len(df)):
+                    # Arrange
+                    expected = per_row_fib_retracement(df, fib_level, 14, uptrend=False)
+
+                    # Act
+                    result, signal_series = DowntrendFibRetracementLevelCondition(fib_level, 14).evaluate(self.downloader, df)
+
+                    # Assert
+                    pd.testing.assert_series_equal(result, expected)
+                    pd.testing.assert_series_equal(signal_series, expected.apply(
+                        lambda x: f'DowntrendFibRetracementLevelSignal({fib_level.value}, 14)' if x else None
+                    ))
+
+    def test_evaluate_batch_equals_evaluate(self):
+        # Arrange
+        fib_levels = [FibonacciLevels.LEVEL_23_6, FibonacciLevels.LEVEL_61_8, FibonacciLevels.LEVEL_100]
+        lengths = [3, 14, 50]
+
+        for condition in [UptrendFibRetracementLevelCondition, DowntrendFibRetracementLevelCondition]:
+            # Act
+            results = condition.evaluate_batch(self.downloader, self.df, fib_levels, lengths)
+
+            # Assert
+            self.assertEqual(list(results.columns), [(fib_level, length) for length in lengths for fib_level in fib_levels])
+            for fib_level in fib_levels:
+                for length in lengths:
+                    expected, _ = condition(fib_level, length).evaluate(self.downloader, self.df)
+                    pd.testing.assert_series_equal(results[(fib_level, length)], expected, check_names=False)
+
+    def test_evaluate_labels_at_equals_evaluate_at_rows(self):
+        # Arrange
+        rows = np.sort(np.random.default_rng(3).choice(len(self.ties_df), 40, replace=False))
+
+        for condition in [UptrendFibRetracementLevelCondition(FibonacciLevels.LEVEL_38_2, 14),
+                          DowntrendFibRetracementLevelCondition(FibonacciLevels.LEVEL_61_8, 14)]:
+            with self.subTest(condition=condition.to_string()):
+                expected, expected_signal_series = condition.evaluate(self.downloader, self.ties_df)
+
+                # Act
+                result, signals = condition.evaluate_labels_at(self.downloader, self.ties_df, rows)
+
+                # Assert
+                np.testing.assert_array_equal(result.to_numpy()[rows], expected.to_numpy()[rows])
+                pd.testing.assert_series_equal(signals.to_series().iloc[rows], expected_signal_series.iloc[rows],
+                                               check_names=False)
+
+    def test_window_longer_than_data_never_matches(self):
+        # Act
+        result, _ = UptrendFibRetracementLevelCondition(FibonacciLevels.LEVEL_50, 400).evaluate(self.downloader, self.ties_df)
+
+        # Assert
+        self.assertFalse(result.any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import random
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -123,6 +124,20 @@ class TestIfThenElseCondition(unittest.TestCase):
         pd.testing.assert_series_equal(if_then_else_condition, expected_if_then_else)
         pd.testing.assert_series_equal(signal_series, expected_signal_series)
 
+    def test_if_then_else_condition_skips_else_when_if_is_always_met(self):
+        # Arrange
+        ticker = 'AAPL'
+        always = TestCondition(TestingSeries(ticker, pd.Series([True] * 5), 1))
+        later = TestCondition(TestingSeries(ticker, pd.Series([True] * 5), 2))
+
+        # Act
+        with mock.patch.object(later, 'evaluate_candidates', wraps=later.evaluate_candidates) as evaluate_candidates:
+            if_then_else_condition, signal_series = IfThenElse(always, later).evaluate(self.downloader, self.df)
+
+        # Assert
+        evaluate_candidates.assert_not_called()
+        pd.testing.assert_series_equal(if_then_else_condition, pd.Series([True] * 5))
+        pd.testing.assert_series_equal(signal_series, pd.Series([always.to_string()] * 5))
 
     def test_to_string(self):
         # Arrange
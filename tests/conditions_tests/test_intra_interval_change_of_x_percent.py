@@ -142,5 +142,19 @@ class TestChangeOfXPercentOnYDays(unittest.TestCase):
         # Assert
         self.assertEqual(condition.to_string(), expected_string)
 
+    def test_evaluate_batch_equals_evaluate(self):
+        # Arrange
+        series = TestingSeries('AAPL', pd.Series([100, 104, 110, 121, 90, 60]), 1)
+        percents = [5, 10, -5, -30]
+
+        # Act
+        results = IntraIntervalChangeOfXPercentCondition.evaluate_batch(self.downloader, self.df, series, percents)
+
+        # Assert
+        self.assertEqual(list(results.columns), percents)
+        for percent in percents:
+            expected, _ = IntraIntervalChangeOfXPercentCondition(series, percent).evaluate(self.downloader, self.df)
+            pd.testing.assert_series_equal(results[percent], expected, check_names=False)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
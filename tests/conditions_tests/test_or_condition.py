@@ -1,5 +1,6 @@
 import random
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -114,6 +115,21 @@ class TestOrCondition(unittest.TestCase):
         pd.testing.assert_series_equal(or_condition, expected_or)
         pd.testing.assert_series_equal(signal_series, expected_signal_series)
 
+    def test_or_condition_skips_conditions_after_every_row_is_met(self):
+        # Arrange
+        ticker = 'AAPL'
+        always = TestCondition(TestingSeries(ticker, pd.Series([True] * 5), 1))
+        later = TestCondition(TestingSeries(ticker, pd.Series([True] * 5), 2))
+
+        # Act
+        with mock.patch.object(later, 'evaluate_candidates', wraps=later.evaluate_candidates) as evaluate_candidates:
+            or_condition, signal_series = OR(always, later).evaluate(self.downloader, self.df)
+
+        # Assert
+        evaluate_candidates.assert_not_called()
+        pd.testing.assert_series_equal(or_condition, pd.Series([True] * 5))
+        pd.testing.assert_series_equal(signal_series, pd.Series([always.to_string()] * 5))
+
     def test_to_string(self):
         # Arrange
         ticker = 'AAPL'
@@ -0,0 +1,97 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.conditions.logical_conditions.and_condition import AND
+from trading_strategy_tester.conditions.parameterized_conditions.after_x_days_condition import AfterXDaysCondition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
+from trading_strategy_tester.conditions.test_condition import TestCondition
+from trading_strategy_tester.conditions.threshold_conditions.greater_than_condition import GreaterThanCondition
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.trading_series.testing_series import TestingSeries
+
+
+class TestSignalLabels(unittest.TestCase):
+
+    def setUp(self):
+        self.index = pd.RangeIndex(5)
+        self.first = SignalLabels.where(pd.Series([True, False, True, False, False]), 'First')
+        self.second = SignalLabels.where(pd.Series([True, True, False, False, True]), 'Second')
+
+    def test_where_and_to_series(self):
+        # Act
+        result = self.first.to_series()
+
+        # Assert
+        np.testing.assert_array_equal(self.first.codes, [0, -1, 0, -1, -1])
+        pd.testing.assert_series_equal(result, pd.Series(['First', None, 'First', None, None], dtype=object))
+
+    def test_from_series(self):
+        # Arrange
+        signal_series = pd.Series([None, 'A', 'B', 'A', None])
+
+        # Act
+        signals = SignalLabels.from_series(signal_series)
+
+        # Assert
+        self.assertEqual(signals.table, ['A', 'B'])
+        pd.testing.assert_series_equal(signals.to_series(), signal_series)
+
+    def test_first_keeps_the_first_signal(self):
+        # Act
+        result = SignalLabels.first([self.first, self.second], self.index).to_series()
+
+        # Assert
+        pd.testing.assert_series_equal(result, pd.Series(['First', 'Second', 'First', None, 'Second'], dtype=object))
+
+    def test_join_builds_each_combination_once(self):
+        # Arrange
+        mask = np.array([True, True, True, False, True])
+        signals = SignalLabels.join([self.first, self.second], mask, 'And(', ', ', ')', self.index)
+
+        # Act
+        with mock.patch.object(self.first, 'label', wraps=self.first.label) as first_label:
+            result = signals.to_series()
+
+        # Assert
+        self.assertEqual(len(signals.table), 3)
+        self.assertEqual(first_label.call_count, 3)  # Once for every combination, not for every row
+        pd.testing.assert_series_equal(result, pd.Series(
+            ['And(First, Second)', 'And(None, Second)', 'And(First, None)', None, 'And(None, Second)'], dtype=object))
+
+    def test_shift_and_wrap(self):
+        # Act
+        shifted = self.first.shift(2).wrap('After(', ')')
+        shifted_back = self.first.shift(-2)
+
+        # Assert
+        self.assertEqual([shifted.label_at(position) for position in range(5)],
+                         [None, None, 'After(First)', None, 'After(First)'])
+        np.testing.assert_array_equal(shifted_back.codes, [0, -1, -1, -1, -1])
+        np.testing.assert_array_equal(self.first.shift(10).codes, [-1] * 5)
+
+    def test_conditions_return_the_same_signals_as_labels(self):
+        # Arrange
+        downloader = DownloadModule()
+        df = pd.DataFrame(index=self.index)
+        first = TestingSeries('AAPL', pd.Series([1, 3, 5, 2, 4]), 'First')
+        second = TestingSeries('AAPL', pd.Series([2, 2, 2, 2, 2]), 'Second')
+        # A condition implementing only `evaluate` is converted by the default `evaluate_labels`
+        condition = AfterXDaysCondition(AND(GreaterThanCondition(first, second), TestCondition(first)), 1)
+
+        # Act
+        result, signal_series = condition.evaluate(downloader, df)
+        labels_result, signals = condition.evaluate_labels(downloader, df)
+
+        # Assert
+        pd.testing.assert_series_equal(labels_result, result)
+        pd.testing.assert_series_equal(signals.to_series(), signal_series)
+        self.assertEqual(signal_series[2],
+                         'AfterXDaysSignal(1, And(GreaterThanSignal(AAPL_TEST_First, AAPL_TEST_Second), '
+                         'TestCondition(AAPL_TEST_First)))')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from trading_strategy_tester.download.cache_manager import CacheManager
+from trading_strategy_tester.download.data_store import NpyDataStore
+
+
+class TestCacheManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = NpyDataStore(self.tmp_dir.name)
+
+        script_dir = os.path.dirname(__file__)
+        self.df = pd.read_csv(
+            os.path.join(script_dir, '..', 'testing_data', 'AAPL_testing_data.csv'),
+            index_col='Date',
+            parse_dates=True
+        )
+        self.spans = [(datetime(2020, 1, 1), datetime(2024, 1, 1))]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def save_with_access_time(self, ticker: str, access_time: float):
+        self.store.save(ticker, '1d', self.df, self.spans)
+        index_path = os.path.join(self.store.entry_path(ticker, '1d'), NpyDataStore.INDEX_FILE)
+        os.utime(index_path, (access_time, access_time))
+
+    def test_enforce_size_limit_evicts_least_recently_used(self):
+        # Arrange
+        self.save_with_access_time('AAPL', 1000)
+        self.save_with_access_time('MSFT', 3000)
+        self.save_with_access_time('TSLA', 2000)
+        entry_size = self.store.size('AAPL', '1d')
+        cache_manager = CacheManager(self.store, max_size_bytes=2 * entry_size)
+
+        # Act
+        cache_manager.enforce_size_limit()
+
+        # Assert
+        self.assertEqual(sorted(self.store.keys()), [('MSFT', '1d'), ('TSLA', '1d')])
+
+    def test_enforce_size_limit_keeps_requested_entry(self):
+        # Arrange
+        self.save_with_access_time('AAPL', 1000)
+        self.save_with_access_time('MSFT', 3000)
+        cache_manager = CacheManager(self.store, max_size_bytes=1)
+
+        # Act
+        cache_manager.enforce_size_limit(keep=('AAPL', '1d'))
+
+        # Assert
+        self.assertEqual(self.store.keys(), [('AAPL', '1d')])
+
+    def test_touch_updates_last_access(self):
+        # Arrange
+        self.save_with_access_time('AAPL', 1000)
+
+        # Act
+        self.store.touch('AAPL', '1d')
+
+        # Assert
+        self.assertGreater(self.store.last_access('AAPL', '1d'), 1000)
+
+    def test_expire_recent_bars_after_ttl(self):
+        # Arrange
+        updated_at = datetime(2023, 6, 14, 15, 30)
+        self.store.save('AAPL', '1d', self.df, self.spans)
+        index = self.store.read_index('AAPL', '1d')
+        index['updated_at'] = updated_at.isoformat()
+        self.store.write_index('AAPL', '1d', index)
+        cache_manager = CacheManager(self.store, recent_bars_ttl=timedelta(hours=1))
+
+        # Act
+        cache_manager.expire_recent_bars('AAPL', '1d')
+
+        # Assert
+        self.assertEqual(self.store.get_spans('AAPL', '1d'), [(datetime(2020, 1, 1), datetime(2023, 6, 14))])
+
+    def test_recent_bars_within_ttl_are_kept(self):
+        # Arrange
+        self.store.save('AAPL', '1d', self.df, [(datetime(2020, 1, 1), datetime.now() + timedelta(days=1))])
+        spans = self.store.get_spans('AAPL', '1d')
+        cache_manager = CacheManager(self.store, recent_bars_ttl=timedelta(hours=1))
+
+        # Act
+        cache_manager.expire_recent_bars('AAPL', '1d')
+
+        # Assert
+        self.assertEqual(self.store.get_spans('AAPL', '1d'), spans)
+
+    def test_purge_ticker(self):
+        # Arrange
+        self.store.save('AAPL', '1d', self.df, self.spans)
+        self.store.save('AAPL', '1wk', self.df, self.spans)
+        self.store.save('MSFT', '1d', self.df, self.spans)
+        cache_manager = CacheManager(self.store)
+
+        # Act
+        cache_manager.purge(ticker='AAPL')
+
+        # Assert
+        self.assertEqual(self.store.keys(), [('MSFT', '1d')])
+
+    def test_purge_all(self):
+        # Arrange
+        self.store.save('AAPL', '1d', self.df, self.spans)
+        self.store.save('MSFT', '1d', self.df, self.spans)
+        cache_manager = CacheManager(self.store)
+
+        # Act
+        cache_manager.purge()
+
+        # Assert
+        self.assertEqual(self.store.keys(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
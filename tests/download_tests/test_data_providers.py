@@ -0,0 +1,162 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.data_provider import OHLCV_COLUMNS
+from trading_strategy_tester.download.data_providers.dataframe_provider import DataFrameProvider
+from trading_strategy_tester.download.data_providers.local_directory_provider import LocalDirectoryProvider
+from trading_strategy_tester.download.data_providers.synthetic_provider import SyntheticProvider
+from trading_strategy_tester.download.data_providers.yfinance_provider import YFinanceProvider
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.download.frame_cache import FrameCache
+
+
+class TestDataProviders(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        script_dir = os.path.dirname(__file__)
+        self.csv_path = os.path.join(script_dir, '..', 'testing_data', 'AAPL_testing_data.csv')
+        self.data = pd.read_csv(self.csv_path, index_col='Date', parse_dates=True)
+        self.start = datetime(2021, 1, 1)
+        self.end = datetime(2022, 1, 1)
+        self.expected_df = self.data[(self.data.index >= self.start) & (self.data.index < self.end)][OHLCV_COLUMNS]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_dataframe_provider_slices_range(self):
+        # Arrange
+        provider = DataFrameProvider({'AAPL': self.data})
+
+        # Act
+        df = provider.download('AAPL', '1d', self.start, self.end)
+
+        # Assert
+        pd.testing.assert_frame_equal(df, self.expected_df, check_freq=False)
+
+    def test_dataframe_provider_unknown_ticker_and_interval(self):
+        # Arrange
+        provider = DataFrameProvider({'AAPL': self.data}, interval='1d')
+
+        # Act & Assert
+        self.assertEqual(len(provider.download('MSFT', '1d', self.start, self.end)), 0)
+        self.assertEqual(len(provider.download('AAPL', '1wk', self.start, self.end)), 0)
+
+    def test_local_directory_provider_reads_csv(self):
+        # Arrange
+        self.data.to_csv(os.path.join(self.tmp_dir.name, 'AAPL_1d.csv'))
+        provider = LocalDirectoryProvider(self.tmp_dir.name)
+
+        # Act
+        df = provider.download('AAPL', '1d', self.start, self.end)
+
+        # Assert
+        pd.testing.assert_frame_equal(df, self.expected_df, check_freq=False)
+
+    def test_local_directory_provider_falls_back_to_ticker_file(self):
+        # Arrange
+        self.data.drop(columns=['Adj Close']).to_csv(os.path.join(self.tmp_dir.name, 'AAPL.csv'))
+        provider = LocalDirectoryProvider(self.tmp_dir.name)
+
+        # Act
+        df = provider.download('AAPL', '1wk', self.start, self.end)
+
+        # Assert
+        self.assertEqual(list(df.columns), OHLCV_COLUMNS)
+        pd.testing.assert_series_equal(df['Adj Close'], df['Close'], check_names=False)
+
+    def test_local_directory_provider_missing_file(self):
+        # Arrange
+        provider = LocalDirectoryProvider(self.tmp_dir.name)
+
+        # Act
+        df = provider.download('MSFT', '1d', self.start, self.end)
+
+        # Assert
+        self.assertEqual(len(df), 0)
+
+    def test_yfinance_provider_names_columns(self):
+        # Arrange
+        provider = YFinanceProvider()
+        downloaded = self.data[OHLCV_COLUMNS].copy()
+        downloaded.columns = pd.MultiIndex.from_product([OHLCV_COLUMNS, ['AAPL']], names=['Price', 'Ticker'])
+
+        # Act
+        with patch('yfinance.download', return_value=downloaded):
+            df = provider.download('AAPL', '1d', self.start, self.end)
+
+        # Assert
+        self.assertEqual(list(df.columns), OHLCV_COLUMNS)
+        self.assertEqual(df.index.name, 'Date')
+
+    def test_download_module_uses_provider_without_disk_cache(self):
+        # Arrange
+        downloader = DownloadModule(
+            start_date=self.start,
+            end_date=self.end,
+            data_path=self.tmp_dir.name,
+            provider=DataFrameProvider({'AAPL': self.data})
+        )
+
+        # Act
+        df = downloader.download_ticker('AAPL')
+
+        # Assert
+        pd.testing.assert_frame_equal(df, self.expected_df, check_freq=False)
+        self.assertEqual(downloader.store.keys(), [])
+
+    def test_download_module_unknown_ticker_raises_value_error(self):
+        # Arrange
+        downloader = DownloadModule(
+            start_date=self.start,
+            end_date=self.end,
+            data_path=self.tmp_dir.name,
+            provider=DataFrameProvider({'AAPL': self.data})
+        )
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            downloader.download_ticker('MSFT')
+
+
+    def test_downloaders_with_different_providers_share_frame_cache(self):
+        # Arrange
+        frame_cache = FrameCache()
+        changed_data = self.data.copy()
+        changed_data['Close'] += 1
+        self.data.to_csv(os.path.join(self.tmp_dir.name, 'AAPL_1d.csv'))
+        providers = [
+            DataFrameProvider({'AAPL': self.data}),
+            DataFrameProvider({'AAPL': changed_data}),
+            SyntheticProvider(seed=1),
+            SyntheticProvider(seed=2),
+            LocalDirectoryProvider(self.tmp_dir.name)
+        ]
+        downloaders = [
+            DownloadModule(start_date=self.start, end_date=self.end, data_path=self.tmp_dir.name,
+                           provider=provider, frame_cache=frame_cache)
+            for provider in providers
+        ]
+
+        # Act
+        frames = [downloader.download_ticker('AAPL') for downloader in downloaders]
+        repeated_frames = [downloader.download_ticker('AAPL') for downloader in downloaders]
+
+        # Assert
+        self.assertEqual(frame_cache.stats()['misses'], len(providers))
+        self.assertEqual(frame_cache.stats()['hits'], len(providers))
+        for position, df in enumerate(frames):
+            pd.testing.assert_frame_equal(repeated_frames[position], df)
+            for other_df in frames[position + 1:-1]:  # The local directory serves the same file as the first
+                self.assertFalse(df['Close'].equals(other_df['Close']))
+        pd.testing.assert_frame_equal(frames[-1], frames[0], check_freq=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
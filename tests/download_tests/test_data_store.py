@@ -0,0 +1,164 @@
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.data_store import NpyDataStore
+from trading_strategy_tester.download.file_lock import file_lock
+
+
+class TestNpyDataStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = NpyDataStore(self.tmp_dir.name)
+
+        script_dir = os.path.dirname(__file__)
+        self.df = pd.read_csv(
+            os.path.join(script_dir, '..', 'testing_data', 'AAPL_testing_data.csv'),
+            index_col='Date',
+            parse_dates=True
+        )
+        self.start = datetime(2020, 1, 1)
+        self.end = datetime(2024, 1, 1)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_save_and_load_whole_history(self):
+        # Act
+        self.store.save('AAPL', '1d', self.df, [(self.start, self.end)])
+        loaded_df = self.store.load('AAPL', '1d', self.start, self.end)
+
+        # Assert
+        pd.testing.assert_frame_equal(loaded_df, self.df, check_freq=False)
+
+    def test_save_and_load_index_of_any_resolution(self):
+        for unit in ['s', 'ms', 'us']:
+            for tz in [None, 'America/New_York']:
+                with self.subTest(unit=unit, tz=tz):
+                    # Arrange
+                    df = self.df.copy()
+                    df.index = df.index.as_unit(unit)
+                    if tz is not None:
+                        df.index = df.index.tz_localize(tz)
+
+                    # Act
+                    self.store.save('AAPL', '1d', df, [(self.start, self.end)])
+                    loaded_df = self.store.load('AAPL', '1d', self.start, self.end)
+
+                    # Assert
+                    self.assertEqual(loaded_df.index.unit, 'ns')
+                    pd.testing.assert_index_equal(loaded_df.index, df.index.as_unit('ns'), exact=False)
+                    pd.testing.assert_frame_equal(loaded_df, df, check_freq=False, check_index_type=False)
+
+    def test_load_sub_range_is_sliced(self):
+        # Arrange
+        start = datetime(2021, 3, 1)
+        end = datetime(2021, 4, 1)
+        expected_df = self.df[(self.df.index >= start) & (self.df.index < end)]
+
+        # Act
+        self.store.save('AAPL', '1d', self.df, [(self.start, self.end)])
+        loaded_df = self.store.load('AAPL', '1d', start, end)
+
+        # Assert
+        pd.testing.assert_frame_equal(loaded_df, expected_df, check_freq=False)
+
+    def test_get_spans(self):
+        # Arrange
+        spans = [(self.start, datetime(2021, 1, 1)), (datetime(2022, 1, 1), self.end)]
+
+        # Act
+        self.store.save('AAPL', '1d', self.df, spans)
+
+        # Assert
+        self.assertEqual(self.store.get_spans('AAPL', '1d'), spans)
+        self.assertEqual(self.store.get_spans('AAPL', '1wk'), [])
+
+    def test_missing_entry_returns_none(self):
+        # Act
+        loaded_df = self.store.load('MSFT', '1d', self.start, self.end)
+
+        # Assert
+        self.assertIsNone(loaded_df)
+
+    def test_save_replaces_previous_version(self):
+        # Arrange
+        entry_path = self.store.entry_path('AAPL', '1d')
+
+        # Act
+        self.store.save('AAPL', '1d', self.df.iloc[:10], [(self.start, datetime(2020, 1, 16))])
+        self.store.save('AAPL', '1d', self.df, [(self.start, self.end)])
+
+        # Assert
+        self.assertEqual(len(self.store.load('AAPL', '1d', self.start, self.end)), len(self.df))
+        self.assertEqual(len([name for name in os.listdir(entry_path) if name != NpyDataStore.INDEX_FILE]), 1)
+
+    def test_keys_and_delete(self):
+        # Act
+        self.store.save('AAPL', '1d', self.df, [(self.start, self.end)])
+        self.store.save('AAPL', '1wk', self.df, [(self.start, self.end)])
+        self.store.delete('AAPL', '1wk')
+
+        # Assert
+        self.assertEqual(self.store.keys(), [('AAPL', '1d')])
+
+    def test_memory_mapped_load_wraps_files_without_copy(self):
+        # Arrange
+        store = NpyDataStore(self.tmp_dir.name, memory_map=True)
+        store.save('AAPL', '1d', self.df, [(self.start, self.end)])
+
+        # Act
+        loaded_df = store.load('AAPL', '1d', datetime(2021, 1, 1), datetime(2022, 1, 1))
+        values = loaded_df['Close'].to_numpy()
+
+        # Assert
+        base = values
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        self.assertIsInstance(base, np.memmap)
+        self.assertFalse(values.flags.writeable)
+        pd.testing.assert_frame_equal(loaded_df, self.df.loc['2021'], check_freq=False)
+
+    def test_memory_mapped_frame_survives_replaced_version(self):
+        # Arrange
+        store = NpyDataStore(self.tmp_dir.name, memory_map=True)
+        store.save('AAPL', '1d', self.df, [(self.start, self.end)])
+        loaded_df = store.load('AAPL', '1d', self.start, self.end)
+
+        # Act
+        store.save('AAPL', '1d', self.df.iloc[:10], [(self.start, datetime(2020, 1, 16))])
+
+        # Assert
+        pd.testing.assert_frame_equal(loaded_df, self.df, check_freq=False)
+
+    def test_delete_waits_for_readers(self):
+        # Arrange
+        self.store.save('AAPL', '1d', self.df, [(self.start, self.end)])
+        deleted = threading.Event()
+
+        def delete():
+            self.store.delete('AAPL', '1d')
+            deleted.set()
+
+        # Act
+        # Hold the shared lock a reader holds while loading
+        with file_lock(self.store.lock_path('AAPL', '1d', 'data'), shared=True):
+            threading.Thread(target=delete, daemon=True).start()
+            deleted_while_reading = deleted.wait(0.2)
+            entry_exists_while_reading = os.path.isdir(self.store.entry_path('AAPL', '1d'))
+
+        # Assert
+        self.assertFalse(deleted_while_reading)
+        self.assertTrue(entry_exists_while_reading)
+        self.assertTrue(deleted.wait(5))
+        self.assertEqual(self.store.keys(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
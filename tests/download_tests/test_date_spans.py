@@ -0,0 +1,78 @@
+import unittest
+from datetime import datetime
+
+from trading_strategy_tester.download.date_spans import ceil_to_day, floor_to_interval, merge_spans, missing_spans
+
+
+class TestDateSpans(unittest.TestCase):
+
+    def test_merge_spans_overlapping_and_touching(self):
+        # Arrange
+        spans = [
+            (datetime(2021, 1, 1), datetime(2021, 6, 1)),
+            (datetime(2020, 1, 1), datetime(2020, 6, 1)),
+            (datetime(2020, 6, 1), datetime(2020, 9, 1)),
+            (datetime(2021, 3, 1), datetime(2021, 4, 1))
+        ]
+
+        # Act
+        merged = merge_spans(spans)
+
+        # Assert
+        self.assertEqual(merged, [
+            (datetime(2020, 1, 1), datetime(2020, 9, 1)),
+            (datetime(2021, 1, 1), datetime(2021, 6, 1))
+        ])
+
+    def test_missing_spans_head_gap_and_tail(self):
+        # Arrange
+        spans = [
+            (datetime(2020, 1, 1), datetime(2020, 6, 1)),
+            (datetime(2021, 1, 1), datetime(2021, 6, 1))
+        ]
+
+        # Act
+        missing = missing_spans(spans, datetime(2019, 1, 1), datetime(2022, 1, 1))
+
+        # Assert
+        self.assertEqual(missing, [
+            (datetime(2019, 1, 1), datetime(2020, 1, 1)),
+            (datetime(2020, 6, 1), datetime(2021, 1, 1)),
+            (datetime(2021, 6, 1), datetime(2022, 1, 1))
+        ])
+
+    def test_missing_spans_fully_covered(self):
+        # Arrange
+        spans = [(datetime(2020, 1, 1), datetime(2022, 1, 1))]
+
+        # Act
+        missing = missing_spans(spans, datetime(2020, 5, 1), datetime(2021, 1, 1))
+
+        # Assert
+        self.assertEqual(missing, [])
+
+    def test_missing_spans_nothing_stored(self):
+        # Act
+        missing = missing_spans([], datetime(2020, 5, 1), datetime(2021, 1, 1))
+
+        # Assert
+        self.assertEqual(missing, [(datetime(2020, 5, 1), datetime(2021, 1, 1))])
+
+    def test_floor_to_interval(self):
+        # Arrange
+        date = datetime(2024, 5, 16, 13, 30)  # Thursday
+
+        # Act & Assert
+        self.assertEqual(floor_to_interval(date, '1d'), datetime(2024, 5, 16))
+        self.assertEqual(floor_to_interval(date, '1wk'), datetime(2024, 5, 13))
+        self.assertEqual(floor_to_interval(date, '1mo'), datetime(2024, 5, 1))
+        self.assertEqual(floor_to_interval(date, '3mo'), datetime(2024, 4, 1))
+
+    def test_ceil_to_day(self):
+        # Act & Assert
+        self.assertEqual(ceil_to_day(datetime(2024, 5, 16, 13, 30)), datetime(2024, 5, 17))
+        self.assertEqual(ceil_to_day(datetime(2024, 5, 16)), datetime(2024, 5, 16))
+
+
+if __name__ == '__main__':
+    unittest.main()
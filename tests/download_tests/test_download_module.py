@@ -0,0 +1,246 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.download.resampling import resample_ohlcv
+from trading_strategy_tester.enums.interval_enum import Interval
+from trading_strategy_tester.enums.period_enum import Period
+
+
+class TestDownloadModule(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        script_dir = os.path.dirname(__file__)
+        data = pd.read_csv(
+            os.path.join(script_dir, '..', 'testing_data', 'AAPL_testing_data.csv'),
+            index_col='Date',
+            parse_dates=True
+        )
+        # Same column order as returned by yfinance
+        self.data = data[['Adj Close', 'Close', 'High', 'Low', 'Open', 'Volume']]
+        self.calls = []
+        self.intervals = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def fake_download(self, ticker, interval, start, end, **kwargs):
+        self.calls.append((ticker, pd.Timestamp(start), pd.Timestamp(end)))
+        self.intervals.append(interval)
+        return self.data[(self.data.index >= start) & (self.data.index < end)].copy()
+
+    def fake_download_many(self, tickers, interval, start, end, **kwargs):
+        self.calls.append((tuple(tickers), pd.Timestamp(start), pd.Timestamp(end)))
+        data = self.data[(self.data.index >= start) & (self.data.index < end)]
+        # Unknown tickers have no data like in yfinance
+        known = {ticker: data for ticker in tickers if ticker != 'UNKNOWN'}
+        return pd.concat(known, axis=1) if len(known) > 0 else pd.DataFrame()
+
+    def create_downloader(self,
+                          start_date: datetime,
+                          end_date: datetime,
+                          interval: Interval = Interval.ONE_DAY) -> DownloadModule:
+        return DownloadModule(start_date=start_date, end_date=end_date, interval=interval, data_path=self.tmp_dir.name)
+
+    def test_second_request_is_served_from_store(self):
+        # Arrange
+        downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1))
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            first_df = downloader.download_ticker('AAPL')
+            second_df = downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(len(self.calls), 1)
+        pd.testing.assert_frame_equal(first_df, second_df)
+
+    def test_repeated_requests_hit_frame_cache(self):
+        # Arrange
+        downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1))
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            for _ in range(6):
+                downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(downloader.frame_cache.stats(), {'hits': 5, 'misses': 1, 'entries': 1})
+
+    def test_sub_range_is_sliced_from_stored_history(self):
+        # Arrange
+        wide_downloader = self.create_downloader(datetime(2020, 1, 1), datetime(2024, 1, 1))
+        narrow_downloader = self.create_downloader(datetime(2022, 3, 1), datetime(2022, 6, 1))
+        expected_df = self.data[(self.data.index >= datetime(2022, 3, 1)) & (self.data.index < datetime(2022, 6, 1))]
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            wide_downloader.download_ticker('AAPL')
+            narrow_df = narrow_downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(len(self.calls), 1)
+        pd.testing.assert_frame_equal(narrow_df, expected_df, check_freq=False)
+
+    def test_only_missing_head_and_tail_are_downloaded(self):
+        # Arrange
+        first_downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1))
+        second_downloader = self.create_downloader(datetime(2020, 6, 1), datetime(2022, 6, 1))
+        expected_df = self.data[(self.data.index >= datetime(2020, 6, 1)) & (self.data.index < datetime(2022, 6, 1))]
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            first_downloader.download_ticker('AAPL')
+            df = second_downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(self.calls[1:], [
+            ('AAPL', pd.Timestamp(2020, 6, 1), pd.Timestamp(2021, 1, 1)),
+            ('AAPL', pd.Timestamp(2022, 1, 1), pd.Timestamp(2022, 6, 1))
+        ])
+        pd.testing.assert_frame_equal(df, expected_df, check_freq=False)
+
+    def test_prefetch_batches_tickers_and_serves_later_requests_from_store(self):
+        # Arrange
+        downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1))
+        tickers = ['AAPL', 'MSFT', 'TSLA', 'NVDA', 'UNKNOWN']
+        expected_df = self.data[(self.data.index >= datetime(2021, 1, 1)) & (self.data.index < datetime(2022, 1, 1))]
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download_many):
+            failed = downloader.prefetch(tickers, batch_size=2, max_workers=2)
+        dfs = {ticker: downloader.download_ticker(ticker) for ticker in tickers[:-1]}
+
+        # Assert
+        self.assertEqual(failed, ['UNKNOWN'])
+        self.assertEqual(sorted(len(call[0]) for call in self.calls), [1, 2, 2])
+        for df in dfs.values():
+            pd.testing.assert_frame_equal(df, expected_df, check_freq=False)
+
+    def test_prefetch_skips_cached_tickers(self):
+        # Arrange
+        downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1))
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download_many):
+            downloader.prefetch(['AAPL', 'MSFT'])
+            downloader.prefetch(['AAPL', 'MSFT'])
+
+        # Assert
+        self.assertEqual(len(self.calls), 1)
+
+    def test_returned_columns_match_downloaded_layout(self):
+        # Arrange
+        downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1))
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            df = downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(list(df.columns), ['Adj Close', 'Close', 'High', 'Low', 'Open', 'Volume'])
+        self.assertEqual(df.index.name, 'Date')
+
+    def test_no_data_raises_value_error(self):
+        # Arrange
+        downloader = self.create_downloader(datetime(2030, 1, 1), datetime(2031, 1, 1))
+
+        # Act & Assert
+        with patch('yfinance.download', side_effect=self.fake_download):
+            with self.assertRaises(ValueError):
+                downloader.download_ticker('AAPL')
+
+    def test_period_is_resolved_to_date_range(self):
+        # Arrange
+        downloader = DownloadModule(period=Period.ONE_YEAR, data_path=self.tmp_dir.name)
+        today = datetime.combine(datetime.today().date(), datetime.min.time())
+
+        # Act
+        start, end = downloader.resolve_date_range()
+
+        # Assert
+        self.assertEqual(end, today + pd.Timedelta(days=1))
+        self.assertEqual(start, (pd.Timestamp(end) - pd.DateOffset(years=1)).to_pydatetime())
+
+    def test_coarser_intervals_are_resampled_from_stored_daily_history(self):
+        # Arrange
+        daily_downloader = self.create_downloader(datetime(2020, 1, 1), datetime(2024, 1, 1))
+        weekly_downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1), Interval.ONE_WEEK)
+        monthly_downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1), Interval.ONE_MONTH)
+        daily_df = self.data[(self.data.index >= datetime(2020, 12, 28)) & (self.data.index < datetime(2022, 1, 1))]
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            daily_downloader.download_ticker('AAPL')
+            weekly_df = weekly_downloader.download_ticker('AAPL')
+            monthly_df = monthly_downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(self.intervals, ['1d'])
+        self.assertEqual(weekly_downloader.store.keys(), [('AAPL', '1d')])
+        pd.testing.assert_frame_equal(weekly_df, resample_ohlcv(daily_df, '1wk').loc['2021-01-01':], check_freq=False)
+        self.assertEqual(len(monthly_df), 12)
+
+    def test_coarser_interval_is_downloaded_without_daily_history(self):
+        # Arrange
+        weekly_downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1), Interval.ONE_WEEK)
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            weekly_downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(self.intervals, ['1wk'])
+        self.assertEqual(weekly_downloader.store.keys(), [('AAPL', '1wk')])
+
+    def test_concurrent_misses_are_downloaded_once(self):
+        # Arrange
+        downloaders = [self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1)) for _ in range(4)]
+        results = []
+
+        def slow_download(*args, **kwargs):
+            time.sleep(0.1)
+            return self.fake_download(*args, **kwargs)
+
+        # Act
+        with patch('yfinance.download', side_effect=slow_download):
+            threads = [
+                threading.Thread(target=lambda downloader=downloader: results.append(downloader.download_ticker('AAPL')))
+                for downloader in downloaders
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Assert
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len(results), 4)
+        for df in results[1:]:
+            pd.testing.assert_frame_equal(df, results[0])
+
+    def test_delete_temp_files_removes_histories_and_keeps_locks(self):
+        # Arrange
+        downloader = self.create_downloader(datetime(2021, 1, 1), datetime(2022, 1, 1))
+
+        # Act
+        with patch('yfinance.download', side_effect=self.fake_download):
+            downloader.download_ticker('AAPL')
+        downloader.delete_temp_files()
+
+        # Assert
+        self.assertEqual(downloader.store.keys(), [])
+        self.assertTrue(os.path.isdir(os.path.join(downloader.store.root, downloader.store.LOCK_DIR)))
+
+
+if __name__ == '__main__':
+    unittest.main()
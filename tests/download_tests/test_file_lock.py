@@ -0,0 +1,56 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from trading_strategy_tester.download.file_lock import file_lock
+
+
+class TestFileLock(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'locks', 'AAPL_1d.data.lock')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def try_lock_in_thread(self, shared: bool) -> threading.Event:
+        acquired = threading.Event()
+
+        def lock():
+            with file_lock(self.path, shared=shared):
+                acquired.set()
+
+        threading.Thread(target=lock, daemon=True).start()
+        return acquired
+
+    def test_exclusive_lock_blocks_other_holders(self):
+        # Act
+        with file_lock(self.path):
+            acquired = self.try_lock_in_thread(shared=True)
+            acquired_while_locked = acquired.wait(0.2)
+
+        # Assert
+        self.assertFalse(acquired_while_locked)
+        self.assertTrue(acquired.wait(5))
+
+    def test_shared_locks_are_held_together(self):
+        # Act
+        with file_lock(self.path, shared=True):
+            acquired = self.try_lock_in_thread(shared=True)
+
+            # Assert
+            self.assertTrue(acquired.wait(5))
+
+    def test_lock_file_is_kept(self):
+        # Act
+        with file_lock(self.path):
+            pass
+
+        # Assert
+        self.assertTrue(os.path.isfile(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
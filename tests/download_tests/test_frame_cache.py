@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.frame_cache import FrameCache
+
+
+class TestFrameCache(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({'Close': np.arange(5, dtype=float), 'Volume': np.arange(5)})
+
+    def test_miss_then_hit_counters(self):
+        # Arrange
+        frame_cache = FrameCache()
+
+        # Act
+        first = frame_cache.get(('AAPL', '1d'))
+        frame_cache.put(('AAPL', '1d'), self.df)
+        second = frame_cache.get(('AAPL', '1d'))
+
+        # Assert
+        self.assertIsNone(first)
+        pd.testing.assert_frame_equal(second, self.df)
+        self.assertEqual(frame_cache.stats(), {'hits': 1, 'misses': 1, 'entries': 1})
+
+    def test_added_columns_do_not_change_cached_frame(self):
+        # Arrange
+        frame_cache = FrameCache()
+        frame_cache.put(('AAPL', '1d'), self.df)
+
+        # Act
+        df = frame_cache.get(('AAPL', '1d'))
+        df['RSI'] = 1.0
+
+        # Assert
+        self.assertEqual(list(frame_cache.get(('AAPL', '1d')).columns), ['Close', 'Volume'])
+
+    def test_cached_columns_are_read_only(self):
+        # Arrange
+        frame_cache = FrameCache()
+        df = frame_cache.put(('AAPL', '1d'), self.df)
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            df.loc[0, 'Close'] = 100.0
+
+    def test_least_recently_used_frame_is_evicted(self):
+        # Arrange
+        frame_cache = FrameCache(max_entries=2)
+
+        # Act
+        frame_cache.put(('AAPL', '1d'), self.df)
+        frame_cache.put(('MSFT', '1d'), self.df)
+        frame_cache.get(('AAPL', '1d'))
+        frame_cache.put(('TSLA', '1d'), self.df)
+
+        # Assert
+        self.assertIsNotNone(frame_cache.get(('AAPL', '1d')))
+        self.assertIsNone(frame_cache.get(('MSFT', '1d')))
+        self.assertIsNotNone(frame_cache.get(('TSLA', '1d')))
+
+    def test_clear(self):
+        # Arrange
+        frame_cache = FrameCache()
+        frame_cache.put(('AAPL', '1d'), self.df)
+        frame_cache.get(('AAPL', '1d'))
+
+        # Act
+        frame_cache.clear()
+
+        # Assert
+        self.assertEqual(frame_cache.stats(), {'hits': 0, 'misses': 0, 'entries': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
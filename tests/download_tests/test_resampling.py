@@ -0,0 +1,77 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.resampling import bar_starts, resample_ohlcv
+from trading_strategy_tester.enums.interval_enum import Interval
+
+
+class TestResampling(unittest.TestCase):
+
+    def setUp(self):
+        script_dir = os.path.dirname(__file__)
+        data = pd.read_csv(
+            os.path.join(script_dir, '..', 'testing_data', 'AAPL_testing_data.csv'),
+            index_col='Date',
+            parse_dates=True
+        )
+        self.data = data[['Adj Close', 'Close', 'High', 'Low', 'Open', 'Volume']]
+
+    def test_resample_matches_pandas_resample(self):
+        rules = {
+            Interval.ONE_WEEK.value: 'W-MON',
+            Interval.ONE_MONTH.value: 'MS',
+            Interval.THREE_MONTHS.value: 'QS',
+        }
+
+        for interval, rule in rules.items():
+            with self.subTest(interval=interval):
+                # Arrange
+                expected_df = self.data.resample(rule, label='left', closed='left').agg({
+                    'Adj Close': 'last',
+                    'Close': 'last',
+                    'High': 'max',
+                    'Low': 'min',
+                    'Open': 'first',
+                    'Volume': 'sum',
+                }).dropna()
+
+                # Act
+                df = resample_ohlcv(self.data, interval)
+
+                # Assert
+                pd.testing.assert_frame_equal(df, expected_df, check_freq=False, check_dtype=False)
+
+    def test_bar_starts(self):
+        # Arrange
+        index = pd.DatetimeIndex(['2024-01-01', '2024-01-07', '2024-02-29', '2024-05-15'])
+
+        # Act
+        weeks = bar_starts(index, Interval.ONE_WEEK.value)
+        quarters = bar_starts(index, Interval.THREE_MONTHS.value)
+
+        # Assert
+        np.testing.assert_array_equal(weeks, np.array(['2024-01-01', '2024-01-01', '2024-02-26', '2024-05-13'], dtype='datetime64[D]'))
+        np.testing.assert_array_equal(quarters, np.array(['2024-01-01', '2024-01-01', '2024-01-01', '2024-04-01'], dtype='datetime64[D]'))
+
+    def test_timezone_aware_index_keeps_its_timezone(self):
+        # Arrange
+        data = self.data.tz_localize('America/New_York')
+
+        # Act
+        df = resample_ohlcv(data, Interval.ONE_MONTH.value)
+
+        # Assert
+        self.assertEqual(str(df.index.tz), 'America/New_York')
+        self.assertEqual(df.index[0], pd.Timestamp('2020-01-01', tz='America/New_York'))
+
+    def test_unsupported_interval_raises_value_error(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            resample_ohlcv(self.data, Interval.ONE_DAY.value)
+
+
+if __name__ == '__main__':
+    unittest.main()
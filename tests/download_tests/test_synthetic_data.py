@@ -0,0 +1,128 @@
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.data_provider import OHLCV_COLUMNS
+from trading_strategy_tester.download.data_providers.synthetic_provider import SyntheticProvider
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.download.synthetic_data import generate_ohlcv, generate_ohlcv_arrays
+from trading_strategy_tester.enums.interval_enum import Interval
+from trading_strategy_tester.enums.synthetic_mode_enum import SyntheticMode
+
+
+class TestSyntheticData(unittest.TestCase):
+
+    def assert_valid_ohlcv(self, df: pd.DataFrame):
+        self.assertEqual(list(df.columns), OHLCV_COLUMNS)
+        self.assertTrue((df['High'] >= np.maximum(df['Open'], df['Close'])).all())
+        self.assertTrue((df['Low'] <= np.minimum(df['Open'], df['Close'])).all())
+        self.assertTrue((df['Low'] > 0).all())
+        self.assertTrue((df['Volume'] > 0).all())
+        self.assertEqual(df['Volume'].dtype, np.int64)
+
+    def test_all_modes_generate_valid_ohlcv(self):
+        # Arrange
+        source = generate_ohlcv(500, seed=1)['Close']
+
+        for mode in SyntheticMode:
+            with self.subTest(mode=mode):
+                # Act
+                df = generate_ohlcv(10_000, mode=mode, source=source)
+
+                # Assert
+                self.assertEqual(len(df), 10_000)
+                self.assert_valid_ohlcv(df)
+
+    def test_same_seed_gives_same_data(self):
+        # Act
+        first_df = generate_ohlcv(1000, seed=42, mode=SyntheticMode.REGIME_SWITCHING)
+        second_df = generate_ohlcv(1000, seed=42, mode=SyntheticMode.REGIME_SWITCHING)
+        other_df = generate_ohlcv(1000, seed=43, mode=SyntheticMode.REGIME_SWITCHING)
+
+        # Assert
+        pd.testing.assert_frame_equal(first_df, second_df)
+        self.assertFalse(first_df['Close'].equals(other_df['Close']))
+
+    def test_dates_follow_interval(self):
+        # Act
+        daily_df = generate_ohlcv(10, start=datetime(2024, 1, 5))
+        weekly_df = generate_ohlcv(10, start=datetime(2024, 1, 5), interval=Interval.ONE_WEEK.value)
+
+        # Assert
+        self.assertEqual(daily_df.index.name, 'Date')
+        self.assertTrue((daily_df.index.dayofweek < 5).all())
+        self.assertTrue((weekly_df.index.dayofweek == 0).all())
+
+    def test_block_bootstrap_without_source_raises_value_error(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            generate_ohlcv(100, mode=SyntheticMode.BLOCK_BOOTSTRAP)
+
+    def test_block_bootstrap_reuses_source_returns(self):
+        # Arrange
+        source = generate_ohlcv(300, seed=3)['Close']
+        source_returns = np.diff(np.log(source.to_numpy()))
+
+        # Act
+        df = generate_ohlcv(1000, mode=SyntheticMode.BLOCK_BOOTSTRAP, source=source, block_size=10)
+        returns = np.diff(np.log(np.concatenate([[100.0], df['Close'].to_numpy()])))
+
+        # Assert
+        distances = np.abs(returns[:, None] - source_returns[None, :]).min(axis=1)
+        self.assertTrue((distances < 1e-9).all())
+
+    def test_detrended_arrays_stay_finite(self):
+        # Act
+        columns = generate_ohlcv_arrays(2_000_000, mode=SyntheticMode.REGIME_SWITCHING, detrend=True)
+
+        # Assert
+        self.assertTrue(np.isfinite(columns['Close']).all())
+        self.assertTrue((columns['Close'] > 0).all())
+
+    def test_fewer_bars_are_prefix_of_more_bars(self):
+        for mode in [SyntheticMode.GBM, SyntheticMode.REGIME_SWITCHING]:
+            with self.subTest(mode=mode):
+                # Act
+                short_df = generate_ohlcv(500, mode=mode, seed=5)
+                long_df = generate_ohlcv(5000, mode=mode, seed=5)
+
+                # Assert
+                pd.testing.assert_frame_equal(short_df, long_df.iloc[:500], check_freq=False)
+
+    def test_provider_overlapping_ranges_are_identical(self):
+        # Arrange
+        provider = SyntheticProvider(seed=7)
+
+        # Act
+        wide_df = provider.download('AAPL', '1d', datetime(2010, 1, 1), datetime(2020, 1, 1))
+        narrow_df = provider.download('AAPL', '1d', datetime(2015, 1, 1), datetime(2016, 1, 1))
+        other_df = provider.download('MSFT', '1d', datetime(2015, 1, 1), datetime(2016, 1, 1))
+
+        # Assert
+        pd.testing.assert_frame_equal(narrow_df, wide_df.loc['2015'], check_freq=False)
+        self.assertFalse(narrow_df['Close'].equals(other_df['Close']))
+
+    def test_download_module_with_synthetic_provider(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            downloader = DownloadModule(
+                start_date=datetime(2020, 1, 1),
+                end_date=datetime(2024, 1, 1),
+                data_path=tmp_dir,
+                provider=SyntheticProvider()
+            )
+
+            # Act
+            df = downloader.download_ticker('AAPL')
+
+        # Assert
+        self.assertEqual(df.index[0], pd.Timestamp(2020, 1, 1))
+        self.assertLess(df.index[-1], pd.Timestamp(2024, 1, 1))
+        self.assert_valid_ohlcv(df)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.enums.source_enum import SourceType
 from trading_strategy_tester.indicators.volatility.bb import bb_lower, bb_upper, bb_middle
+from trading_strategy_tester.indicators.volatility.bb import bb_lower_batch, bb_upper_batch, bb_middle_batch
 from trading_strategy_tester.trading_series.bb_series.bb_lower_series import BB_LOWER
 from trading_strategy_tester.trading_series.bb_series.bb_upper_series import BB_UPPER
 from trading_strategy_tester.trading_series.bb_series.bb_middle_series import BB_MIDDLE
@@ -470,6 +471,60 @@ class TestBB(unittest.TestCase):
         calculated_bb_upper = bb_upper_series.get_data(self.downloader, pd.DataFrame()).tail(20).reset_index(drop=True).round(2)
         pd.testing.assert_series_equal(calculated_bb_upper, trading_view_bb_upper)
 
+    def test_bb_batch_equals_bands_for_every_combination(self):
+        """
+        Test that the batch bands of many lengths and standard deviations match the bands calculated one by one.
+        """
+        lengths = [9, 20]
+        std_devs = [1, 2.5]
+        offset = 1
+        series = self.data[SourceType.CLOSE.value]
+
+        for ma_type in SmoothingType:
+            calculated = {
+                'BBLOWER': (bb_lower_batch(series, lengths, std_devs, ma_type, offset), bb_lower),
+                'BBUPPER': (bb_upper_batch(series, lengths, std_devs, ma_type, offset), bb_upper),
+                'BBMIDDLE': (bb_middle_batch(series, lengths, std_devs, ma_type, offset), bb_middle)
+            }
+
+            for prefix, (batch_df, band) in calculated.items():
+                self.assertEqual(len(batch_df.columns), len(lengths) * len(std_devs))
+
+                for length in lengths:
+                    for std_dev in std_devs:
+                        with self.subTest(band=prefix, ma_type=ma_type, length=length, std_dev=std_dev):
+                            pd.testing.assert_series_equal(
+                                batch_df[f'{prefix}_{length}_{ma_type.value}_{float(std_dev)}_{offset}'],
+                                band(series, length, ma_type, std_dev, offset),
+                                rtol=1e-10
+                            )
+
+
+    def test_bb_batch_equals_bands_with_missing_values(self):
+        """
+        Test that the batch bands match the bands calculated one by one for a series with missing values.
+        """
+        lengths = [5, 14]
+        std_devs = [2]
+        series = self.data[SourceType.CLOSE.value].head(60).copy()
+        series.iloc[[20, 21, 35]] = float('nan')
+
+        for ma_type in [SmoothingType.EMA, SmoothingType.RMA]:
+            calculated = {
+                'BBLOWER': (bb_lower_batch(series, lengths, std_devs, ma_type), bb_lower),
+                'BBUPPER': (bb_upper_batch(series, lengths, std_devs, ma_type), bb_upper),
+                'BBMIDDLE': (bb_middle_batch(series, lengths, std_devs, ma_type), bb_middle)
+            }
+
+            for prefix, (batch_df, band) in calculated.items():
+                for length in lengths:
+                    with self.subTest(band=prefix, ma_type=ma_type, length=length):
+                        pd.testing.assert_series_equal(
+                            batch_df[f'{prefix}_{length}_{ma_type.value}_2.0_0'],
+                            band(series, length, ma_type, 2, 0),
+                            rtol=1e-10
+                        )
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
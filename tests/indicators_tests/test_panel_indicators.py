@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.synthetic_data import generate_ohlcv_arrays
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.indicators.momentum.dmi import di_plus, di_minus
+from trading_strategy_tester.indicators.momentum.macd import macd, macd_signal
+from trading_strategy_tester.indicators.momentum.rsi import rsi
+from trading_strategy_tester.indicators.momentum.stoch import percent_k, percent_d
+from trading_strategy_tester.indicators.overlap.ema import ema
+from trading_strategy_tester.indicators.overlap.sma import sma
+from trading_strategy_tester.indicators.trend.adx import adx
+from trading_strategy_tester.indicators.volatility.atr import atr
+from trading_strategy_tester.indicators.volatility.bb import bb_lower, bb_middle, bb_upper
+from trading_strategy_tester.smoothings.smooth import smooth
+
+
+class TestPanelIndicators(unittest.TestCase):
+    """
+    Compares indicators computed on a panel of tickers with the same indicators computed ticker by ticker.
+    """
+
+    def setUp(self):
+        tickers = [f'TICKER{i}' for i in range(5)]
+        columns = {ticker: generate_ohlcv_arrays(600, seed=i) for i, ticker in enumerate(tickers)}
+
+        self.high = pd.DataFrame({ticker: columns[ticker]['High'] for ticker in tickers})
+        self.low = pd.DataFrame({ticker: columns[ticker]['Low'] for ticker in tickers})
+        self.close = pd.DataFrame({ticker: columns[ticker]['Close'] for ticker in tickers})
+
+        # A ticker listed later and a ticker with missing bars
+        for panel in [self.high, self.low, self.close]:
+            panel.iloc[:150, 1] = np.nan
+            panel.iloc[300:303, 3] = np.nan
+
+        self.indicators = {
+            'rsi': lambda high, low, close: rsi(close, 9),
+            'macd': lambda high, low, close: macd(close, 12, 26, SmoothingType.SMA),
+            'macd_signal': lambda high, low, close: macd_signal(close),
+            'atr': lambda high, low, close: atr(high, low, close, 14),
+            'atr_wma': lambda high, low, close: atr(high, low, close, 10, SmoothingType.WMA),
+            'bb_upper': lambda high, low, close: bb_upper(close, 20, SmoothingType.EMA, 2, 1),
+            'bb_lower': lambda high, low, close: bb_lower(close),
+            'bb_middle': lambda high, low, close: bb_middle(close, 5, SmoothingType.WMA),
+            'percent_k': lambda high, low, close: percent_k(close, low, high),
+            'percent_d': lambda high, low, close: percent_d(close, low, high),
+            'adx': lambda high, low, close: adx(high, low, close),
+            'di_plus': lambda high, low, close: di_plus(high, low, close),
+            'di_minus': lambda high, low, close: di_minus(high, low, close),
+            'sma': lambda high, low, close: sma(close, 9, 2),
+            'ema': lambda high, low, close: ema(close, 9),
+        }
+
+    def test_panel_equals_indicator_of_every_ticker(self):
+        for name, indicator in self.indicators.items():
+            with self.subTest(indicator=name):
+                # Act
+                panel_result = indicator(self.high, self.low, self.close)
+
+                # Assert
+                self.assertIsInstance(panel_result, pd.DataFrame)
+                self.assertEqual(list(panel_result.columns), list(self.close.columns))
+                for ticker in self.close.columns:
+                    expected = indicator(self.high[ticker], self.low[ticker], self.close[ticker])
+                    pd.testing.assert_series_equal(panel_result[ticker], expected, check_names=False)
+
+    def test_smoothings_of_panel(self):
+        for smoothing_type in SmoothingType:
+            with self.subTest(smoothing_type=smoothing_type):
+                # Act
+                panel_result = smooth(self.close, 7, smoothing_type)
+
+                # Assert
+                for ticker in self.close.columns:
+                    pd.testing.assert_series_equal(panel_result[ticker], smooth(self.close[ticker], 7, smoothing_type))
+
+    def test_two_dimensional_arrays_return_arrays(self):
+        for name, indicator in self.indicators.items():
+            with self.subTest(indicator=name):
+                # Act
+                array_result = indicator(self.high.to_numpy(), self.low.to_numpy(), self.close.to_numpy())
+
+                # Assert
+                self.assertIsInstance(array_result, np.ndarray)
+                np.testing.assert_array_equal(array_result, indicator(self.high, self.low, self.close).to_numpy())
+
+    def test_series_results_keep_their_names(self):
+        # Act
+        result = rsi(self.close['TICKER0'], 14)
+
+        # Assert
+        self.assertIsInstance(result, pd.Series)
+        self.assertEqual(result.name, 'RSI_14')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.synthetic_provider import SyntheticProvider
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.indicators.candlestick_patterns import pattern_scanner
+from trading_strategy_tester.indicators.candlestick_patterns.pattern_scanner import (
+    candlestick_pattern,
+    has_pattern,
+    pattern_bit,
+    scan_candlestick_patterns
+)
+from trading_strategy_tester.trading_series.candlestick_series.bullish_engulfing_series import BULLISH_ENGULFING
+from trading_strategy_tester.trading_series.candlestick_series.doji_series import DOJI
+from trading_strategy_tester.trading_series.candlestick_series.hammer_series import HAMMER
+from trading_strategy_tester.utils.intermediate_store import intermediate_store
+
+
+def candles(*bars: tuple) -> list[pd.Series]:
+    """
+    Returns the high, low, open and close Series of bars given as (open, high, low, close).
+    """
+    df = pd.DataFrame(bars, columns=['Open', 'High', 'Low', 'Close'])
+    return [df['High'], df['Low'], df['Open'], df['Close']]
+
+
+class TestPatternScanner(unittest.TestCase):
+
+    def setUp(self):
+        script_dir = os.path.dirname(__file__)
+        self.data = pd.read_csv(os.path.join(script_dir, 'testing_data', 'AAPL_testing_data.csv'))
+
+        # Bars as (open, high, low, close), the pattern is completed on the last bar
+        self.examples = {
+            CandlestickPattern.HAMMER: [(104, 104, 90, 103)],
+            CandlestickPattern.INVERTED_HAMMER: [(100, 115, 100, 101)],
+            CandlestickPattern.DOJI: [(100, 105, 95, 100.5)],
+            CandlestickPattern.BULLISH_ENGULFING: [(105, 106, 99, 100), (99, 108, 98, 107)],
+            CandlestickPattern.BEARISH_ENGULFING: [(100, 106, 99, 105), (106, 107, 98, 99)],
+            CandlestickPattern.BULLISH_HARAMI: [(110, 111, 99, 100), (102, 106, 101, 105)],
+            CandlestickPattern.BEARISH_HARAMI: [(100, 111, 99, 110), (108, 109, 103, 104)],
+            CandlestickPattern.MORNING_STAR: [(110, 111, 99, 100), (98, 99, 96, 97.5), (99, 108, 98, 107)],
+            CandlestickPattern.EVENING_STAR: [(100, 111, 99, 110), (112, 114, 111, 112.5), (111, 112, 102, 103)],
+        }
+
+    def test_detects_every_pattern(self):
+        for pattern, bars in self.examples.items():
+            with self.subTest(pattern=pattern):
+                # Act
+                result = candlestick_pattern(*candles(*bars), pattern=pattern)
+
+                # Assert
+                self.assertTrue(result.iloc[-1])
+                self.assertFalse(result.iloc[:-1].any())
+                self.assertEqual(result.name, f'{pattern.value}-CANDLESTICK-PATTERN')
+
+    def test_bitmask_combines_all_patterns(self):
+        # Arrange
+        high, low, open, close = (self.data[column] for column in ['High', 'Low', 'Open', 'Close'])
+
+        # Act
+        bitmask = scan_candlestick_patterns(high, low, open, close)
+
+        # Assert
+        self.assertEqual(bitmask.dtype, np.uint16)
+        expected = np.zeros(len(bitmask), dtype=np.uint16)
+        for pattern in CandlestickPattern:
+            occurrences = has_pattern(bitmask, pattern)
+            pd.testing.assert_series_equal(occurrences, candlestick_pattern(high, low, open, close, pattern))
+            expected |= np.where(occurrences, pattern_bit(pattern), 0).astype(np.uint16)
+        np.testing.assert_array_equal(bitmask.to_numpy(), expected)
+
+    def test_hammer_equals_original_definition(self):
+        # Arrange
+        high, low, open, close = (self.data[column] for column in ['High', 'Low', 'Open', 'Close'])
+        expected = ((open == high) | (close == high)) & (1.8 * np.abs(open - close) <= np.abs(np.minimum(close, open) - low))
+
+        # Act
+        result = candlestick_pattern(high, low, open, close, CandlestickPattern.HAMMER)
+
+        # Assert
+        np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+    def test_missing_prices_never_match(self):
+        # Arrange
+        bars = [(104, 104, 90, 103), (np.nan, np.nan, np.nan, np.nan)]
+
+        # Act
+        bitmask = scan_candlestick_patterns(*candles(*bars))
+
+        # Assert
+        self.assertEqual(bitmask.iloc[-1], 0)
+
+
+class TestCandlestickPatternSeries(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.downloader = DownloadModule(datetime(2020, 1, 1), datetime(2024, 1, 1), data_path=self.tmp_dir.name,
+                                         provider=SyntheticProvider(seed=5))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_pattern_series_share_one_scan(self):
+        # Arrange
+        df = self.downloader.download_ticker('AAPL')
+        series = [HAMMER('AAPL'), DOJI('AAPL'), BULLISH_ENGULFING('AAPL')]
+
+        # Act
+        with mock.patch.object(pattern_scanner, 'scan_candlestick_patterns',
+                               wraps=pattern_scanner.scan_candlestick_patterns) as scan:
+            with intermediate_store():
+                results = [trading_series.get_data(self.downloader, df.copy()) for trading_series in series]
+
+        # Assert
+        self.assertEqual(scan.call_count, 1)
+        for trading_series, result in zip(series, results):
+            expected = candlestick_pattern(df['High'], df['Low'], df['Open'], df['Close'], trading_series.pattern)
+            np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+            self.assertEqual(result.name, trading_series.get_name())
+
+    def test_names_and_dicts(self):
+        # Act
+        hammer_series = HAMMER('AAPL')
+        doji_series = DOJI('MSFT')
+
+        # Assert
+        self.assertEqual(hammer_series.get_name(), 'AAPL_HAMMER')
+        self.assertEqual(hammer_series.to_dict(), {'type': 'HAMMER', 'ticker': 'AAPL'})
+        self.assertEqual(doji_series.get_name(), 'MSFT_DOJI')
+        self.assertEqual(doji_series.to_dict(), {'type': 'DOJI', 'ticker': 'MSFT'})
+
+
+if __name__ == '__main__':
+    unittest.main()
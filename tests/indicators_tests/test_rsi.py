@@ -5,7 +5,7 @@ from datetime import datetime
 
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.source_enum import SourceType
-from trading_strategy_tester.indicators.momentum.rsi import rsi
+from trading_strategy_tester.indicators.momentum.rsi import rsi, rsi_batch
 from trading_strategy_tester.trading_series.rsi_series.rsi_series import RSI
 
 
@@ -104,6 +104,18 @@ class TestRSI(unittest.TestCase):
         calculated_rsi = rsi_series.get_data(self.downloader, pd.DataFrame()).tail(20).reset_index(drop=True).round(2)
         pd.testing.assert_series_equal(calculated_rsi, trading_view_rsi)
 
+    def test_rsi_batch_equals_rsi_for_every_length(self):
+        """
+        Test that the batch RSI of many lengths is equal to the RSI calculated for every length alone.
+        """
+        lengths = [2, 9, 14, 14, 50]
+
+        calculated_rsi = rsi_batch(self.data[SourceType.CLOSE.value], lengths)
+
+        self.assertEqual(list(calculated_rsi.columns), ['RSI_2', 'RSI_9', 'RSI_14', 'RSI_50'])
+        for length in lengths:
+            pd.testing.assert_series_equal(calculated_rsi[f'RSI_{length}'], rsi(self.data[SourceType.CLOSE.value], length))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
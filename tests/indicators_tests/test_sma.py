@@ -5,7 +5,7 @@ from datetime import datetime
 
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.source_enum import SourceType
-from trading_strategy_tester.indicators.overlap.sma import sma
+from trading_strategy_tester.indicators.overlap.sma import sma, sma_batch
 from trading_strategy_tester.trading_series.ma_series.sma_series import SMA
 
 
@@ -107,5 +107,22 @@ class TestSMA(unittest.TestCase):
         calculated_sma = sma_series.get_data(self.downloader, pd.DataFrame()).tail(20).reset_index(drop=True).round(2)
         pd.testing.assert_series_equal(calculated_sma, trading_view_sma)
 
+    def test_sma_batch_equals_sma_for_every_length(self):
+        """
+        Test that the batch SMA of many lengths matches the SMA calculated for every length alone.
+        """
+        lengths = [1, 9, 20, 200]
+        offset = 3
+
+        calculated_sma = sma_batch(self.data[SourceType.CLOSE.value], lengths, offset)
+
+        for length in lengths:
+            pd.testing.assert_series_equal(
+                calculated_sma[f'SMA_{length}_{offset}'],
+                sma(self.data[SourceType.CLOSE.value], length, offset),
+                rtol=1e-10
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,76 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.indicators.momentum.macd import macd, macd_signal
+from trading_strategy_tester.indicators.momentum.rsi import rsi
+from trading_strategy_tester.indicators.volatility.atr import atr
+from trading_strategy_tester.streaming.atr_state import ATRState
+from trading_strategy_tester.streaming.macd_state import MACDState
+from trading_strategy_tester.streaming.rsi_state import RSIState
+
+
+class TestIndicatorStates(unittest.TestCase):
+
+    def setUp(self):
+        script_dir = os.path.dirname(__file__)
+        data = pd.read_csv(os.path.join(script_dir, '..', 'testing_data', 'AAPL_testing_data.csv'))
+        self.high = data['High']
+        self.low = data['Low']
+        self.close = data['Close'].copy()
+        self.close.iloc[[100, 101, 500]] = np.nan
+        self.history_lengths = [0, 1, 5, 300, len(self.close) - 1]
+
+    def test_rsi_state_equals_rsi(self):
+        for history_length in self.history_lengths:
+            with self.subTest(history_length=history_length):
+                # Arrange
+                state = RSIState.from_history(self.close.iloc[:history_length], length=14)
+
+                # Act
+                result = np.array([state.update(price) for price in self.close.iloc[history_length:]])
+
+                # Assert
+                np.testing.assert_array_equal(result, rsi(self.close, 14).to_numpy()[history_length:])
+
+    def test_atr_state_equals_atr(self):
+        for smoothing in SmoothingType:
+            for history_length in self.history_lengths:
+                with self.subTest(smoothing=smoothing, history_length=history_length):
+                    # Arrange
+                    history = slice(None, history_length)
+                    state = ATRState.from_history(
+                        self.high.iloc[history], self.low.iloc[history], self.close.iloc[history], 14, smoothing
+                    )
+                    bars = zip(self.high.iloc[history_length:], self.low.iloc[history_length:],
+                               self.close.iloc[history_length:])
+
+                    # Act
+                    result = np.array([state.update(high, low, close) for high, low, close in bars])
+
+                    # Assert
+                    expected = atr(self.high, self.low, self.close, 14, smoothing).to_numpy()[history_length:]
+                    np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    def test_macd_state_equals_macd_and_signal(self):
+        for history_length in self.history_lengths:
+            with self.subTest(history_length=history_length):
+                # Arrange
+                state = MACDState.from_history(self.close.iloc[:history_length])
+                macd_result, signal_result = [], []
+
+                # Act
+                for price in self.close.iloc[history_length:]:
+                    macd_result.append(state.update(price))
+                    signal_result.append(state.signal)
+
+                # Assert
+                np.testing.assert_array_equal(macd_result, macd(self.close).to_numpy()[history_length:])
+                np.testing.assert_array_equal(signal_result, macd_signal(self.close).to_numpy()[history_length:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.smoothings.smooth import smooth
+from trading_strategy_tester.streaming.smoothing_states import SMAState, WMAState, smoothing_state
+
+
+class TestSmoothingStates(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        values = 100 + np.cumsum(rng.standard_normal(2000))
+        # Missing values at the start, in a run and at the end
+        values[[0, 1, 50, 51, 52, 700, 1999]] = np.nan
+        self.series = pd.Series(values)
+        self.lengths = [1, 2, 14, 50]
+
+    def assert_equal_to_batch(self, smoothing_type: SmoothingType, result: np.ndarray, expected: np.ndarray):
+        if smoothing_type in [SmoothingType.EMA, SmoothingType.RMA]:
+            np.testing.assert_array_equal(result, expected)
+        else:
+            np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    def test_updates_equal_batch_smoothing(self):
+        for smoothing_type in SmoothingType:
+            for length in self.lengths:
+                with self.subTest(smoothing_type=smoothing_type, length=length):
+                    # Arrange
+                    state = smoothing_state(length, smoothing_type)
+
+                    # Act
+                    result = np.array([state.update(value) for value in self.series])
+
+                    # Assert
+                    expected = smooth(self.series, length, smoothing_type).to_numpy()
+                    self.assert_equal_to_batch(smoothing_type, result, expected)
+
+    def test_warm_up_continues_like_batch_smoothing(self):
+        for smoothing_type in SmoothingType:
+            for history_length in [0, 1, 51, 1000]:
+                with self.subTest(smoothing_type=smoothing_type, history_length=history_length):
+                    # Arrange
+                    state = smoothing_state(14, smoothing_type, self.series.iloc[:history_length])
+
+                    # Act
+                    result = np.array([state.update(value) for value in self.series.iloc[history_length:]])
+
+                    # Assert
+                    expected = smooth(self.series, 14, smoothing_type).to_numpy()[history_length:]
+                    self.assert_equal_to_batch(smoothing_type, result, expected)
+
+    def test_running_sums_do_not_drift(self):
+        # Arrange
+        values = pd.Series(np.random.default_rng(2).uniform(1e6, 1e6 + 1, 50_000))
+        sma_state, wma_state = SMAState(7), WMAState(7)
+
+        # Act
+        sma_result = np.array([sma_state.update(value) for value in values])
+        wma_result = np.array([wma_state.update(value) for value in values])
+
+        # Assert
+        np.testing.assert_allclose(sma_result, smooth(values, 7, SmoothingType.SMA), rtol=1e-14, equal_nan=True)
+        np.testing.assert_allclose(wma_result, smooth(values, 7, SmoothingType.WMA), rtol=1e-14, equal_nan=True)
+
+    def test_states_have_no_instance_dictionary(self):
+        for smoothing_type in SmoothingType:
+            with self.subTest(smoothing_type=smoothing_type):
+                self.assertFalse(hasattr(smoothing_state(14, smoothing_type), '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.dataframe_provider import DataFrameProvider
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.indicators.momentum.rsi import rsi
+from trading_strategy_tester.indicators.trend.mass import mass_index
+from trading_strategy_tester.trading_series.default_series.close_series import CLOSE
+from trading_strategy_tester.trading_series import indicator_cache
+from trading_strategy_tester.trading_series.indicator_cache import IndicatorCache, fingerprint, shared_indicator_cache
+from trading_strategy_tester.trading_series.bb_series.bb_upper_series import BB_UPPER
+from trading_strategy_tester.trading_series.ma_series.sma_series import SMA
+from trading_strategy_tester.trading_series.mass_series.mass_series import MASS_INDEX
+from trading_strategy_tester.trading_series.rsi_series.rsi_series import RSI
+
+
+class TestIndicatorCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        script_dir = os.path.dirname(__file__)
+        data = pd.read_csv(
+            os.path.join(script_dir, '..', 'testing_data', 'AAPL_testing_data.csv'),
+            index_col='Date',
+            parse_dates=True
+        )
+        self.data = data[['Adj Close', 'Close', 'High', 'Low', 'Open', 'Volume']]
+        shared_indicator_cache.clear()
+
+    def tearDown(self):
+        shared_indicator_cache.clear()
+        self.tmp_dir.cleanup()
+
+    def create_downloader(self, data: pd.DataFrame) -> DownloadModule:
+        return DownloadModule(
+            start_date=datetime(2020, 1, 1),
+            end_date=datetime(2025, 1, 1),
+            data_path=self.tmp_dir.name,
+            provider=DataFrameProvider({'AAPL': data})
+        )
+
+    def test_equal_indicators_of_different_strategies_are_computed_once(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+        first_df = downloader.download_ticker('AAPL')
+        second_df = downloader.download_ticker('AAPL')
+
+        # Act
+        with patch('trading_strategy_tester.trading_series.rsi_series.rsi_series.rsi', wraps=rsi) as rsi_mock:
+            first_series = RSI('AAPL', length=14).get_data(downloader, first_df)
+            second_series = RSI('AAPL', length=14).get_data(downloader, second_df)
+
+        # Assert
+        self.assertEqual(rsi_mock.call_count, 1)
+        pd.testing.assert_series_equal(first_series, second_series)
+        pd.testing.assert_series_equal(first_df['AAPL_RSI_Close_14'], second_df['AAPL_RSI_Close_14'])
+        self.assertEqual(shared_indicator_cache.stats()['hits'], 1)
+
+    def test_different_parameters_or_data_are_computed_again(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+        changed_data = self.data.copy()
+        changed_data.iloc[-1, changed_data.columns.get_loc('Close')] += 1
+        changed_downloader = self.create_downloader(changed_data)
+
+        # Act
+        with patch('trading_strategy_tester.trading_series.rsi_series.rsi_series.rsi', wraps=rsi) as rsi_mock:
+            RSI('AAPL', length=14).get_data(downloader, downloader.download_ticker('AAPL'))
+            RSI('AAPL', length=9).get_data(downloader, downloader.download_ticker('AAPL'))
+            RSI('AAPL', length=14).get_data(changed_downloader, changed_downloader.download_ticker('AAPL'))
+
+        # Assert
+        self.assertEqual(rsi_mock.call_count, 3)
+
+    def test_mass_index_is_served_from_the_cache(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+        first_df = downloader.download_ticker('AAPL')
+        second_df = downloader.download_ticker('AAPL')
+        expected = mass_index(high=first_df['High'], low=first_df['Low'], length=10)
+
+        # Act
+        with patch('trading_strategy_tester.trading_series.mass_series.mass_series.mass_index',
+                   wraps=mass_index) as mass_index_mock:
+            first_series = MASS_INDEX('AAPL').get_data(downloader, first_df)
+            second_series = MASS_INDEX('AAPL').get_data(downloader, second_df)
+
+        # Assert
+        self.assertEqual(mass_index_mock.call_count, 1)
+        self.assertEqual(shared_indicator_cache.stats()['hits'], 1)
+        pd.testing.assert_series_equal(first_series, expected, check_names=False)
+        pd.testing.assert_series_equal(second_series, first_series)
+
+    def test_cached_result_is_not_changed_by_callers(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+        first_series = RSI('AAPL').get_data(downloader, downloader.download_ticker('AAPL'))
+        expected_series = first_series.copy()
+
+        # Act
+        first_series.iloc[:] = 0
+        second_series = RSI('AAPL').get_data(downloader, downloader.download_ticker('AAPL'))
+
+        # Assert
+        pd.testing.assert_series_equal(second_series, expected_series)
+
+    def test_not_cacheable_series_are_not_cached(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+
+        # Act
+        CLOSE('AAPL').get_data(downloader, downloader.download_ticker('AAPL'))
+
+        # Assert
+        self.assertEqual(shared_indicator_cache.stats()['entries'], 0)
+
+    def test_lru_eviction_spills_to_disk(self):
+        # Arrange
+        cache = IndicatorCache(max_bytes=10_000, spill_path=os.path.join(self.tmp_dir.name, 'spill'))
+        first_series = pd.Series(range(1000), dtype=float)
+        second_series = pd.Series(range(1000, 2000), dtype=float)
+
+        # Act
+        cache.put('first', (first_series, {}))
+        cache.put('second', (second_series, {}))
+        spilled_entry = cache.get('first')
+
+        # Assert
+        pd.testing.assert_series_equal(spilled_entry[0], first_series)
+        self.assertEqual(cache.stats()['entries'], 1)
+        self.assertIsNone(IndicatorCache(max_bytes=10_000).get('first'))
+
+    def test_frame_with_column_is_not_hashed_again(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+        df = downloader.download_ticker('AAPL')
+        expected = SMA('AAPL', length=20).get_data(downloader, df)
+
+        # Act
+        with patch.object(indicator_cache, 'fingerprint', wraps=fingerprint) as fingerprint_mock:
+            result = SMA('AAPL', length=20).get_data(downloader, df)
+
+        # Assert
+        fingerprint_mock.assert_not_called()
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_downloaded_frame_is_hashed_once(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+
+        # Act
+        with patch.object(indicator_cache, 'fingerprint', wraps=fingerprint) as fingerprint_mock:
+            RSI('AAPL', length=14).get_data(downloader, downloader.download_ticker('AAPL'))
+            SMA('AAPL', length=20).get_data(downloader, downloader.download_ticker('AAPL'))
+            RSI('AAPL', length=9).get_data(downloader, downloader.download_ticker('AAPL'))
+
+        # Assert
+        self.assertEqual(fingerprint_mock.call_count, 2)  # The downloaded data and its index
+
+    def test_fingerprint_depends_on_values_and_index(self):
+        # Arrange
+        shifted_data = self.data.copy()
+        shifted_data.index = shifted_data.index + pd.Timedelta(days=1)
+
+        # Act & Assert
+        self.assertEqual(fingerprint(self.data), fingerprint(self.data.copy()))
+        self.assertNotEqual(fingerprint(self.data), fingerprint(shifted_data))
+        self.assertNotEqual(fingerprint(self.data), fingerprint(self.data * 2))
+
+    def test_batch_series_read_their_slice_of_the_batch(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+        lengths = [2, 14, 30]
+
+        # Act
+        with patch('trading_strategy_tester.trading_series.rsi_series.rsi_series.rsi', wraps=rsi) as rsi_mock:
+            batch_series = RSI.batch(downloader, 'AAPL', lengths=lengths)
+            results = [series.get_data(downloader, downloader.download_ticker('AAPL')) for series in batch_series]
+
+        # Assert
+        self.assertEqual(rsi_mock.call_count, 0)
+        self.assertEqual([series.length for series in batch_series], lengths)
+        for series, result in zip(batch_series, results):
+            expected = rsi(self.data['Close'], series.length)
+            pd.testing.assert_series_equal(result, expected.rename(series.get_name()), check_freq=False)
+
+    def test_batch_bands_match_single_computation(self):
+        # Arrange
+        downloader = self.create_downloader(self.data)
+        batch_series = BB_UPPER.batch(downloader, 'AAPL', lengths=[10, 20], std_devs=[1.5, 2])
+        batch_results = [series.get_data(downloader, downloader.download_ticker('AAPL')) for series in batch_series]
+
+        # Act
+        shared_indicator_cache.clear()
+        single_results = [series.get_data(downloader, downloader.download_ticker('AAPL')) for series in batch_series]
+
+        # Assert
+        self.assertEqual(len(batch_series), 4)
+        for batch_result, single_result in zip(batch_results, single_results):
+            pd.testing.assert_series_equal(batch_result, single_result, rtol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
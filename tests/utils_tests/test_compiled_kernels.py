@@ -0,0 +1,155 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.backend_enum import Backend
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.indicators.momentum.rsi import rsi
+from trading_strategy_tester.smoothings.smooth import smooth
+from trading_strategy_tester.utils import compiled_kernels
+from trading_strategy_tester.utils.compiled_kernels import (
+    _ewm_mean_loop,
+    _window_extrema_loop,
+    ewm_mean,
+    get_backend,
+    numba_available,
+    set_backend,
+    window_extrema_positions,
+    window_extrema_positions_at
+)
+
+
+class TestCompiledKernels(unittest.TestCase):
+    """
+    Compares the loops of the compiled backend with pandas. The loops are run as plain Python without Numba.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        values = 100 + np.cumsum(rng.standard_normal(800))
+        # Leading, single and repeated missing values and a constant part
+        values[:3] = np.nan
+        values[[50, 400, 401, 402]] = np.nan
+        values[600:620] = 90.0
+        self.series = pd.Series(values, index=pd.date_range('2020-01-01', periods=800), name='Close')
+        self.panel = pd.DataFrame({'A': values, 'B': values[::-1], 'C': 2 * values})
+
+    def tearDown(self):
+        set_backend(Backend.NUMPY)
+
+    def test_ewm_mean_loop_equals_pandas(self):
+        for com in [0.5, 4, 13, (1 - 1 / 14) / (1 / 14)]:
+            for min_periods in [0, 1, 14]:
+                with self.subTest(com=com, min_periods=min_periods):
+                    # Arrange
+                    expected = self.panel.ewm(com=com, adjust=False, min_periods=min_periods).mean()
+
+                    # Act
+                    result = _ewm_mean_loop(self.panel.to_numpy(), com, min_periods)
+
+                    # Assert
+                    np.testing.assert_array_equal(result, expected.to_numpy())
+
+    def test_smoothings_with_loop_equal_numpy_backend(self):
+        # Arrange
+        expected = {smoothing: smooth(self.series, 14, smoothing) for smoothing in SmoothingType}
+        expected_panel = smooth(self.panel, 9, SmoothingType.EMA)
+        expected_rsi = rsi(self.series, 14)
+
+        # Act
+        with mock.patch.object(compiled_kernels, 'numba', object()), \
+                mock.patch.object(compiled_kernels, '_compiled_ewm_mean', _ewm_mean_loop):
+            self.assertEqual(set_backend(Backend.NUMBA), Backend.NUMBA)
+            result = {smoothing: smooth(self.series, 14, smoothing) for smoothing in SmoothingType}
+            result_panel = smooth(self.panel, 9, SmoothingType.EMA)
+            result_rsi = rsi(self.series, 14)
+
+        # Assert
+        for smoothing in SmoothingType:
+            pd.testing.assert_series_equal(result[smoothing], expected[smoothing])
+        pd.testing.assert_frame_equal(result_panel, expected_panel)
+        pd.testing.assert_series_equal(result_rsi, expected_rsi)
+
+    def test_numba_backend_falls_back_without_numba(self):
+        # Act
+        with mock.patch.object(compiled_kernels, 'numba', None):
+            backend = set_backend(Backend.NUMBA)
+
+        # Assert
+        self.assertEqual(backend, Backend.NUMPY)
+        self.assertEqual(get_backend(), Backend.NUMPY)
+
+    def test_window_extrema_loop_equals_argmin(self):
+        # Arrange
+        rng = np.random.default_rng(4)
+        first = np.round(rng.normal(0, 3, 300))
+        second = np.round(rng.normal(0, 3, 300))
+        first[[10, 11, 150]] = np.nan
+        second[[12, 151, 152]] = np.nan
+        length = 7
+
+        # Act
+        first_positions, second_positions = _window_extrema_loop(first, second, length)
+
+        # Assert
+        np.testing.assert_array_equal(first_positions[:length], -1)
+        for bar in range(length, len(first)):
+            start = bar - length
+            expected_first = int(np.nanargmin(first[start:bar]))
+            window = second[start + expected_first:bar]
+            expected_second = int(np.nanargmin(window)) + expected_first if not np.isnan(window).all() else -1
+
+            self.assertEqual(first_positions[bar], expected_first if expected_second != -1 else -1)
+            self.assertEqual(second_positions[bar], expected_second)
+
+    def test_window_extrema_positions_at_equals_loop(self):
+        # Arrange
+        rng = np.random.default_rng(5)
+        first = rng.integers(0, 4, 200).astype(float)  # Many ties
+        second = rng.integers(0, 4, 200).astype(float)
+        first[[20, 21, 22, 23, 24, 25, 26, 90]] = np.nan
+        second[[27, 28, 91, 92]] = np.nan
+        rows = np.sort(rng.choice(200, 60, replace=False))
+
+        for length in [0, 1, 7, 30]:
+            with self.subTest(length=length):
+                expected_first, expected_second = _window_extrema_loop(first, second, length)
+
+                # Act
+                first_positions, second_positions = window_extrema_positions_at(first, second, length, rows)
+
+                # Assert
+                np.testing.assert_array_equal(first_positions, expected_first[rows])
+                np.testing.assert_array_equal(second_positions, expected_second[rows])
+
+    def test_window_extrema_positions_with_loop_equal_numpy_backend(self):
+        # Arrange
+        values = self.series.to_numpy()
+        expected = window_extrema_positions(values, -values, 14)
+
+        # Act
+        with mock.patch.object(compiled_kernels, 'numba', object()), \
+                mock.patch.object(compiled_kernels, '_compiled_window_extrema', _window_extrema_loop):
+            set_backend(Backend.NUMBA)
+            result = window_extrema_positions(values, -values, 14)
+
+        # Assert
+        np.testing.assert_array_equal(result[0], expected[0])
+        np.testing.assert_array_equal(result[1], expected[1])
+
+    @unittest.skipUnless(numba_available(), 'Numba is not installed')
+    def test_compiled_ewm_mean_equals_pandas(self):
+        # Arrange
+        expected = self.series.ewm(com=6.5, adjust=False, min_periods=14).mean()
+
+        # Act
+        result = ewm_mean(self.series, com=6.5, min_periods=14)
+
+        # Assert
+        pd.testing.assert_series_equal(result, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from trading_strategy_tester.download.synthetic_data import generate_ohlcv_arrays
+from trading_strategy_tester.indicators.momentum.dmi import di_minus, di_plus
+from trading_strategy_tester.indicators.momentum.kst import kst, kst_signal
+from trading_strategy_tester.indicators.momentum.macd import macd, macd_signal
+from trading_strategy_tester.indicators.trend.adx import adx
+from trading_strategy_tester.indicators.volatility.bb import bb_lower, bb_upper
+from trading_strategy_tester.indicators.volatility.chop import chop
+from trading_strategy_tester.utils.intermediate_store import (
+    IntermediateStore,
+    intermediate_store,
+    shared_intermediate
+)
+
+
+class TestIntermediateStore(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame(generate_ohlcv_arrays(500, seed=3))
+
+    def test_result_is_computed_once_per_key(self):
+        # Arrange
+        compute = mock.Mock(return_value=pd.Series([1.0, 2.0]))
+
+        # Act
+        with intermediate_store() as store:
+            first = shared_intermediate('name', (self.df['Close'],), (14,), compute)
+            second = shared_intermediate('name', (self.df['Close'],), (14,), compute)
+            other_parameters = shared_intermediate('name', (self.df['Close'],), (9,), compute)
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertEqual(compute.call_count, 2)
+        self.assertEqual((store.hits, store.misses, len(store)), (1, 2, 2))
+        self.assertIs(other_parameters, compute.return_value)
+
+    def test_shallow_copies_share_results(self):
+        # Arrange
+        compute = mock.Mock(return_value=pd.Series([1.0]))
+
+        # Act
+        with intermediate_store():
+            shared_intermediate('name', (self.df['Close'],), (), compute)
+            shared_intermediate('name', (self.df.copy(deep=False)['Close'],), (), compute)
+            shared_intermediate('name', (pd.Series(self.df['Close'], name='Renamed'),), (), compute)
+            shared_intermediate('name', (self.df['Close'].copy(),), (), compute)
+
+        # Assert
+        self.assertEqual(compute.call_count, 2)
+
+    def test_without_store_every_call_computes(self):
+        # Arrange
+        compute = mock.Mock(return_value=pd.Series([1.0]))
+
+        # Act
+        shared_intermediate('name', (self.df['Close'],), (), compute)
+        shared_intermediate('name', (self.df['Close'],), (), compute)
+
+        # Assert
+        self.assertEqual(compute.call_count, 2)
+
+    def test_nested_contexts_reuse_active_store(self):
+        # Arrange
+        explicit_store = IntermediateStore()
+
+        # Act
+        with intermediate_store() as outer:
+            with intermediate_store() as inner:
+                reused = inner
+            with intermediate_store(explicit_store) as explicit:
+                replaced = explicit
+
+        # Assert
+        self.assertIs(reused, outer)
+        self.assertIs(replaced, explicit_store)
+
+    def test_clear(self):
+        # Arrange
+        store = IntermediateStore()
+        store.get_or_compute('name', (self.df['Close'],), (), lambda: 1)
+
+        # Act
+        store.clear()
+
+        # Assert
+        self.assertEqual((store.hits, store.misses, len(store)), (0, 0, 0))
+
+    def test_directional_indicators_compute_directional_movement_once(self):
+        # Arrange
+        high, low, close = self.df['High'], self.df['Low'], self.df['Close']
+        expected = [di_plus(high, low, close), di_minus(high, low, close), adx(high, low, close)]
+
+        # Act
+        with mock.patch.object(pd.Series, 'diff', autospec=True, side_effect=pd.Series.diff) as diff:
+            with intermediate_store():
+                result = [di_plus(high, low, close), di_minus(high, low, close), adx(high, low, close)]
+
+        # Assert
+        self.assertEqual(diff.call_count, 2)
+        for expected_series, result_series in zip(expected, result):
+            pd.testing.assert_series_equal(result_series, expected_series)
+
+    def test_bollinger_bands_compute_standard_deviation_once(self):
+        # Arrange
+        close = self.df['Close']
+        expected = [bb_upper(close), bb_lower(close)]
+
+        # Act
+        with mock.patch.object(pd.Series, 'rolling', autospec=True, side_effect=pd.Series.rolling) as rolling:
+            bb_upper(close)
+            single_band_calls = rolling.call_count
+            rolling.reset_mock()
+
+            with intermediate_store():
+                result = [bb_upper(close), bb_lower(close)]
+
+        # Assert
+        self.assertEqual(rolling.call_count, single_band_calls)
+        for expected_series, result_series in zip(expected, result):
+            pd.testing.assert_series_equal(result_series, expected_series)
+
+    def test_shared_results_equal_direct_results(self):
+        # Arrange
+        high, low, close = self.df['High'], self.df['Low'], self.df['Close']
+        indicators = [
+            lambda: macd(close),
+            lambda: macd_signal(close),
+            lambda: kst(close),
+            lambda: kst_signal(close),
+            lambda: chop(high, low, close),
+        ]
+        expected = [indicator() for indicator in indicators]
+
+        # Act
+        with intermediate_store():
+            result = [indicator() for indicator in indicators]
+
+        # Assert
+        for expected_series, result_series in zip(expected, result):
+            pd.testing.assert_series_equal(result_series, expected_series)
+
+
+if __name__ == '__main__':
+    unittest.main()
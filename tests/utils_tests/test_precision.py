@@ -0,0 +1,160 @@
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester import indicators
+from trading_strategy_tester.download.data_providers.synthetic_provider import SyntheticProvider
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.download.synthetic_data import generate_ohlcv_arrays
+from trading_strategy_tester.enums.precision_enum import Precision
+from trading_strategy_tester.trading_series.rsi_series.rsi_series import RSI
+from trading_strategy_tester.utils.precision import to_float64, to_precision
+
+# Largest allowed difference between float32 and float64 results, relative to the largest absolute value
+PRICE_TOLERANCE = 1e-6  # Moving averages, bands and channels on the price scale
+OSCILLATOR_TOLERANCE = 1e-5  # Oscillators, price differences and ratios of prices
+VOLUME_TOLERANCE = 1e-4  # Indicators weighted by volume
+
+
+class TestFloat32Accuracy(unittest.TestCase):
+    """
+    The accuracy of indicators calculated from float32 data, compared with the same indicators
+    calculated from float64 data. The tolerances are the ones documented for the FLOAT32 precision.
+    """
+
+    def setUp(self):
+        self.df = pd.DataFrame(generate_ohlcv_arrays(2000, seed=7), index=pd.date_range('2015-01-01', periods=2000))
+        self.df32 = to_precision(self.df, Precision.FLOAT32)
+
+        self.indicators = {
+            PRICE_TOLERANCE: {
+                'sma': lambda df: indicators.sma(df['Close'], 9),
+                'ema': lambda df: indicators.ema(df['Close'], 9),
+                'bb_upper': lambda df: indicators.bb_upper(df['Close']),
+                'bb_lower': lambda df: indicators.bb_lower(df['Close']),
+                'dc_basis': lambda df: indicators.dc_basis(df['High'], df['Low']),
+                'kc': lambda df: indicators.kc(df['High'], df['Low'], df['Close'], df['Close']),
+                'base_line': lambda df: indicators.base_line(df['High'], df['Low']),
+                'leading_span_b': lambda df: indicators.leading_span_b(df['High'], df['Low']),
+            },
+            OSCILLATOR_TOLERANCE: {
+                'rsi': lambda df: indicators.rsi(df['Close']),
+                'macd': lambda df: indicators.macd(df['Close']),
+                'macd_signal': lambda df: indicators.macd_signal(df['Close']),
+                'atr': lambda df: indicators.atr(df['High'], df['Low'], df['Close']),
+                'adx': lambda df: indicators.adx(df['High'], df['Low'], df['Close']),
+                'di_plus': lambda df: indicators.di_plus(df['High'], df['Low'], df['Close']),
+                'cci': lambda df: indicators.cci(df['Close']),
+                'cmo': lambda df: indicators.cmo(df['Close']),
+                'percent_k': lambda df: indicators.percent_k(df['Close'], df['Low'], df['High']),
+                'roc': lambda df: indicators.roc(df['Close']),
+                'kst': lambda df: indicators.kst(df['Close']),
+                'trix': lambda df: indicators.trix(df['Close']),
+                'chop': lambda df: indicators.chop(df['High'], df['Low'], df['Close']),
+                'mass_index': lambda df: indicators.mass_index(df['High'], df['Low']),
+            },
+            VOLUME_TOLERANCE: {
+                'obv': lambda df: indicators.obv(df['Close'], df['Volume']),
+                'pvi': lambda df: indicators.pvi(df['Close'], df['Volume']),
+                'pvt': lambda df: indicators.pvt(df['Close'], df['Volume']),
+                'efi': lambda df: indicators.efi(df['Close'], df['Volume']),
+                'cmf': lambda df: indicators.cmf(df['High'], df['Low'], df['Close'], df['Volume']),
+                'chaikin_osc': lambda df: indicators.chaikin_osc(df['High'], df['Low'], df['Close'], df['Volume']),
+            },
+        }
+
+    def test_indicators_of_float32_data_within_tolerance(self):
+        for tolerance, group in self.indicators.items():
+            for name, indicator in group.items():
+                with self.subTest(indicator=name):
+                    # Act
+                    expected = indicator(self.df).to_numpy(dtype=float)
+                    result = indicator(self.df32).to_numpy(dtype=float)
+
+                    # Assert
+                    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+                    np.testing.assert_allclose(result, expected, rtol=0,
+                                               atol=tolerance * np.nanmax(np.abs(expected)), equal_nan=True)
+
+    def test_cumulative_indicators_accumulate_in_float64(self):
+        # Act
+        result = indicators.pvt(self.df32['Close'], self.df32['Volume'])
+
+        # Assert
+        self.assertEqual(result.dtype, np.float64)
+
+
+class TestPrecision(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'Close': [1.5, 2.5, 3.5],
+            'Volume': [100, 200, 300],
+            'Signal': [True, False, True],
+            'Label': ['a', 'b', 'c'],
+        })
+
+    def test_to_precision_float32_converts_numeric_columns(self):
+        # Act
+        result = to_precision(self.df, Precision.FLOAT32)
+
+        # Assert
+        self.assertEqual(list(result.dtypes), [np.float32, np.float32, np.bool_, object])
+
+    def test_to_precision_float64_returns_data_unchanged(self):
+        # Act
+        result = to_precision(self.df, Precision.FLOAT64)
+
+        # Assert
+        self.assertIs(result, self.df)
+
+    def test_to_float64_converts_only_float32(self):
+        # Arrange
+        df32 = to_precision(self.df, Precision.FLOAT32)
+
+        # Act
+        result = to_float64(df32)
+
+        # Assert
+        self.assertEqual(list(result.dtypes), [np.float64, np.float64, np.bool_, object])
+        self.assertIs(to_float64(self.df), self.df)
+
+    def test_download_module_returns_float32_frames(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Arrange
+            provider = SyntheticProvider(seed=3)
+            downloader64 = DownloadModule(datetime(2020, 1, 1), datetime(2022, 1, 1), data_path=tmp_dir,
+                                          provider=provider)
+            downloader32 = DownloadModule(datetime(2020, 1, 1), datetime(2022, 1, 1), data_path=tmp_dir,
+                                          provider=provider, precision=Precision.FLOAT32)
+
+            # Act
+            df64 = downloader64.download_ticker('AAPL')
+            df32 = downloader32.download_ticker('AAPL')
+
+        # Assert
+        self.assertTrue((df32.dtypes == np.float32).all())
+        self.assertTrue((df64.dtypes != np.float32).all())
+        pd.testing.assert_frame_equal(df32, to_precision(df64, Precision.FLOAT32))
+
+    def test_trading_series_keep_float32(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Arrange
+            downloader = DownloadModule(datetime(2020, 1, 1), datetime(2022, 1, 1), data_path=tmp_dir,
+                                        provider=SyntheticProvider(seed=3), precision=Precision.FLOAT32)
+            df = downloader.download_ticker('AAPL')
+            series = RSI('AAPL', length=14)
+
+            # Act
+            result = series.get_data(downloader, df)
+
+        # Assert
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(df[series.get_name()].dtype, np.float32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.utils.rolling_kernels import (
+    rolling_bars_since_max,
+    rolling_bars_since_min,
+    rolling_mean_absolute_deviation,
+    rolling_mean_batch,
+    rolling_wma,
+    trend_for_window
+)
+
+
+class TestRollingKernels(unittest.TestCase):
+    """
+    Compares the kernels with the `rolling(...).apply(...)` implementations they replaced.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # Rounded values create ties, NaN values create invalid windows
+        values = np.round(100 + np.cumsum(rng.standard_normal(3000)), 1)
+        values[[5, 500, 501, 1700]] = np.nan
+        self.series = pd.Series(values)
+        self.windows = [1, 2, 3, 9, 14, 21, 50]
+
+    def test_rolling_wma(self):
+        for window in self.windows:
+            with self.subTest(window=window):
+                # Arrange
+                weights = np.arange(1, window + 1)
+                expected = self.series.rolling(window=window).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
+
+                # Act
+                result = rolling_wma(self.series.to_numpy(), window)
+
+                # Assert
+                np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-12, atol=1e-12, equal_nan=True)
+
+    def test_rolling_mean_absolute_deviation(self):
+        for window in self.windows:
+            with self.subTest(window=window):
+                # Arrange
+                expected = self.series.rolling(window=window).apply(lambda x: np.mean(np.abs(x - np.mean(x))), raw=True)
+
+                # Act
+                result = rolling_mean_absolute_deviation(self.series.to_numpy(), window)
+
+                # Assert
+                np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-9, atol=1e-12, equal_nan=True)
+
+    def test_rolling_bars_since_extrema(self):
+        for window in self.windows:
+            with self.subTest(window=window):
+                # Arrange
+                expected_max = self.series.rolling(window=window).apply(lambda x: x[::-1].argmax(), raw=True)
+                expected_min = self.series.rolling(window=window).apply(lambda x: x[::-1].argmin(), raw=True)
+
+                # Act
+                result_max = rolling_bars_since_max(self.series.to_numpy(), window)
+                result_min = rolling_bars_since_min(self.series.to_numpy(), window)
+
+                # Assert
+                np.testing.assert_array_equal(result_max, expected_max.to_numpy())
+                np.testing.assert_array_equal(result_min, expected_min.to_numpy())
+
+    def test_trend_for_window(self):
+        # Arrange
+        flat_series = pd.Series([1.0, 1.0, 2.0, 2.0, 1.0, np.nan, 3.0, 4.0, 4.0, 5.0, 6.0])
+
+        for series in [self.series, flat_series]:
+            for window in [0, *self.windows]:
+                with self.subTest(window=window, length=len(series)):
+                    # Arrange
+                    expected_up = series.rolling(window=window).apply(
+                        lambda x: (x.diff().fillna(0) >= 0).all(), raw=False
+                    ).fillna(0).astype(bool)
+                    expected_down = series.rolling(window=window).apply(
+                        lambda x: (x.diff().fillna(0) <= 0).all(), raw=False
+                    ).fillna(0).astype(bool)
+
+                    # Act
+                    result_up = trend_for_window(series.to_numpy(), window, uptrend=True)
+                    result_down = trend_for_window(series.to_numpy(), window, uptrend=False)
+
+                    # Assert
+                    np.testing.assert_array_equal(result_up, expected_up.to_numpy())
+                    np.testing.assert_array_equal(result_down, expected_down.to_numpy())
+
+    def test_windows_longer_than_values(self):
+        # Act
+        result = rolling_wma(np.arange(3, dtype=float), 5)
+        trend = trend_for_window(np.arange(3, dtype=float), 5)
+
+        # Assert
+        self.assertTrue(np.isnan(result).all())
+        self.assertFalse(trend.any())
+
+    def test_non_positive_window_raises_value_error(self):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            rolling_wma(np.arange(3, dtype=float), 0)
+
+    def test_rolling_mean_batch(self):
+        # Act
+        result = rolling_mean_batch(self.series.to_numpy(), self.windows)
+
+        # Assert
+        self.assertEqual(result.shape, (len(self.series), len(self.windows)))
+        for column, window in enumerate(self.windows):
+            with self.subTest(window=window):
+                expected = self.series.rolling(window=window).mean().to_numpy()
+                np.testing.assert_allclose(result[:, column], expected, rtol=1e-10, atol=1e-9, equal_nan=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
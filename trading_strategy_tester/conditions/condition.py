@@ -1,7 +1,60 @@
+import functools
+import json
+
+import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
+from trading_strategy_tester.utils.intermediate_store import active_intermediate_store, shared_intermediate
+
+# Candidate rows of a logical condition are evaluated with `evaluate_labels_at` up to this fraction of all rows
+SPARSE_ROWS_FRACTION = 0.1
+
+
+def node_key(node) -> str:
+    """
+    Returns the key identifying a condition or trading series in a condition tree.
+
+    The key combines the class, the `to_dict()` description and the string representation (the name of
+    a trading series), so equal nodes of different trees have the same key and are evaluated once.
+
+    :param node: The condition or trading series.
+    :type node: Condition | TradingSeries
+    :return: The key of the node.
+    :rtype: str
+    """
+    description = node.to_string() if isinstance(node, Condition) else node.get_name()
+
+    return json.dumps([type(node).__name__, node.to_dict(), description], sort_keys=True, default=str)
+
+
+def shared_evaluate(evaluate, name: str):
+    """
+    Wraps the `evaluate` or `evaluate_labels` method of a condition, so equal conditions are evaluated
+    once per frame.
+
+    While an intermediate store is active, the result is stored under the key of the condition and the
+    frame, and every equal condition evaluated on the same frame gets the stored result. Without an
+    active store the method runs unchanged.
+
+    :param evaluate: The method to wrap.
+    :type evaluate: Callable
+    :param name: The name of the stored results, different for each wrapped method.
+    :type name: str
+    :return: The wrapped method.
+    :rtype: Callable
+    """
+
+    @functools.wraps(evaluate)
+    def wrapper(self, downloader: DownloadModule, df: pd.DataFrame) -> tuple:
+        if active_intermediate_store() is None:
+            return evaluate(self, downloader, df)
+
+        return shared_intermediate(name, (df,), (node_key(self),), lambda: evaluate(self, downloader, df))
+
+    return wrapper
 
 
 class Condition(ABC):
@@ -15,8 +68,26 @@ class Condition(ABC):
     - `evaluate`
     - `get_graphs`
     - `to_string`
+
+    Conditions can also implement `evaluate_labels`, which returns the signals as `SignalLabels` codes
+    instead of strings. Logical conditions combine the codes of their conditions, and the strings are
+    built only when the signals are turned into a Series.
+
+    Every implementation of `evaluate` and `evaluate_labels` is wrapped by `shared_evaluate`, so conditions
+    that appear several times in the buy and sell trees are evaluated once (see `ConditionPlan`).
     """
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Wraps the `evaluate` and `evaluate_labels` methods of every concrete subclass with `shared_evaluate`.
+        """
+        super().__init_subclass__(**kwargs)
+
+        for method in ['evaluate', 'evaluate_labels']:
+            evaluate = cls.__dict__.get(method)
+            if evaluate is not None and not getattr(evaluate, '__isabstractmethod__', False):
+                setattr(cls, method, shared_evaluate(evaluate, f'condition_{method}'))
+
     @abstractmethod
     def evaluate(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, pd.Series):
         """
@@ -34,6 +105,81 @@ class Condition(ABC):
         """
         pass
 
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition and return its signals as label codes.
+
+        The default implementation converts the signal Series of `evaluate`. Conditions override it to
+        return the codes without building a string for every row.
+
+        :param downloader: The module responsible for downloading and providing market data.
+        :type downloader: DownloadModule
+        :param df: The dataframe containing relevant market data (e.g., price, volume, indicators).
+        :type df: pd.DataFrame
+        :return: The result Series of the condition and its signals.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        result, signal_series = self.evaluate(downloader, df)
+
+        return result, SignalLabels.from_series(signal_series)
+
+    def evaluate_labels_at(self, downloader: DownloadModule, df: pd.DataFrame,
+                           rows: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition for the given rows only.
+
+        The result and the signals of the given rows are the same as from `evaluate_labels`, the other rows
+        can have any values. Conditions that evaluate a few rows faster than all rows override it, the default
+        implementation evaluates all rows.
+
+        :param downloader: The module responsible for downloading and providing market data.
+        :type downloader: DownloadModule
+        :param df: The dataframe containing relevant market data (e.g., price, volume, indicators).
+        :type df: pd.DataFrame
+        :param rows: The positions of the evaluated rows.
+        :type rows: np.ndarray
+        :return: The result Series of the condition and its signals.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        return self.evaluate_labels(downloader, df)
+
+    def evaluate_candidates(self, downloader: DownloadModule, df: pd.DataFrame,
+                            candidates: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition for the candidate rows of a logical condition.
+
+        Sparse candidates are evaluated with `evaluate_labels_at`. Otherwise all rows are evaluated with
+        `evaluate_labels`, whose result is shared with equal conditions (see `ConditionPlan`).
+
+        :param downloader: The module responsible for downloading and providing market data.
+        :type downloader: DownloadModule
+        :param df: The dataframe containing relevant market data (e.g., price, volume, indicators).
+        :type df: pd.DataFrame
+        :param candidates: A boolean mask of the rows whose result is needed.
+        :type candidates: np.ndarray
+        :return: The result Series of the condition and its signals, exact for the candidate rows.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        rows = np.flatnonzero(candidates)
+
+        if len(rows) <= SPARSE_ROWS_FRACTION * len(candidates):
+            return self.evaluate_labels_at(downloader, df, rows)
+
+        return self.evaluate_labels(downloader, df)
+
+    def evaluation_cost(self) -> float:
+        """
+        Returns the estimated cost of evaluating the condition on all rows, relative to other conditions.
+
+        Logical conditions evaluate cheaper conditions first, so the expensive ones are skipped or evaluated
+        only for the rows the cheaper ones leave. A cost of 1 is about one vectorized comparison of two
+        series. The trading series are not counted, because each is calculated once and shared.
+
+        :return: The estimated cost.
+        :rtype: float
+        """
+        return 1
+
     @abstractmethod
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
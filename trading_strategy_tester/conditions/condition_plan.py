@@ -0,0 +1,232 @@
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.conditions.condition import Condition, node_key
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.trading_series.trading_series import TradingSeries
+from trading_strategy_tester.utils.intermediate_store import intermediate_store
+
+
+class PlanNode:
+    """
+    A unique condition or trading series of a `ConditionPlan`.
+    """
+
+    def __init__(self, key: str, node: Condition | TradingSeries, children: list[str]):
+        """
+        :param key: The key of the node, see `node_key`.
+        :type key: str
+        :param node: The first condition or trading series found with this key.
+        :type node: Condition | TradingSeries
+        :param children: The keys of the conditions and trading series the node is built from.
+        :type children: list[str]
+        """
+        self.key = key
+        self.node = node
+        self.children = children
+        self.references = 1  # How many times the node appears in the trees
+
+    @property
+    def kind(self) -> str:
+        """
+        Returns 'condition' for conditions and 'series' for trading series.
+
+        :return: The kind of the node.
+        :rtype: str
+        """
+        return 'condition' if isinstance(self.node, Condition) else 'series'
+
+    @property
+    def label(self) -> str:
+        """
+        Returns the string representation of a condition or the name of a trading series.
+
+        :return: The label of the node.
+        :rtype: str
+        """
+        return self.node.to_string() if isinstance(self.node, Condition) else self.node.get_name()
+
+
+def _children(node: Condition | TradingSeries) -> list[Condition | TradingSeries]:
+    """
+    Returns the conditions and trading series stored in the attributes of a node, in the order of the attributes.
+    """
+    children = []
+
+    for value in vars(node).values():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        children += [child for child in values if isinstance(child, (Condition, TradingSeries))]
+
+    return children
+
+
+class ConditionPlan:
+    """
+    A compiled evaluation plan of one or more condition trees, e.g. the buy and sell conditions of a strategy.
+
+    Compiling walks the trees and merges equal conditions and trading series, identified by their
+    `to_dict()` description (see `node_key`), into a DAG of unique nodes. When the plan is evaluated, it
+    evaluates the shared conditions and the roots in topological order (see `evaluation_order`) and stores
+    the result of every node, so the parents evaluated later read the results of their shared children
+    instead of evaluating them again. A plan can be compiled once and evaluated on many frames, and the
+    roots can come from many strategies evaluated on the same data.
+    """
+
+    def __init__(self, roots: dict[str, Condition]):
+        """
+        Compiles the plan of the given condition trees.
+
+        :param roots: The root condition of every tree, by the name of the tree (e.g. 'BUY' and 'SELL').
+        :type roots: dict[str, Condition]
+        """
+        self.roots = {name: node_key(condition) for name, condition in roots.items()}
+        self.nodes: dict[str, PlanNode] = {}  # In topological order, every node after its children
+
+        for condition in roots.values():
+            self._add(condition)
+
+    def _add(self, node: Condition | TradingSeries) -> str:
+        """
+        Adds a node and its children to the plan, merging nodes with equal keys.
+        """
+        key = node_key(node)
+
+        if key in self.nodes:
+            self.nodes[key].references += 1
+            return key
+
+        children = list(dict.fromkeys(self._add(child) for child in _children(node)))
+        self.nodes[key] = PlanNode(key, node, children)
+
+        return key
+
+    def shared_nodes(self) -> list[PlanNode]:
+        """
+        Returns the nodes that appear more than once in the trees and are evaluated only once.
+
+        :return: The shared nodes.
+        :rtype: list[PlanNode]
+        """
+        return [node for node in self.nodes.values() if node.references > 1]
+
+    def describe(self) -> str:
+        """
+        Returns a readable description of the plan, listing the unique nodes in topological order
+        with their number of references and children.
+
+        :return: The description of the plan.
+        :rtype: str
+        """
+        numbers = {key: number for number, key in enumerate(self.nodes)}
+
+        lines = [f'ConditionPlan with {len(self.nodes)} unique nodes, {len(self.shared_nodes())} shared']
+        for key, node in self.nodes.items():
+            children = ', '.join(f'#{numbers[child]}' for child in node.children)
+            lines.append(f'#{numbers[key]} {node.kind} x{node.references}: {node.label}'
+                         + (f' <- {children}' if children else ''))
+        for name, key in self.roots.items():
+            lines.append(f'{name} = #{numbers[key]}')
+
+        return '\n'.join(lines)
+
+    def evaluation_order(self, roots: list[str] = None) -> list[PlanNode]:
+        """
+        Returns the conditions the plan evaluates itself, in topological order.
+
+        These are the shared conditions of the given trees, followed by the roots of the trees. A condition
+        that appears only once is evaluated by its parent, which can skip it or evaluate it for some rows
+        only (see `AND`), and trading series are shared through the columns of the frame.
+
+        :param roots: The names of the evaluated trees. All trees if None.
+        :type roots: list[str], optional
+        :return: The evaluated condition nodes, every node after its children.
+        :rtype: list[PlanNode]
+        """
+        root_keys = {self.roots[name] for name in (self.roots if roots is None else roots)}
+
+        # The nodes the given trees are built from
+        reachable = set()
+        pending = list(root_keys)
+        while pending:
+            key = pending.pop()
+            if key not in reachable:
+                reachable.add(key)
+                pending += self.nodes[key].children
+
+        return [node for key, node in self.nodes.items()
+                if key in reachable and node.kind == 'condition' and (node.references > 1 or key in root_keys)]
+
+    def _evaluate_nodes(self, downloader: DownloadModule, df: pd.DataFrame,
+                        roots: list[str]) -> dict[str, tuple[pd.Series, SignalLabels]]:
+        """
+        Evaluates the conditions of the evaluation order one after another and returns their results by key.
+
+        Every result is stored in the active intermediate store under the key of its node (see
+        `shared_evaluate`), where the parents evaluated later read it.
+        """
+        return {node.key: node.node.evaluate_labels(downloader, df) for node in self.evaluation_order(roots)}
+
+    def evaluate(self, downloader: DownloadModule, df: pd.DataFrame,
+                 roots: list[str] = None) -> dict[str, tuple[pd.Series, pd.Series]]:
+        """
+        Evaluates the trees of the plan on a frame.
+
+        The results of the nodes are kept in the active intermediate store, or in a new store for the
+        duration of the call, so consecutive calls inside one active store share the nodes as well.
+
+        :param downloader: The module used to download the data of the trading series.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the data.
+        :type df: pd.DataFrame
+        :param roots: The names of the evaluated trees, in evaluation order. All trees if None.
+        :type roots: list[str], optional
+        :return: The result and signal Series of every evaluated tree, by the name of the tree.
+        :rtype: dict[str, tuple[pd.Series, pd.Series]]
+        """
+        roots = list(self.roots) if roots is None else roots
+
+        with intermediate_store():
+            self._evaluate_nodes(downloader, df, roots)
+
+            # The signal strings of the roots, built from their stored label codes
+            return {name: self.nodes[self.roots[name]].node.evaluate(downloader, df) for name in roots}
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame,
+                        roots: list[str] = None) -> dict[str, tuple[pd.Series, SignalLabels]]:
+        """
+        Evaluates the trees of the plan on a frame and returns their signals as label codes.
+
+        :param downloader: The module used to download the data of the trading series.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the data.
+        :type df: pd.DataFrame
+        :param roots: The names of the evaluated trees, in evaluation order. All trees if None.
+        :type roots: list[str], optional
+        :return: The result Series and the signals of every evaluated tree, by the name of the tree.
+        :rtype: dict[str, tuple[pd.Series, SignalLabels]]
+        """
+        roots = list(self.roots) if roots is None else roots
+
+        with intermediate_store():
+            results = self._evaluate_nodes(downloader, df, roots)
+
+            return {name: results[self.roots[name]] for name in roots}
+
+    def evaluate_masks(self, downloader: DownloadModule, df: pd.DataFrame,
+                       roots: list[str] = None) -> dict[str, np.ndarray]:
+        """
+        Evaluates the trees of the plan on a frame and returns only their boolean masks.
+
+        :param downloader: The module used to download the data of the trading series.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the data.
+        :type df: pd.DataFrame
+        :param roots: The names of the evaluated trees. All trees if None.
+        :type roots: list[str], optional
+        :return: The boolean mask of every evaluated tree, by the name of the tree.
+        :rtype: dict[str, np.ndarray]
+        """
+        results = self.evaluate_labels(downloader, df, roots)
+
+        return {name: result.to_numpy(dtype=bool, na_value=False) for name, (result, _) in results.items()}
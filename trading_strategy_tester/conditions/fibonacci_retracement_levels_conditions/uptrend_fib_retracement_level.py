@@ -1,11 +1,18 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.fibonacci_levels_enum import FibonacciLevels
 from trading_strategy_tester.enums.source_enum import SourceType
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
-from trading_strategy_tester.utils.fib_utils import is_in_fib_interval
+from trading_strategy_tester.utils.fib_utils import (
+    FIB_RETRACEMENT_COST,
+    fib_retracement_batch,
+    fib_retracement_mask,
+    fib_retracement_mask_at
+)
 from trading_strategy_tester.utils.parameter_validations import get_length
 
 
@@ -44,33 +51,87 @@ class UptrendFibRetracementLevelCondition(Condition):
                  and the second containing signal descriptions where the condition is met.
         :rtype: (pd.Series, pd.Series)
         """
-        result = pd.Series([False] * len(df), index=df.index)
-        uptrend = True  # Indicate we are looking for uptrend retracement levels
-        counter = 0  # Counter to keep track of retracement occurrences
-
-        # Iterate over the data frame to evaluate the condition for each row
-        for index, (date, row) in enumerate(df.iterrows()):
-            if index >= self.length:
-                # Find the min and max indices in the historical window
-                min_window_index = df[SourceType.LOW.value][index - self.length:index].argmin()
-                max_window_index = df[SourceType.HIGH.value][index - self.length + min_window_index:index].argmax() + min_window_index
-
-                # Ensure we're in an uptrend (min before max)
-                if min_window_index < max_window_index:
-                    counter += 1
-                    low = df[SourceType.LOW.value].iloc[min_window_index]
-                    high = df[SourceType.HIGH.value].iloc[max_window_index]
-
-                    # Check if the current row is within the Fibonacci retracement level
-                    if is_in_fib_interval(high, low, row, self.fib_level, uptrend):
-                        result.iloc[index] = True
-
-        # Create a signal series to describe where the condition is met
-        signal_series = result.apply(
-            lambda x: f'UptrendFibRetracementLevelSignal({self.fib_level.value}, {self.length})' if x else None
-        )
-
-        return result, signal_series
+        result, signals = self.evaluate_labels(downloader, df)
+
+        return result, signals.to_series()
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition and return its signals as label codes (see `evaluate`).
+
+        :param downloader: The module used to download additional data if needed.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the price data, must include 'High' and 'Low' columns.
+        :type df: pd.DataFrame
+        :return: The result Series and the signals of the condition.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        # Find the window extremes of every row in one pass and check the Fibonacci level
+        result = fib_retracement_mask(df[SourceType.LOW.value], df[SourceType.HIGH.value], self.fib_level,
+                                      self.length, uptrend=True)
+
+        # Label the rows where the condition is met
+        signals = SignalLabels.where(result, self._signal())
+
+        return result, signals
+
+    def evaluate_labels_at(self, downloader: DownloadModule, df: pd.DataFrame,
+                           rows: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition for the given rows only, scanning only the price windows of these rows.
+
+        :param downloader: The module used to download additional data if needed.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the price data, must include 'High' and 'Low' columns.
+        :type df: pd.DataFrame
+        :param rows: The positions of the evaluated rows.
+        :type rows: np.ndarray
+        :return: The result Series and the signals of the condition, exact for the given rows.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        result = np.zeros(len(df), dtype=bool)
+        result[rows] = fib_retracement_mask_at(df[SourceType.LOW.value], df[SourceType.HIGH.value], self.fib_level,
+                                               self.length, uptrend=True, rows=rows)
+        result = pd.Series(result, index=df.index)
+
+        return result, SignalLabels.where(result, self._signal())
+
+    def evaluation_cost(self) -> float:
+        """
+        Returns the estimated cost of the condition, which scans a window of prices for every row.
+
+        :return: The estimated cost.
+        :rtype: float
+        """
+        return FIB_RETRACEMENT_COST
+
+    def _signal(self) -> str:
+        """
+        Returns the label of the rows where the condition is met.
+        """
+        return f'UptrendFibRetracementLevelSignal({self.fib_level.value}, {self.length})'
+
+    @staticmethod
+    def evaluate_batch(downloader: DownloadModule, df: pd.DataFrame, fib_levels: list[FibonacciLevels],
+                       lengths: list[int]) -> pd.DataFrame:
+        """
+        Evaluate the condition for all combinations of Fibonacci levels and lengths at once, e.g. for
+        parameter sweeps. The window extremes are found once per length and shared by all levels.
+        Every column equals the result of `evaluate` of the condition with that level and length.
+
+        :param downloader: The module used to download additional data if needed.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the price data, must include 'High' and 'Low' columns.
+        :type df: pd.DataFrame
+        :param fib_levels: The Fibonacci levels to check against.
+        :type fib_levels: list[FibonacciLevels]
+        :param lengths: The lengths of the price window.
+        :type lengths: list[int]
+        :return: A DataFrame with one boolean column per combination, with the columns indexed by `(fib_level, length)`.
+        :rtype: pd.DataFrame
+        """
+        return fib_retracement_batch(df[SourceType.LOW.value], df[SourceType.HIGH.value], fib_levels,
+                                     [get_length(length, 14) for length in lengths], uptrend=True)
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
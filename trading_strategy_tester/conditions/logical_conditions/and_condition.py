@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
 
@@ -39,25 +41,78 @@ class AND(Condition):
             - signal_series: A series of concatenated signals from the conditions.
         :rtype: (pd.Series, pd.Series)
         """
-        result = pd.Series([True] * len(df), index=df.index)
-        signal_series = pd.Series([''] * len(df), index=df.index)
+        result, signals = self.evaluate_labels(downloader, df)
+
+        return result, signals.to_series()
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the AND combination of the provided conditions and return its signals as label codes.
+
+        The labels of the conditions are joined only once for every distinct combination of labels,
+        instead of concatenating strings for every row.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the conditions are evaluated.
+        :type df: pd.DataFrame
+        :return: The combined result and the combined signals of the conditions.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        return self._evaluate_candidates(downloader, df, np.ones(len(df), dtype=bool))
+
+    def evaluate_labels_at(self, downloader: DownloadModule, df: pd.DataFrame,
+                           rows: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the AND combination of the provided conditions for the given rows only.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the conditions are evaluated.
+        :type df: pd.DataFrame
+        :param rows: The positions of the evaluated rows.
+        :type rows: np.ndarray
+        :return: The combined result and the combined signals of the conditions, exact for the given rows.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        candidates = np.zeros(len(df), dtype=bool)
+        candidates[rows] = True
+
+        return self._evaluate_candidates(downloader, df, candidates)
+
+    def _evaluate_candidates(self, downloader: DownloadModule, df: pd.DataFrame,
+                             candidates: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluates the conditions from the cheapest one, each only for the rows where all previous conditions
+        are met, and stops when no row is left.
+        """
+        result = pd.Series(candidates, index=df.index, copy=True)
+        condition_signals = [None] * len(self.conditions)
 
         # Evaluate each condition and combine results
-        for i, condition in enumerate(self.conditions):
-            cond_result, signal_result = condition.evaluate(downloader, df)
+        for i in sorted(range(len(self.conditions)), key=lambda i: self.conditions[i].evaluation_cost()):
+            candidates = result.to_numpy(dtype=bool)
+            if not candidates.any():
+                # The result is False everywhere, so the signals of the remaining conditions are not needed
+                break
+
+            cond_result, signals = self.conditions[i].evaluate_candidates(downloader, df, candidates)
             result &= cond_result  # Logical AND operation on results
-            signal_series += signal_result.astype(str)  # Concatenate signal strings
+            condition_signals[i] = signals
 
-            if i != len(self.conditions) - 1:
-                # Add a separator between signals for all but the last condition
-                signal_series += pd.Series([', '] * len(df), index=df.index)
+        # Join the signals where the combined result is True and wrap them in 'And()' to indicate AND logic
+        signals = SignalLabels.join(condition_signals, result.to_numpy(dtype=bool), 'And(', ', ', ')', df.index)
 
-        # If the combined result is False, replace signal with None
-        signal_series = signal_series.where(result, None)
-        # Wrap the signal in 'And()' to indicate AND logic
-        signal_series = signal_series.apply(lambda x: f'And({x})' if x is not None else None)
+        return result, signals
 
-        return result, signal_series
+    def evaluation_cost(self) -> float:
+        """
+        Returns the estimated cost of evaluating all combined conditions.
+
+        :return: The sum of the costs of the conditions.
+        :rtype: float
+        """
+        return sum(condition.evaluation_cost() for condition in self.conditions)
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
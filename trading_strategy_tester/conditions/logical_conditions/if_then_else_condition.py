@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
 
@@ -43,20 +45,80 @@ class IfThenElse(Condition):
             - signal_series: A series of signals from both the `if_condition` and `else_condition`.
         :rtype: (pd.Series, pd.Series)
         """
+        result, signals = self.evaluate_labels(downloader, df)
+
+        return result, signals.to_series()
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the IfThenElse logic for the provided conditions and return its signals as label codes.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the conditions are evaluated.
+        :type df: pd.DataFrame
+        :return: The combined result and the signals of the `if_condition`, or of the `else_condition` where
+                 the `if_condition` gives no signal.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        return self._evaluate_candidates(downloader, df, np.ones(len(df), dtype=bool))
+
+    def evaluate_labels_at(self, downloader: DownloadModule, df: pd.DataFrame,
+                           rows: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the IfThenElse logic for the provided conditions for the given rows only.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the conditions are evaluated.
+        :type df: pd.DataFrame
+        :param rows: The positions of the evaluated rows.
+        :type rows: np.ndarray
+        :return: The combined result and signals of the conditions, exact for the given rows.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        candidates = np.zeros(len(df), dtype=bool)
+        candidates[rows] = True
+
+        return self._evaluate_candidates(downloader, df, candidates)
+
+    def _evaluate_candidates(self, downloader: DownloadModule, df: pd.DataFrame,
+                             candidates: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluates the `if_condition`, and the `else_condition` only for the rows where the `if_condition`
+        is not True with a signal.
+        """
         result = pd.Series([True] * len(df), index=df.index)
-        signal_series = pd.Series([None] * len(df), index=df.index)
 
-        # Evaluate both the if-condition and else-condition
-        if_cond_result, if_signal_result = self.if_condition.evaluate(downloader, df)
-        else_cond_result, else_signal_result = self.else_condition.evaluate(downloader, df)
+        # Evaluate the if-condition first
+        if_cond_result, if_signals = self.if_condition.evaluate_candidates(downloader, df, candidates)
+        result = result & if_cond_result
+
+        # The else-condition changes neither the result nor the signal of rows where the if-condition is True
+        # with a signal, so it is evaluated only for the other rows
+        pending = candidates & ~(result.to_numpy(dtype=bool) & (if_signals.codes >= 0))
+        if pending.any():
+            else_cond_result, else_signals = self.else_condition.evaluate_candidates(downloader, df, pending)
+        else:
+            else_cond_result = pd.Series(False, index=df.index)
+            else_signals = SignalLabels.empty(df.index)
 
         # Result is True if the if-condition is True, otherwise it takes the result of the else-condition
-        result = (result & if_cond_result) | else_cond_result
+        result = result | else_cond_result
+
+        # Combine signals from both conditions
+        signals = SignalLabels.first([if_signals, else_signals], df.index)
 
-        # Combine signal series from both conditions
-        signal_series = signal_series.combine_first(if_signal_result).combine_first(else_signal_result)
+        return result, signals
 
-        return result, signal_series
+    def evaluation_cost(self) -> float:
+        """
+        Returns the estimated cost of evaluating both conditions.
+
+        :return: The sum of the costs of the conditions.
+        :rtype: float
+        """
+        return self.if_condition.evaluation_cost() + self.else_condition.evaluation_cost()
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
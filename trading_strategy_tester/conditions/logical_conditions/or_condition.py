@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
 
@@ -40,17 +42,77 @@ class OR(Condition):
             - signal_series: A series containing the first non-null signal from the conditions.
         :rtype: (pd.Series, pd.Series)
         """
+        result, signals = self.evaluate_labels(downloader, df)
+
+        return result, signals.to_series()
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the OR combination of the provided conditions and return its signals as label codes.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the conditions are evaluated.
+        :type df: pd.DataFrame
+        :return: The combined result and the first signal of the conditions in every row.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        return self._evaluate_candidates(downloader, df, np.ones(len(df), dtype=bool))
+
+    def evaluate_labels_at(self, downloader: DownloadModule, df: pd.DataFrame,
+                           rows: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the OR combination of the provided conditions for the given rows only.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the conditions are evaluated.
+        :type df: pd.DataFrame
+        :param rows: The positions of the evaluated rows.
+        :type rows: np.ndarray
+        :return: The combined result and the first signal of the conditions, exact for the given rows.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        candidates = np.zeros(len(df), dtype=bool)
+        candidates[rows] = True
+
+        return self._evaluate_candidates(downloader, df, candidates)
+
+    def _evaluate_candidates(self, downloader: DownloadModule, df: pd.DataFrame,
+                             candidates: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluates the conditions in order, each only for the rows that are not yet True with a signal,
+        and stops when no row is left. The order is kept, because the first signal of a row is used.
+        """
         result = pd.Series([False] * len(df), index=df.index)
-        signal_series = pd.Series([None] * len(df), index=df.index).astype(object)
+        signalled = np.zeros(len(df), dtype=bool)
+        condition_signals = []
 
         # Evaluate each condition and combine results
         for condition in self.conditions:
-            cond_result, signal_result = condition.evaluate(downloader, df)
+            # Later conditions change neither the result nor the signal of rows that are True with a signal
+            pending = candidates & ~(result.to_numpy(dtype=bool) & signalled)
+            if not pending.any():
+                break
+
+            cond_result, signals = condition.evaluate_candidates(downloader, df, pending)
             result |= cond_result  # Logical OR operation on results
-            # Keep the first non-null signal from previous conditions
-            signal_series = signal_series.combine_first(signal_result)
+            signalled |= signals.codes >= 0
+            condition_signals.append(signals)
+
+        # Keep the first signal of the conditions in every row
+        signals = SignalLabels.first(condition_signals, df.index)
+
+        return result, signals
 
-        return result, signal_series
+    def evaluation_cost(self) -> float:
+        """
+        Returns the estimated cost of evaluating all combined conditions.
+
+        :return: The sum of the costs of the conditions.
+        :rtype: float
+        """
+        return sum(condition.evaluation_cost() for condition in self.conditions)
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
 
@@ -42,20 +44,67 @@ class AfterXDaysCondition(Condition):
             - signal_series: A series of signals indicating where the condition was triggered.
         :rtype: (pd.Series, pd.Series)
         """
-        after_x_days, signal_series = self.condition.evaluate(downloader, df)
+        after_x_days, signals = self.evaluate_labels(downloader, df)
 
+        return after_x_days, signals.to_series()
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition after shifting it by the specified number of days and return its signals
+        as label codes.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the condition is evaluated.
+        :type df: pd.DataFrame
+        :return: The shifted result and the shifted signals of the condition.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        return self._shift(*self.condition.evaluate_labels(downloader, df))
+
+    def evaluate_labels_at(self, downloader: DownloadModule, df: pd.DataFrame,
+                           rows: np.ndarray) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the shifted condition for the given rows only, evaluating the underlying condition for the rows
+        the specified number of days before them.
+
+        :param downloader: Module to download necessary data for evaluation.
+        :type downloader: DownloadModule
+        :param df: The data frame containing the data on which the condition is evaluated.
+        :type df: pd.DataFrame
+        :param rows: The positions of the evaluated rows.
+        :type rows: np.ndarray
+        :return: The shifted result and the shifted signals of the condition, exact for the given rows.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        shifted_rows = rows - self.number_of_days
+        candidates = np.zeros(len(df), dtype=bool)
+        candidates[shifted_rows[(shifted_rows >= 0) & (shifted_rows < len(df))]] = True
+
+        return self._shift(*self.condition.evaluate_candidates(downloader, df, candidates))
+
+    def _shift(self, after_x_days: pd.Series, signals: SignalLabels) -> (pd.Series, SignalLabels):
+        """
+        Shifts the result and the signals of the underlying condition by the specified number of days.
+        """
         # Shift the after_x_days series by the given number of days, and fill any missing values with False
         after_x_days = after_x_days.shift(self.number_of_days).astype(bool)
         after_x_days[:self.number_of_days] = False  # Set the initial 'number_of_days' to False
         after_x_days.name = None
 
-        # Shift the signal series by the given number of days and apply a custom signal label
-        signal_series = pd.Series(signal_series.shift(self.number_of_days))
-        signal_series.name = None
-        signal_series = signal_series.apply(
-            lambda x: f'AfterXDaysSignal({self.number_of_days}, {x})' if x is not None else None)
+        # Shift the signals by the given number of days and apply a custom signal label
+        signals = signals.shift(self.number_of_days).wrap(f'AfterXDaysSignal({self.number_of_days}, ', ')')
+
+        return after_x_days, signals
 
-        return after_x_days, signal_series
+    def evaluation_cost(self) -> float:
+        """
+        Returns the estimated cost of evaluating the underlying condition.
+
+        :return: The cost of the underlying condition.
+        :rtype: float
+        """
+        return self.condition.evaluation_cost()
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
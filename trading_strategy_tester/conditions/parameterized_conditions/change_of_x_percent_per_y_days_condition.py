@@ -1,12 +1,88 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.change_of_x_percent_per_y_days_plot import ChangeOfXPercentPerYDaysPlot
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
 
 
+def percent_change(values: np.ndarray, number_of_days: int) -> np.ndarray:
+    """
+    Calculates the percentage change of every value compared to the value `number_of_days` before it.
+
+    The change is 0 where the earlier value is 0 and NaN for the first `number_of_days` values,
+    so neither of them ever meets a percentage threshold.
+
+    :param values: The values of the series.
+    :type values: np.ndarray
+    :param number_of_days: The number of days over which to calculate the change.
+    :type number_of_days: int
+    :return: The percentage changes.
+    :rtype: np.ndarray
+    """
+    number_of_days = min(number_of_days, len(values))
+    current = values[number_of_days:]
+    previous = values[:len(values) - number_of_days]
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        shifted_changes = np.where(previous != 0, (100 * current) / previous - 100, 0)
+
+    # Keep the precision of the series, so float32 changes are compared with the threshold in float32
+    changes = np.full(len(values), np.nan, dtype=np.result_type(shifted_changes.dtype, np.float32))
+    changes[number_of_days:] = shifted_changes
+
+    return changes
+
+
+def meets_percent(changes: np.ndarray, percent: float) -> np.ndarray:
+    """
+    Checks where the percentage changes reach the percentage threshold. A positive threshold is met by
+    changes of at least `percent`, a negative one by changes of at most `percent` and 0 is never met.
+
+    :param changes: The percentage changes.
+    :type changes: np.ndarray
+    :param percent: The percentage change to check against.
+    :type percent: float
+    :return: A boolean array where True indicates that the threshold is met.
+    :rtype: np.ndarray
+    """
+    if percent > 0:
+        return changes >= percent
+    if percent < 0:
+        return changes <= percent
+
+    return np.zeros(len(changes), dtype=bool)
+
+
+def change_of_x_percent_batch(series: pd.Series, parameters: list[tuple[float, int]]) -> pd.DataFrame:
+    """
+    Evaluates the change of x percent per y days for many `(percent, number_of_days)` pairs at once.
+
+    The percentage changes are calculated once for every distinct number of days and compared with all
+    percentages of that number of days.
+
+    :param series: The series to evaluate.
+    :type series: pd.Series
+    :param parameters: The `(percent, number_of_days)` pairs.
+    :type parameters: list[tuple[float, int]]
+    :return: A DataFrame with one boolean column per pair, with the columns indexed by `(percent, number_of_days)`.
+    :rtype: pd.DataFrame
+    """
+    values = series.to_numpy()
+    changes = {number_of_days: percent_change(values, number_of_days)
+               for number_of_days in dict.fromkeys(number_of_days for _, number_of_days in parameters)}
+
+    results = np.empty((len(values), len(parameters)), dtype=bool)
+    for column, (percent, number_of_days) in enumerate(parameters):
+        results[:, column] = meets_percent(changes[number_of_days], percent)
+
+    return pd.DataFrame(results, index=series.index,
+                        columns=pd.MultiIndex.from_tuples(parameters, names=['percent', 'number_of_days']))
+
+
 class ChangeOfXPercentPerYDaysCondition(Condition):
 
     def __init__(self, series: TradingSeries, percent: float, number_of_days: int):
@@ -36,27 +112,55 @@ class ChangeOfXPercentPerYDaysCondition(Condition):
                  The second Series contains descriptive signals where the condition is met.
         :rtype: (pd.Series, pd.Series)
         """
+        result, signals = self.evaluate_labels(downloader, df)
+
+        return result, signals.to_series()
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition and return its signals as label codes (see `evaluate`).
+
+        :param downloader: The DownloadModule used to fetch the required data.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the data.
+        :type df: pd.DataFrame
+        :return: The result Series and the signals of the condition.
+        :rtype: (pd.Series, SignalLabels)
+        """
         series: pd.Series = self.series.get_data(downloader, df)
-        result = pd.Series([False] * len(df), index=df.index)
-
-        for i in range(len(series)):
-            if i >= self.number_of_days:
-                # Calculate the percentage change compared to the value from 'number_of_days' ago
-                current_percent = (100 * series.iloc[i]) / series.iloc[i - self.number_of_days] - 100 if series.iloc[i - self.number_of_days] != 0 else 0
-                # Check if the percentage change meets the criteria
-                if 0 < self.percent <= current_percent:
-                    result.iloc[i] = True
-                elif 0 > self.percent >= current_percent:
-                    result.iloc[i] = True
-
-        result.name = None
-
-        # Generate signals for the series where the condition is met
-        signal_series = result.apply(
-            lambda x: f'ChangeOfXPercentPerYDaysSignal({self.percent}, {self.number_of_days}, {self.series.get_name()})' if x else None
-        )
-
-        return result, signal_series
+
+        # Compare every value with the value from 'number_of_days' ago and check the percentage change
+        changes = percent_change(series.to_numpy(), self.number_of_days)
+        result = pd.Series(meets_percent(changes, self.percent), index=df.index)
+
+        # Label the rows where the condition is met
+        signals = SignalLabels.where(
+            result, f'ChangeOfXPercentPerYDaysSignal({self.percent}, {self.number_of_days}, {self.series.get_name()})')
+
+        return result, signals
+
+    @staticmethod
+    def evaluate_batch(downloader: DownloadModule, df: pd.DataFrame, series: TradingSeries,
+                       parameters: list[tuple[float, int]]) -> pd.DataFrame:
+        """
+        Evaluate the condition for many `(percent, number_of_days)` pairs on one series at once, e.g. for
+        parameter sweeps. Every column equals the result of `evaluate` of the condition with that pair.
+
+        :param downloader: The DownloadModule used to fetch the required data.
+        :type downloader: DownloadModule
+        :param df: The DataFrame containing the data.
+        :type df: pd.DataFrame
+        :param series: The TradingSeries object containing the data to evaluate.
+        :type series: TradingSeries
+        :param parameters: The `(percent, number_of_days)` pairs.
+        :type parameters: list[tuple[float, int]]
+        :return: A DataFrame with one boolean column per pair, with the columns indexed by `(percent, number_of_days)`.
+        :rtype: pd.DataFrame
+        """
+        results = change_of_x_percent_batch(series.get_data(downloader, df), parameters)
+        results.index = df.index
+
+        return results
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
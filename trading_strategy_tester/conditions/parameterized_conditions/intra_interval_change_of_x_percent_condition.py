@@ -1,7 +1,12 @@
 import pandas as pd
 
-from trading_strategy_tester.conditions.parameterized_conditions.change_of_x_percent_per_y_days_condition import ChangeOfXPercentPerYDaysCondition
+from trading_strategy_tester.conditions.parameterized_conditions.change_of_x_percent_per_y_days_condition import (
+    change_of_x_percent_batch,
+    meets_percent,
+    percent_change
+)
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.change_of_x_percent_per_y_days_plot import ChangeOfXPercentPerYDaysPlot
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
@@ -20,8 +25,6 @@ class IntraIntervalChangeOfXPercentCondition(Condition):
         """
         self.series = series
         self.percent = percent
-        # Initialize a ChangeOfXPercentPerYDaysCondition with a window of 1 day
-        self.change_of_x_percent_on_y_days_condition = ChangeOfXPercentPerYDaysCondition(series, percent, 1)
 
     def evaluate(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, pd.Series):
         """
@@ -34,14 +37,54 @@ class IntraIntervalChangeOfXPercentCondition(Condition):
         :return: A tuple containing the result series and signal series.
         :rtype: tuple(pd.Series, pd.Series)
         """
-        result, _ = self.change_of_x_percent_on_y_days_condition.evaluate(downloader, df)
+        result, signals = self.evaluate_labels(downloader, df)
 
-        # Create a signal series with a description of the condition
-        signal_series = result.apply(
-            lambda x: f'IntraIntervalChangeOfXPercentSignal({self.percent}, {self.series.get_name()})' if x else None
-        )
+        return result, signals.to_series()
 
-        return result, signal_series
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the condition and return its signals as label codes (see `evaluate`).
+
+        :param downloader: The DownloadModule used to fetch the data.
+        :type downloader: DownloadModule
+        :param df: The dataframe containing the data to evaluate.
+        :type df: pd.DataFrame
+        :return: The result Series and the signals of the condition.
+        :rtype: (pd.Series, SignalLabels)
+        """
+        # Check the percentage change compared to the previous value
+        changes = percent_change(self.series.get_data(downloader, df).to_numpy(), 1)
+        result = pd.Series(meets_percent(changes, self.percent), index=df.index)
+
+        # Label the rows where the condition is met
+        signals = SignalLabels.where(
+            result, f'IntraIntervalChangeOfXPercentSignal({self.percent}, {self.series.get_name()})')
+
+        return result, signals
+
+    @staticmethod
+    def evaluate_batch(downloader: DownloadModule, df: pd.DataFrame, series: TradingSeries,
+                       percents: list[float]) -> pd.DataFrame:
+        """
+        Evaluate the condition for many percentages on one series at once, e.g. for parameter sweeps.
+        The change to the previous value is calculated once and compared with every percentage.
+
+        :param downloader: The DownloadModule used to fetch the data.
+        :type downloader: DownloadModule
+        :param df: The dataframe containing the data to evaluate.
+        :type df: pd.DataFrame
+        :param series: The TradingSeries object containing the data series to evaluate.
+        :type series: TradingSeries
+        :param percents: The percentage change thresholds.
+        :type percents: list[float]
+        :return: A DataFrame with one boolean column per percentage, with the percentages as column labels.
+        :rtype: pd.DataFrame
+        """
+        results = change_of_x_percent_batch(series.get_data(downloader, df), [(percent, 1) for percent in percents])
+        results.index = df.index
+        results.columns = results.columns.get_level_values('percent')
+
+        return results
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+
+
+class SignalLabels:
+    """
+    The signals of a condition as integer codes into a table of labels.
+
+    Every row holds the code of its label, or -1 where the condition gives no signal. A label of the
+    table is either a string or a composition of labels of other `SignalLabels`, e.g. the labels of the
+    conditions combined by an AND. The strings of composed labels are built only when they are needed,
+    once per label rather than once per row, so combining, masking and shifting signals works on integer
+    arrays only.
+    """
+
+    def __init__(self, index: pd.Index, codes: np.ndarray, table: list):
+        """
+        :param index: The index of the evaluated data.
+        :type index: pd.Index
+        :param codes: The code of the label of every row, -1 for rows without a signal.
+        :type codes: np.ndarray
+        :param table: The labels. A label is a string or a tuple (prefix, separator, suffix, parts), where
+                      parts is a tuple of (SignalLabels, code) pairs whose labels are joined by the separator.
+        :type table: list
+        """
+        self.index = index
+        self.codes = codes
+        self.table = table
+        self._rendered = dict()
+
+    @classmethod
+    def where(cls, result: pd.Series, label: str) -> 'SignalLabels':
+        """
+        Returns the signals of a condition that gives the same label wherever its result is truthy.
+
+        :param result: The result of the condition.
+        :type result: pd.Series
+        :param label: The label of the signal, e.g. 'CrossOverSignal(AAPL_Close, AAPL_SMA_20)'.
+        :type label: str
+        :return: The signals of the condition.
+        :rtype: SignalLabels
+        """
+        codes = np.where(result.astype(bool).to_numpy(), 0, -1)
+
+        return cls(result.index, codes, [label])
+
+    @classmethod
+    def empty(cls, index: pd.Index) -> 'SignalLabels':
+        """
+        Returns signals without a signal in any row.
+
+        :param index: The index of the evaluated data.
+        :type index: pd.Index
+        :return: The empty signals.
+        :rtype: SignalLabels
+        """
+        return cls(index, np.full(len(index), -1), [])
+
+    @classmethod
+    def from_series(cls, signal_series: pd.Series) -> 'SignalLabels':
+        """
+        Returns the signals given as a Series of strings, None where there is no signal.
+
+        :param signal_series: The signal Series of a condition.
+        :type signal_series: pd.Series
+        :return: The signals of the condition.
+        :rtype: SignalLabels
+        """
+        codes, labels = pd.factorize(signal_series)
+
+        return cls(signal_series.index, codes, list(labels))
+
+    @classmethod
+    def first(cls, signals: list['SignalLabels'], index: pd.Index) -> 'SignalLabels':
+        """
+        Returns the first signal of every row, like `combine_first` of the signal Series.
+
+        :param signals: The signals, in order of priority.
+        :type signals: list[SignalLabels]
+        :param index: The index of the evaluated data.
+        :type index: pd.Index
+        :return: The combined signals.
+        :rtype: SignalLabels
+        """
+        codes = np.full(len(index), -1)
+        table = []
+
+        for signal in signals:
+            missing = (codes < 0) & (signal.codes >= 0)
+            codes[missing] = signal.codes[missing] + len(table)
+            table += signal.table
+
+        return cls(index, codes, table)
+
+    @classmethod
+    def join(cls, signals: list['SignalLabels'], mask: np.ndarray, prefix: str, separator: str,
+             suffix: str, index: pd.Index) -> 'SignalLabels':
+        """
+        Returns the signals joining the labels of all signals of a row, for the rows in the mask.
+
+        A missing label is joined as 'None'. Each distinct combination of labels gets one label
+        in the table.
+
+        :param signals: The joined signals.
+        :type signals: list[SignalLabels]
+        :param mask: The rows that get a signal.
+        :type mask: np.ndarray
+        :param prefix: The text before the joined labels, e.g. 'And('.
+        :type prefix: str
+        :param separator: The text between the labels, e.g. ', '.
+        :type separator: str
+        :param suffix: The text after the joined labels, e.g. ')'.
+        :type suffix: str
+        :param index: The index of the evaluated data.
+        :type index: pd.Index
+        :return: The joined signals.
+        :rtype: SignalLabels
+        """
+        if not mask.any():
+            return cls.empty(index)
+
+        codes = np.full(len(index), -1)
+
+        combinations = np.column_stack([signal.codes[mask] for signal in signals] or [np.zeros(mask.sum(), int)])
+        unique_combinations, inverse = np.unique(combinations, axis=0, return_inverse=True)
+        codes[mask] = inverse.reshape(-1)
+
+        table = [(prefix, separator, suffix, tuple(zip(signals, combination)))
+                 for combination in unique_combinations.tolist()]
+
+        return cls(index, codes, table)
+
+    def wrap(self, prefix: str, suffix: str) -> 'SignalLabels':
+        """
+        Returns the signals with every label wrapped in a prefix and suffix, e.g. 'AfterXDaysSignal(2, ' and ')'.
+
+        :param prefix: The text before the label.
+        :type prefix: str
+        :param suffix: The text after the label.
+        :type suffix: str
+        :return: The wrapped signals.
+        :rtype: SignalLabels
+        """
+        table = [(prefix, '', suffix, ((self, code),)) for code in range(len(self.table))]
+
+        return SignalLabels(self.index, self.codes, table)
+
+    def shift(self, periods: int) -> 'SignalLabels':
+        """
+        Returns the signals shifted by a number of rows, like `shift` of the signal Series.
+
+        :param periods: The number of rows to shift by, negative to shift backwards.
+        :type periods: int
+        :return: The shifted signals.
+        :rtype: SignalLabels
+        """
+        length = len(self.codes)
+        codes = np.full(length, -1)
+
+        if periods >= 0:
+            codes[periods:] = self.codes[:max(length - periods, 0)]
+        else:
+            codes[:max(length + periods, 0)] = self.codes[-periods:]
+
+        return SignalLabels(self.index, codes, self.table)
+
+    def label(self, code: int) -> str | None:
+        """
+        Returns the string of a label of the table, building it the first time it is needed.
+
+        :param code: The code of the label, -1 for no signal.
+        :type code: int
+        :return: The label, or None for no signal.
+        :rtype: str | None
+        """
+        if code < 0:
+            return None
+
+        if code not in self._rendered:
+            entry = self.table[code]
+            if not isinstance(entry, str):
+                prefix, separator, suffix, parts = entry
+                entry = prefix + separator.join(str(signals.label(part)) for signals, part in parts) + suffix
+            self._rendered[code] = entry
+
+        return self._rendered[code]
+
+    def label_at(self, position: int) -> str | None:
+        """
+        Returns the label of one row.
+
+        :param position: The position of the row.
+        :type position: int
+        :return: The label of the row, or None where there is no signal.
+        :rtype: str | None
+        """
+        return self.label(int(self.codes[position]))
+
+    def to_series(self, name: str = None) -> pd.Series:
+        """
+        Returns the signals as a Series of strings, None where there is no signal.
+
+        Every used label is built once and shared by all of its rows.
+
+        :param name: The name of the Series.
+        :type name: str, optional
+        :return: The signal Series.
+        :rtype: pd.Series
+        """
+        lookup = np.full(len(self.table) + 1, None, dtype=object)  # The last item is looked up by -1
+        for code in np.unique(self.codes[self.codes >= 0]).tolist():
+            lookup[code] = self.label(code)
+
+        return pd.Series(lookup[self.codes], index=self.index, name=name)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows.
+        """
+        return len(self.codes)
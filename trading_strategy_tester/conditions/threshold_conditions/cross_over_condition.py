@@ -1,6 +1,7 @@
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
@@ -42,6 +43,21 @@ class CrossOverCondition(Condition):
                  providing a signal description string for crossover points.
         :rtype: (pd.Series, pd.Series)
         """
+        crossover, signals = self.evaluate_labels(downloader, df)
+
+        return crossover, signals.to_series(crossover.name)
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the crossover condition and return its signals as label codes (see `evaluate`).
+
+        :param downloader: The module responsible for downloading and providing market data.
+        :type downloader: DownloadModule
+        :param df: A DataFrame containing relevant market data (e.g., prices, indicators).
+        :type df: pd.DataFrame
+        :return: The crossover Series and the crossover signals.
+        :rtype: (pd.Series, SignalLabels)
+        """
         # Retrieve data from both trading series
         series1: pd.Series = self.first_series.get_data(downloader, df)
         series2: pd.Series = self.second_series.get_data(downloader, df)
@@ -50,11 +66,11 @@ class CrossOverCondition(Condition):
         crossover = pd.Series((series1.shift(1) < series2.shift(1)) & (series1 > series2))
         crossover.fillna(False, inplace=True)
 
-        # Create a signal string for detected crossover points
-        signal_series = crossover.apply(
-            lambda x: f'CrossOverSignal({self.first_series.get_name()}, {self.second_series.get_name()})' if x else None)
+        # Label the detected crossover points
+        signals = SignalLabels.where(
+            crossover, f'CrossOverSignal({self.first_series.get_name()}, {self.second_series.get_name()})')
 
-        return crossover, signal_series
+        return crossover, signals
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
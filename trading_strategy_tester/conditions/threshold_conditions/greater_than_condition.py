@@ -1,6 +1,7 @@
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
@@ -40,6 +41,21 @@ class GreaterThanCondition(Condition):
                  providing a signal description string where the condition is met.
         :rtype: (pd.Series, pd.Series)
         """
+        greater_than, signals = self.evaluate_labels(downloader, df)
+
+        return greater_than, signals.to_series(greater_than.name)
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the greater-than condition and return its signals as label codes (see `evaluate`).
+
+        :param downloader: The module responsible for downloading and providing market data.
+        :type downloader: DownloadModule
+        :param df: A DataFrame containing relevant market data (e.g., prices, indicators).
+        :type df: pd.DataFrame
+        :return: The greater-than Series and the greater-than signals.
+        :rtype: (pd.Series, SignalLabels)
+        """
         # Retrieve data from both trading series
         series1 = self.first_series.get_data(downloader, df)
         series2 = self.second_series.get_data(downloader, df)
@@ -47,11 +63,11 @@ class GreaterThanCondition(Condition):
         # Detect where series1 is greater than series2
         greater_than = pd.Series(series1 > series2)
 
-        # Create a signal string for detected points where series1 is greater than series2
-        signal_series = greater_than.apply(
-            lambda x: f'GreaterThanSignal({self.first_series.get_name()}, {self.second_series.get_name()})' if x else None)
+        # Label the detected points where series1 is greater than series2
+        signals = SignalLabels.where(
+            greater_than, f'GreaterThanSignal({self.first_series.get_name()}, {self.second_series.get_name()})')
 
-        return greater_than, signal_series
+        return greater_than, signals
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.trading_plot.less_than_plot import LessThanPlot
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
 from trading_strategy_tester.download.download_module import DownloadModule
@@ -40,6 +41,21 @@ class LessThanCondition(Condition):
                  providing a signal description string where the condition is met.
         :rtype: (pd.Series, pd.Series)
         """
+        less_than, signals = self.evaluate_labels(downloader, df)
+
+        return less_than, signals.to_series(less_than.name)
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the less-than condition and return its signals as label codes (see `evaluate`).
+
+        :param downloader: The module responsible for downloading and providing market data.
+        :type downloader: DownloadModule
+        :param df: A DataFrame containing relevant market data (e.g., prices, indicators).
+        :type df: pd.DataFrame
+        :return: The less-than Series and the less-than signals.
+        :rtype: (pd.Series, SignalLabels)
+        """
         # Retrieve data from both trading series
         series1 = self.first_series.get_data(downloader, df)
         series2 = self.second_series.get_data(downloader, df)
@@ -47,11 +63,11 @@ class LessThanCondition(Condition):
         # Detect where series1 is less than series2
         less_than = pd.Series(series1 < series2)
 
-        # Create a signal string for detected points where series1 is less than series2
-        signal_series = less_than.apply(
-            lambda x: f'LessThanSignal({self.first_series.get_name()}, {self.second_series.get_name()})' if x else None)
+        # Label the detected points where series1 is less than series2
+        signals = SignalLabels.where(
+            less_than, f'LessThanSignal({self.first_series.get_name()}, {self.second_series.get_name()})')
 
-        return less_than, signal_series
+        return less_than, signals
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
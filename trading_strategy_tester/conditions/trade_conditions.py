@@ -1,8 +1,10 @@
 import pandas as pd
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.condition_plan import ConditionPlan
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.price_plot import PricePlot
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
+from trading_strategy_tester.utils.intermediate_store import intermediate_store
 
 
 class TradeConditions:
@@ -10,26 +12,33 @@ class TradeConditions:
         self.buy_condition = buy_condition
         self.sell_condition = sell_condition
         self.downloader = downloader
-
+        # Conditions and series shared by the buy and sell trees are evaluated once
+        self.plan = ConditionPlan({'BUY': buy_condition, 'SELL': sell_condition})
+        # The shifted signals of the last evaluation as label codes, by 'BUY' and 'SELL'
+        self.signal_labels = dict()
 
     def evaluate_conditions(self, df: pd.DataFrame) -> pd.DataFrame:
-        buy, buy_signal_series = self.buy_condition.evaluate(self.downloader, df)
-        # Shift by one because the execution of the trade happens on the next day after the signal
-        buy = buy.astype('boolean')
-        buy = buy.shift(1).fillna(False)
-        df['BUY'] = buy
-
-        buy_signal_series = buy_signal_series.shift(1)
-        df['BUY_Signals'] = buy_signal_series
-
-        sell, sell_signal_series = self.sell_condition.evaluate(self.downloader, df)
-        # Shift by one because the execution of the trade happens on the next day after the signal
-        sell = sell.astype('boolean')
-        sell = sell.shift(1).fillna(False)
-        df['SELL'] = sell
-
-        sell_signal_series = sell_signal_series.shift(1)
-        df['SELL_Signals'] = sell_signal_series
+        # Nodes evaluated for the buy tree are reused by the sell tree while the store is active
+        with intermediate_store():
+            buy, buy_signals = self.plan.evaluate_labels(self.downloader, df, ['BUY'])['BUY']
+            # Shift by one because the execution of the trade happens on the next day after the signal
+            buy = buy.astype('boolean')
+            buy = buy.shift(1).fillna(False)
+            df['BUY'] = buy
+
+            # The signals are shifted as codes and every label is built once for all of its rows
+            self.signal_labels['BUY'] = buy_signals.shift(1)
+            df['BUY_Signals'] = self.signal_labels['BUY'].to_series()
+
+            sell, sell_signals = self.plan.evaluate_labels(self.downloader, df, ['SELL'])['SELL']
+            # Shift by one because the execution of the trade happens on the next day after the signal
+            sell = sell.astype('boolean')
+            sell = sell.shift(1).fillna(False)
+            df['SELL'] = sell
+
+            # The signals are shifted as codes and every label is built once for all of its rows
+            self.signal_labels['SELL'] = sell_signals.shift(1)
+            df['SELL_Signals'] = self.signal_labels['SELL'].to_series()
 
         return df
 
@@ -1,10 +1,12 @@
 import pandas as pd
 
 from trading_strategy_tester.conditions.condition import Condition
+from trading_strategy_tester.conditions.signal_labels import SignalLabels
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.trading_plot.downtrend_plot import DowntrendPlot
 from trading_strategy_tester.trading_plot.trading_plot import TradingPlot
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
+from trading_strategy_tester.utils.rolling_kernels import trend_for_window
 
 class DowntrendForXDaysCondition(Condition):
     def __init__(self, series: TradingSeries, number_of_days: int):
@@ -34,21 +36,45 @@ class DowntrendForXDaysCondition(Condition):
             - signal_series: A pandas Series with descriptive strings where the condition is True, otherwise None.
         :rtype: tuple(pd.Series, pd.Series)
         """
+        is_downtrend, signals = self.evaluate_labels(downloader, df)
+
+        return is_downtrend, signals.to_series()
+
+    def evaluate_labels(self, downloader: DownloadModule, df: pd.DataFrame) -> (pd.Series, SignalLabels):
+        """
+        Evaluate the downtrend condition and return its signals as label codes (see `evaluate`).
+
+        :param downloader: The DownloadModule used to fetch the data.
+        :type downloader: DownloadModule
+        :param df: The dataframe containing the data to evaluate.
+        :type df: pd.DataFrame
+        :return: The downtrend Series and the downtrend signals.
+        :rtype: (pd.Series, SignalLabels)
+        """
         series: pd.Series = self.series.get_data(downloader, df)
 
-        # Apply rolling window to check for downtrend
-        is_downtrend = series.rolling(window=self.number_of_days).apply(
-            lambda x: (x.diff().fillna(0) <= 0).all(), raw=False
+        # Check the run of non-rising steps ending at every day
+        is_downtrend = pd.Series(
+            trend_for_window(series.to_numpy(dtype=float), self.number_of_days, uptrend=False),
+            index=series.index
         )
-        is_downtrend = is_downtrend.fillna(0).astype(bool)
         is_downtrend.name = None
 
-        # Generate signal series with descriptive strings
-        signal_series = is_downtrend.apply(
-            lambda x: f'DowntrendForXDaysSignal({self.number_of_days}, {self.series.get_name()})' if x else None
-        )
+        # Label the days of the trend
+        signals = SignalLabels.where(
+            is_downtrend, f'DowntrendForXDaysSignal({self.number_of_days}, {self.series.get_name()})')
+
+        return is_downtrend, signals
 
-        return is_downtrend, signal_series
+    def evaluation_cost(self) -> float:
+        """
+        Returns the estimated cost of the condition, which compares every value with the previous one
+        and counts the runs of trend steps.
+
+        :return: The estimated cost.
+        :rtype: float
+        """
+        return 3
 
     def get_graphs(self, downloader: DownloadModule, df: pd.DataFrame) -> [TradingPlot]:
         """
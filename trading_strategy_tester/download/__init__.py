@@ -1 +1 @@
-__all__ = ['download_module']
\ No newline at end of file
+__all__ = ['download_module', 'data_store', 'date_spans', 'cache_manager', 'frame_cache', 'data_providers', 'synthetic_data', 'resampling']
\ No newline at end of file
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+
+from trading_strategy_tester.download.data_store import DataStore
+from trading_strategy_tester.download.date_spans import floor_to_interval
+
+
+class CacheManager:
+    """
+    Applies the caching policy to the histories kept in a `DataStore`.
+
+    The cache is bounded by a total size limit and the least recently used histories are evicted
+    once the limit is exceeded. Bars that were still in progress when they were downloaded expire
+    after a time to live, so they are downloaded again by the next request. Histories are only ever
+    removed by eviction or by an explicit call to `purge`.
+    """
+
+    def __init__(self,
+                 store: DataStore,
+                 max_size_bytes: int | None = 1024 ** 3,
+                 recent_bars_ttl: timedelta = timedelta(hours=1)):
+        """
+        Initializes the CacheManager for the given store.
+
+        :param store: The store holding the cached histories.
+        :type store: DataStore
+        :param max_size_bytes: The maximum total size of the cache in bytes, None for no limit. Default is 1 GiB.
+        :type max_size_bytes: int | None, optional
+        :param recent_bars_ttl: How long the bar that was in progress during the last download stays valid. Default is 1 hour.
+        :type recent_bars_ttl: timedelta, optional
+        """
+        self.store = store
+        self.max_size_bytes = max_size_bytes
+        self.recent_bars_ttl = recent_bars_ttl
+
+    def expire_recent_bars(self, ticker: str, interval: str):
+        """
+        Stops covering the bars that were in progress during the last download once their time to live passed.
+
+        The stored bars are kept, but the spans covering them are cut at the start of the bar that was
+        in progress, so the next request downloads them again and replaces them.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        """
+        updated_at = self.store.get_updated_at(ticker, interval)
+
+        if updated_at is None or datetime.now() - updated_at <= self.recent_bars_ttl:
+            return
+
+        cutoff = floor_to_interval(updated_at, interval)
+        spans = self.store.get_spans(ticker, interval)
+
+        if len(spans) == 0 or spans[-1][1] <= cutoff:
+            return
+
+        expired_spans = [(start, min(end, cutoff)) for start, end in spans if start < cutoff]
+        self.store.update_spans(ticker, interval, expired_spans)
+
+    def total_size(self) -> int:
+        """
+        Returns the total size of all cached histories in bytes.
+
+        :return: The total size in bytes.
+        :rtype: int
+        """
+        return sum(self.store.size(ticker, interval) for ticker, interval in self.store.keys())
+
+    def enforce_size_limit(self, keep: tuple[str, str] = None):
+        """
+        Evicts the least recently used histories until the cache fits into the size limit.
+
+        :param keep: A `(ticker, interval)` pair that must not be evicted, e.g. the one just requested.
+        :type keep: tuple[str, str], optional
+        """
+        if self.max_size_bytes is None:
+            return
+
+        entries = [
+            (self.store.last_access(ticker, interval), self.store.size(ticker, interval), (ticker, interval))
+            for ticker, interval in self.store.keys()
+        ]
+        total_size = sum(size for _, size, _ in entries)
+
+        # Evict from the oldest access on
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            if key == keep:
+                continue
+
+            self.store.delete(*key)
+            total_size -= size
+
+    def purge(self, ticker: str = None, interval: str = None):
+        """
+        Deletes cached histories. Without arguments the whole cache is deleted.
+
+        :param ticker: Only delete histories of this ticker.
+        :type ticker: str, optional
+        :param interval: Only delete histories of this interval.
+        :type interval: str, optional
+        """
+        for stored_ticker, stored_interval in self.store.keys():
+            if ticker is not None and stored_ticker != ticker:
+                continue
+            if interval is not None and stored_interval != interval:
+                continue
+
+            self.store.delete(stored_ticker, stored_interval)
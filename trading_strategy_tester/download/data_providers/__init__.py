@@ -0,0 +1,7 @@
+__all__ = [
+    'data_provider',
+    'yfinance_provider',
+    'local_directory_provider',
+    'dataframe_provider',
+    'synthetic_provider'
+]
@@ -0,0 +1,131 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from datetime import datetime
+
+import pandas as pd
+
+from trading_strategy_tester.enums.source_enum import SourceType
+
+# Column layout of every DataFrame returned by a data provider
+OHLCV_COLUMNS = [
+    'Adj Close',
+    SourceType.CLOSE.value,
+    SourceType.HIGH.value,
+    SourceType.LOW.value,
+    SourceType.OPEN.value,
+    SourceType.VOLUME.value
+]
+
+
+def normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Brings a DataFrame with named OHLCV columns into the column layout used by the `DownloadModule`.
+
+    The columns are reordered to `OHLCV_COLUMNS`, 'Adj Close' defaults to 'Close' if it is missing,
+    and the index is converted to a sorted DatetimeIndex named 'Date'.
+
+    :param df: The DataFrame with 'Open', 'High', 'Low', 'Close' and 'Volume' columns.
+    :type df: pd.DataFrame
+    :return: The normalized DataFrame.
+    :rtype: pd.DataFrame
+    """
+    df = df.copy()
+
+    if 'Adj Close' not in df.columns:
+        df['Adj Close'] = df[SourceType.CLOSE.value]
+
+    df = df[OHLCV_COLUMNS]
+    df.index = pd.DatetimeIndex(df.index, name='Date')
+
+    return df.sort_index()
+
+
+class DataProvider(ABC):
+    """
+    Abstract base class for sources of market data used by the `DownloadModule`.
+
+    A data provider returns the bars of one ticker and interval for a date range in the column layout
+    given by `OHLCV_COLUMNS`, with a DatetimeIndex named 'Date'.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """
+        The name of the provider, used to keep cached data of different providers apart.
+
+        :return: The name of the provider.
+        :rtype: str
+        """
+        pass
+
+    @property
+    def cache_key(self) -> Hashable:
+        """
+        Identifies the data served by the provider in the in-memory frame cache of the `DownloadModule`.
+
+        The default is the name of the provider, which is enough for providers whose data depends only
+        on the ticker, interval and dates. Providers serving data given to the instance must include it.
+
+        :return: The key of the provider.
+        :rtype: Hashable
+        """
+        return self.name
+
+    @property
+    def persistent(self) -> bool:
+        """
+        Whether the data of this provider should be kept in the on-disk cache.
+
+        Providers that are slow to query, like remote APIs, should return True. Providers that already
+        serve local data return False and are queried directly.
+
+        :return: True if the data should be cached on disk.
+        :rtype: bool
+        """
+        return True
+
+    @abstractmethod
+    def download(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+        Returns the bars of a ticker in the date range `[start, end)`.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param interval: The interval value (e.g. '1d').
+        :type interval: str
+        :param start: The first date (inclusive).
+        :type start: datetime
+        :param end: The last date (exclusive).
+        :type end: datetime
+        :return: The DataFrame with the bars, empty if there is no data.
+        :rtype: pd.DataFrame
+        """
+        pass
+
+    def download_many(self, tickers: list[str], interval: str, start: datetime, end: datetime) -> dict[str, pd.DataFrame]:
+        """
+        Returns the bars of several tickers in the date range `[start, end)`.
+
+        The default implementation downloads the tickers one by one. Providers with multi-symbol
+        requests should override it.
+
+        :param tickers: The ticker symbols.
+        :type tickers: list[str]
+        :param interval: The interval value.
+        :type interval: str
+        :param start: The first date (inclusive).
+        :type start: datetime
+        :param end: The last date (exclusive).
+        :type end: datetime
+        :return: A dictionary mapping every ticker with data to its DataFrame.
+        :rtype: dict[str, pd.DataFrame]
+        """
+        downloaded = dict()
+
+        for ticker in tickers:
+            df = self.download(ticker, interval, start, end)
+            if len(df) > 0:
+                downloaded[ticker] = df
+
+        return downloaded
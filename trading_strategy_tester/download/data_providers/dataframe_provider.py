@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.data_provider import DataProvider, normalize_ohlcv
+
+
+class DataFrameProvider(DataProvider):
+    """
+    Data provider serving market data from DataFrames held in memory.
+
+    Useful for tests and benchmarks that need deterministic data without network or disk access.
+    """
+
+    def __init__(self, frames: dict[str, pd.DataFrame], interval: str = None):
+        """
+        Initializes the provider with the DataFrames of each ticker.
+
+        :param frames: A dictionary mapping ticker symbols to DataFrames with named OHLCV columns and a date index.
+        :type frames: dict[str, pd.DataFrame]
+        :param interval: The only interval the frames are served for, None to serve them for any interval.
+        :type interval: str, optional
+        """
+        self.frames = {ticker: normalize_ohlcv(df) for ticker, df in frames.items()}
+        self.interval = interval
+
+    @property
+    def name(self) -> str:
+        return 'dataframe'
+
+    @property
+    def cache_key(self) -> tuple:
+        # The frames belong to this instance, the key keeps it alive while its frames are cached
+        return self.name, self
+
+    @property
+    def persistent(self) -> bool:
+        return False
+
+    def download(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame:
+        df = self.frames.get(ticker)
+
+        if df is None or (self.interval is not None and interval != self.interval):
+            return pd.DataFrame()
+
+        # Slice by binary search over the sorted index, `end` is exclusive
+        left = df.index.searchsorted(pd.Timestamp(start), side='left')
+        right = df.index.searchsorted(pd.Timestamp(end), side='left')
+
+        return df.iloc[left:right]
@@ -0,0 +1,74 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.data_provider import DataProvider, normalize_ohlcv
+
+
+class LocalDirectoryProvider(DataProvider):
+    """
+    Data provider reading market data from a local directory of Parquet or CSV files.
+
+    For every ticker the provider looks for `{ticker}_{interval}.parquet`, `{ticker}_{interval}.csv`,
+    `{ticker}.parquet` and `{ticker}.csv` in this order. Files must have a date index column named
+    'Date' and at least 'Open', 'High', 'Low', 'Close' and 'Volume' columns. Reading Parquet files
+    requires `pyarrow` or `fastparquet` to be installed.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initializes the provider for the given directory.
+
+        :param directory: The directory containing the data files.
+        :type directory: str
+        """
+        self.directory = directory
+
+    @property
+    def name(self) -> str:
+        return 'local'
+
+    @property
+    def cache_key(self) -> tuple:
+        return self.name, os.path.abspath(self.directory)
+
+    @property
+    def persistent(self) -> bool:
+        return False
+
+    def find_file(self, ticker: str, interval: str) -> str | None:
+        """
+        Returns the path of the file holding the data of a ticker and interval.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param interval: The interval value.
+        :type interval: str
+        :return: The path of the file or None if there is no file for the ticker.
+        :rtype: str | None
+        """
+        for name in [f'{ticker}_{interval}', ticker]:
+            for extension in ['parquet', 'csv']:
+                path = os.path.join(self.directory, f'{name}.{extension}')
+                if os.path.isfile(path):
+                    return path
+
+        return None
+
+    def download(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame:
+        path = self.find_file(ticker, interval)
+
+        if path is None:
+            return pd.DataFrame()
+
+        if path.endswith('.parquet'):
+            df = pd.read_parquet(path)
+            if 'Date' in df.columns:
+                df = df.set_index('Date')
+        else:
+            df = pd.read_csv(path, index_col='Date', parse_dates=True)
+
+        df = normalize_ohlcv(df)
+
+        return df[(df.index >= start) & (df.index < end)]
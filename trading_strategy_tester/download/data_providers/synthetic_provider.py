@@ -0,0 +1,78 @@
+import zlib
+from datetime import datetime
+
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.data_provider import DataProvider
+from trading_strategy_tester.download.synthetic_data import generate_ohlcv, synthetic_dates
+from trading_strategy_tester.enums.synthetic_mode_enum import SyntheticMode
+
+
+class SyntheticProvider(DataProvider):
+    """
+    Data provider generating deterministic synthetic market data for any ticker.
+
+    Every ticker gets its own seed derived from the provider seed and the ticker symbol. The bars are
+    always generated from the same anchor date, so overlapping date ranges return identical bars.
+    """
+
+    def __init__(self,
+                 seed: int = 0,
+                 mode: SyntheticMode = SyntheticMode.GBM,
+                 anchor: datetime = datetime(2000, 1, 3),
+                 **parameters):
+        """
+        Initializes the provider.
+
+        :param seed: The base seed of the generated data. Default is 0.
+        :type seed: int, optional
+        :param mode: The model generating the close prices. Default is `SyntheticMode.GBM`.
+        :type mode: SyntheticMode, optional
+        :param anchor: The date of the first generated bar, no data exists before it. Default is 2000-01-03.
+        :type anchor: datetime, optional
+        :param parameters: Further keyword arguments passed to `generate_ohlcv`, e.g. `volatility`.
+        """
+        self.seed = seed
+        self.mode = mode
+        self.anchor = anchor
+        self.parameters = parameters
+
+    @property
+    def name(self) -> str:
+        return 'synthetic'
+
+    @property
+    def cache_key(self) -> tuple:
+        return self.name, self.seed, self.mode, self.anchor, tuple(sorted(self.parameters.items()))
+
+    @property
+    def persistent(self) -> bool:
+        return False
+
+    def ticker_seed(self, ticker: str) -> int:
+        """
+        Returns the seed of the given ticker.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :return: The seed used for the ticker.
+        :rtype: int
+        """
+        return self.seed + zlib.crc32(ticker.encode())
+
+    def download(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame:
+        n_bars = len(synthetic_dates(interval, self.anchor, end=end))
+
+        if n_bars == 0:
+            return pd.DataFrame()
+
+        df = generate_ohlcv(
+            n_bars,
+            start=self.anchor,
+            interval=interval,
+            mode=self.mode,
+            seed=self.ticker_seed(ticker),
+            **self.parameters
+        )
+
+        return df[df.index >= start]
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pandas as pd
+import yfinance as yf
+
+from trading_strategy_tester.download.data_providers.data_provider import DataProvider, OHLCV_COLUMNS
+from trading_strategy_tester.enums.source_enum import SourceType
+
+
+class YFinanceProvider(DataProvider):
+    """
+    Data provider downloading market data from Yahoo Finance using the `yfinance` library.
+    """
+
+    @property
+    def name(self) -> str:
+        return 'yfinance'
+
+    def download(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame:
+        df = yf.download(ticker, interval=interval, start=start, end=end, auto_adjust=False, progress=False)
+
+        if len(df) == 0:
+            return df
+
+        # Automatically change columns to ensure robustness against future changes of API
+        df.columns = OHLCV_COLUMNS
+        df.index.name = 'Date'
+
+        return df
+
+    def download_many(self, tickers: list[str], interval: str, start: datetime, end: datetime) -> dict[str, pd.DataFrame]:
+        df = yf.download(tickers, interval=interval, start=start, end=end, auto_adjust=False,
+                         progress=False, group_by='ticker', threads=False)
+
+        downloaded = dict()
+
+        for ticker in tickers:
+            if len(df) == 0 or ticker not in df.columns.get_level_values(0):
+                continue
+
+            # Tickers share one index, so rows of the other tickers are missing for this one
+            ticker_df = df[ticker][OHLCV_COLUMNS].dropna(how='all')
+
+            if len(ticker_df) == 0:
+                continue
+
+            ticker_df[SourceType.VOLUME.value] = ticker_df[SourceType.VOLUME.value].fillna(0).astype('int64')
+            ticker_df.columns.name = None
+            ticker_df.index.name = 'Date'
+            downloaded[ticker] = ticker_df
+
+        return downloaded
@@ -0,0 +1,456 @@
+import json
+import os
+import shutil
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.file_lock import file_lock
+
+class DataStore(ABC):
+    """
+    Abstract base class for on-disk storage of downloaded market data.
+
+    A data store keeps one history per `(ticker, interval)` pair together with the date spans `[start, end)`
+    that the history covers. Any date sub-range of a span can then be served by slicing the stored history
+    instead of looking up a file for the exact requested window.
+    """
+
+    @abstractmethod
+    def get_spans(self, ticker: str, interval: str) -> list[tuple[datetime, datetime]]:
+        """
+        Returns the date spans covered by the stored history.
+
+        :param ticker: The ticker symbol of the stored history.
+        :type ticker: str
+        :param interval: The interval of the stored history (e.g. '1d').
+        :type interval: str
+        :return: A sorted list of disjoint `(start, end)` spans with exclusive end, empty if nothing is stored.
+        :rtype: list[tuple[datetime, datetime]]
+        """
+        pass
+
+    @abstractmethod
+    def load(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame | None:
+        """
+        Loads the bars of the stored history that fall into `[start, end)`.
+
+        :param ticker: The ticker symbol of the stored history.
+        :type ticker: str
+        :param interval: The interval of the stored history.
+        :type interval: str
+        :param start: The first date of the requested range (inclusive).
+        :type start: datetime
+        :param end: The last date of the requested range (exclusive).
+        :type end: datetime
+        :return: The sliced DataFrame, or None if nothing is stored.
+        :rtype: pd.DataFrame | None
+        """
+        pass
+
+    @abstractmethod
+    def save(self, ticker: str, interval: str, df: pd.DataFrame, spans: list[tuple[datetime, datetime]]):
+        """
+        Stores the history for the given ticker and interval, replacing any previous history.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        :param df: The DataFrame with a sorted DatetimeIndex containing the bars.
+        :type df: pd.DataFrame
+        :param spans: The `(start, end)` spans covered by the history, with exclusive end.
+        :type spans: list[tuple[datetime, datetime]]
+        """
+        pass
+
+    @abstractmethod
+    def update_spans(self, ticker: str, interval: str, spans: list[tuple[datetime, datetime]]):
+        """
+        Replaces the covered date spans of the stored history without rewriting the data.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        :param spans: The new `(start, end)` spans covered by the history, with exclusive end.
+        :type spans: list[tuple[datetime, datetime]]
+        """
+        pass
+
+    @abstractmethod
+    def get_updated_at(self, ticker: str, interval: str) -> datetime | None:
+        """
+        Returns the time when the history was last saved.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        :return: The time of the last save or None if nothing is stored.
+        :rtype: datetime | None
+        """
+        pass
+
+    @abstractmethod
+    def size(self, ticker: str, interval: str) -> int:
+        """
+        Returns the number of bytes used by the stored history.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        :return: The size in bytes, 0 if nothing is stored.
+        :rtype: int
+        """
+        pass
+
+    @abstractmethod
+    def touch(self, ticker: str, interval: str):
+        """
+        Marks the stored history as used now.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        """
+        pass
+
+    @abstractmethod
+    def last_access(self, ticker: str, interval: str) -> float:
+        """
+        Returns the time when the stored history was last saved or touched.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        :return: The POSIX timestamp of the last access, 0 if nothing is stored.
+        :rtype: float
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, ticker: str, interval: str):
+        """
+        Deletes the stored history for the given ticker and interval if it exists.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        """
+        pass
+
+    @abstractmethod
+    def keys(self) -> list[tuple[str, str]]:
+        """
+        Returns all `(ticker, interval)` pairs that have a stored history.
+
+        :return: A list of `(ticker, interval)` tuples.
+        :rtype: list[tuple[str, str]]
+        """
+        pass
+
+    def update_lock(self, ticker: str, interval: str):
+        """
+        Returns a context manager that is held while the history is downloaded and updated.
+
+        Only one holder at a time may update the history of a key, so concurrent requests missing the same
+        bars wait for the first one and find the bars stored afterwards. The default does not lock, stores
+        shared between processes should return an inter-process lock.
+
+        :param ticker: The ticker symbol of the history.
+        :type ticker: str
+        :param interval: The interval of the history.
+        :type interval: str
+        :return: The context manager holding the lock.
+        """
+        return nullcontext()
+
+
+class NpyDataStore(DataStore):
+    """
+    Data store that keeps every column of a history in its own raw `.npy` file.
+
+    Each `(ticker, interval)` pair has its own directory with a small `index.json` file and a version
+    directory holding one `.npy` file per column plus the dates stored as int64 nanoseconds. Loading a
+    history is a handful of binary reads without any text or date parsing. A new version is always
+    written to a fresh directory and the index is replaced afterwards, so readers never see a half
+    written history.
+
+    With `memory_map` the columns are memory-mapped read-only instead of read into memory. All processes
+    loading the same history then share the pages of the operating system's file cache, so N workers hold
+    one physical copy of the data. The returned frames wrap the mapped arrays without copying them.
+
+    The store can be shared by several processes. Readers hold a shared file lock while they load a
+    history, and old versions and deleted histories are only removed under an exclusive lock, so files
+    are never deleted while another process reads them. The lock files live in a separate `.locks`
+    directory and are never deleted.
+    """
+
+    INDEX_FILE = 'index.json'
+    DATE_FILE = 'Date.npy'
+    LOCK_DIR = '.locks'
+
+    def __init__(self, root: str, memory_map: bool = False):
+        """
+        Initializes the store in the given root directory.
+
+        :param root: The directory under which the histories are stored.
+        :type root: str
+        :param memory_map: If True, loaded columns are read-only memory maps of the stored files. Default is False.
+        :type memory_map: bool, optional
+        """
+        self.root = root
+        self.memory_map = memory_map
+
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+
+    def entry_path(self, ticker: str, interval: str) -> str:
+        """
+        Returns the directory used for the given ticker and interval.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param interval: The interval.
+        :type interval: str
+        :return: The path of the entry directory.
+        :rtype: str
+        """
+        name = f'{ticker}_{interval}'.replace(os.sep, '-')
+        return os.path.join(self.root, name)
+
+    def lock_path(self, ticker: str, interval: str, kind: str) -> str:
+        """
+        Returns the lock file of the given kind for the given ticker and interval.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param interval: The interval.
+        :type interval: str
+        :param kind: The kind of the lock, 'data' for reading and replacing files or 'update' for downloads.
+        :type kind: str
+        :return: The path of the lock file.
+        :rtype: str
+        """
+        name = os.path.basename(self.entry_path(ticker, interval))
+        return os.path.join(self.root, self.LOCK_DIR, f'{name}.{kind}.lock')
+
+    def update_lock(self, ticker: str, interval: str):
+        return file_lock(self.lock_path(ticker, interval, 'update'))
+
+    def read_index(self, ticker: str, interval: str) -> dict | None:
+        """
+        Reads the index file of the given entry.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param interval: The interval.
+        :type interval: str
+        :return: The parsed index or None if the entry does not exist.
+        :rtype: dict | None
+        """
+        index_path = os.path.join(self.entry_path(ticker, interval), self.INDEX_FILE)
+
+        try:
+            with open(index_path, 'r') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def get_spans(self, ticker: str, interval: str) -> list[tuple[datetime, datetime]]:
+        index = self.read_index(ticker, interval)
+
+        if index is None:
+            return []
+
+        return [(datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in index['spans']]
+
+    def load(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame | None:
+        # The files of the current version are not removed while the shared lock is held
+        with file_lock(self.lock_path(ticker, interval, 'data'), shared=True):
+            return self._load(ticker, interval, start, end)
+
+    def _load(self, ticker: str, interval: str, start: datetime, end: datetime) -> pd.DataFrame | None:
+        """
+        Loads the bars in `[start, end)` from the version referenced by the index.
+        """
+        index = self.read_index(ticker, interval)
+
+        if index is None:
+            return None
+
+        version_path = os.path.join(self.entry_path(ticker, interval), index['version'])
+
+        try:
+            dates = self._load_array(os.path.join(version_path, self.DATE_FILE))
+        except FileNotFoundError:
+            # The version was replaced between reading the index and the data, retry with the new index
+            new_index = self.read_index(ticker, interval)
+            if new_index is None or new_index['version'] == index['version']:
+                return None
+            return self._load(ticker, interval, start, end)
+
+        # Slice by binary search over the sorted dates, `end` is exclusive
+        date_index = self._to_datetime_index(dates, index['tz'])
+        left = date_index.searchsorted(self._localize(start, index['tz']), side='left')
+        right = date_index.searchsorted(self._localize(end, index['tz']), side='left')
+
+        columns = {
+            column: self._load_array(os.path.join(version_path, f'{position}.npy'))[left:right]
+            for position, column in enumerate(index['columns'])
+        }
+
+        return pd.DataFrame(columns, index=date_index[left:right], copy=False)
+
+    def save(self, ticker: str, interval: str, df: pd.DataFrame, spans: list[tuple[datetime, datetime]]):
+        entry_path = self.entry_path(ticker, interval)
+        version = uuid.uuid4().hex
+
+        # Write all columns into a temporary directory and publish it with a single rename
+        tmp_path = os.path.join(self.root, f'.tmp-{version}')
+        os.makedirs(tmp_path)
+
+        # Dates are stored as UTC nanoseconds, whatever the resolution of the index (pandas 2 has s, ms and us)
+        date_index = pd.DatetimeIndex(df.index)
+        tz = str(date_index.tz) if date_index.tz is not None else None
+        if tz is not None:
+            date_index = date_index.tz_convert(None)
+        np.save(os.path.join(tmp_path, self.DATE_FILE), date_index.as_unit('ns').asi8)
+
+        for position, column in enumerate(df.columns):
+            np.save(os.path.join(tmp_path, f'{position}.npy'), df[column].to_numpy())
+
+        size = sum(entry.stat().st_size for entry in os.scandir(tmp_path))
+
+        index = {
+            'ticker': ticker,
+            'interval': interval,
+            'spans': [[start.isoformat(), end.isoformat()] for start, end in spans],
+            'rows': len(df),
+            'columns': [str(column) for column in df.columns],
+            'tz': tz,
+            'size': size,
+            'updated_at': datetime.now().isoformat(),
+            'version': version
+        }
+
+        # Wait for readers of the previous version before it is removed
+        with file_lock(self.lock_path(ticker, interval, 'data')):
+            os.makedirs(entry_path, exist_ok=True)
+            previous_index = self.read_index(ticker, interval)
+
+            os.rename(tmp_path, os.path.join(entry_path, version))
+            self.write_index(ticker, interval, index)
+
+            if previous_index is not None:
+                shutil.rmtree(os.path.join(entry_path, previous_index['version']), ignore_errors=True)
+
+    def write_index(self, ticker: str, interval: str, index: dict):
+        """
+        Atomically replaces the index file of the given entry.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param interval: The interval.
+        :type interval: str
+        :param index: The index to write.
+        :type index: dict
+        """
+        entry_path = self.entry_path(ticker, interval)
+        tmp_index_path = os.path.join(entry_path, f'.tmp-{uuid.uuid4().hex}.json')
+
+        with open(tmp_index_path, 'w') as file:
+            json.dump(index, file)
+        os.replace(tmp_index_path, os.path.join(entry_path, self.INDEX_FILE))
+
+    def update_spans(self, ticker: str, interval: str, spans: list[tuple[datetime, datetime]]):
+        with file_lock(self.lock_path(ticker, interval, 'data')):
+            index = self.read_index(ticker, interval)
+
+            if index is not None:
+                index['spans'] = [[start.isoformat(), end.isoformat()] for start, end in spans]
+                self.write_index(ticker, interval, index)
+
+    def get_updated_at(self, ticker: str, interval: str) -> datetime | None:
+        index = self.read_index(ticker, interval)
+        return datetime.fromisoformat(index['updated_at']) if index is not None else None
+
+    def size(self, ticker: str, interval: str) -> int:
+        index = self.read_index(ticker, interval)
+        return index['size'] if index is not None else 0
+
+    def touch(self, ticker: str, interval: str):
+        try:
+            os.utime(os.path.join(self.entry_path(ticker, interval), self.INDEX_FILE))
+        except FileNotFoundError:
+            pass
+
+    def last_access(self, ticker: str, interval: str) -> float:
+        try:
+            return os.path.getmtime(os.path.join(self.entry_path(ticker, interval), self.INDEX_FILE))
+        except FileNotFoundError:
+            return 0
+
+    def delete(self, ticker: str, interval: str):
+        # Wait for readers of the history before it is removed
+        with file_lock(self.lock_path(ticker, interval, 'data')):
+            shutil.rmtree(self.entry_path(ticker, interval), ignore_errors=True)
+
+    def keys(self) -> list[tuple[str, str]]:
+        keys = []
+
+        for name in os.listdir(self.root):
+            index_path = os.path.join(self.root, name, self.INDEX_FILE)
+
+            if os.path.isfile(index_path):
+                try:
+                    with open(index_path, 'r') as file:
+                        index = json.load(file)
+                except json.JSONDecodeError:
+                    continue
+                keys.append((index['ticker'], index['interval']))
+
+        return keys
+
+    def _load_array(self, path: str) -> np.ndarray:
+        """
+        Reads an `.npy` file, or maps it read-only as a plain ndarray view if memory mapping is enabled.
+        """
+        if not self.memory_map:
+            return np.load(path)
+
+        # Mapped pages stay valid after a replaced version is unlinked, so readers never lose their data
+        return np.load(path, mmap_mode='r').view(np.ndarray)
+
+    @staticmethod
+    def _to_datetime_index(dates: np.ndarray, tz: str | None) -> pd.DatetimeIndex:
+        """
+        Wraps int64 nanoseconds as a DatetimeIndex named 'Date' without copying.
+        """
+        date_index = pd.DatetimeIndex(dates.view('datetime64[ns]'), name='Date')
+
+        if tz is not None:
+            date_index = date_index.tz_localize('UTC').tz_convert(tz)
+
+        return date_index
+
+    @staticmethod
+    def _localize(date: datetime, tz: str | None) -> pd.Timestamp:
+        """
+        Converts a naive datetime to a Timestamp comparable with the stored dates.
+        """
+        timestamp = pd.Timestamp(date)
+
+        if tz is not None and timestamp.tz is None:
+            timestamp = timestamp.tz_localize(tz)
+
+        return timestamp
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from trading_strategy_tester.enums.interval_enum import Interval
+
+
+def merge_spans(spans: list[tuple[datetime, datetime]]) -> list[tuple[datetime, datetime]]:
+    """
+    Merges overlapping or touching date spans into a sorted list of disjoint spans.
+
+    :param spans: A list of `(start, end)` spans with exclusive end.
+    :type spans: list[tuple[datetime, datetime]]
+    :return: A sorted list of disjoint `(start, end)` spans.
+    :rtype: list[tuple[datetime, datetime]]
+    """
+    merged = []
+
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            # Extend the previous span if the current one overlaps or touches it
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def missing_spans(spans: list[tuple[datetime, datetime]], start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+    """
+    Returns the parts of the range `[start, end)` that are not covered by the given spans.
+
+    :param spans: A list of covered `(start, end)` spans with exclusive end.
+    :type spans: list[tuple[datetime, datetime]]
+    :param start: The start of the requested range (inclusive).
+    :type start: datetime
+    :param end: The end of the requested range (exclusive).
+    :type end: datetime
+    :return: A sorted list of `(start, end)` spans that are missing.
+    :rtype: list[tuple[datetime, datetime]]
+    """
+    missing = []
+    current = start
+
+    for span_start, span_end in merge_spans(spans):
+        if span_end <= current:
+            continue
+        if span_start >= end:
+            break
+        if span_start > current:
+            missing.append((current, span_start))
+        current = max(current, span_end)
+
+    if current < end:
+        missing.append((current, end))
+
+    return missing
+
+
+def floor_to_interval(date: datetime, interval: str) -> datetime:
+    """
+    Floors a date to the start of the bar it belongs to for the given interval.
+
+    Daily bars start at midnight, weekly bars on Monday, monthly bars on the first day
+    of the month and quarterly bars on the first day of the quarter.
+
+    :param date: The date to floor.
+    :type date: datetime
+    :param interval: The interval value (e.g. '1wk').
+    :type interval: str
+    :return: The start of the bar containing the date.
+    :rtype: datetime
+    """
+    day = datetime.combine(date.date(), datetime.min.time())
+
+    if interval == Interval.ONE_WEEK.value:
+        return day - timedelta(days=day.weekday())
+    elif interval == Interval.ONE_MONTH.value:
+        return day.replace(day=1)
+    elif interval == Interval.THREE_MONTHS.value:
+        return day.replace(month=3 * ((day.month - 1) // 3) + 1, day=1)
+    else:
+        return day
+
+
+def ceil_to_day(date: datetime) -> datetime:
+    """
+    Rounds a date up to the next midnight unless it already is a midnight.
+
+    :param date: The date to round.
+    :type date: datetime
+    :return: The rounded date.
+    :rtype: datetime
+    """
+    return pd.Timestamp(date).ceil('D').to_pydatetime()
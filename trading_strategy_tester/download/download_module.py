@@ -1,34 +1,72 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 import pandas as pd
-import yfinance as yf
-from datetime import datetime
-
+from datetime import datetime, timedelta
+
+from trading_strategy_tester.download.cache_manager import CacheManager
+from trading_strategy_tester.download.data_providers.data_provider import DataProvider
+from trading_strategy_tester.download.data_providers.yfinance_provider import YFinanceProvider
+from trading_strategy_tester.download.data_store import DataStore, NpyDataStore
+from trading_strategy_tester.download.frame_cache import FrameCache
+from trading_strategy_tester.download.date_spans import ceil_to_day, floor_to_interval, merge_spans, missing_spans
+from trading_strategy_tester.download.resampling import BASE_INTERVAL, RESAMPLED_INTERVALS, resample_ohlcv
 from trading_strategy_tester.enums.interval_enum import Interval
 from trading_strategy_tester.enums.period_enum import Period
-from trading_strategy_tester.enums.source_enum import SourceType
+from trading_strategy_tester.enums.precision_enum import Precision
+from trading_strategy_tester.utils.precision import to_precision
+
+# Calendar length of every period that ends today
+PERIOD_OFFSETS = {
+    Period.ONE_DAY.value: pd.DateOffset(days=1),
+    Period.FIVE_DAYS.value: pd.DateOffset(days=5),
+    Period.ONE_MONTH.value: pd.DateOffset(months=1),
+    Period.THREE_MONTHS.value: pd.DateOffset(months=3),
+    Period.SIX_MONTHS.value: pd.DateOffset(months=6),
+    Period.ONE_YEAR.value: pd.DateOffset(years=1),
+    Period.TWO_YEARS.value: pd.DateOffset(years=2),
+    Period.FIVE_YEARS.value: pd.DateOffset(years=5),
+    Period.TEN_YEARS.value: pd.DateOffset(years=10),
+}
 
 
 class DownloadModule:
     """
-    A module for downloading and caching financial data from Yahoo Finance.
+    A module for downloading and caching financial data from a data provider, Yahoo Finance by default.
 
     Methods:
     --------
-    download_save_and_return_ticker(ticker, filepath, datetime_type):
-        Downloads data for a given ticker, saves it to a CSV file, and returns a DataFrame.
-    return_cached_or_download_date(ticker):
-        Returns cached data based on start and end date for a given ticker if available, otherwise downloads it.
-    return_cached_or_download_period(ticker):
-        Returns cached data based on a specified period for a given ticker if available, otherwise downloads it.
+    resolve_date_range():
+        Resolves the requested start and end date or period to a date range.
+    download_range(ticker, start, end):
+        Downloads data for a given ticker and date range.
+    download_range_many(tickers, start, end):
+        Downloads data for several tickers and a date range with one request.
+    update_history(ticker, start, end):
+        Downloads the missing parts of a date range and merges them into the stored history.
+    prefetch(tickers, batch_size, max_workers):
+        Downloads the requested window for many tickers ahead of time using batched concurrent requests.
+    download_resampled(ticker, start, end):
+        Builds weekly, monthly or quarterly bars from the stored daily history.
     download_ticker(ticker):
-        Determines the appropriate method to fetch data based on the period and returns the DataFrame.
+        Returns the data for a given ticker sliced from the stored history, downloading it if it is missing.
+    purge(ticker):
+        Deletes the cached histories of a ticker or the whole cache.
     """
 
     def __init__(self,
                  start_date: datetime = datetime(2024, 1, 1),
                  end_date: datetime = datetime.today(),
                  interval: Interval = Interval.ONE_DAY,
-                 period: Period = Period.NOT_PASSED):
+                 period: Period = Period.NOT_PASSED,
+                 data_path: str = None,
+                 store: DataStore = None,
+                 cache_manager: CacheManager = None,
+                 frame_cache: FrameCache = None,
+                 provider: DataProvider = None,
+                 resample_from_daily: bool = True,
+                 memory_map: bool = False,
+                 precision: Precision = Precision.FLOAT64):
         """
         Initializes the DownloadModule with the given parameters.
 
@@ -40,6 +78,26 @@ class DownloadModule:
         :type interval: Interval
         :param period: The period over which to fetch data.
         :type period: Period
+        :param data_path: The directory used for cached data. Defaults to the `_data` directory of the package.
+        :type data_path: str, optional
+        :param store: The store used for cached data. Defaults to a `NpyDataStore` in `data_path`.
+        :type store: DataStore, optional
+        :param cache_manager: The policy applied to the cache. Defaults to a `CacheManager` with its default limits.
+        :type cache_manager: CacheManager, optional
+        :param frame_cache: The in-memory cache of returned frames. Defaults to a cache owned by this downloader,
+            pass `shared_frame_cache` to share frames between all downloaders of the process.
+        :type frame_cache: FrameCache, optional
+        :param provider: The source of the market data. Defaults to `YFinanceProvider`.
+        :type provider: DataProvider, optional
+        :param resample_from_daily: If True, weekly, monthly and quarterly bars are built from the stored daily
+            history when it covers the requested window. Default is True.
+        :type resample_from_daily: bool, optional
+        :param memory_map: If True, the default store memory-maps the cached columns, so all processes reading
+            the same history share one physical copy of it. The returned columns are read-only. Default is False.
+        :type memory_map: bool, optional
+        :param precision: The floating point type of the returned prices and volumes. FLOAT32 halves their memory,
+            the cached histories on disk stay in their original precision. Default is FLOAT64.
+        :type precision: Precision, optional
         """
 
         self.start_date = start_date
@@ -47,105 +105,377 @@ class DownloadModule:
         self.interval = interval.value  # String value representing the interval
         self.period = period.value  # String value representing the period
 
-        script_dir = os.path.dirname(__file__)
-        self.data_path = os.path.join(script_dir, '..' ,'_data')
+        if data_path is None:
+            script_dir = os.path.dirname(__file__)
+            data_path = os.path.join(script_dir, '..' ,'_data')
+        self.data_path = data_path
 
         # Create the data directory if it does not exist
         if not os.path.exists(self.data_path):
             os.makedirs(self.data_path)
 
-    def download_save_and_return_ticker(self, ticker: str, filepath: str, datetime_type: bool) -> pd.DataFrame:
+        self.provider = provider if provider is not None else YFinanceProvider()
+        # Keep the cached data of different providers apart
+        self.store = store if store is not None else NpyDataStore(
+            os.path.join(self.data_path, self.provider.name),
+            memory_map=memory_map
+        )
+        self.cache_manager = cache_manager if cache_manager is not None else CacheManager(self.store)
+        self.frame_cache = frame_cache if frame_cache is not None else FrameCache()
+        self.resample_from_daily = resample_from_daily
+        self.precision = precision
+
+    def resolve_date_range(self) -> tuple[datetime, datetime]:
+        """
+        Resolves the requested data window to a date range with exclusive end.
+
+        If a period is passed, it is converted to a range ending today, so period and date requests
+        are served from the same stored history.
+
+        :return: A tuple `(start, end)` of the requested data window.
+        :rtype: tuple[datetime, datetime]
+        """
+
+        if self.period == Period.NOT_PASSED.value:
+            return self.start_date, self.end_date
+
+        # Include today's bar like a period download does
+        today = datetime.combine(datetime.today().date(), datetime.min.time())
+        end = today + timedelta(days=1)
+
+        if self.period == Period.MAX.value:
+            start = datetime(1900, 1, 1)
+        elif self.period == Period.YEAR_TO_DATE.value:
+            start = datetime(today.year, 1, 1)
+        else:
+            start = (pd.Timestamp(end) - PERIOD_OFFSETS[self.period]).to_pydatetime()
+
+        return start, end
+
+    def download_range(self, ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
         """
-        Downloads data for a given ticker and saves it to a CSV file. Returns the data as a DataFrame.
+        Downloads data for a given ticker and date range from the data provider.
 
         :param ticker: The ticker symbol for the data to be downloaded.
         :type ticker: str
-        :param filepath: The file path where the data should be saved.
-        :type filepath: str
-        :param datetime_type: If True, uses start_date and end_date for downloading; otherwise, uses period.
-        :type datetime_type: bool
+        :param start: The first date to download (inclusive).
+        :type start: datetime
+        :param end: The last date to download (exclusive).
+        :type end: datetime
         :return: The DataFrame containing the downloaded data.
         :rtype: pd.DataFrame
+        """
 
-        :raise ValueError: If no data is found for the given ticker.
+        return self.provider.download(ticker, self.interval, start, end)
+
+    def download_range_many(self, tickers: list[str], start: datetime, end: datetime) -> dict[str, pd.DataFrame]:
+        """
+        Downloads data for several tickers and the same date range, with a single request if the provider supports it.
+
+        :param tickers: The ticker symbols for the data to be downloaded.
+        :type tickers: list[str]
+        :param start: The first date to download (inclusive).
+        :type start: datetime
+        :param end: The last date to download (exclusive).
+        :type end: datetime
+        :return: A dictionary mapping every ticker with data to its DataFrame.
+        :rtype: dict[str, pd.DataFrame]
         """
 
-        if datetime_type:
-            df = yf.download(ticker, interval=self.interval, start=self.start_date, end=self.end_date, auto_adjust=False, progress=False)
-        else:
-            df = yf.download(ticker, interval=self.interval, period=self.period, auto_adjust=False, progress=False)
+        return self.provider.download_many(tickers, self.interval, start, end)
 
-        if len(df) == 0:
-            self.delete_temp_files()
-            raise ValueError(f"No data found for ticker '{ticker}'. Please check the ticker symbol or the date range or other parameters.")
+    def get_missing_spans(self, ticker: str, start: datetime, end: datetime, interval: str = None) -> tuple[list, list]:
+        """
+        Returns the stored spans of a ticker and the parts of `[start, end)` that are missing in them.
 
-        # Automatically change columns to ensure robustness against future changes of API
-        df.columns = [
-            'Adj Close',
-            SourceType.CLOSE.value,
-            SourceType.HIGH.value,
-            SourceType.LOW.value,
-            SourceType.OPEN.value,
-            SourceType.VOLUME.value
-        ]
+        Expired recent bars count as missing and spans never reach past the current day, so bars that
+        do not exist yet are fetched again by later requests.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param start: The start of the requested range (inclusive).
+        :type start: datetime
+        :param end: The end of the requested range (exclusive).
+        :type end: datetime
+        :param interval: The interval of the stored history. Defaults to the interval of the downloader.
+        :type interval: str, optional
+        :return: A tuple of the stored spans and the missing spans.
+        :rtype: tuple[list, list]
+        """
+
+        interval = interval if interval is not None else self.interval
+        tomorrow = datetime.combine(datetime.today().date(), datetime.min.time()) + timedelta(days=1)
+        start = floor_to_interval(start, interval)
+        end = min(ceil_to_day(end), tomorrow)
+
+        self.cache_manager.expire_recent_bars(ticker, interval)
+        spans = self.store.get_spans(ticker, interval)
 
-        df.to_csv(filepath)
-        return df
+        return spans, missing_spans(spans, start, end)
 
-    def return_cached_or_download_date(self, ticker: str) -> pd.DataFrame:
+    def merge_into_history(self, ticker: str, spans: list, missing: list, downloaded_dfs: list[pd.DataFrame]):
         """
-        Returns cached data for the given ticker if available; otherwise, downloads it using a date range.
+        Merges downloaded bars into the stored history and marks the missing spans as covered.
 
-        :param ticker: The ticker symbol for the data to be retrieved or downloaded.
+        The new history is written atomically by the store, so concurrent readers see either the
+        old or the new history.
+
+        :param ticker: The ticker symbol.
         :type ticker: str
-        :return: The DataFrame containing the cached or newly downloaded data.
-        :rtype: pd.DataFrame
+        :param spans: The spans stored before the download.
+        :type spans: list
+        :param missing: The spans that were downloaded.
+        :type missing: list
+        :param downloaded_dfs: The downloaded DataFrames, may be empty.
+        :type downloaded_dfs: list[pd.DataFrame]
         """
 
-        filename = f'{ticker}_{self.start_date.date()}_{self.end_date.date()}_{self.interval}.csv'
-        filepath = os.path.join(self.data_path, filename)
+        downloaded_dfs = [df for df in downloaded_dfs if len(df) > 0]
 
-        if os.path.isfile(filepath):
-            return pd.read_csv(filepath, index_col='Date', parse_dates=True)
-        else:
-            return self.download_save_and_return_ticker(ticker, filepath, True)
+        # Do not remember tickers that do not have any data
+        if len(downloaded_dfs) == 0 and len(spans) == 0:
+            return
+
+        if len(spans) > 0:
+            stored_df = self.store.load(ticker, self.interval, spans[0][0], spans[-1][1])
+            if stored_df is not None:
+                downloaded_dfs.insert(0, stored_df)
+
+        # Newer bars replace stored bars with the same date
+        history = pd.concat(downloaded_dfs)
+        history = history[~history.index.duplicated(keep='last')].sort_index()
+
+        self.store.save(ticker, self.interval, history, merge_spans(spans + missing))
+        self.cache_manager.enforce_size_limit(keep=(ticker, self.interval))
 
-    def return_cached_or_download_period(self, ticker: str) -> pd.DataFrame:
+    def update_history(self, ticker: str, start: datetime, end: datetime):
         """
-       Returns cached data for the given ticker if available; otherwise, downloads it using period.
+        Downloads the parts of `[start, end)` that are missing in the stored history and merges them into it.
 
-       :param ticker: The ticker symbol for the data to be retrieved or downloaded.
-       :type ticker: str
-       :return: The DataFrame containing the cached or newly downloaded data.
-       :rtype: pd.DataFrame
-       """
+        Only the missing head, tail or gap segments are downloaded. The download runs under the update lock
+        of the store, so concurrent requests missing the same bars download them only once.
 
-        filename = f'{ticker}_{datetime.today().date()}_{self.period}_{self.interval}.csv'
-        filepath = os.path.join(self.data_path, filename)
+        :param ticker: The ticker symbol for the data to be downloaded.
+        :type ticker: str
+        :param start: The start of the requested range (inclusive).
+        :type start: datetime
+        :param end: The end of the requested range (exclusive).
+        :type end: datetime
+        """
 
-        if os.path.isfile(filepath):
-            return pd.read_csv(filepath, index_col='Date', parse_dates=True)
-        else:
-            return self.download_save_and_return_ticker(ticker, filepath, False)
+        spans, missing = self.get_missing_spans(ticker, start, end)
+
+        if len(missing) == 0:
+            return
+
+        with self.store.update_lock(ticker, self.interval):
+            # Another thread or process may have downloaded the missing bars while we waited for the lock
+            spans, missing = self.get_missing_spans(ticker, start, end)
+
+            if len(missing) == 0:
+                return
+
+            # Start at the beginning of the bar, so a partially stored bar is replaced as a whole
+            downloaded_dfs = [
+                self.download_range(ticker, floor_to_interval(missing_start, self.interval), missing_end)
+                for missing_start, missing_end in missing
+            ]
+
+            self.merge_into_history(ticker, spans, missing, downloaded_dfs)
+
+    def prefetch(self, tickers: list[str], batch_size: int = 50, max_workers: int = 4) -> list[str]:
+        """
+        Downloads the requested window for many tickers ahead of time, so later requests are served from the cache.
+
+        Tickers that miss the same spans are grouped into batches downloaded with one multi-symbol request,
+        and the batches run on a bounded thread pool. Tickers that are already cached are skipped. For providers
+        without on-disk cache the frames are loaded into the frame cache instead.
+
+        :param tickers: The ticker symbols to prefetch.
+        :type tickers: list[str]
+        :param batch_size: The maximum number of tickers in one request. Default is 50.
+        :type batch_size: int, optional
+        :param max_workers: The maximum number of concurrent requests. Default is 4.
+        :type max_workers: int, optional
+        :return: The tickers for which no data was found.
+        :rtype: list[str]
+        """
+
+        start, end = self.resolve_date_range()
+
+        if not self.provider.persistent:
+            return self._prefetch_frames(tickers, max_workers)
+
+        # Group tickers by the spans they miss, so every batch downloads the same date ranges
+        pending = dict()
+        for ticker in dict.fromkeys(tickers):
+            spans, missing = self.get_missing_spans(ticker, start, end)
+
+            if len(missing) > 0:
+                pending.setdefault(tuple(missing), []).append((ticker, spans))
+
+        batches = [
+            (list(missing), group[i:i + batch_size])
+            for missing, group in pending.items()
+            for i in range(0, len(group), batch_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda batch: self._prefetch_batch(start, end, *batch), batches))
+
+        return [ticker for ticker in dict.fromkeys(tickers) if len(self.store.get_spans(ticker, self.interval)) == 0]
+
+    def _prefetch_frames(self, tickers: list[str], max_workers: int) -> list[str]:
+        """
+        Loads the requested window of providers without on-disk cache into the frame cache.
+        """
+
+        def load(ticker: str) -> str | None:
+            try:
+                self.download_ticker(ticker)
+            except ValueError:
+                return ticker
+            return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            failed = list(executor.map(load, dict.fromkeys(tickers)))
+
+        return [ticker for ticker in failed if ticker is not None]
+
+    def _prefetch_batch(self, start: datetime, end: datetime, missing: list, batch: list[tuple[str, list]]):
+        """
+        Downloads the missing spans for one batch of tickers and merges them into their histories.
+        """
+
+        with ExitStack() as stack:
+            # Lock in sorted order, so overlapping batches of other workers cannot deadlock
+            for ticker, _ in sorted(batch):
+                stack.enter_context(self.store.update_lock(ticker, self.interval))
+
+            # Skip tickers that other workers updated while we waited for the locks
+            locked_batch = []
+            for ticker, _ in batch:
+                spans, ticker_missing = self.get_missing_spans(ticker, start, end)
+                if ticker_missing == missing:
+                    locked_batch.append((ticker, spans))
+            batch = locked_batch
+
+            if len(batch) == 0:
+                return
+
+            tickers = [ticker for ticker, _ in batch]
+            downloaded = {ticker: [] for ticker in tickers}
+
+            for missing_start, missing_end in missing:
+                ranges = self.download_range_many(tickers, floor_to_interval(missing_start, self.interval), missing_end)
+                for ticker, df in ranges.items():
+                    downloaded[ticker].append(df)
+
+            for ticker, spans in batch:
+                self.merge_into_history(ticker, spans, missing, downloaded[ticker])
+
+    def download_resampled(self, ticker: str, start: datetime, end: datetime) -> pd.DataFrame | None:
+        """
+        Builds the weekly, monthly or quarterly bars of `[start, end)` from the stored daily history.
+
+        The daily bars from the start of the first coarse bar on are aggregated by `resample_ohlcv`.
+        Nothing is downloaded and the derived bars are not stored, so a ticker keeps a single history
+        for all coarser intervals.
+
+        :param ticker: The ticker symbol.
+        :type ticker: str
+        :param start: The start of the requested range (inclusive).
+        :type start: datetime
+        :param end: The end of the requested range (exclusive).
+        :type end: datetime
+        :return: The resampled bars, or None if the daily history does not cover the range.
+        :rtype: pd.DataFrame | None
+        """
+
+        if self.interval not in RESAMPLED_INTERVALS:
+            return None
+
+        _, missing = self.get_missing_spans(ticker, start, end, interval=BASE_INTERVAL)
+
+        if len(missing) > 0:
+            return None
+
+        daily_df = self.store.load(ticker, BASE_INTERVAL, floor_to_interval(start, self.interval), end)
+
+        if daily_df is None or len(daily_df) == 0:
+            return None
+
+        self.store.touch(ticker, BASE_INTERVAL)
+        df = resample_ohlcv(daily_df, self.interval)
+
+        # Keep the bars starting in the requested range like a slice of a stored history
+        start = pd.Timestamp(start)
+        if df.index.tz is not None and start.tz is None:
+            start = start.tz_localize(df.index.tz)
+
+        return df[df.index >= start]
 
     def download_ticker(self, ticker: str) -> pd.DataFrame:
         """
-        Determines the appropriate method to fetch data based on the period attribute and returns the DataFrame.
+        Returns the data for the given ticker in the requested window.
+
+        Frames that were already returned are served from the in-memory frame cache. Weekly, monthly and
+        quarterly bars are resampled from the stored daily history if it covers the requested window.
+        Otherwise the data is sliced from the stored history of the ticker and interval. Parts of the
+        requested window that are not stored yet are downloaded and merged into the history first.
 
         :param ticker: The ticker symbol for the data to be downloaded.
         :type ticker: str
         :return: The DataFrame containing the data for the given ticker.
         :rtype: pd.DataFrame
+
+        :raise ValueError: If no data is found for the given ticker.
         """
 
-        if self.period == 'not_passed':
-            return self.return_cached_or_download_date(ticker=ticker)
+        start, end = self.resolve_date_range()
+        # Downloaders sharing a frame cache can use different providers and stores
+        key = (self.provider.cache_key, os.path.abspath(self.data_path), ticker, self.interval, start, end,
+               self.precision.value)
+
+        df = self.frame_cache.get(key)
+        if df is not None:
+            return df
+
+        if self.provider.persistent:
+            # Coarser intervals are derived from the daily history and only downloaded if it is missing
+            df = self.download_resampled(ticker, start, end) if self.resample_from_daily else None
+
+            if df is None:
+                self.update_history(ticker, start, end)
+
+                df = self.store.load(ticker, self.interval, start, end)
+                self.store.touch(ticker, self.interval)
         else:
-            return self.return_cached_or_download_period(ticker=ticker)
+            # Local providers are queried directly without the on-disk cache
+            df = self.provider.download(ticker, self.interval, start, end)
+
+        if df is None or len(df) == 0:
+            raise ValueError(f"No data found for ticker '{ticker}'. Please check the ticker symbol or the date range or other parameters.")
+
+        return self.frame_cache.put(key, to_precision(df, self.precision))
+
+    def purge(self, ticker: str = None):
+        """
+        Deletes the cached histories of the given ticker, or the whole cache if no ticker is passed.
+
+        :param ticker: Only delete histories of this ticker.
+        :type ticker: str, optional
+        """
+
+        self.cache_manager.purge(ticker=ticker)
+        self.frame_cache.clear()
 
     def delete_temp_files(self):
         """
         Deletes all files in the directory specified by self.data_path.
+        Prefer `purge`, which only removes cached histories.
+
+        Cached histories are deleted through their store, which waits until no other process reads them.
 
         :raises FileNotFoundError: If self.data_path does not exist.
         :raises IsADirectoryError: If self.data_path is not a directory.
@@ -161,3 +491,8 @@ class DownloadModule:
             file_path = os.path.join(self.data_path, filename)
             if os.path.isfile(file_path):
                 os.remove(file_path)
+            elif os.path.isdir(file_path):
+                # Every directory is the store of one provider, its lock files stay in place
+                store = NpyDataStore(file_path)
+                for ticker, interval in store.keys():
+                    store.delete(ticker, interval)
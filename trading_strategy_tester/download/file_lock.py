@@ -0,0 +1,47 @@
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Advisory file locks are not available on Windows
+    fcntl = None
+
+# Fallback locks used without fcntl, they only guard threads of the current process
+_process_locks = dict()
+_process_locks_lock = threading.Lock()
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False):
+    """
+    Holds an advisory lock on the given lock file while the context is active.
+
+    The lock is taken with `fcntl.flock`, so it is respected by all processes and threads that lock the same
+    file and it is released by the operating system if the holding process dies. Shared locks can be held by
+    many readers at once, an exclusive lock waits until no other lock is held. The lock file is created if it
+    does not exist and is never deleted, so every process always locks the same file. Without `fcntl` the lock
+    falls back to an exclusive lock of the current process.
+
+    :param path: The path of the lock file.
+    :type path: str
+    :param shared: If True, a shared lock is taken instead of an exclusive one. Default is False.
+    :type shared: bool, optional
+    """
+    if fcntl is None:
+        with _process_locks_lock:
+            lock = _process_locks.setdefault(os.path.abspath(path), threading.Lock())
+        with lock:
+            yield
+        return
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
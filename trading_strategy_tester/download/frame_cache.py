@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+class FrameCache:
+    """
+    An in-memory cache of downloaded DataFrames with least recently used eviction.
+
+    Every `TradingSeries` asks the downloader for the data of its ticker again, so one strategy
+    requests the same frame many times. The cache keeps these frames in memory and serves them
+    without touching the disk. Cached columns are read-only and every hit returns a shallow copy,
+    so callers can add columns without changing the cached frame.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        """
+        Initializes an empty FrameCache.
+
+        :param max_entries: The maximum number of cached frames, None for no limit.
+        :type max_entries: int | None, optional
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> pd.DataFrame | None:
+        """
+        Returns a shallow copy of the cached frame for the given key and counts the hit or miss.
+
+        :param key: The key of the frame, e.g. `(ticker, interval, start, end)`.
+        :type key: tuple
+        :return: A shallow copy of the cached frame, or None if it is not cached.
+        :rtype: pd.DataFrame | None
+        """
+        with self._lock:
+            frame = self._frames.get(key)
+
+            if frame is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._frames.move_to_end(key)
+
+        return frame.copy(deep=False)
+
+    def put(self, key: tuple, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Caches a read-only view of the given frame, evicting the least recently used frame if the cache is full.
+
+        :param key: The key of the frame.
+        :type key: tuple
+        :param df: The frame to cache.
+        :type df: pd.DataFrame
+        :return: A shallow copy of the cached frame.
+        :rtype: pd.DataFrame
+        """
+        columns = {}
+        for column in df.columns:
+            values = df[column].to_numpy().view()
+            values.flags.writeable = False
+            columns[column] = values
+
+        frame = pd.DataFrame(columns, index=df.index, copy=False)
+
+        with self._lock:
+            self._frames[key] = frame
+            self._frames.move_to_end(key)
+
+            while self.max_entries is not None and len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+
+        return frame.copy(deep=False)
+
+    def clear(self):
+        """
+        Removes all cached frames and resets the counters.
+        """
+        with self._lock:
+            self._frames.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the hit and miss counters of the cache.
+
+        :return: A dictionary with the number of hits, misses and cached frames.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._frames)
+            }
+
+
+# Cache shared by all downloaders of the process that opt into it
+shared_frame_cache = FrameCache(max_entries=256)
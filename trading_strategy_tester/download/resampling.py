@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.interval_enum import Interval
+
+# Interval whose cached bars are resampled into the coarser intervals
+BASE_INTERVAL = Interval.ONE_DAY.value
+RESAMPLED_INTERVALS = [Interval.ONE_WEEK.value, Interval.ONE_MONTH.value, Interval.THREE_MONTHS.value]
+
+# How the bars of one coarse bar are aggregated, other columns keep their last value
+OHLCV_AGGREGATIONS = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Adj Close': 'last',
+    'Volume': 'sum',
+}
+
+
+def bar_starts(index: pd.DatetimeIndex, interval: str) -> np.ndarray:
+    """
+    Returns the start of the coarse bar every date belongs to, computed on whole arrays.
+
+    Weekly bars start on Monday, monthly bars on the first day of the month and quarterly bars
+    on the first day of the quarter, like `floor_to_interval`.
+
+    :param index: The dates of the base bars.
+    :type index: pd.DatetimeIndex
+    :param interval: The coarse interval value (e.g. '1wk').
+    :type interval: str
+    :return: The bar starts as a `datetime64[D]` array.
+    :rtype: np.ndarray
+
+    :raise ValueError: If the interval is not weekly, monthly or quarterly.
+    """
+    # Group by the local calendar day of timezone aware dates
+    if index.tz is not None:
+        index = index.tz_localize(None)
+
+    days = index.values.astype('datetime64[D]')
+
+    if interval == Interval.ONE_WEEK.value:
+        # 1970-01-01 was a Thursday, so Mondays have `(days + 3) % 7 == 0`
+        return days - (days.astype(np.int64) + 3) % 7
+    elif interval == Interval.ONE_MONTH.value:
+        return days.astype('datetime64[M]').astype('datetime64[D]')
+    elif interval == Interval.THREE_MONTHS.value:
+        months = days.astype('datetime64[M]').astype(np.int64)
+        return (months - months % 3).astype('datetime64[M]').astype('datetime64[D]')
+    else:
+        raise ValueError(f"Interval '{interval}' cannot be resampled from daily bars.")
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    Resamples sorted daily OHLCV bars into weekly, monthly or quarterly bars.
+
+    Every coarse bar takes the first open, the highest high, the lowest low, the last close and
+    the summed volume of its daily bars and is labeled with its start date. The bars are grouped
+    by the positions where the bar start changes and aggregated with `np.ufunc.reduceat`, so the
+    whole frame is resampled without a Python loop over the bars.
+
+    :param df: The daily bars with a sorted DatetimeIndex.
+    :type df: pd.DataFrame
+    :param interval: The coarse interval value (e.g. '1wk').
+    :type interval: str
+    :return: The resampled bars with the same columns and a 'Date' index.
+    :rtype: pd.DataFrame
+
+    :raise ValueError: If the interval cannot be resampled from daily bars.
+    """
+    if interval not in RESAMPLED_INTERVALS:
+        raise ValueError(f"Interval '{interval}' cannot be resampled from daily bars.")
+
+    if len(df) == 0:
+        return df.copy()
+
+    starts = bar_starts(df.index, interval)
+
+    # Positions where a new coarse bar begins and where every bar ends
+    first = np.flatnonzero(np.concatenate([[True], starts[1:] != starts[:-1]]))
+    last = np.concatenate([first[1:], [len(df)]]) - 1
+
+    columns = {}
+    for column in df.columns:
+        values = df[column].to_numpy()
+        aggregation = OHLCV_AGGREGATIONS.get(column, 'last')
+
+        if aggregation == 'first':
+            columns[column] = values[first]
+        elif aggregation == 'max':
+            columns[column] = np.maximum.reduceat(values, first)
+        elif aggregation == 'min':
+            columns[column] = np.minimum.reduceat(values, first)
+        elif aggregation == 'sum':
+            columns[column] = np.add.reduceat(values, first)
+        else:
+            columns[column] = values[last]
+
+    index = pd.DatetimeIndex(starts[first].astype('datetime64[ns]'), name='Date')
+    if df.index.tz is not None:
+        index = index.tz_localize(df.index.tz)
+
+    return pd.DataFrame(columns, index=index)
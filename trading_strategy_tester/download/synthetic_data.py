@@ -0,0 +1,227 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.download.data_providers.data_provider import OHLCV_COLUMNS
+from trading_strategy_tester.enums.interval_enum import Interval
+from trading_strategy_tester.enums.synthetic_mode_enum import SyntheticMode
+
+# Number of bars per year and pandas frequency of every interval
+BARS_PER_YEAR = {
+    Interval.ONE_DAY.value: 252,
+    Interval.FIVE_DAYS.value: 252 / 5,
+    Interval.ONE_WEEK.value: 52,
+    Interval.ONE_MONTH.value: 12,
+    Interval.THREE_MONTHS.value: 4,
+}
+INTERVAL_FREQUENCIES = {
+    Interval.ONE_DAY.value: 'B',
+    Interval.FIVE_DAYS.value: '5B',
+    Interval.ONE_WEEK.value: 'W-MON',
+    Interval.ONE_MONTH.value: 'MS',
+    Interval.THREE_MONTHS.value: 'QS',
+}
+
+
+def synthetic_dates(interval: str, start: datetime, end: datetime = None, periods: int = None) -> pd.DatetimeIndex:
+    """
+    Returns the bar dates of an interval, either between `start` and the exclusive `end` or a number of `periods`.
+
+    Daily bars fall on business days, weekly bars on Mondays, monthly bars on the first day of the month
+    and quarterly bars on the first day of the quarter.
+
+    :param interval: The interval value (e.g. '1d').
+    :type interval: str
+    :param start: The first possible date.
+    :type start: datetime
+    :param end: The end of the dates (exclusive).
+    :type end: datetime, optional
+    :param periods: The number of dates, used if `end` is not passed.
+    :type periods: int, optional
+    :return: The dates of the bars.
+    :rtype: pd.DatetimeIndex
+    """
+    frequency = INTERVAL_FREQUENCIES.get(interval, 'B')
+
+    if end is not None:
+        return pd.date_range(start=start, end=end, freq=frequency, inclusive='left', name='Date')
+
+    return pd.date_range(start=start, periods=periods, freq=frequency, name='Date')
+
+
+def _regime_path(rng: np.random.Generator, n_bars: int, mean_durations: tuple[float, float]) -> np.ndarray:
+    """
+    Returns the regime (0 for bull, 1 for bear) of every bar of a two-state Markov chain.
+
+    The durations of the regimes are geometric, so the path is built from sampled run lengths
+    instead of simulating the chain bar by bar.
+    """
+    # Runs are drawn in fixed size chunks, so a longer path always extends a shorter one
+    n_runs = 64
+    durations = np.empty(0, dtype=np.int64)
+
+    while durations.sum() < n_bars:
+        bull = rng.geometric(1 / mean_durations[0], size=n_runs)
+        bear = rng.geometric(1 / mean_durations[1], size=n_runs)
+        durations = np.concatenate([durations, np.column_stack([bull, bear]).ravel()])
+
+    regimes = np.arange(len(durations)) % 2
+    return np.repeat(regimes, durations)[:n_bars]
+
+
+def _log_returns(rng: np.random.Generator,
+                 regime_rng: np.random.Generator,
+                 n_bars: int,
+                 interval: str,
+                 mode: SyntheticMode,
+                 drift: float,
+                 volatility: float,
+                 source: pd.Series,
+                 block_size: int) -> np.ndarray:
+    """
+    Returns the log returns of the close prices for the selected model.
+    """
+    dt = 1 / BARS_PER_YEAR.get(interval, 252)
+
+    if mode == SyntheticMode.BLOCK_BOOTSTRAP:
+        if source is None:
+            raise ValueError('Block bootstrap needs a source price series.')
+
+        source_returns = np.diff(np.log(np.asarray(source, dtype=np.float64)))
+        source_returns = source_returns[np.isfinite(source_returns)]
+        block_size = min(block_size, len(source_returns))
+
+        if block_size < 1:
+            raise ValueError('The source price series needs at least two valid prices.')
+
+        # Concatenate randomly chosen blocks of consecutive returns
+        n_blocks = -(-n_bars // block_size)
+        block_starts = rng.integers(0, len(source_returns) - block_size + 1, size=n_blocks)
+        positions = (block_starts[:, None] + np.arange(block_size)).ravel()[:n_bars]
+        return source_returns[positions]
+
+    shocks = rng.standard_normal(n_bars)
+
+    if mode == SyntheticMode.REGIME_SWITCHING:
+        regimes = _regime_path(regime_rng, n_bars, mean_durations=(250, 100))
+        # Bull regime keeps the parameters, bear regime has negative drift and doubled volatility
+        drifts = np.where(regimes == 0, drift, -2 * abs(drift))
+        volatilities = np.where(regimes == 0, volatility, 2 * volatility)
+    else:
+        drifts = drift
+        volatilities = volatility
+
+    return (drifts - 0.5 * volatilities ** 2) * dt + volatilities * np.sqrt(dt) * shocks
+
+
+def generate_ohlcv_arrays(n_bars: int,
+                          interval: str = Interval.ONE_DAY.value,
+                          mode: SyntheticMode = SyntheticMode.GBM,
+                          seed: int = 0,
+                          initial_price: float = 100.0,
+                          drift: float = 0.05,
+                          volatility: float = 0.2,
+                          base_volume: float = 1_000_000,
+                          source: pd.Series = None,
+                          block_size: int = 20,
+                          detrend: bool = False) -> dict[str, np.ndarray]:
+    """
+    Generates deterministic synthetic OHLCV columns as NumPy arrays.
+
+    Close prices follow the selected model. Opens gap slightly from the previous close, highs and lows
+    extend beyond the open and close by a random part of the bar volatility, and volumes are positive
+    and grow with the size of the move. All values are computed with vectorized NumPy operations, so
+    millions of bars are generated in well under a second. Unlike `generate_ohlcv`, the number of bars
+    is not limited by the dates pandas can represent.
+
+    :param n_bars: The number of bars to generate.
+    :type n_bars: int
+    :param interval: The interval of the bars, used to scale the annualized drift and volatility. Default is '1d'.
+    :type interval: str, optional
+    :param mode: The model generating the close prices. Default is `SyntheticMode.GBM`.
+    :type mode: SyntheticMode, optional
+    :param seed: The seed of the random generator. The same seed always gives the same data. Default is 0.
+    :type seed: int, optional
+    :param initial_price: The price before the first bar. Default is 100.
+    :type initial_price: float, optional
+    :param drift: The annualized drift of the GBM. Default is 0.05.
+    :type drift: float, optional
+    :param volatility: The annualized volatility of the GBM. Default is 0.2.
+    :type volatility: float, optional
+    :param base_volume: The typical volume of a bar. Default is 1,000,000.
+    :type base_volume: float, optional
+    :param source: Prices whose returns are resampled in block bootstrap mode.
+    :type source: pd.Series, optional
+    :param block_size: The number of consecutive returns in one bootstrap block. Default is 20.
+    :type block_size: int, optional
+    :param detrend: If True, the mean log return is removed, so very long series neither overflow nor vanish. Default is False.
+    :type detrend: bool, optional
+    :return: A dictionary with 'Adj Close', 'Close', 'High', 'Low', 'Open' and 'Volume' arrays.
+    :rtype: dict[str, np.ndarray]
+
+    :raise ValueError: If block bootstrap mode is used without a valid source series.
+    """
+    # Every component has its own generator, so fewer bars are always a prefix of more bars
+    return_rng, regime_rng, open_rng, high_rng, low_rng, volume_rng = [
+        np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(6)
+    ]
+    bar_volatility = volatility * np.sqrt(1 / BARS_PER_YEAR.get(interval, 252))
+
+    log_returns = _log_returns(return_rng, regime_rng, n_bars, interval, mode, drift, volatility, source, block_size)
+    if detrend:
+        log_returns = log_returns - log_returns.mean()
+    close = initial_price * np.exp(np.cumsum(log_returns))
+
+    # Open gaps a little from the previous close
+    previous_close = np.concatenate([[initial_price], close[:-1]])
+    open_ = previous_close * np.exp(0.1 * bar_volatility * open_rng.standard_normal(n_bars))
+
+    # Wicks extend beyond the body, so high >= max(open, close) and low <= min(open, close)
+    high = np.maximum(open_, close) * np.exp(0.5 * bar_volatility * np.abs(high_rng.standard_normal(n_bars)))
+    low = np.minimum(open_, close) * np.exp(-0.5 * bar_volatility * np.abs(low_rng.standard_normal(n_bars)))
+
+    relative_move = np.abs(log_returns) / max(bar_volatility, 1e-12)
+    volume = base_volume * np.exp(0.3 * volume_rng.standard_normal(n_bars)) * (1 + 0.5 * relative_move)
+    volume = np.maximum(volume, 1).astype(np.int64)
+
+    return {
+        'Adj Close': close,
+        'Close': close,
+        'High': high,
+        'Low': low,
+        'Open': open_,
+        'Volume': volume
+    }
+
+
+def generate_ohlcv(n_bars: int,
+                   start: datetime = datetime(2000, 1, 3),
+                   interval: str = Interval.ONE_DAY.value,
+                   mode: SyntheticMode = SyntheticMode.GBM,
+                   seed: int = 0,
+                   **parameters) -> pd.DataFrame:
+    """
+    Generates a deterministic synthetic OHLCV DataFrame with the column layout of the `DownloadModule`.
+
+    The bars are generated by `generate_ohlcv_arrays` and indexed by the bar dates of the interval.
+    The dates must stay within the range pandas can represent (until the year 2262).
+
+    :param n_bars: The number of bars to generate.
+    :type n_bars: int
+    :param start: The date of the first bar, moved to the next valid bar date of the interval. Default is 2000-01-03.
+    :type start: datetime, optional
+    :param interval: The interval of the bars. Default is '1d'.
+    :type interval: str, optional
+    :param mode: The model generating the close prices. Default is `SyntheticMode.GBM`.
+    :type mode: SyntheticMode, optional
+    :param seed: The seed of the random generator. Default is 0.
+    :type seed: int, optional
+    :param parameters: Further keyword arguments passed to `generate_ohlcv_arrays`, e.g. `volatility`.
+    :return: A DataFrame with 'Adj Close', 'Close', 'High', 'Low', 'Open', 'Volume' columns and a 'Date' index.
+    :rtype: pd.DataFrame
+    """
+    columns = generate_ohlcv_arrays(n_bars, interval=interval, mode=mode, seed=seed, **parameters)
+    df = pd.DataFrame(columns, index=synthetic_dates(interval, start, periods=n_bars), copy=False)
+
+    return df[OHLCV_COLUMNS]
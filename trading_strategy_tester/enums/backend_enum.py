@@ -0,0 +1,17 @@
+from enum import Enum
+
+class Backend(Enum):
+    """
+    Backend is an enumeration that represents the implementations used to calculate the smoothings and
+    recursive indicators.
+
+    Attributes:
+    ----------
+    NUMPY : str
+        Represents the vectorized NumPy and pandas implementations, always available.
+    NUMBA : str
+        Represents loops compiled with Numba, available if Numba is installed.
+    """
+
+    NUMPY = 'numpy'  # Vectorized NumPy and pandas implementations
+    NUMBA = 'numba'  # Loops compiled just in time with Numba
@@ -0,0 +1,40 @@
+from enum import Enum
+
+class CandlestickPattern(Enum):
+    """
+    CandlestickPattern is an enumeration that represents the candlestick patterns detected by the pattern scanner.
+
+    The position of a member in the enumeration is the bit of the pattern in the bitmask returned by
+    `scan_candlestick_patterns`, so new patterns are always appended at the end.
+
+    Attributes:
+    ----------
+    HAMMER : str
+        Small body at the top of the candle with a long lower wick.
+    INVERTED_HAMMER : str
+        Small body at the bottom of the candle with a long upper wick.
+    DOJI : str
+        Open and close are almost equal.
+    BULLISH_ENGULFING : str
+        A bullish body engulfing the bearish body of the previous candle.
+    BEARISH_ENGULFING : str
+        A bearish body engulfing the bullish body of the previous candle.
+    BULLISH_HARAMI : str
+        A bullish body inside the bearish body of the previous candle.
+    BEARISH_HARAMI : str
+        A bearish body inside the bullish body of the previous candle.
+    MORNING_STAR : str
+        A long bearish candle, a small candle and a bullish candle closing above the middle of the first one.
+    EVENING_STAR : str
+        A long bullish candle, a small candle and a bearish candle closing below the middle of the first one.
+    """
+
+    HAMMER = 'HAMMER'
+    INVERTED_HAMMER = 'INVERTED_HAMMER'
+    DOJI = 'DOJI'
+    BULLISH_ENGULFING = 'BULLISH_ENGULFING'
+    BEARISH_ENGULFING = 'BEARISH_ENGULFING'
+    BULLISH_HARAMI = 'BULLISH_HARAMI'
+    BEARISH_HARAMI = 'BEARISH_HARAMI'
+    MORNING_STAR = 'MORNING_STAR'
+    EVENING_STAR = 'EVENING_STAR'
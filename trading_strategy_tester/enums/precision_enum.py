@@ -0,0 +1,16 @@
+from enum import Enum
+
+class Precision(Enum):
+    """
+    Precision is an enumeration that represents the floating point types used for price data and indicator values.
+
+    Attributes:
+    ----------
+    FLOAT64 : str
+        Represents double precision, the default.
+    FLOAT32 : str
+        Represents single precision, which halves the memory and memory bandwidth of large universes.
+    """
+
+    FLOAT64 = 'float64'  # Double precision
+    FLOAT32 = 'float32'  # Single precision
@@ -0,0 +1,19 @@
+from enum import Enum
+
+class SyntheticMode(Enum):
+    """
+    SyntheticMode is an enumeration that represents the models used to generate synthetic price series.
+
+    Attributes:
+    ----------
+    GBM : str
+        Represents a Geometric Brownian Motion with constant drift and volatility.
+    REGIME_SWITCHING : str
+        Represents a Geometric Brownian Motion switching between a bull and a bear regime.
+    BLOCK_BOOTSTRAP : str
+        Represents resampling of blocks of returns from an existing price series.
+    """
+
+    GBM = 'gbm'  # Geometric Brownian Motion
+    REGIME_SWITCHING = 'regime_switching'  # Two-state regime-switching GBM
+    BLOCK_BOOTSTRAP = 'block_bootstrap'  # Block bootstrap of historical returns
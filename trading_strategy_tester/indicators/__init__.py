@@ -1,4 +1,6 @@
 from .candlestick_patterns.hammer import hammer
+from .candlestick_patterns.pattern_scanner import candlestick_pattern
+from .candlestick_patterns.pattern_scanner import scan_candlestick_patterns
 
 from .momentum.bbp import bbp
 from .momentum.cci import cci
@@ -13,6 +15,7 @@ from .momentum.macd import macd_signal
 from .momentum.momentum import momentum
 from .momentum.roc import roc
 from .momentum.rsi import rsi
+from .momentum.rsi import rsi_batch
 from .momentum.stoch import percent_k
 from .momentum.stoch import percent_d
 from .momentum.trix import trix
@@ -26,6 +29,7 @@ from .overlap.ichimoku import leading_span_a
 from .overlap.ichimoku import leading_span_b
 from .overlap.ichimoku import lagging_span
 from .overlap.sma import sma
+from .overlap.sma import sma_batch
 
 from .trend.adx import adx
 from .trend.aroon import aroon_up
@@ -37,6 +41,9 @@ from .volatility.atr import atr
 from .volatility.bb import bb_lower
 from .volatility.bb import bb_upper
 from .volatility.bb import bb_middle
+from .volatility.bb import bb_lower_batch
+from .volatility.bb import bb_upper_batch
+from .volatility.bb import bb_middle_batch
 from .volatility.chop import chop
 from .volatility.dc import dc_lower
 from .volatility.dc import dc_upper
@@ -54,6 +61,8 @@ from .volume.pvt import pvt
 
 __all__ = [
     'hammer',
+    'candlestick_pattern',
+    'scan_candlestick_patterns',
 
     'bbp',
     'cci',
@@ -68,6 +77,7 @@ __all__ = [
     'momentum',
     'roc',
     'rsi',
+    'rsi_batch',
     'percent_k',
     'percent_d',
     'trix',
@@ -81,6 +91,7 @@ __all__ = [
     'leading_span_b',
     'lagging_span',
     'sma',
+    'sma_batch',
 
     'adx',
     'aroon_up',
@@ -92,6 +103,9 @@ __all__ = [
     'bb_lower',
     'bb_upper',
     'bb_middle',
+    'bb_lower_batch',
+    'bb_upper_batch',
+    'bb_middle_batch',
     'chop',
     'dc_lower',
     'dc_upper',
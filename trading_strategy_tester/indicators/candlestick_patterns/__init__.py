@@ -1 +1 @@
-__all__ = ['hammer']
\ No newline at end of file
+__all__ = ['hammer', 'pattern_scanner']
\ No newline at end of file
@@ -1,5 +1,7 @@
 import pandas as pd
-import numpy as np
+
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.indicators.candlestick_patterns.pattern_scanner import candlestick_pattern
 
 
 def hammer(high: pd.Series, low: pd.Series, open: pd.Series, close: pd.Series) -> pd.Series:
@@ -19,16 +21,5 @@ def hammer(high: pd.Series, low: pd.Series, open: pd.Series, close: pd.Series) -
     :rtype: pd.Series
     """
 
-    # Calculate differences of series
-    open_close_diff = np.abs(open - close)
-    min_low_diff = np.abs(np.minimum(close, open) - low)
-
-    # Prepare result series
-    hammer_series = pd.Series(False, index=high.index)
-
-    # Create hammer condition with 1.8 multiplier
-    hammer_condition = ((open == high) | (close == high)) & (1.8 * open_close_diff <= min_low_diff)
-    hammer_series[hammer_condition] = True
-
-    return pd.Series(hammer_series, name='HAMMER-CANDLESTICK-PATTERN')
-
+    # The hammer is one pattern of the candlestick pattern scanner
+    return candlestick_pattern(high, low, open, close, CandlestickPattern.HAMMER)
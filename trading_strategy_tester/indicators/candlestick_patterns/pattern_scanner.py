@@ -0,0 +1,192 @@
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.utils.intermediate_store import shared_intermediate
+
+# Thresholds of the pattern definitions
+WICK_BODY_RATIO = 1.8  # The long wick of a hammer is at least 1.8 times its body, like in `hammer`
+DOJI_BODY_RATIO = 0.1  # The body of a doji is at most 10 % of its range
+LONG_BODY_RATIO = 0.5  # A long body is at least half of the range of its candle
+STAR_BODY_RATIO = 0.3  # The body of a star is at most 30 % of the long body before it
+
+
+class CandleAnatomy:
+    """
+    The parts of every candle shared by all pattern definitions, calculated once as NumPy arrays.
+    """
+
+    def __init__(self, high: pd.Series, low: pd.Series, open: pd.Series, close: pd.Series):
+        """
+        Calculates the body, wicks and range of every candle.
+
+        :param high: Series representing the high prices for each period.
+        :type high: pd.Series
+        :param low: Series representing the low prices for each period.
+        :type low: pd.Series
+        :param open: Series representing the opening prices for each period.
+        :type open: pd.Series
+        :param close: Series representing the closing prices for each period.
+        :type close: pd.Series
+        """
+        self.high = high.to_numpy(dtype=np.float64)
+        self.low = low.to_numpy(dtype=np.float64)
+        self.open = open.to_numpy(dtype=np.float64)
+        self.close = close.to_numpy(dtype=np.float64)
+
+        self.body = self.close - self.open  # Positive for bullish and negative for bearish candles
+        self.body_size = np.abs(self.body)
+        self.body_top = np.maximum(self.open, self.close)
+        self.body_bottom = np.minimum(self.open, self.close)
+        self.upper_wick = np.abs(self.high - self.body_top)
+        self.lower_wick = np.abs(self.body_bottom - self.low)
+        self.range = self.high - self.low
+
+    @staticmethod
+    def previous(values: np.ndarray, periods: int = 1) -> np.ndarray:
+        """
+        Returns the values of the candle `periods` bars before every candle, NaN for the first candles.
+
+        :param values: The values of every candle.
+        :type values: np.ndarray
+        :param periods: The number of bars to look back. Default is 1.
+        :type periods: int, optional
+        :return: The shifted values.
+        :rtype: np.ndarray
+        """
+        shifted = np.full(len(values), np.nan)
+        shifted[periods:] = values[:len(values) - periods]
+        return shifted
+
+
+def _pattern_masks(candles: CandleAnatomy) -> dict[CandlestickPattern, np.ndarray]:
+    """
+    Evaluates every pattern of the catalogue on the candle anatomy. Comparisons with NaN are False,
+    so candles with missing prices and candles without enough history never match.
+    """
+    previous = candles.previous
+
+    body_1, body_size_1 = previous(candles.body), previous(candles.body_size)
+    open_1, close_1 = previous(candles.open), previous(candles.close)
+    body_top_1, body_bottom_1 = previous(candles.body_top), previous(candles.body_bottom)
+
+    body_2, body_size_2 = previous(candles.body, 2), previous(candles.body_size, 2)
+    open_2, close_2, range_2 = previous(candles.open, 2), previous(candles.close, 2), previous(candles.range, 2)
+
+    bullish, bearish = candles.body > 0, candles.body < 0
+    bullish_1, bearish_1 = body_1 > 0, body_1 < 0
+
+    # A long first candle followed by a small star, the third candle closes beyond the middle of the first body
+    long_first = body_size_2 >= LONG_BODY_RATIO * range_2
+    small_star = body_size_1 <= STAR_BODY_RATIO * body_size_2
+    middle_2 = (open_2 + close_2) / 2
+
+    return {
+        CandlestickPattern.HAMMER: (
+            ((candles.open == candles.high) | (candles.close == candles.high))
+            & (WICK_BODY_RATIO * candles.body_size <= candles.lower_wick)
+        ),
+        CandlestickPattern.INVERTED_HAMMER: (
+            ((candles.open == candles.low) | (candles.close == candles.low))
+            & (WICK_BODY_RATIO * candles.body_size <= candles.upper_wick)
+        ),
+        CandlestickPattern.DOJI: (candles.range > 0) & (candles.body_size <= DOJI_BODY_RATIO * candles.range),
+        CandlestickPattern.BULLISH_ENGULFING: (
+            bearish_1 & bullish & (candles.open <= close_1) & (candles.close >= open_1)
+            & (candles.body_size > body_size_1)
+        ),
+        CandlestickPattern.BEARISH_ENGULFING: (
+            bullish_1 & bearish & (candles.open >= close_1) & (candles.close <= open_1)
+            & (candles.body_size > body_size_1)
+        ),
+        CandlestickPattern.BULLISH_HARAMI: bearish_1 & bullish & (candles.open > close_1) & (candles.close < open_1),
+        CandlestickPattern.BEARISH_HARAMI: bullish_1 & bearish & (candles.open < close_1) & (candles.close > open_1),
+        CandlestickPattern.MORNING_STAR: (
+            (body_2 < 0) & long_first & small_star & (body_top_1 <= close_2) & bullish & (candles.close > middle_2)
+        ),
+        CandlestickPattern.EVENING_STAR: (
+            (body_2 > 0) & long_first & small_star & (body_bottom_1 >= close_2) & bearish & (candles.close < middle_2)
+        ),
+    }
+
+
+def pattern_bit(pattern: CandlestickPattern) -> int:
+    """
+    Returns the bit of the pattern in the bitmask of `scan_candlestick_patterns`.
+
+    :param pattern: The candlestick pattern.
+    :type pattern: CandlestickPattern
+    :return: The bit value, a power of two.
+    :rtype: int
+    """
+    return 1 << list(CandlestickPattern).index(pattern)
+
+
+def scan_candlestick_patterns(high: pd.Series, low: pd.Series, open: pd.Series, close: pd.Series) -> pd.Series:
+    """
+    Detects all patterns of the `CandlestickPattern` catalogue in one vectorized pass.
+
+    The body, wicks and range of the candles are calculated once and shared by all pattern definitions.
+    The result holds one integer per candle, in which the bit of every matching pattern is set
+    (see `pattern_bit`), so one column describes all patterns.
+
+    :param high: Series representing the high prices for each period.
+    :type high: pd.Series
+    :param low: Series representing the low prices for each period.
+    :type low: pd.Series
+    :param open: Series representing the opening prices for each period.
+    :type open: pd.Series
+    :param close: Series representing the closing prices for each period.
+    :type close: pd.Series
+    :return: A Series of pattern bitmasks named 'CANDLESTICK-PATTERNS'.
+    :rtype: pd.Series
+    """
+    masks = _pattern_masks(CandleAnatomy(high, low, open, close))
+
+    bitmask = np.zeros(len(high), dtype=np.uint16)
+    for pattern, mask in masks.items():
+        bitmask |= np.where(mask, pattern_bit(pattern), 0).astype(np.uint16)
+
+    return pd.Series(bitmask, index=high.index, name='CANDLESTICK-PATTERNS')
+
+
+def has_pattern(bitmask: pd.Series, pattern: CandlestickPattern) -> pd.Series:
+    """
+    Extracts the occurrences of one pattern from the bitmasks of `scan_candlestick_patterns`.
+
+    :param bitmask: The pattern bitmasks.
+    :type bitmask: pd.Series
+    :param pattern: The candlestick pattern.
+    :type pattern: CandlestickPattern
+    :return: A Series where True indicates the occurrence of the pattern.
+    :rtype: pd.Series
+    """
+    return pd.Series((bitmask.to_numpy() & pattern_bit(pattern)) != 0, index=bitmask.index,
+                     name=f'{pattern.value}-CANDLESTICK-PATTERN')
+
+
+def candlestick_pattern(high: pd.Series, low: pd.Series, open: pd.Series, close: pd.Series,
+                        pattern: CandlestickPattern) -> pd.Series:
+    """
+    Identifies one candlestick pattern of the `CandlestickPattern` catalogue.
+
+    The whole catalogue is scanned once per price data through the active intermediate store,
+    so detecting several patterns of the same prices costs one scan.
+
+    :param high: Series representing the high prices for each period.
+    :type high: pd.Series
+    :param low: Series representing the low prices for each period.
+    :type low: pd.Series
+    :param open: Series representing the opening prices for each period.
+    :type open: pd.Series
+    :param close: Series representing the closing prices for each period.
+    :type close: pd.Series
+    :param pattern: The candlestick pattern to identify.
+    :type pattern: CandlestickPattern
+    :return: A Series where True indicates the occurrence of the pattern.
+    :rtype: pd.Series
+    """
+    bitmask = shared_intermediate('candlestick_patterns', (high, low, open, close), (),
+                                  lambda: scan_candlestick_patterns(high, low, open, close))
+
+    return has_pattern(bitmask, pattern)
@@ -1,10 +1,10 @@
 import pandas as pd
-import numpy as np
 
 from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.smoothings.sma_smoothing import sma_smoothing
 from trading_strategy_tester.smoothings.smooth import smooth
 from trading_strategy_tester.utils.parameter_validations import get_length
+from trading_strategy_tester.utils.rolling_kernels import rolling_mean_absolute_deviation
 
 
 def cci(series: pd.Series, length: int = 20, smoothing_type: SmoothingType = SmoothingType.SMA, smoothing_length: int = 1) -> pd.Series:
@@ -34,7 +34,7 @@ def cci(series: pd.Series, length: int = 20, smoothing_type: SmoothingType = Smo
     sma_typical_price = sma_smoothing(series, length)
 
     # Calculate the Mean Deviation
-    mean_deviation = series.rolling(window=length).apply(lambda x: np.mean(np.abs(x - np.mean(x))), raw=True)
+    mean_deviation = pd.Series(rolling_mean_absolute_deviation(series.to_numpy(dtype=float), length), index=series.index)
 
     # Calculate the CCI
     cci = (series - sma_typical_price) / (0.015 * mean_deviation)
@@ -4,9 +4,43 @@ from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.smoothings.smooth import smooth
 from trading_strategy_tester.utils.parameter_validations import get_length
 from trading_strategy_tester.indicators.volatility.atr import atr
+from trading_strategy_tester.utils.intermediate_store import shared_intermediate
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
 
-def di_plus(high: pd.Series, low: pd.Series, close: pd.Series, di_length: int = 14) -> pd.Series:
+def directional_movement(high: pd.Series | pd.DataFrame,
+                         low: pd.Series | pd.DataFrame) -> tuple[pd.Series | pd.DataFrame, pd.Series | pd.DataFrame]:
+    """
+    Calculate the Positive and Negative Directional Movement (+DM and -DM) used by the Directional Indicators.
+
+    Only the greater of the two movements is kept on every period, and only if it is positive. Both movements
+    are calculated together and shared through the active intermediate store, so +DI, -DI and ADX of the same
+    prices calculate them once.
+
+    :param high: A pandas Series representing the high prices for each period.
+    :type high: pd.Series | pd.DataFrame
+    :param low: A pandas Series representing the low prices for each period.
+    :type low: pd.Series | pd.DataFrame
+    :return: A tuple of the +DM and the -DM, which must not be modified.
+    :rtype: tuple[pd.Series | pd.DataFrame, pd.Series | pd.DataFrame]
+    """
+
+    def compute():
+        up_move = high.diff()
+        down_move = -low.diff()
+
+        # Keep only the positive movement which is greater than the opposite movement
+        plus_dm = up_move.where((up_move > down_move) & (up_move > 0), 0.0)
+        minus_dm = down_move.where((down_move > up_move) & (down_move > 0), 0.0)
+
+        return plus_dm, minus_dm
+
+    return shared_intermediate('directional_movement', (high, low), (), compute)
+
+
+@panel_indicator
+def di_plus(high: pd.Series | pd.DataFrame, low: pd.Series | pd.DataFrame, close: pd.Series | pd.DataFrame,
+            di_length: int = 14) -> pd.Series | pd.DataFrame:
     """
     Calculate the Positive Directional Indicator (+DI) for a given price series.
 
@@ -15,40 +49,38 @@ def di_plus(high: pd.Series, low: pd.Series, close: pd.Series, di_length: int =
     by comparing the current high price to the previous high price, normalized by the Average True Range (ATR).
 
     :param high: A pandas Series representing the high prices for each period.
-    :type high: pd.Series
+    :type high: pd.Series | pd.DataFrame
     :param low: A pandas Series representing the low prices for each period.
-    :type low: pd.Series
+    :type low: pd.Series | pd.DataFrame
     :param close: A pandas Series representing the closing prices for each period.
-    :type close: pd.Series
+    :type close: pd.Series | pd.DataFrame
     :param di_length: The number of periods over which to calculate the +DI. Default is 14.
     :type di_length: int, optional
     :return: A pandas Series containing the +DI values.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
     # Validate arguments
     di_length = get_length(di_length, 14)
 
-    # Calculate the Average True Range (ATR)
-    atr_series = atr(high, low, close, di_length)
-
-    # Calculate the Positive Directional Movement (+DM)
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
+    def compute():
+        # Calculate the Average True Range (ATR)
+        atr_series = atr(high, low, close, di_length)
 
-    # Keep only positive +DM values where +DM is greater than -DM
-    plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0.0)
+        # Smooth the Positive Directional Movement (+DM) using Wilder's Smoothing (RMA)
+        plus_dm_smoothed = smooth(directional_movement(high, low)[0], di_length, SmoothingType.RMA)
 
-    # Smooth the Positive Directional Movement using Wilder's Smoothing (RMA)
-    plus_dm_smoothed = smooth(plus_dm, di_length, SmoothingType.RMA)
+        # Calculate the Positive Directional Indicator (+DI)
+        return 100 * (plus_dm_smoothed / atr_series)
 
-    # Calculate the Positive Directional Indicator (+DI)
-    plus_di = 100 * (plus_dm_smoothed / atr_series)
+    plus_di = shared_intermediate('di_plus', (high, low, close), (di_length,), compute)
 
     # Return the +DI values as a pandas Series
-    return pd.Series(plus_di, name=f'DIPLUS_{di_length}')
+    return named(plus_di, f'DIPLUS_{di_length}')
 
 
-def di_minus(high: pd.Series, low: pd.Series, close: pd.Series, di_length: int = 14) -> pd.Series:
+@panel_indicator
+def di_minus(high: pd.Series | pd.DataFrame, low: pd.Series | pd.DataFrame, close: pd.Series | pd.DataFrame,
+             di_length: int = 14) -> pd.Series | pd.DataFrame:
     """
     Calculate the Negative Directional Indicator (-DI) for a given price series.
 
@@ -57,34 +89,30 @@ def di_minus(high: pd.Series, low: pd.Series, close: pd.Series, di_length: int =
     by comparing the current low price to the previous low price, normalized by the Average True Range (ATR).
 
     :param high: A pandas Series representing the high prices for each period.
-    :type high: pd.Series
+    :type high: pd.Series | pd.DataFrame
     :param low: A pandas Series representing the low prices for each period.
-    :type low: pd.Series
+    :type low: pd.Series | pd.DataFrame
     :param close: A pandas Series representing the closing prices for each period.
-    :type close: pd.Series
+    :type close: pd.Series | pd.DataFrame
     :param di_length: The number of periods over which to calculate the -DI. Default is 14.
     :type di_length: int, optional
     :return: A pandas Series containing the -DI values.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
     # Validate arguments
     di_length = get_length(di_length, 14)
 
-    # Calculate the Average True Range (ATR)
-    atr_series = atr(high, low, close, di_length)
-
-    # Calculate the Negative Directional Movement (-DM)
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
+    def compute():
+        # Calculate the Average True Range (ATR)
+        atr_series = atr(high, low, close, di_length)
 
-    # Keep only positive -DM values where -DM is greater than +DM
-    minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0.0)
+        # Smooth the Negative Directional Movement (-DM) using Wilder's Smoothing (RMA)
+        minus_dm_smoothed = smooth(directional_movement(high, low)[1], di_length, SmoothingType.RMA)
 
-    # Smooth the Negative Directional Movement using Wilder's Smoothing (RMA)
-    minus_dm_smoothed = smooth(minus_dm, di_length, SmoothingType.RMA)
+        # Calculate the Negative Directional Indicator (-DI)
+        return 100 * (minus_dm_smoothed / atr_series)
 
-    # Calculate the Negative Directional Indicator (-DI)
-    minus_di = 100 * (minus_dm_smoothed / atr_series)
+    minus_di = shared_intermediate('di_minus', (high, low, close), (di_length,), compute)
 
     # Return the -DI values as a pandas Series
-    return pd.Series(minus_di, name=f'DIMINUS_{di_length}')
+    return named(minus_di, f'DIMINUS_{di_length}')
@@ -4,6 +4,7 @@ from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.smoothings.smooth import smooth
 from trading_strategy_tester.utils.parameter_validations import get_length
 from trading_strategy_tester.indicators.momentum.roc import roc
+from trading_strategy_tester.utils.intermediate_store import shared_intermediate
 
 
 def kst(series: pd.Series,
@@ -54,20 +55,26 @@ def kst(series: pd.Series,
     sma_length_3 = get_length(length=sma_length_3, default=10)
     sma_length_4 = get_length(length=sma_length_4, default=15)
 
-    # Calculate Rate Of Change for each period
-    roc_1 = roc(series=series, length=roc_length_1)
-    roc_2 = roc(series=series, length=roc_length_2)
-    roc_3 = roc(series=series, length=roc_length_3)
-    roc_4 = roc(series=series, length=roc_length_4)
-
-    # Smooth each ROC using SMA
-    roc_1_smoothen = smooth(series=roc_1, length=sma_length_1, smoothing_type=SmoothingType.SMA)
-    roc_2_smoothen = smooth(series=roc_2, length=sma_length_2, smoothing_type=SmoothingType.SMA)
-    roc_3_smoothen = smooth(series=roc_3, length=sma_length_3, smoothing_type=SmoothingType.SMA)
-    roc_4_smoothen = smooth(series=roc_4, length=sma_length_4, smoothing_type=SmoothingType.SMA)
-
-    # Sum the weighted ROCs to get the KST line
-    kst_series = roc_1_smoothen + 2 * roc_2_smoothen + 3 * roc_3_smoothen + 4 * roc_4_smoothen
+    def compute():
+        # Calculate Rate Of Change for each period
+        roc_1 = roc(series=series, length=roc_length_1)
+        roc_2 = roc(series=series, length=roc_length_2)
+        roc_3 = roc(series=series, length=roc_length_3)
+        roc_4 = roc(series=series, length=roc_length_4)
+
+        # Smooth each ROC using SMA
+        roc_1_smoothen = smooth(series=roc_1, length=sma_length_1, smoothing_type=SmoothingType.SMA)
+        roc_2_smoothen = smooth(series=roc_2, length=sma_length_2, smoothing_type=SmoothingType.SMA)
+        roc_3_smoothen = smooth(series=roc_3, length=sma_length_3, smoothing_type=SmoothingType.SMA)
+        roc_4_smoothen = smooth(series=roc_4, length=sma_length_4, smoothing_type=SmoothingType.SMA)
+
+        # Sum the weighted ROCs to get the KST line
+        return roc_1_smoothen + 2 * roc_2_smoothen + 3 * roc_3_smoothen + 4 * roc_4_smoothen
+
+    # The KST line is shared with the KST signal line through the active intermediate store
+    lengths = (roc_length_1, roc_length_2, roc_length_3, roc_length_4, sma_length_1, sma_length_2, sma_length_3,
+               sma_length_4)
+    kst_series = shared_intermediate('kst', (series,), lengths, compute)
 
     return pd.Series(kst_series,
                      name=f'KST_{roc_length_1}_{roc_length_2}_{roc_length_3}_{roc_length_4}_{sma_length_1}_{sma_length_2}_{sma_length_3}_{sma_length_4}')
@@ -1,6 +1,8 @@
 import pandas as pd
+from trading_strategy_tester.utils.intermediate_store import shared_intermediate
 from trading_strategy_tester.utils.parameter_validations import get_length
 
+
 def roc(series: pd.Series, length: int = 9) -> pd.Series:
     """
     Calculate the Rate of Change (ROC) of a given series.
@@ -21,6 +23,7 @@ def roc(series: pd.Series, length: int = 9) -> pd.Series:
     length = get_length(length=length, default=14)
 
     # Calculate the ROC
-    roc_ser = (series.diff(length) / series.shift(length)) * 100
+    roc_ser = shared_intermediate('roc', (series,), (length,),
+                                  lambda: (series.diff(length) / series.shift(length)) * 100)
 
     return pd.Series(roc_ser, name=f'ROC_{length}')
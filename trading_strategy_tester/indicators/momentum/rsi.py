@@ -1,11 +1,14 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.smoothings.smooth import smooth
 from trading_strategy_tester.utils.parameter_validations import get_length
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
 
-def rsi(series: pd.Series, length: int = 14) -> pd.Series:
+@panel_indicator
+def rsi(series: pd.Series | pd.DataFrame, length: int = 14) -> pd.Series | pd.DataFrame:
     """
     Calculate the Relative Strength Index (RSI) of a given series using Wilder's Moving Average.
 
@@ -13,11 +16,11 @@ def rsi(series: pd.Series, length: int = 14) -> pd.Series:
     It oscillates between 0 and 100 and is typically used to identify overbought or oversold conditions in a market.
 
     :param series: A pandas Series representing the series data (e.g., closing prices) for which the RSI is to be calculated.
-    :type series: pd.Series
+    :type series: pd.Series | pd.DataFrame
     :param length: The number of periods to use for calculating the RSI. Default is 14, which is a common standard.
     :type length: int, optional
     :return: A pandas Series containing the RSI values for the input series, with the same index as the input series.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
@@ -40,4 +43,41 @@ def rsi(series: pd.Series, length: int = 14) -> pd.Series:
     # Calculate RSI
     rsi_ser = 100 - (100 / (1 + rs))
 
-    return pd.Series(rsi_ser, name=f'RSI_{length}')
+    return named(rsi_ser, f'RSI_{length}')
+
+
+def rsi_batch(series: pd.Series, lengths: list[int]) -> pd.DataFrame:
+    """
+    Calculate the Relative Strength Index (RSI) of a given series for many lengths at once.
+
+    The price delta, gains and losses are computed only once and shared by all lengths, only Wilder's
+    Moving Average is applied per length. The results are equal to calling `rsi` for every length.
+
+    :param series: A pandas Series representing the series data (e.g., closing prices) for which the RSI is to be calculated.
+    :type series: pd.Series
+    :param lengths: The numbers of periods to use for calculating the RSI.
+    :type lengths: list[int]
+    :return: A DataFrame with one column per distinct length, named like the results of `rsi`.
+    :rtype: pd.DataFrame
+    """
+
+    # Validate arguments, keeping the first occurrence of repeated lengths
+    lengths = list(dict.fromkeys(get_length(length=length, default=14) for length in lengths))
+
+    # Calculate the difference between consecutive prices
+    delta = series.diff()
+
+    # Calculate gains and losses
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+
+    columns = {}
+    for length in lengths:
+        # Compute the average gain and loss using Wilder's Moving Average (RMA)
+        avg_gain = smooth(gain, length, SmoothingType.RMA).to_numpy()
+        avg_loss = smooth(loss, length, SmoothingType.RMA).to_numpy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            columns[f'RSI_{length}'] = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    return pd.DataFrame(columns, index=series.index)
@@ -2,9 +2,12 @@ import pandas as pd
 from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.smoothings.smooth import smooth
 from trading_strategy_tester.utils.parameter_validations import get_length
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
 
-def percent_k(close: pd.Series, low: pd.Series, high: pd.Series, length: int = 14) -> pd.Series:
+@panel_indicator
+def percent_k(close: pd.Series | pd.DataFrame, low: pd.Series | pd.DataFrame, high: pd.Series | pd.DataFrame,
+              length: int = 14) -> pd.Series | pd.DataFrame:
     """
     Calculate the Stochastic %K indicator for a given financial instrument.
 
@@ -12,15 +15,15 @@ def percent_k(close: pd.Series, low: pd.Series, high: pd.Series, length: int = 1
     (default is 14). It is used in technical analysis to identify overbought and oversold conditions.
 
     :param close: Series of closing prices.
-    :type close: pd.Series
+    :type close: pd.Series | pd.DataFrame
     :param low: Series of the lowest prices.
-    :type low: pd.Series
+    :type low: pd.Series | pd.DataFrame
     :param high: Series of the highest prices.
-    :type high: pd.Series
+    :type high: pd.Series | pd.DataFrame
     :param length: The number of periods over which to calculate the %K component. Default is 14.
     :type length: int, optional
     :return: A pandas Series containing the Stochastic %K values labeled with the appropriate name.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate the length argument
@@ -35,11 +38,12 @@ def percent_k(close: pd.Series, low: pd.Series, high: pd.Series, length: int = 1
     hl = highest_high - lowest_low
     percent_k = (cl / hl) * 100
 
-    return pd.Series(percent_k, name=f'STOCH-PERCENT-K_{length}')
+    return named(percent_k, f'STOCH-PERCENT-K_{length}')
 
 
-def percent_d(close: pd.Series, low: pd.Series, high: pd.Series, length: int = 14,
-              d_smooth_length: int = 3) -> pd.Series:
+@panel_indicator
+def percent_d(close: pd.Series | pd.DataFrame, low: pd.Series | pd.DataFrame, high: pd.Series | pd.DataFrame,
+              length: int = 14, d_smooth_length: int = 3) -> pd.Series | pd.DataFrame:
     """
     Calculate the Stochastic %D indicator for a given financial instrument.
 
@@ -48,17 +52,17 @@ def percent_d(close: pd.Series, low: pd.Series, high: pd.Series, length: int = 1
     trends and potential reversal points.
 
     :param close: Series of closing prices.
-    :type close: pd.Series
+    :type close: pd.Series | pd.DataFrame
     :param low: Series of the lowest prices.
-    :type low: pd.Series
+    :type low: pd.Series | pd.DataFrame
     :param high: Series of the highest prices.
-    :type high: pd.Series
+    :type high: pd.Series | pd.DataFrame
     :param length: The number of periods over which to calculate the %K component. Default is 14.
     :type length: int, optional
     :param d_smooth_length: The smoothing period for calculating %D from %K. Default is 3.
     :type d_smooth_length: int, optional
     :return: A pandas Series containing the Stochastic %D values labeled with the appropriate name.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Calculate the Stochastic %K series
@@ -67,4 +71,4 @@ def percent_d(close: pd.Series, low: pd.Series, high: pd.Series, length: int = 1
     # Calculate %D as the smoothed %K (SMA by default)
     percent_d = smooth(percent_k_series, d_smooth_length, SmoothingType.SMA)
 
-    return pd.Series(percent_d, name=f'STOCH-PERCENT-D_{length}_{d_smooth_length}')
+    return named(percent_d, f'STOCH-PERCENT-D_{length}_{d_smooth_length}')
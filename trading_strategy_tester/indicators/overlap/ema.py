@@ -1,8 +1,10 @@
 import pandas as pd
 
 from trading_strategy_tester.utils.parameter_validations import get_length, get_offset
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
-def ema(series: pd.Series, length: int = 9, offset: int = 0) -> pd.Series:
+@panel_indicator
+def ema(series: pd.Series | pd.DataFrame, length: int = 9, offset: int = 0) -> pd.Series | pd.DataFrame:
     """
     Calculate the Exponential Moving Average (EMA) of a given series.
 
@@ -11,13 +13,13 @@ def ema(series: pd.Series, length: int = 9, offset: int = 0) -> pd.Series:
     in technical analysis to identify trends and to smooth out price data.
 
     :param series: A pandas Series representing the series data (e.g., closing prices) for which the EMA is to be calculated.
-    :type series: pd.Series
+    :type series: pd.Series | pd.DataFrame
     :param length: The window length to calculate the EMA. Default is 9.
     :type length: int, optional
     :param offset: The number of periods by which to offset the EMA. Default is 0.
     :type offset: int, optional
     :return: A pandas Series containing the EMA of the given series.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
@@ -29,4 +31,4 @@ def ema(series: pd.Series, length: int = 9, offset: int = 0) -> pd.Series:
     if offset != 0:
         ema_series = ema_series.shift(offset)
 
-    return pd.Series(ema_series, name=f'EMA_{length}_{offset}')
+    return named(ema_series, f'EMA_{length}_{offset}')
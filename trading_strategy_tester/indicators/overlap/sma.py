@@ -1,8 +1,11 @@
 import pandas as pd
 
 from trading_strategy_tester.utils.parameter_validations import get_length, get_offset
+from trading_strategy_tester.utils.rolling_kernels import rolling_mean_batch
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
-def sma(series: pd.Series, length: int = 9, offset: int = 0) -> pd.Series:
+@panel_indicator
+def sma(series: pd.Series | pd.DataFrame, length: int = 9, offset: int = 0) -> pd.Series | pd.DataFrame:
     """
     Calculate the Simple Moving Average (SMA) of a given series.
 
@@ -11,13 +14,13 @@ def sma(series: pd.Series, length: int = 9, offset: int = 0) -> pd.Series:
     trends in the data by filtering out the "noise" of short-term fluctuations.
 
     :param series: A pandas Series representing the series data (e.g., closing prices) for which the SMA is to be calculated.
-    :type series: pd.Series
+    :type series: pd.Series | pd.DataFrame
     :param length: The window length to calculate the SMA. Default is 9.
     :type length: int, optional
     :param offset: The number of periods by which to offset the SMA. Default is 0.
     :type offset: int, optional
     :return: A pandas Series containing the SMA of the given series.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
@@ -29,4 +32,38 @@ def sma(series: pd.Series, length: int = 9, offset: int = 0) -> pd.Series:
     if offset != 0:
         sma_series = sma_series.shift(offset)
 
-    return pd.Series(sma_series, name=f'SMA_{length}_{offset}')
+    return named(sma_series, f'SMA_{length}_{offset}')
+
+
+def sma_batch(series: pd.Series, lengths: list[int], offset: int = 0) -> pd.DataFrame:
+    """
+    Calculate the Simple Moving Average (SMA) of a given series for many lengths at once.
+
+    The cumulative sums of the series are computed once and every length is a difference of two cumulative
+    sums, so each additional length costs a single vectorized pass. The results match `sma` up to floating
+    point rounding.
+
+    :param series: A pandas Series representing the series data (e.g., closing prices) for which the SMA is to be calculated.
+    :type series: pd.Series
+    :param lengths: The window lengths to calculate the SMA.
+    :type lengths: list[int]
+    :param offset: The number of periods by which to offset the SMA. Default is 0.
+    :type offset: int, optional
+    :return: A DataFrame with one column per distinct length, named like the results of `sma`.
+    :rtype: pd.DataFrame
+    """
+
+    # Validate arguments, keeping the first occurrence of repeated lengths
+    lengths = list(dict.fromkeys(get_length(length=length, default=9) for length in lengths))
+    offset = get_offset(offset=offset)
+
+    sma_df = pd.DataFrame(
+        rolling_mean_batch(series.to_numpy(dtype=float), lengths),
+        index=series.index,
+        columns=[f'SMA_{length}_{offset}' for length in lengths]
+    )
+
+    if offset != 0:
+        sma_df = sma_df.shift(offset)
+
+    return sma_df
@@ -2,9 +2,12 @@ import pandas as pd
 from trading_strategy_tester.indicators.momentum.dmi import di_plus, di_minus
 from trading_strategy_tester.smoothings.rma_smoothing import rma_smoothing
 from trading_strategy_tester.utils.parameter_validations import get_length
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
 
-def adx(high: pd.Series, low: pd.Series, close: pd.Series, adx_smoothing: int = 14, di_length: int = 14) -> pd.Series:
+@panel_indicator
+def adx(high: pd.Series | pd.DataFrame, low: pd.Series | pd.DataFrame, close: pd.Series | pd.DataFrame,
+        adx_smoothing: int = 14, di_length: int = 14) -> pd.Series | pd.DataFrame:
     """
     Calculate the Average Directional Index (ADX) and the Directional Indicators (+DI and -DI).
 
@@ -13,17 +16,17 @@ def adx(high: pd.Series, low: pd.Series, close: pd.Series, adx_smoothing: int =
     (+DI and -DI) which help in identifying the direction of the trend.
 
     :param high: A pandas Series containing the high prices of the financial instrument.
-    :type high: pd.Series
+    :type high: pd.Series | pd.DataFrame
     :param low: A pandas Series containing the low prices of the financial instrument.
-    :type low: pd.Series
+    :type low: pd.Series | pd.DataFrame
     :param close: A pandas Series containing the closing prices of the financial instrument.
-    :type close: pd.Series
+    :type close: pd.Series | pd.DataFrame
     :param adx_smoothing: The period for smoothing the ADX calculation. Default is 14.
     :type adx_smoothing: int, optional
     :param di_length: The period for calculating the Directional Indicators (+DI and -DI). Default is 14.
     :type di_length: int, optional
     :return: A pandas Series containing the ADX values.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
@@ -40,4 +43,4 @@ def adx(high: pd.Series, low: pd.Series, close: pd.Series, adx_smoothing: int =
     # Calculate the ADX (Average Directional Index) using Wilder's Moving Average
     adx_series = rma_smoothing(dx, adx_smoothing)
 
-    return pd.Series(adx_series, name=f'ADX_{adx_smoothing}_{di_length}')
+    return named(adx_series, f'ADX_{adx_smoothing}_{di_length}')
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from trading_strategy_tester.utils.parameter_validations import get_length
+from trading_strategy_tester.utils.rolling_kernels import rolling_bars_since_max, rolling_bars_since_min
 
 
 def aroon_up(series: pd.Series, length: int = 14) -> pd.Series:
@@ -22,7 +23,7 @@ def aroon_up(series: pd.Series, length: int = 14) -> pd.Series:
     length = get_length(length=length, default=14)
 
     # Calculate rolling window's highest high index
-    rolling_high_idx = series.rolling(window=length + 1).apply(lambda x: x[::-1].argmax(), raw=True)
+    rolling_high_idx = pd.Series(rolling_bars_since_max(series.to_numpy(dtype=float), length + 1), index=series.index)
 
     # Aroon Up calculation
     aroon_up_series = 100 * (length - rolling_high_idx) / length
@@ -49,7 +50,7 @@ def aroon_down(series: pd.Series, length: int = 14) -> pd.Series:
     length = get_length(length=length, default=14)
 
     # Calculate rolling window's lowest low index
-    rolling_low_idx = series.rolling(window=length + 1).apply(lambda x: x[::-1].argmin(), raw=True)
+    rolling_low_idx = pd.Series(rolling_bars_since_min(series.to_numpy(dtype=float), length + 1), index=series.index)
 
     # Aroon Down calculation
     aroon_down_series = 100 * (length - rolling_low_idx) / length
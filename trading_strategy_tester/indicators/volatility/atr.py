@@ -1,12 +1,44 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.smoothings.smooth import smooth
 from trading_strategy_tester.utils.parameter_validations import get_length
+from trading_strategy_tester.utils.intermediate_store import shared_intermediate
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
 
-def atr(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14,
-        smoothing: SmoothingType = SmoothingType.RMA) -> pd.Series:
+def true_range(high: pd.Series | pd.DataFrame, low: pd.Series | pd.DataFrame,
+               close: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the True Range (TR), the greatest of the current high-low range and the distances
+    of the previous close to the current high and low.
+
+    The True Range is shared through the active intermediate store by every indicator calculated from it.
+
+    :param high: A pandas Series representing the high prices.
+    :type high: pd.Series | pd.DataFrame
+    :param low: A pandas Series representing the low prices.
+    :type low: pd.Series | pd.DataFrame
+    :param close: A pandas Series representing the closing prices.
+    :type close: pd.Series | pd.DataFrame
+    :return: The True Range, which must not be modified.
+    :rtype: pd.Series | pd.DataFrame
+    """
+
+    def compute():
+        tr1 = high - low
+        tr2 = (high - close.shift(1)).abs()
+        tr3 = (low - close.shift(1)).abs()
+        # The NaN ignoring maximum works element-wise, so it also keeps the ticker columns of a panel
+        return np.fmax(np.fmax(tr1, tr2), tr3)
+
+    return shared_intermediate('true_range', (high, low, close), (), compute)
+
+
+@panel_indicator
+def atr(high: pd.Series | pd.DataFrame, low: pd.Series | pd.DataFrame, close: pd.Series | pd.DataFrame,
+        length: int = 14, smoothing: SmoothingType = SmoothingType.RMA) -> pd.Series | pd.DataFrame:
     """
     Calculate the Average True Range (ATR) of a given series using a specified smoothing method.
 
@@ -16,29 +48,24 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14,
     - The difference between the previous close and the current low.
 
     :param high: A pandas Series representing the high prices.
-    :type high: pd.Series
+    :type high: pd.Series | pd.DataFrame
     :param low: A pandas Series representing the low prices.
-    :type low: pd.Series
+    :type low: pd.Series | pd.DataFrame
     :param close: A pandas Series representing the closing prices.
-    :type close: pd.Series
+    :type close: pd.Series | pd.DataFrame
     :param length: The window length to calculate the ATR. Default is 14 periods.
     :type length: int, optional
     :param smoothing: The smoothing method to use. Can be 'RMA', 'SMA', 'EMA', or 'WMA'. Default is SmoothingType.RMA.
     :type smoothing: SmoothingType, optional
     :return: A pandas Series containing the ATR values for the given series.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
     length = get_length(length=length, default=14)
 
-    # Calculate True Range (TR)
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    # Calculate ATR using the specified smoothing method
-    atr_series = smooth(true_range, length, smoothing)
+    # Calculate ATR from the True Range (TR) using the specified smoothing method
+    atr_series = shared_intermediate('atr', (high, low, close), (length, smoothing),
+                                     lambda: smooth(true_range(high, low, close), length, smoothing))
 
-    return pd.Series(atr_series, name=f'ATR_{length}_{smoothing.value}')
+    return named(atr_series, f'ATR_{length}_{smoothing.value}')
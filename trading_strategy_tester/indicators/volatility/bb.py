@@ -1,19 +1,42 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.smoothings.smooth import smooth
 from trading_strategy_tester.utils.parameter_validations import get_length, get_std_dev, get_offset
+from trading_strategy_tester.utils.intermediate_store import shared_intermediate
+from trading_strategy_tester.utils.rolling_kernels import rolling_mean_batch
+from trading_strategy_tester.utils.panel import named, panel_indicator
 
 
-def bb_middle(series: pd.Series, length: int = 20, ma_type: SmoothingType = SmoothingType.SMA, std_dev: float = 2,
-              offset: int = 0) -> pd.Series:
+def population_std(series: pd.Series | pd.DataFrame, length: int) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the rolling population standard deviation used by the Bollinger Bands.
+
+    The standard deviation is shared through the active intermediate store, so the upper and lower band
+    of the same series calculate it once.
+
+    :param series: A pandas Series representing the input time series (e.g., closing prices).
+    :type series: pd.Series | pd.DataFrame
+    :param length: The number of periods in the rolling window.
+    :type length: int
+    :return: The rolling standard deviation, which must not be modified.
+    :rtype: pd.Series | pd.DataFrame
+    """
+    return shared_intermediate('population_std', (series,), (length,),
+                               lambda: series.rolling(window=length).std(ddof=0))
+
+
+@panel_indicator
+def bb_middle(series: pd.Series | pd.DataFrame, length: int = 20, ma_type: SmoothingType = SmoothingType.SMA,
+              std_dev: float = 2, offset: int = 0) -> pd.Series | pd.DataFrame:
     """
     Calculate the middle band (moving average) for Bollinger Bands.
 
     The middle band is a moving average of the input series, used as the centerline for the Bollinger Bands.
 
     :param series: A pandas Series representing the input time series (e.g., closing prices).
-    :type series: pd.Series
+    :type series: pd.Series | pd.DataFrame
     :param length: The number of periods to use for calculating the moving average. Default is 20 periods.
     :type length: int, optional
     :param ma_type: The type of moving average to use. Can be 'SMA', 'EMA', 'WMA', or 'RMA'. Default is SmoothingType.SMA.
@@ -23,7 +46,7 @@ def bb_middle(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoo
     :param offset: The number of periods to offset the resulting series. Default is 0.
     :type offset: int, optional
     :return: A pandas Series containing the middle band (moving average) with the specified offset.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
@@ -38,18 +61,19 @@ def bb_middle(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoo
     if offset != 0:
         middle_band = middle_band.shift(offset)
 
-    return pd.Series(middle_band, name=f'BBMIDDLE_{length}_{ma_type.value}_{std_dev}_{offset}')
+    return named(middle_band, f'BBMIDDLE_{length}_{ma_type.value}_{std_dev}_{offset}')
 
 
-def bb_upper(series: pd.Series, length: int = 20, ma_type: SmoothingType = SmoothingType.SMA, std_dev: float = 2,
-             offset: int = 0) -> pd.Series:
+@panel_indicator
+def bb_upper(series: pd.Series | pd.DataFrame, length: int = 20, ma_type: SmoothingType = SmoothingType.SMA,
+             std_dev: float = 2, offset: int = 0) -> pd.Series | pd.DataFrame:
     """
     Calculate the upper band for Bollinger Bands.
 
     The upper band is calculated as the middle band plus a multiple of the rolling standard deviation.
 
     :param series: A pandas Series representing the input time series (e.g., closing prices).
-    :type series: pd.Series
+    :type series: pd.Series | pd.DataFrame
     :param length: The number of periods to use for calculating the moving average. Default is 20 periods.
     :type length: int, optional
     :param ma_type: The type of moving average to use. Can be 'SMA', 'EMA', 'WMA', or 'RMA'. Default is SmoothingType.SMA.
@@ -59,7 +83,7 @@ def bb_upper(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoot
     :param offset: The number of periods to offset the resulting series. Default is 0.
     :type offset: int, optional
     :return: A pandas Series containing the upper band with the specified offset.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
@@ -68,7 +92,7 @@ def bb_upper(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoot
     offset = get_offset(offset=offset)
 
     # Calculate the standard deviation of the series
-    rolling_std = series.rolling(window=length).std(ddof=0)
+    rolling_std = population_std(series, length)
 
     # Apply the offset
     if offset != 0:
@@ -77,18 +101,19 @@ def bb_upper(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoot
     # Calculate the upper band
     upper_band = bb_middle(series, length, ma_type, std_dev, offset) + (std_dev * rolling_std)
 
-    return pd.Series(upper_band, name=f'BBUPPER_{length}_{ma_type.value}_{std_dev}_{offset}')
+    return named(upper_band, f'BBUPPER_{length}_{ma_type.value}_{std_dev}_{offset}')
 
 
-def bb_lower(series: pd.Series, length: int = 20, ma_type: SmoothingType = SmoothingType.SMA, std_dev: float = 2,
-             offset: int = 0) -> pd.Series:
+@panel_indicator
+def bb_lower(series: pd.Series | pd.DataFrame, length: int = 20, ma_type: SmoothingType = SmoothingType.SMA,
+             std_dev: float = 2, offset: int = 0) -> pd.Series | pd.DataFrame:
     """
     Calculate the lower band for Bollinger Bands.
 
     The lower band is calculated as the middle band minus a multiple of the rolling standard deviation.
 
     :param series: A pandas Series representing the input time series (e.g., closing prices).
-    :type series: pd.Series
+    :type series: pd.Series | pd.DataFrame
     :param length: The number of periods to use for calculating the moving average. Default is 20 periods.
     :type length: int, optional
     :param ma_type: The type of moving average to use. Can be 'SMA', 'EMA', 'WMA', or 'RMA'. Default is SmoothingType.SMA.
@@ -98,7 +123,7 @@ def bb_lower(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoot
     :param offset: The number of periods to offset the resulting series. Default is 0.
     :type offset: int, optional
     :return: A pandas Series containing the lower band with the specified offset.
-    :rtype: pd.Series
+    :rtype: pd.Series | pd.DataFrame
     """
 
     # Validate arguments
@@ -107,7 +132,7 @@ def bb_lower(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoot
     offset = get_offset(offset=offset)
 
     # Calculate the standard deviation of the series
-    rolling_std = series.rolling(window=length).std(ddof=0)
+    rolling_std = population_std(series, length)
 
     # Apply the offset
     if offset != 0:
@@ -116,4 +141,114 @@ def bb_lower(series: pd.Series, length: int = 20, ma_type: SmoothingType = Smoot
     # Calculate the lower band
     lower_band = bb_middle(series, length, ma_type, std_dev, offset) - (std_dev * rolling_std)
 
-    return pd.Series(lower_band, name=f'BBLOWER_{length}_{ma_type.value}_{std_dev}_{offset}')
+    return named(lower_band, f'BBLOWER_{length}_{ma_type.value}_{std_dev}_{offset}')
+
+
+def _bb_batch(series: pd.Series, lengths: list[int], ma_type: SmoothingType, std_devs: list[float], offset: int,
+              direction: int, prefix: str) -> pd.DataFrame:
+    """
+    Calculates Bollinger Bands for every combination of length and standard deviation multiple.
+
+    The moving averages and rolling standard deviations are computed once per length and shared by all
+    standard deviation multiples, the SMA of all lengths from one cumulative sum. The bands of all multiples
+    are then formed in one broadcast. `direction` is 1 for the upper, -1 for the lower and 0 for the middle band.
+    """
+
+    # Validate arguments, keeping the first occurrence of repeated values
+    lengths = list(dict.fromkeys(get_length(length=length, default=20) for length in lengths))
+    std_devs = list(dict.fromkeys(get_std_dev(std_dev=std_dev, default=2) for std_dev in std_devs))
+    offset = get_offset(offset=offset)
+
+    # Moving averages with one column per length
+    if ma_type == SmoothingType.SMA:
+        middle = rolling_mean_batch(series.to_numpy(dtype=float), lengths)
+    else:
+        middle = np.column_stack([smooth(series, length, ma_type).to_numpy(dtype=float) for length in lengths])
+
+    # Bands with the shape (time, length, std_dev)
+    if direction == 0:
+        # The middle band has no deviation term, where the rolling std is NaN it would turn 0 * NaN into NaN
+        bands = np.repeat(middle[:, :, None], len(std_devs), axis=2)
+    else:
+        rolling_std = np.column_stack([series.rolling(window=length).std(ddof=0).to_numpy() for length in lengths])
+        bands = middle[:, :, None] + direction * rolling_std[:, :, None] * np.asarray(std_devs)[None, None, :]
+
+    columns = [
+        f'{prefix}_{length}_{ma_type.value}_{std_dev}_{offset}' for length in lengths for std_dev in std_devs
+    ]
+    bands_df = pd.DataFrame(bands.reshape(len(series), -1), index=series.index, columns=columns)
+
+    # Apply the offset
+    if offset != 0:
+        bands_df = bands_df.shift(offset)
+
+    return bands_df
+
+
+def bb_middle_batch(series: pd.Series, lengths: list[int], std_devs: list[float] = (2,),
+                    ma_type: SmoothingType = SmoothingType.SMA, offset: int = 0) -> pd.DataFrame:
+    """
+    Calculate the middle band for Bollinger Bands for many lengths at once.
+
+    The standard deviation multiples do not change the middle band, they are only part of the column names.
+
+    :param series: A pandas Series representing the input time series (e.g., closing prices).
+    :type series: pd.Series
+    :param lengths: The numbers of periods to use for calculating the moving average.
+    :type lengths: list[int]
+    :param std_devs: The numbers of standard deviations to use for calculating the bands. Default is [2].
+    :type std_devs: list[float], optional
+    :param ma_type: The type of moving average to use. Can be 'SMA', 'EMA', 'WMA', or 'RMA'. Default is SmoothingType.SMA.
+    :type ma_type: SmoothingType, optional
+    :param offset: The number of periods to offset the resulting series. Default is 0.
+    :type offset: int, optional
+    :return: A DataFrame with one column per combination of length and std_dev, named like the results of `bb_middle`.
+    :rtype: pd.DataFrame
+    """
+    return _bb_batch(series, lengths, ma_type, std_devs, offset, 0, 'BBMIDDLE')
+
+
+def bb_upper_batch(series: pd.Series, lengths: list[int], std_devs: list[float] = (2,),
+                   ma_type: SmoothingType = SmoothingType.SMA, offset: int = 0) -> pd.DataFrame:
+    """
+    Calculate the upper band for Bollinger Bands for every combination of lengths and standard deviation multiples.
+
+    The results match `bb_upper` up to floating point rounding.
+
+    :param series: A pandas Series representing the input time series (e.g., closing prices).
+    :type series: pd.Series
+    :param lengths: The numbers of periods to use for calculating the moving average.
+    :type lengths: list[int]
+    :param std_devs: The numbers of standard deviations to use for calculating the bands. Default is [2].
+    :type std_devs: list[float], optional
+    :param ma_type: The type of moving average to use. Can be 'SMA', 'EMA', 'WMA', or 'RMA'. Default is SmoothingType.SMA.
+    :type ma_type: SmoothingType, optional
+    :param offset: The number of periods to offset the resulting series. Default is 0.
+    :type offset: int, optional
+    :return: A DataFrame with one column per combination of length and std_dev, named like the results of `bb_upper`.
+    :rtype: pd.DataFrame
+    """
+    return _bb_batch(series, lengths, ma_type, std_devs, offset, 1, 'BBUPPER')
+
+
+def bb_lower_batch(series: pd.Series, lengths: list[int], std_devs: list[float] = (2,),
+                   ma_type: SmoothingType = SmoothingType.SMA, offset: int = 0) -> pd.DataFrame:
+    """
+    Calculate the lower band for Bollinger Bands for every combination of lengths and standard deviation multiples.
+
+    The results match `bb_lower` up to floating point rounding.
+
+    :param series: A pandas Series representing the input time series (e.g., closing prices).
+    :type series: pd.Series
+    :param lengths: The numbers of periods to use for calculating the moving average.
+    :type lengths: list[int]
+    :param std_devs: The numbers of standard deviations to use for calculating the bands. Default is [2].
+    :type std_devs: list[float], optional
+    :param ma_type: The type of moving average to use. Can be 'SMA', 'EMA', 'WMA', or 'RMA'. Default is SmoothingType.SMA.
+    :type ma_type: SmoothingType, optional
+    :param offset: The number of periods to offset the resulting series. Default is 0.
+    :type offset: int, optional
+    :return: A DataFrame with one column per combination of length and std_dev, named like the results of `bb_lower`.
+    :rtype: pd.DataFrame
+    """
+    return _bb_batch(series, lengths, ma_type, std_devs, offset, -1, 'BBLOWER')
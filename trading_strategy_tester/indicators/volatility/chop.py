@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 
+from trading_strategy_tester.indicators.volatility.atr import true_range
 from trading_strategy_tester.utils.parameter_validations import get_length, get_offset
 
 def chop(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14, offset: int = 0) -> pd.Series:
@@ -29,14 +30,8 @@ def chop(high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14, of
     length = get_length(length=length, default=14)
     offset = get_offset(offset=offset)
 
-    # Calculate True Range (TR) components
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    # Compute the sum of True Range over the specified length
-    sum_tr = true_range.rolling(window=length).sum()
+    # Compute the sum of True Range (TR) over the specified length
+    sum_tr = true_range(high, low, close).rolling(window=length).sum()
 
     # Find the maximum high and minimum low over the specified length
     max_high = high.rolling(window=length).max()
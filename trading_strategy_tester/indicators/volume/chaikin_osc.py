@@ -2,6 +2,7 @@ import pandas as pd
 
 from trading_strategy_tester.utils.parameter_validations import get_length
 from trading_strategy_tester.indicators.overlap.ema import ema
+from trading_strategy_tester.utils.precision import to_float64
 
 def chaikin_osc(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series, fast_length: int = 3, slow_length: int = 10) -> pd.Series:
     """
@@ -43,7 +44,7 @@ def chaikin_osc(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Se
     money_flow_volume = money_flow_multiplier * volume
 
     # Calculate Accumulation/Distribution Line (Cumulative Sum of Money Flow Volume)
-    accumulation_distribution = money_flow_volume.cumsum()
+    accumulation_distribution = to_float64(money_flow_volume).cumsum()
 
     # Calculate the fast and slow EMAs of the A/D line
     fast_ema = ema(series=accumulation_distribution, length=fast_length, offset=0)
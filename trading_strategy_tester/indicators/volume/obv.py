@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from trading_strategy_tester.utils.precision import to_float64
 
 def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     """
@@ -21,7 +22,7 @@ def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     direction = np.sign(price_change)
 
     # Calculate OBV by cumulatively summing volume based on the direction of price changes
-    obv_values = (direction * volume).fillna(0).cumsum()
+    obv_values = to_float64((direction * volume).fillna(0)).cumsum()
 
     # Return the OBV series with a descriptive name
     return pd.Series(obv_values, name="OBV")
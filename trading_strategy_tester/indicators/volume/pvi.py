@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from trading_strategy_tester.utils.precision import to_float64
 
 
 def pvi(close: pd.Series, volume: pd.Series) -> pd.Series:
@@ -22,7 +23,7 @@ def pvi(close: pd.Series, volume: pd.Series) -> pd.Series:
     # Mask out only volumes where it is more than day before
     positive_volume = np.where(mask, volume, 0)
 
-    pvi_series = (close.pct_change() * positive_volume).fillna(0).cumsum()
+    pvi_series = to_float64((close.pct_change() * positive_volume).fillna(0)).cumsum()
 
     # Return the PVI series
     return pd.Series(pvi_series, name='PVI')
@@ -1,4 +1,5 @@
 import pandas as pd
+from trading_strategy_tester.utils.precision import to_float64
 
 
 def pvt(close: pd.Series, volume: pd.Series) -> pd.Series:
@@ -24,6 +25,6 @@ def pvt(close: pd.Series, volume: pd.Series) -> pd.Series:
     pvt_increment = pct_change * volume
 
     # Calculate cumulative PVT
-    pvt_series = pvt_increment.cumsum().fillna(0)
+    pvt_series = to_float64(pvt_increment).cumsum().fillna(0)
 
     return pd.Series(pvt_series, name='PVT')
\ No newline at end of file
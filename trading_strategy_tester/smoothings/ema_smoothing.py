@@ -1,14 +1,22 @@
 import pandas as pd
 
-def ema_smoothing(series: pd.Series, length: int) -> pd.Series:
+from trading_strategy_tester.utils.compiled_kernels import ewm_mean, use_compiled_kernels
+from trading_strategy_tester.utils.panel import panel_indicator
+
+@panel_indicator
+def ema_smoothing(series: pd.Series | pd.DataFrame, length: int) -> pd.Series | pd.DataFrame:
     """
     Calculates the Exponential Moving Average (EMA) for a given series.
 
-    :param series: The pandas Series representing the data to smooth.
-    :type series: pd.Series
+    :param series: The pandas Series representing the data to smooth, or a DataFrame with one column per ticker.
+    :type series: pd.Series | pd.DataFrame
     :param length: The smoothing period for the EMA.
     :type length: int
-    :return: A pandas Series containing the EMA of the given series.
-    :rtype: pd.Series
+    :return: A pandas Series containing the EMA of the given series, or a DataFrame for a panel.
+    :rtype: pd.Series | pd.DataFrame
     """
+    if use_compiled_kernels():
+        # The center of mass of span = length, calculated like in pandas
+        return ewm_mean(series, com=(length - 1) / 2, min_periods=length)
+
     return series.ewm(span=length, adjust=False, min_periods=length).mean()
@@ -1,14 +1,23 @@
 import pandas as pd
 
-def rma_smoothing(series: pd.Series, length: int) -> pd.Series:
+from trading_strategy_tester.utils.compiled_kernels import ewm_mean, use_compiled_kernels
+from trading_strategy_tester.utils.panel import panel_indicator
+
+@panel_indicator
+def rma_smoothing(series: pd.Series | pd.DataFrame, length: int) -> pd.Series | pd.DataFrame:
     """
     Calculates the Wilder's Moving Average (RMA), also known as the Rolling Moving Average.
 
-    :param series: The pandas Series representing the data to smooth.
-    :type series: pd.Series
+    :param series: The pandas Series representing the data to smooth, or a DataFrame with one column per ticker.
+    :type series: pd.Series | pd.DataFrame
     :param length: The smoothing period for the RMA.
     :type length: int
-    :return: A pandas Series containing the RMA of the given series.
-    :rtype: pd.Series
+    :return: A pandas Series containing the RMA of the given series, or a DataFrame for a panel.
+    :rtype: pd.Series | pd.DataFrame
     """
+    if use_compiled_kernels():
+        # The center of mass of alpha = 1 / length, calculated like in pandas
+        alpha = 1 / length
+        return ewm_mean(series, com=(1 - alpha) / alpha, min_periods=length)
+
     return series.ewm(alpha=1 / length, adjust=False, min_periods=length).mean()
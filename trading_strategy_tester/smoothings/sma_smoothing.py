@@ -1,14 +1,17 @@
 import pandas as pd
 
-def sma_smoothing(series: pd.Series, length: int) -> pd.Series:
+from trading_strategy_tester.utils.panel import panel_indicator
+
+@panel_indicator
+def sma_smoothing(series: pd.Series | pd.DataFrame, length: int) -> pd.Series | pd.DataFrame:
     """
     Calculates the Simple Moving Average (SMA) of a given series.
 
-    :param series: The pandas Series representing the data to smooth.
-    :type series: pd.Series
+    :param series: The pandas Series representing the data to smooth, or a DataFrame with one column per ticker.
+    :type series: pd.Series | pd.DataFrame
     :param length: The window length to use for the SMA calculation.
     :type length: int
-    :return: A pandas Series containing the SMA of the given series.
-    :rtype: pd.Series
+    :return: A pandas Series containing the SMA of the given series, or a DataFrame for a panel.
+    :rtype: pd.Series | pd.DataFrame
     """
     return series.rolling(window=length).mean()
@@ -5,8 +5,12 @@ from trading_strategy_tester.smoothings.ema_smoothing import ema_smoothing
 from trading_strategy_tester.smoothings.rma_smoothing import rma_smoothing
 from trading_strategy_tester.smoothings.sma_smoothing import sma_smoothing
 from trading_strategy_tester.smoothings.wma_smoothing import wma_smoothing
+from trading_strategy_tester.utils.intermediate_store import shared_intermediate
+from trading_strategy_tester.utils.panel import panel_indicator
 
-def smooth(series: pd.Series, length: int, smoothing_type: SmoothingType) -> pd.Series:
+
+@panel_indicator
+def smooth(series: pd.Series | pd.DataFrame, length: int, smoothing_type: SmoothingType) -> pd.Series | pd.DataFrame:
     """
     Applies the specified smoothing technique to a given price series.
 
@@ -14,14 +18,23 @@ def smooth(series: pd.Series, length: int, smoothing_type: SmoothingType) -> pd.
     Simple Moving Average (SMA), Exponential Moving Average (EMA),
     Running Moving Average (RMA), or Weighted Moving Average (WMA).
 
-    :param series: The pandas Series containing the price data to be smoothed.
-    :type series: pd.Series
+    :param series: The pandas Series containing the price data to be smoothed, or a DataFrame with one column per ticker.
+    :type series: pd.Series | pd.DataFrame
     :param length: The number of periods to use for the smoothing calculation.
     :type length: int
     :param smoothing_type: The type of smoothing to apply, defined in the `SmoothingType` enum.
     :type smoothing_type: SmoothingType
-    :return: A pandas Series with the smoothed data.
-    :rtype: pd.Series
+    :return: A pandas Series with the smoothed data, or a DataFrame for a panel.
+    :rtype: pd.Series | pd.DataFrame
+    """
+    # Indicators smoothing the same data share the result through the active intermediate store
+    return shared_intermediate('smooth', (series,), (length, smoothing_type),
+                               lambda: _smooth(series, length, smoothing_type))
+
+
+def _smooth(series: pd.Series | pd.DataFrame, length: int, smoothing_type: SmoothingType) -> pd.Series | pd.DataFrame:
+    """
+    Applies the smoothing without looking up the intermediate store.
     """
     if smoothing_type == SmoothingType.SMA:
         # Apply Simple Moving Average smoothing
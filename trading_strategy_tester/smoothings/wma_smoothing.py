@@ -1,17 +1,23 @@
 import pandas as pd
-import numpy as np
 
-def wma_smoothing(series: pd.Series, length: int) -> pd.Series:
+from trading_strategy_tester.utils.panel import panel_indicator
+from trading_strategy_tester.utils.rolling_kernels import rolling_wma
+
+@panel_indicator
+def wma_smoothing(series: pd.Series | pd.DataFrame, length: int) -> pd.Series | pd.DataFrame:
     """
     Calculates the Weighted Moving Average (WMA) of a given series.
 
-    :param series: The pandas Series representing the data to smooth.
-    :type series: pd.Series
+    :param series: The pandas Series representing the data to smooth, or a DataFrame with one column per ticker.
+    :type series: pd.Series | pd.DataFrame
     :param length: The window length to use for the WMA calculation.
     :type length: int
-    :return: A pandas Series containing the WMA of the given series.
-    :rtype: pd.Series
+    :return: A pandas Series containing the WMA of the given series, or a DataFrame for a panel.
+    :rtype: pd.Series | pd.DataFrame
     """
-    weights = np.arange(1, length + 1)
-    wma = series.rolling(window=length).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
-    return wma
+    wma = rolling_wma(series.to_numpy(dtype=float), length)
+
+    if isinstance(series, pd.DataFrame):
+        return pd.DataFrame(wma, index=series.index, columns=series.columns)
+
+    return pd.Series(wma, index=series.index, name=series.name)
@@ -3,6 +3,7 @@ import numpy as np
 from trading_strategy_tester.enums.source_enum import SourceType
 from trading_strategy_tester.trade.order_size.order_size import OrderSize
 from trading_strategy_tester.trade.trade import Trade
+from trading_strategy_tester.utils.precision import to_float64
 
 def get_strategy_stats(trades: list[Trade], df: pd.DataFrame, initial_capital: float, order_size: OrderSize) -> dict:
     """
@@ -21,6 +22,9 @@ def get_strategy_stats(trades: list[Trade], df: pd.DataFrame, initial_capital: f
              average trade P&L, largest winning trade, and largest losing trade.
     :rtype: dict
     """
+    # Net profit, gross profit and loss and the drawdown are summed over all trades, see `to_float64`
+    df = to_float64(df)
+
     net_profit = 0
     gross_profit = 0
     gross_loss = 0
@@ -9,12 +9,14 @@ from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.interval_enum import Interval
 from trading_strategy_tester.enums.period_enum import Period
 from trading_strategy_tester.enums.position_type_enum import PositionTypeEnum
+from trading_strategy_tester.enums.precision_enum import Precision
 from trading_strategy_tester.statistics.statistics import get_strategy_stats
 from trading_strategy_tester.trade.order_size.contracts import Contracts
 from trading_strategy_tester.trade.order_size.order_size import OrderSize
 from trading_strategy_tester.trade.trade import create_all_trades
 from trading_strategy_tester.trade.trade_commissions.money_commissions import MoneyCommissions
 from trading_strategy_tester.trade.trade_commissions.trade_commissions import TradeCommissions
+from trading_strategy_tester.utils.intermediate_store import intermediate_store
 from trading_strategy_tester.utils.parameter_validations import get_position_type_from_enum
 
 
@@ -49,6 +51,8 @@ class Strategy:
     :type order_size: OrderSize, optional
     :param trade_commissions: The commissions associated with trades (default is zero commission).
     :type trade_commissions: TradeCommissions
+    :param precision: The floating point type of the price data and indicator values (default is FLOAT64).
+    :type precision: Precision
     """
 
     def __init__(self,
@@ -64,7 +68,8 @@ class Strategy:
                  period: Period = Period.NOT_PASSED,
                  initial_capital: float = 1_000_000,
                  order_size: OrderSize = Contracts(1),
-                 trade_commissions: TradeCommissions = MoneyCommissions(0)
+                 trade_commissions: TradeCommissions = MoneyCommissions(0),
+                 precision: Precision = Precision.FLOAT64
                  ):
         self.ticker = ticker
         self.position_type_enum = position_type
@@ -80,6 +85,7 @@ class Strategy:
         self.trade_commissions = trade_commissions
         self.initial_capital = initial_capital
         self.order_size = order_size
+        self.precision = precision
         self.trade_conditions = None
         self.graphs = dict()
         self.trades = list()
@@ -94,7 +100,7 @@ class Strategy:
         :return: A DataFrame containing the evaluated conditions for buying and selling.
         :rtype: pd.DataFrame
         """
-        downloader = DownloadModule(self.start_date, self.end_date, self.interval, self.period)
+        downloader = DownloadModule(self.start_date, self.end_date, self.interval, self.period, precision=self.precision)
         df = downloader.download_ticker(self.ticker)
 
         self.trade_conditions = TradeConditions(
@@ -103,29 +109,28 @@ class Strategy:
             downloader=downloader
         )
 
-        evaluated_conditions_df = self.trade_conditions.evaluate_conditions(df)
+        # Indicators of the conditions and graphs share their intermediate results during the evaluation
+        with intermediate_store():
+            evaluated_conditions_df = self.trade_conditions.evaluate_conditions(df)
 
-        # Sets stop losses and take profits
-        if self.take_profit is not None:
-            self.take_profit.set_take_profit(evaluated_conditions_df, self.position_type_enum)
-        if self.stop_loss is not None:
-            self.stop_loss.set_stop_loss(evaluated_conditions_df, self.position_type_enum)
+            # Sets stop losses and take profits
+            if self.take_profit is not None:
+                self.take_profit.set_take_profit(evaluated_conditions_df, self.position_type_enum)
+            if self.stop_loss is not None:
+                self.stop_loss.set_stop_loss(evaluated_conditions_df, self.position_type_enum)
 
-        # Clean the BUY and SELL columns based on the position type
-        self.position_type.clean_buy_sell_columns(evaluated_conditions_df)
+            # Clean the BUY and SELL columns based on the position type
+            self.position_type.clean_buy_sell_columns(evaluated_conditions_df)
 
-        # Create list of trades
-        self.trades = create_all_trades(df, self.order_size, self.initial_capital, self.trade_commissions)
+            # Create list of trades
+            self.trades = create_all_trades(df, self.order_size, self.initial_capital, self.trade_commissions)
 
-        # Create Graphs
-        self.graphs = self.trade_conditions.get_graphs(df, self.trades)
+            # Create Graphs
+            self.graphs = self.trade_conditions.get_graphs(df, self.trades)
 
         # Create stats of the strategy
         self.stats = get_strategy_stats(self.trades, evaluated_conditions_df, self.initial_capital, self.order_size)
 
-        # Delete temp downloaded files
-        downloader.delete_temp_files()
-
         return evaluated_conditions_df
 
     def get_trades(self) -> list:
@@ -0,0 +1 @@
+__all__ = ['indicator_state', 'smoothing_states', 'rsi_state', 'atr_state', 'macd_state']
\ No newline at end of file
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.streaming.indicator_state import IndicatorState
+from trading_strategy_tester.streaming.smoothing_states import smoothing_state
+from trading_strategy_tester.utils.parameter_validations import get_length
+
+
+class ATRState(IndicatorState):
+    """
+    The incremental state of `atr`, equal to the batch ATR bit for bit with RMA or EMA smoothing.
+    """
+
+    __slots__ = ('length', 'smoothing', 'previous_close', 'average')
+
+    def __init__(self, length: int = 14, smoothing: SmoothingType = SmoothingType.RMA):
+        """
+        Initializes an empty ATR state.
+
+        :param length: The window length to calculate the ATR. Default is 14 periods.
+        :type length: int, optional
+        :param smoothing: The smoothing method to use. Can be 'RMA', 'SMA', 'EMA', or 'WMA'. Default is SmoothingType.RMA.
+        :type smoothing: SmoothingType, optional
+        """
+        super().__init__()
+        self.length = get_length(length=length, default=14)
+        self.smoothing = smoothing
+        self.previous_close = float('nan')  # The close of the previous bar
+        self.average = smoothing_state(self.length, smoothing)
+
+    @classmethod
+    def from_history(cls, high: pd.Series, low: pd.Series, close: pd.Series, length: int = 14,
+                     smoothing: SmoothingType = SmoothingType.RMA) -> 'ATRState':
+        """
+        Creates the ATR state after the given bars.
+
+        :param high: The history of the high prices.
+        :type high: pd.Series
+        :param low: The history of the low prices.
+        :type low: pd.Series
+        :param close: The history of the closing prices.
+        :type close: pd.Series
+        :param length: The window length to calculate the ATR. Default is 14 periods.
+        :type length: int, optional
+        :param smoothing: The smoothing method to use. Can be 'RMA', 'SMA', 'EMA', or 'WMA'. Default is SmoothingType.RMA.
+        :type smoothing: SmoothingType, optional
+        :return: The state after the last bar of the history.
+        :rtype: ATRState
+        """
+        state = cls(length, smoothing)
+
+        if len(close) == 0:
+            return state
+
+        # True range like in `atr`
+        true_range = np.fmax(np.fmax(high - low, (high - close.shift(1)).abs()), (low - close.shift(1)).abs())
+
+        state.previous_close = float(close.iloc[-1])
+        state.average = smoothing_state(state.length, smoothing, true_range)
+        state.value = state.average.value
+
+        return state
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """
+        Appends a bar and returns the new ATR.
+
+        :param high: The high price of the bar.
+        :type high: float
+        :param low: The low price of the bar.
+        :type low: float
+        :param close: The closing price of the bar.
+        :type close: float
+        :return: The ATR, NaN during the warm-up.
+        :rtype: float
+        """
+        high, low, close = float(high), float(low), float(close)
+
+        # The maximum ignores the missing previous close of the first bar
+        true_range = float(np.fmax(np.fmax(high - low, abs(high - self.previous_close)), abs(low - self.previous_close)))
+        self.previous_close = close
+
+        self.value = self.average.update(true_range)
+        return self.value
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+
+class IndicatorState(ABC):
+    """
+    An abstract base class for the incremental state of an indicator.
+
+    An indicator state holds only what is needed to calculate the next value of its indicator, so appending
+    a bar costs O(1) instead of recalculating the whole history. Feeding the values of a series one by one to
+    `update` gives the same values as the batch function of the indicator. States are created empty or from
+    the history with `from_history`, which derives the state from one batch calculation. Subclasses declare
+    their attributes in `__slots__` to keep many states compact.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        """
+        Initializes the state without a value.
+        """
+        self.value = float('nan')  # The last value of the indicator
+
+    @abstractmethod
+    def update(self, *values: float) -> float:
+        """
+        Appends one bar to the state and returns the new value of the indicator.
+
+        :param values: The values of the new bar the indicator is calculated from.
+        :type values: float
+        :return: The value of the indicator after the bar, NaN while it is not defined.
+        :rtype: float
+        """
+        pass
+
+    def __repr__(self) -> str:
+        """
+        Returns the class name with the current value.
+        """
+        return f'{type(self).__name__}(value={self.value})'
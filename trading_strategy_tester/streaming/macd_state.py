@@ -0,0 +1,92 @@
+import pandas as pd
+
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.smoothings.smooth import smooth
+from trading_strategy_tester.streaming.indicator_state import IndicatorState
+from trading_strategy_tester.streaming.smoothing_states import smoothing_state
+from trading_strategy_tester.utils.parameter_validations import get_length
+
+
+class MACDState(IndicatorState):
+    """
+    The incremental state of `macd` and `macd_signal`.
+
+    `update` returns the MACD and keeps the signal line of the same bar in `signal`. Both are equal to
+    the batch functions bit for bit with EMA or RMA smoothing.
+    """
+
+    __slots__ = ('fast', 'slow', 'signal_average', 'signal')
+
+    def __init__(self, fast_length: int = 12, slow_length: int = 26, ma_type: SmoothingType = SmoothingType.EMA,
+                 signal_ma_type: SmoothingType = SmoothingType.EMA, signal_length: int = 9):
+        """
+        Initializes an empty MACD state.
+
+        :param fast_length: The number of periods for the fast moving average. Default is 12.
+        :type fast_length: int, optional
+        :param slow_length: The number of periods for the slow moving average. Default is 26.
+        :type slow_length: int, optional
+        :param ma_type: The type of moving average used for the MACD. Default is SmoothingType.EMA.
+        :type ma_type: SmoothingType, optional
+        :param signal_ma_type: The type of moving average applied to the MACD to create the signal line. Default is SmoothingType.EMA.
+        :type signal_ma_type: SmoothingType, optional
+        :param signal_length: The period for the moving average of the signal line. Default is 9.
+        :type signal_length: int, optional
+        """
+        super().__init__()
+        self.fast = smoothing_state(get_length(length=fast_length, default=12), ma_type)
+        self.slow = smoothing_state(get_length(length=slow_length, default=26), ma_type)
+        self.signal_average = smoothing_state(get_length(length=signal_length, default=9), signal_ma_type)
+        self.signal = float('nan')  # The signal line of the last bar
+
+    @classmethod
+    def from_history(cls, series: pd.Series, fast_length: int = 12, slow_length: int = 26,
+                     ma_type: SmoothingType = SmoothingType.EMA, signal_ma_type: SmoothingType = SmoothingType.EMA,
+                     signal_length: int = 9) -> 'MACDState':
+        """
+        Creates the MACD state after the given price history.
+
+        :param series: The price history (e.g., closing prices).
+        :type series: pd.Series
+        :param fast_length: The number of periods for the fast moving average. Default is 12.
+        :type fast_length: int, optional
+        :param slow_length: The number of periods for the slow moving average. Default is 26.
+        :type slow_length: int, optional
+        :param ma_type: The type of moving average used for the MACD. Default is SmoothingType.EMA.
+        :type ma_type: SmoothingType, optional
+        :param signal_ma_type: The type of moving average applied to the MACD to create the signal line. Default is SmoothingType.EMA.
+        :type signal_ma_type: SmoothingType, optional
+        :param signal_length: The period for the moving average of the signal line. Default is 9.
+        :type signal_length: int, optional
+        :return: The state after the last price of the history.
+        :rtype: MACDState
+        """
+        state = cls(fast_length, slow_length, ma_type, signal_ma_type, signal_length)
+
+        if len(series) == 0:
+            return state
+
+        fast_length = get_length(length=fast_length, default=12)
+        slow_length = get_length(length=slow_length, default=26)
+        macd_series = smooth(series, fast_length, ma_type) - smooth(series, slow_length, ma_type)
+
+        state.fast = smoothing_state(fast_length, ma_type, series)
+        state.slow = smoothing_state(slow_length, ma_type, series)
+        state.signal_average = smoothing_state(get_length(length=signal_length, default=9), signal_ma_type, macd_series)
+        state.value = state.fast.value - state.slow.value
+        state.signal = state.signal_average.value
+
+        return state
+
+    def update(self, price: float) -> float:
+        """
+        Appends a price and returns the new MACD, the new signal line is stored in `signal`.
+
+        :param price: The new price.
+        :type price: float
+        :return: The MACD, NaN during the warm-up.
+        :rtype: float
+        """
+        self.value = self.fast.update(price) - self.slow.update(price)
+        self.signal = self.signal_average.update(self.value)
+        return self.value
@@ -0,0 +1,94 @@
+import pandas as pd
+
+from trading_strategy_tester.streaming.indicator_state import IndicatorState
+from trading_strategy_tester.streaming.smoothing_states import RMAState
+from trading_strategy_tester.utils.parameter_validations import get_length
+
+
+def relative_strength_index(avg_gain: float, avg_loss: float) -> float:
+    """
+    Calculates the RSI from the average gain and loss with the division semantics of pandas.
+
+    :param avg_gain: The average gain.
+    :type avg_gain: float
+    :param avg_loss: The average loss.
+    :type avg_loss: float
+    :return: The RSI, 100 if there were only gains and NaN if there was no change.
+    :rtype: float
+    """
+    if avg_loss == 0:
+        rs = float('inf') if avg_gain > 0 else float('nan')
+    else:
+        rs = avg_gain / avg_loss
+
+    return 100 - (100 / (1 + rs))
+
+
+class RSIState(IndicatorState):
+    """
+    The incremental state of `rsi`, equal to the batch RSI bit for bit.
+    """
+
+    __slots__ = ('length', 'previous', 'avg_gain', 'avg_loss')
+
+    def __init__(self, length: int = 14):
+        """
+        Initializes an empty RSI state.
+
+        :param length: The number of periods to use for calculating the RSI. Default is 14.
+        :type length: int, optional
+        """
+        super().__init__()
+        self.length = get_length(length=length, default=14)
+        self.previous = float('nan')  # The previous price
+        self.avg_gain = RMAState(self.length)
+        self.avg_loss = RMAState(self.length)
+
+    @classmethod
+    def from_history(cls, series: pd.Series, length: int = 14) -> 'RSIState':
+        """
+        Creates the RSI state after the given price history.
+
+        :param series: The price history (e.g., closing prices).
+        :type series: pd.Series
+        :param length: The number of periods to use for calculating the RSI. Default is 14.
+        :type length: int, optional
+        :return: The state after the last price of the history.
+        :rtype: RSIState
+        """
+        state = cls(length)
+
+        if len(series) == 0:
+            return state
+
+        # Gains and losses like in `rsi`
+        delta = series.diff()
+        gain = delta.where(delta > 0, 0)
+        loss = -delta.where(delta < 0, 0)
+
+        state.previous = float(series.iloc[-1])
+        state.avg_gain = RMAState.from_history(gain, state.length)
+        state.avg_loss = RMAState.from_history(loss, state.length)
+        state.value = relative_strength_index(state.avg_gain.value, state.avg_loss.value)
+
+        return state
+
+    def update(self, price: float) -> float:
+        """
+        Appends a price and returns the new RSI.
+
+        :param price: The new price.
+        :type price: float
+        :return: The RSI, NaN during the warm-up.
+        :rtype: float
+        """
+        price = float(price)
+        delta = price - self.previous
+        self.previous = price
+
+        # A missing delta is neither a gain nor a loss, like in `Series.where`
+        avg_gain = self.avg_gain.update(delta if delta > 0 else 0.0)
+        avg_loss = self.avg_loss.update(-delta if delta < 0 else -0.0)
+
+        self.value = relative_strength_index(avg_gain, avg_loss)
+        return self.value
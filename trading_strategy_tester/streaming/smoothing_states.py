@@ -0,0 +1,364 @@
+import math
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.smoothing_enum import SmoothingType
+from trading_strategy_tester.streaming.indicator_state import IndicatorState
+
+
+class EWMState(IndicatorState):
+    """
+    The incremental state of an exponentially weighted mean with `adjust=False`, shared by the EMA and the RMA.
+
+    The update repeats the recursion of `pandas.Series.ewm(...).mean()` operation by operation, including the
+    decay of the weight over missing values, so the values are equal to the batch smoothing bit for bit.
+    """
+
+    __slots__ = ('com', 'old_wt_factor', 'new_wt', 'min_periods', 'weighted', 'old_wt', 'nobs')
+
+    def __init__(self, com: float, min_periods: int):
+        """
+        Initializes an empty state.
+
+        :param com: The center of mass of the weights, calculated like in pandas.
+        :type com: float
+        :param min_periods: The number of observations needed for a value.
+        :type min_periods: int
+        """
+        super().__init__()
+        self.com = com
+        alpha = 1.0 / (1.0 + com)
+        self.old_wt_factor = 1.0 - alpha
+        self.new_wt = alpha
+        self.min_periods = max(int(min_periods), 1)
+        self.weighted = float('nan')  # The mean of all observations so far
+        self.old_wt = 1.0  # The weight of the mean at the next observation
+        self.nobs = 0  # The number of observations so far
+
+    def update(self, value: float) -> float:
+        """
+        Appends a value and returns the new mean.
+
+        :param value: The new value, NaN if it is missing.
+        :type value: float
+        :return: The mean, NaN until `min_periods` values were observed.
+        :rtype: float
+        """
+        value = float(value)
+        is_observation = value == value
+        self.nobs += is_observation
+
+        if self.weighted == self.weighted:
+            self.old_wt *= self.old_wt_factor
+
+            if is_observation:
+                if self.weighted != value:
+                    self.weighted = self.old_wt * self.weighted + self.new_wt * value
+                    self.weighted /= self.old_wt + self.new_wt
+                self.old_wt = 1.0
+        elif is_observation:
+            self.weighted = value
+
+        self.value = self.weighted if self.nobs >= self.min_periods else float('nan')
+        return self.value
+
+    def _warm_up(self, series: pd.Series):
+        """
+        Sets the state to the state after the given values, calculated with one batch mean.
+        """
+        values = series.to_numpy(dtype=float)
+        observed = np.flatnonzero(~np.isnan(values))
+
+        if len(observed) == 0:
+            return
+
+        self.nobs = len(observed)
+        self.weighted = float(series.ewm(com=self.com, adjust=False).mean().iloc[-1])
+
+        # The weight decays once for every missing value after the last observation
+        for _ in range(len(values) - 1 - observed[-1]):
+            self.old_wt *= self.old_wt_factor
+
+        self.value = self.weighted if self.nobs >= self.min_periods else float('nan')
+
+
+class EMAState(EWMState):
+    """
+    The incremental state of `ema_smoothing`.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, length: int):
+        """
+        Initializes an empty EMA state.
+
+        :param length: The smoothing period for the EMA.
+        :type length: int
+        """
+        super().__init__(com=(length - 1) / 2, min_periods=length)
+
+    @classmethod
+    def from_history(cls, series: pd.Series, length: int) -> 'EMAState':
+        """
+        Creates the EMA state after the given history.
+
+        :param series: The history of the smoothed values.
+        :type series: pd.Series
+        :param length: The smoothing period for the EMA.
+        :type length: int
+        :return: The state after the last value of the history.
+        :rtype: EMAState
+        """
+        state = cls(length)
+        state._warm_up(series)
+        return state
+
+
+class RMAState(EWMState):
+    """
+    The incremental state of `rma_smoothing`.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, length: int):
+        """
+        Initializes an empty RMA state.
+
+        :param length: The smoothing period for the RMA.
+        :type length: int
+        """
+        alpha = 1 / length
+        super().__init__(com=(1 - alpha) / alpha, min_periods=length)
+
+    @classmethod
+    def from_history(cls, series: pd.Series, length: int) -> 'RMAState':
+        """
+        Creates the RMA state after the given history.
+
+        :param series: The history of the smoothed values.
+        :type series: pd.Series
+        :param length: The smoothing period for the RMA.
+        :type length: int
+        :return: The state after the last value of the history.
+        :rtype: RMAState
+        """
+        state = cls(length)
+        state._warm_up(series)
+        return state
+
+
+class WindowState(IndicatorState):
+    """
+    The incremental state of a moving average over a fixed window, kept in a ring buffer.
+
+    Missing values count as zero in the running sums and are tracked separately, so a window with a
+    missing value is NaN like in `pandas.Series.rolling`. The running sums are recalculated exactly
+    every time the ring buffer wraps around, which bounds the rounding errors at amortized O(1) cost.
+    """
+
+    __slots__ = ('length', 'buffer', 'position', 'nan_count')
+
+    def __init__(self, length: int):
+        """
+        Initializes an empty state, whose window is filled with missing values.
+
+        :param length: The window length.
+        :type length: int
+        """
+        super().__init__()
+        self.length = length
+        self.buffer = [float('nan')] * length
+        self.position = 0  # The position of the oldest value in the ring buffer
+        self.nan_count = length  # The number of missing values in the window
+
+    def update(self, value: float) -> float:
+        """
+        Appends a value and returns the new moving average.
+
+        :param value: The new value, NaN if it is missing.
+        :type value: float
+        :return: The moving average, NaN if the window is not full or contains a missing value.
+        :rtype: float
+        """
+        value = float(value)
+        oldest = self.buffer[self.position]
+
+        self.nan_count += (value != value) - (oldest != oldest)
+        self._shift(0.0 if oldest != oldest else oldest, 0.0 if value != value else value)
+
+        self.buffer[self.position] = value
+        self.position = (self.position + 1) % self.length
+
+        if self.position == 0:
+            self._resync()
+
+        self.value = self._average() if self.nan_count == 0 else float('nan')
+        return self.value
+
+    def _ordered(self) -> list[float]:
+        """
+        Returns the window from the oldest to the newest value with missing values as zero.
+        """
+        ordered = self.buffer[self.position:] + self.buffer[:self.position]
+        return [0.0 if value != value else value for value in ordered]
+
+    def _warm_up(self, series: pd.Series):
+        """
+        Sets the state to the state after the given values.
+        """
+        values = series.to_numpy(dtype=float)[-self.length:]
+
+        self.buffer = [float('nan')] * (self.length - len(values)) + values.tolist()
+        self.position = 0
+        self.nan_count = sum(value != value for value in self.buffer)
+        self._resync()
+
+        self.value = self._average() if self.nan_count == 0 else float('nan')
+
+    @abstractmethod
+    def _shift(self, oldest: float, value: float):
+        """
+        Updates the running sums for the value leaving and the value entering the window.
+        """
+        pass
+
+    @abstractmethod
+    def _resync(self):
+        """
+        Recalculates the running sums from the ring buffer.
+        """
+        pass
+
+    @abstractmethod
+    def _average(self) -> float:
+        """
+        Returns the average of a window without missing values.
+        """
+        pass
+
+
+class SMAState(WindowState):
+    """
+    The incremental state of `sma_smoothing`, equal to the batch smoothing up to floating point rounding.
+    """
+
+    __slots__ = ('total',)
+
+    def __init__(self, length: int):
+        """
+        Initializes an empty SMA state.
+
+        :param length: The window length to use for the SMA calculation.
+        :type length: int
+        """
+        super().__init__(length)
+        self.total = 0.0  # The sum of the window
+
+    @classmethod
+    def from_history(cls, series: pd.Series, length: int) -> 'SMAState':
+        """
+        Creates the SMA state after the given history.
+
+        :param series: The history of the smoothed values.
+        :type series: pd.Series
+        :param length: The window length to use for the SMA calculation.
+        :type length: int
+        :return: The state after the last value of the history.
+        :rtype: SMAState
+        """
+        state = cls(length)
+        state._warm_up(series)
+        return state
+
+    def _shift(self, oldest: float, value: float):
+        self.total += value - oldest
+
+    def _resync(self):
+        self.total = math.fsum(self._ordered())
+
+    def _average(self) -> float:
+        return self.total / self.length
+
+
+class WMAState(WindowState):
+    """
+    The incremental state of `wma_smoothing`, equal to the batch smoothing up to floating point rounding.
+
+    The weighted sum is updated with `numerator + length * new - total`, because every value in the window
+    loses one unit of weight when a new value enters.
+    """
+
+    __slots__ = ('total', 'numerator')
+
+    def __init__(self, length: int):
+        """
+        Initializes an empty WMA state.
+
+        :param length: The window length to use for the WMA calculation.
+        :type length: int
+        """
+        super().__init__(length)
+        self.total = 0.0  # The sum of the window
+        self.numerator = 0.0  # The weighted sum of the window
+
+    @classmethod
+    def from_history(cls, series: pd.Series, length: int) -> 'WMAState':
+        """
+        Creates the WMA state after the given history.
+
+        :param series: The history of the smoothed values.
+        :type series: pd.Series
+        :param length: The window length to use for the WMA calculation.
+        :type length: int
+        :return: The state after the last value of the history.
+        :rtype: WMAState
+        """
+        state = cls(length)
+        state._warm_up(series)
+        return state
+
+    def _shift(self, oldest: float, value: float):
+        self.numerator += self.length * value - self.total
+        self.total += value - oldest
+
+    def _resync(self):
+        ordered = self._ordered()
+        self.total = math.fsum(ordered)
+        self.numerator = math.fsum(weight * value for weight, value in enumerate(ordered, start=1))
+
+    def _average(self) -> float:
+        return self.numerator / (self.length * (self.length + 1) / 2)
+
+
+# State classes of the smoothing types, in the order of `smooth`
+SMOOTHING_STATES = {
+    SmoothingType.SMA: SMAState,
+    SmoothingType.EMA: EMAState,
+    SmoothingType.RMA: RMAState,
+    SmoothingType.WMA: WMAState,
+}
+
+
+def smoothing_state(length: int, smoothing_type: SmoothingType, series: pd.Series = None) -> IndicatorState:
+    """
+    Creates the incremental state of `smooth` for the given smoothing type.
+
+    :param length: The number of periods to use for the smoothing calculation.
+    :type length: int
+    :param smoothing_type: The type of smoothing to apply, defined in the `SmoothingType` enum.
+    :type smoothing_type: SmoothingType
+    :param series: The history to warm the state up with, None for an empty state.
+    :type series: pd.Series, optional
+    :return: The smoothing state.
+    :rtype: IndicatorState
+    """
+    state_class = SMOOTHING_STATES.get(smoothing_type, WMAState)
+
+    if series is None:
+        return state_class(length)
+
+    return state_class.from_history(series, length)
@@ -2,6 +2,7 @@ import pandas as pd
 from trading_strategy_tester.enums.source_enum import SourceType
 from trading_strategy_tester.trade.order_size.order_size import OrderSize
 from trading_strategy_tester.trade.trade_commissions.trade_commissions import TradeCommissions
+from trading_strategy_tester.utils.precision import to_float64
 
 class Trade:
     """
@@ -301,6 +302,9 @@ def create_all_trades(df: pd.DataFrame, order_size: OrderSize, initial_capital:
     :rtype: list[Trade]
     """
 
+    # The capital is carried from trade to trade, so the prices it is computed from are read as float64
+    df = to_float64(df)
+
     # Initialize capital and an empty list to store the Trade objects
     current_capital = initial_capital
     trades = []
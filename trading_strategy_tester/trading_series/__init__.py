@@ -7,6 +7,14 @@ from .bb_series.bb_upper_series import BB_UPPER
 from .bb_series.bb_middle_series import BB_MIDDLE
 from .bbp_series.bbp_series import BBP
 from .candlestick_series.hammer_series import HAMMER
+from .candlestick_series.inverted_hammer_series import INVERTED_HAMMER
+from .candlestick_series.doji_series import DOJI
+from .candlestick_series.bullish_engulfing_series import BULLISH_ENGULFING
+from .candlestick_series.bearish_engulfing_series import BEARISH_ENGULFING
+from .candlestick_series.bullish_harami_series import BULLISH_HARAMI
+from .candlestick_series.bearish_harami_series import BEARISH_HARAMI
+from .candlestick_series.morning_star_series import MORNING_STAR
+from .candlestick_series.evening_star_series import EVENING_STAR
 from .cci_series.cci_series import CCI
 from .cci_series.cci_smoothened_series import CCI_SMOOTHENED
 from .chaikin_osc_series.chaikin_osc_series import CHAIKIN_OSC
@@ -65,6 +73,14 @@ __all__ = [
     'BB_MIDDLE',
     'BBP',
     'HAMMER',
+    'INVERTED_HAMMER',
+    'DOJI',
+    'BULLISH_ENGULFING',
+    'BEARISH_ENGULFING',
+    'BULLISH_HARAMI',
+    'BEARISH_HARAMI',
+    'MORNING_STAR',
+    'EVENING_STAR',
     'CCI',
     'CCI_SMOOTHENED',
     'CHAIKIN_OSC',
@@ -3,9 +3,10 @@ import pandas as pd
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.smoothing_enum import SmoothingType
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
-from trading_strategy_tester.indicators.volatility.bb import bb_lower
+from trading_strategy_tester.indicators.volatility.bb import bb_lower, bb_lower_batch
+from trading_strategy_tester.trading_series.indicator_cache import shared_indicator_cache
 from trading_strategy_tester.enums.source_enum import SourceType
-from trading_strategy_tester.utils.parameter_validations import get_base_sources
+from trading_strategy_tester.utils.parameter_validations import get_base_sources, get_length, get_std_dev, get_offset
 
 
 class BB_LOWER(TradingSeries):
@@ -86,6 +87,55 @@ class BB_LOWER(TradingSeries):
         # Return the BBLower series as a pandas Series
         return pd.Series(df[self.name], name=self.name)
 
+    @classmethod
+    def batch(cls, downloader: DownloadModule, ticker: str, source: SourceType = SourceType.CLOSE,
+              lengths: list[int] = (20,), std_devs: list[float] = (2,), ma_type: SmoothingType = SmoothingType.SMA,
+              offset: int = 0) -> list['BB_LOWER']:
+        """
+        Create BB_LOWER series for every combination of lengths and standard deviations and compute them in one batch.
+
+        The lower Bollinger Bands are calculated by `bb_lower_batch` and every column of the result is stored in the
+        shared indicator cache, so the `get_data` calls of the returned series read their slice of the batch.
+
+        :param downloader: The module responsible for downloading market data.
+        :type downloader: DownloadModule
+        :param ticker: The ticker symbol for the financial instrument (e.g., 'AAPL' for Apple Inc.).
+        :type ticker: str
+        :param source: The column in the DataFrame on which the lower Bollinger Band is calculated (e.g., 'Close').
+                       Default is SourceType.CLOSE.
+        :type source: SourceType, optional
+        :param lengths: The numbers of periods over which to calculate the moving average. Default is [20].
+        :type lengths: list[int], optional
+        :param std_devs: The numbers of standard deviations to use for the Bollinger Band calculation. Default is [2].
+        :type std_devs: list[float], optional
+        :param ma_type: The type of moving average to use (e.g., Simple Moving Average, SMA). Default is SmoothingType.SMA.
+        :type ma_type: SmoothingType, optional
+        :param offset: The number of periods to offset the calculation. Default is 0.
+        :type offset: int, optional
+        :return: One BB_LOWER series per combination, ordered by length and then by std_dev.
+        :rtype: list[BB_LOWER]
+        """
+        # Download the latest data for the ticker and calculate the bands of all combinations
+        new_df = downloader.download_ticker(ticker)
+        bands_df = bb_lower_batch(
+            series=new_df[get_base_sources(source=source, default=SourceType.CLOSE).value],
+            lengths=lengths,
+            std_devs=std_devs,
+            ma_type=ma_type,
+            offset=offset
+        )
+
+        series_list = []
+        for length in lengths:
+            for std_dev in std_devs:
+                series = cls(ticker, source, length, ma_type, std_dev, offset)
+                column = (f'BBLOWER_{get_length(length=length, default=20)}_{ma_type.value}_'
+                          f'{get_std_dev(std_dev=std_dev, default=2)}_{get_offset(offset=offset)}')
+                shared_indicator_cache.prime(series, new_df, bands_df[column])
+                series_list.append(series)
+
+        return series_list
+
     def get_name(self) -> str:
         """
         Get the name of the BBLower indicator.
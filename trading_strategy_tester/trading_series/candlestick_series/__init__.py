@@ -1,3 +1,12 @@
 __all__ = [
-    'hammer_series'
-]
\ No newline at end of file
+    'candlestick_pattern_series',
+    'hammer_series',
+    'inverted_hammer_series',
+    'doji_series',
+    'bullish_engulfing_series',
+    'bearish_engulfing_series',
+    'bullish_harami_series',
+    'bearish_harami_series',
+    'morning_star_series',
+    'evening_star_series'
+]
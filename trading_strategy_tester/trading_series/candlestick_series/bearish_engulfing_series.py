@@ -0,0 +1,10 @@
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.trading_series.candlestick_series.candlestick_pattern_series import CandlestickPatternSeries
+
+
+class BEARISH_ENGULFING(CandlestickPatternSeries):
+    """
+    Class representing the Bearish Engulfing candlestick pattern for a given ticker symbol, a bearish body engulfing the bullish body of the previous candle.
+    """
+
+    pattern = CandlestickPattern.BEARISH_ENGULFING
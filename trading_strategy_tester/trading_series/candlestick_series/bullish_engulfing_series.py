@@ -0,0 +1,10 @@
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.trading_series.candlestick_series.candlestick_pattern_series import CandlestickPatternSeries
+
+
+class BULLISH_ENGULFING(CandlestickPatternSeries):
+    """
+    Class representing the Bullish Engulfing candlestick pattern for a given ticker symbol, a bullish body engulfing the bearish body of the previous candle.
+    """
+
+    pattern = CandlestickPattern.BULLISH_ENGULFING
@@ -0,0 +1,92 @@
+import pandas as pd
+
+from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.enums.source_enum import SourceType
+from trading_strategy_tester.indicators.candlestick_patterns.pattern_scanner import candlestick_pattern
+from trading_strategy_tester.trading_series.trading_series import TradingSeries
+
+
+class CandlestickPatternSeries(TradingSeries):
+    """
+    Base class of the trading series detecting one pattern of the `CandlestickPattern` catalogue.
+
+    Subclasses only set `pattern`. All pattern series of a ticker share one scan of the whole catalogue
+    through the intermediate store of the evaluation, and each of them extracts its own pattern.
+    """
+
+    # The candlestick pattern detected by the series
+    pattern: CandlestickPattern = None
+
+    def __init__(self, ticker: str):
+        """
+        Initialize the candlestick pattern series.
+
+        :param ticker: The ticker symbol for which the pattern is to be detected.
+        :type ticker: str
+        """
+        super().__init__(ticker)
+        self.name = f'{self._ticker}_{self.pattern.value}'  # Define the name for the pattern series
+
+    @property
+    def ticker(self) -> str:
+        """
+        Get the ticker symbol for the pattern series.
+
+        :return: The ticker symbol.
+        :rtype: str
+        """
+        return self._ticker
+
+    def get_data(self, downloader: DownloadModule, df: pd.DataFrame) -> pd.Series:
+        """
+        Retrieve or calculate the pattern data for the specified ticker.
+
+        If the pattern data is not already present in the provided DataFrame, this method downloads the
+        latest market data for the ticker, detects the pattern, and adds it to the DataFrame.
+
+        :param downloader: The module responsible for downloading market data.
+        :type downloader: DownloadModule
+        :param df: DataFrame containing the existing market data.
+        :type df: pd.DataFrame
+        :return: A Pandas Series where True indicates the occurrence of the pattern.
+        :rtype: pd.Series
+        """
+        if self.name not in df.columns:
+            # Download the latest data for the ticker using the downloader
+            new_df = downloader.download_ticker(self._ticker)
+            # Detect the pattern based on OHLC data
+            pattern_series = candlestick_pattern(
+                high=new_df[SourceType.HIGH.value],
+                low=new_df[SourceType.LOW.value],
+                open=new_df[SourceType.OPEN.value],
+                close=new_df[SourceType.CLOSE.value],
+                pattern=self.pattern
+            )
+
+            # Add the pattern series to the DataFrame
+            df[self.name] = pattern_series
+
+        # Return the pattern series as a pandas Series
+        return pd.Series(df[self.name], name=self.name)
+
+    def get_name(self) -> str:
+        """
+        Get the name of the pattern series.
+
+        :return: The name of the pattern series, formatted with the ticker.
+        :rtype: str
+        """
+        return self.name
+
+    def to_dict(self) -> dict:
+        """
+        Convert the pattern series to a dictionary representation.
+
+        :return: A dictionary representation of the pattern series.
+        :rtype: dict
+        """
+        return {
+            'type': self.pattern.value,
+            'ticker': self._ticker
+        }
@@ -0,0 +1,10 @@
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.trading_series.candlestick_series.candlestick_pattern_series import CandlestickPatternSeries
+
+
+class DOJI(CandlestickPatternSeries):
+    """
+    Class representing the Doji candlestick pattern for a given ticker symbol, a candle whose open and close are almost equal, showing indecision.
+    """
+
+    pattern = CandlestickPattern.DOJI
@@ -0,0 +1,10 @@
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.trading_series.candlestick_series.candlestick_pattern_series import CandlestickPatternSeries
+
+
+class EVENING_STAR(CandlestickPatternSeries):
+    """
+    Class representing the Evening Star candlestick pattern for a given ticker symbol, a three candle bearish reversal pattern.
+    """
+
+    pattern = CandlestickPattern.EVENING_STAR
@@ -0,0 +1,10 @@
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.trading_series.candlestick_series.candlestick_pattern_series import CandlestickPatternSeries
+
+
+class INVERTED_HAMMER(CandlestickPatternSeries):
+    """
+    Class representing the Inverted Hammer candlestick pattern for a given ticker symbol, a bullish reversal pattern with a small body at the bottom of the candle and a long upper wick.
+    """
+
+    pattern = CandlestickPattern.INVERTED_HAMMER
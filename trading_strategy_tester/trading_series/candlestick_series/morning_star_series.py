@@ -0,0 +1,10 @@
+from trading_strategy_tester.enums.candlestick_pattern_enum import CandlestickPattern
+from trading_strategy_tester.trading_series.candlestick_series.candlestick_pattern_series import CandlestickPatternSeries
+
+
+class MORNING_STAR(CandlestickPatternSeries):
+    """
+    Class representing the Morning Star candlestick pattern for a given ticker symbol, a three candle bullish reversal pattern.
+    """
+
+    pattern = CandlestickPattern.MORNING_STAR
@@ -61,10 +61,10 @@ class CHAIKIN_OSC(TradingSeries):
             new_df = downloader.download_ticker(self.ticker)
             # Calculate the Chaikin Oscillator using the specified parameters
             chaikin_osc_series = chaikin_osc(
-                high=df[SourceType.HIGH.value],
-                low=df[SourceType.LOW.value],
-                close=df[SourceType.CLOSE.value],
-                volume=df[SourceType.VOLUME.value],
+                high=new_df[SourceType.HIGH.value],
+                low=new_df[SourceType.LOW.value],
+                close=new_df[SourceType.CLOSE.value],
+                volume=new_df[SourceType.VOLUME.value],
                 fast_length=self.fast_length,
                 slow_length=self.slow_length
             )
@@ -10,6 +10,9 @@ class CLOSE(TradingSeries):
     closing prices associated with a given ticker symbol.
     """
 
+    # Selecting a column is cheaper than fingerprinting the data for the indicator cache
+    cacheable = False
+
     def __init__(self, ticker: str):
         """
         Initialize the Close series with the specified ticker symbol.
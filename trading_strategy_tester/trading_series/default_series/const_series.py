@@ -12,6 +12,9 @@ class CONST(TradingSeries):
     such as setting a baseline or a fixed reference point.
     """
 
+    # Creating a constant series is cheaper than fingerprinting the data for the indicator cache
+    cacheable = False
+
     def __init__(self, const_number: int):
         """
         Initialize the constant series with the specified numeric value.
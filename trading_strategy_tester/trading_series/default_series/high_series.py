@@ -9,6 +9,9 @@ class HIGH(TradingSeries):
     highest prices (daily highs) associated with a given ticker symbol.
     """
 
+    # Selecting a column is cheaper than fingerprinting the data for the indicator cache
+    cacheable = False
+
     def __init__(self, ticker: str):
         """
         Initialize the HIGH series with the specified ticker symbol.
@@ -9,6 +9,9 @@ class OPEN(TradingSeries):
     opening prices associated with a given ticker symbol.
     """
 
+    # Selecting a column is cheaper than fingerprinting the data for the indicator cache
+    cacheable = False
+
     def __init__(self, ticker: str):
         """
         Initialize the OPEN series with the specified ticker symbol.
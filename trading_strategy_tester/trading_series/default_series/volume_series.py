@@ -11,6 +11,9 @@ class VOLUME(TradingSeries):
     trading volume data associated with a given ticker symbol.
     """
 
+    # Selecting a column is cheaper than fingerprinting the data for the indicator cache
+    cacheable = False
+
     def __init__(self, ticker: str):
         """
         Initialize the VOLUME series with the specified ticker symbol.
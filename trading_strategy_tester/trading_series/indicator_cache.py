@@ -0,0 +1,352 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import threading
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def fingerprint(data: pd.DataFrame | pd.Index) -> str:
+    """
+    Returns a hash of the values, dtypes, column names and index of a DataFrame, or of an Index alone.
+
+    Numeric columns are hashed from their raw bytes, so fingerprinting is a single pass over the data.
+
+    :param data: The DataFrame or Index to fingerprint.
+    :type data: pd.DataFrame | pd.Index
+    :return: The hexadecimal digest.
+    :rtype: str
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    if isinstance(data, pd.Index):
+        index, columns = data, {}
+    else:
+        index, columns = data.index, {column: data[column] for column in data.columns}
+
+    for name, values in [('__index__', index), *columns.items()]:
+        array = np.asarray(values.asi8 if isinstance(values, pd.DatetimeIndex) else values)
+        digest.update(f'{name}|{array.dtype}|{len(array)}|{getattr(values, "tz", None)}'.encode())
+
+        if array.dtype.kind in 'biufcmM':
+            digest.update(np.ascontiguousarray(array).view(np.uint8))
+        else:
+            digest.update(pd.util.hash_array(array.astype(object)).view(np.uint8))
+
+    return digest.hexdigest()
+
+
+# Maximum number of fingerprints kept by `cached_fingerprint`
+MAX_CACHED_FINGERPRINTS = 256
+
+# Fingerprints of data that cannot change, by the identity of its memory, with the data kept alive
+_fingerprints = OrderedDict()
+_fingerprints_lock = threading.Lock()
+
+
+def _memory_identity(data: pd.DataFrame | pd.Index) -> tuple | None:
+    """
+    Returns a key identifying immutable data by its memory, None if the values can be changed in place.
+
+    An Index cannot be changed, so it is identified by the object. A DataFrame is identified by its index
+    and the memory of its columns if all of them are read-only arrays, like the columns of the frames
+    served by the `FrameCache`, which all shallow copies of a downloaded frame share.
+    """
+    if isinstance(data, pd.Index):
+        return 'index', id(data)
+
+    columns = []
+    for column in data.columns:
+        values = data[column].to_numpy()
+        if not isinstance(values, np.ndarray) or values.flags.writeable:
+            return None
+        columns.append((str(column), values.__array_interface__['data'][0], values.shape, values.strides,
+                        values.dtype.str))
+
+    return 'frame', id(data.index), tuple(columns)
+
+
+def cached_fingerprint(data: pd.DataFrame | pd.Index) -> str:
+    """
+    Returns the fingerprint of a DataFrame or Index, computing it only once for data that cannot change.
+
+    Downloaded frames are fingerprinted once rather than once per trading series computed from them.
+    Data with writable columns is fingerprinted on every call.
+
+    :param data: The DataFrame or Index to fingerprint.
+    :type data: pd.DataFrame | pd.Index
+    :return: The hexadecimal digest.
+    :rtype: str
+    """
+    identity = _memory_identity(data)
+
+    if identity is None:
+        return fingerprint(data)
+
+    with _fingerprints_lock:
+        entry = _fingerprints.get(identity)
+        if entry is not None:
+            _fingerprints.move_to_end(identity)
+            return entry[1]
+
+    digest = fingerprint(data)
+
+    with _fingerprints_lock:
+        # The data is kept, so its memory and the index object cannot be reused while the entry exists
+        _fingerprints[identity] = (data, digest)
+        while len(_fingerprints) > MAX_CACHED_FINGERPRINTS:
+            _fingerprints.popitem(last=False)
+
+    return digest
+
+
+class IndicatorCache:
+    """
+    A process-wide cache of computed `TradingSeries` results with least recently used eviction.
+
+    Entries are keyed by the fingerprint of the data the series is computed from, the index of the
+    frame it is aligned to and the `to_dict()` description of the series, so equal indicators of
+    different strategies share one computation. The cache is bounded by the memory of the cached
+    series. Evicted entries can optionally be spilled to a directory and are loaded back from there.
+    """
+
+    def __init__(self, max_bytes: int | None = 256 * 1024 ** 2, spill_path: str = None):
+        """
+        Initializes an empty IndicatorCache.
+
+        :param max_bytes: The maximum memory of the cached series in bytes, None for no limit. Default is 256 MiB.
+        :type max_bytes: int | None, optional
+        :param spill_path: The directory evicted entries are written to, None to drop them.
+        :type spill_path: str, optional
+        """
+        self.max_bytes = max_bytes
+        self.spill_path = spill_path
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._sizes = dict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        if self.spill_path is not None:
+            os.makedirs(self.spill_path, exist_ok=True)
+
+    @staticmethod
+    def make_key(series, data: pd.DataFrame, index: pd.Index) -> str:
+        """
+        Returns the cache key of a trading series computed from the given data and aligned to the given index.
+
+        :param series: The trading series.
+        :type series: TradingSeries
+        :param data: The downloaded data the series is computed from.
+        :type data: pd.DataFrame
+        :param index: The index of the frame the result is aligned to.
+        :type index: pd.Index
+        :return: The cache key.
+        :rtype: str
+        """
+        description = json.dumps(
+            [type(series).__module__, type(series).__qualname__, series.get_name(), series.to_dict()],
+            sort_keys=True,
+            default=str
+        )
+
+        return hashlib.blake2b(
+            f'{cached_fingerprint(data)}|{cached_fingerprint(index)}|{description}'.encode(),
+            digest_size=16
+        ).hexdigest()
+
+    def get(self, key: str) -> tuple[pd.Series, dict] | None:
+        """
+        Returns the cached entry for the given key, loading it from the spill directory if it was evicted.
+
+        :param key: The cache key.
+        :type key: str
+        :return: A tuple of the result and the columns the series added to the frame, or None if not cached.
+        :rtype: tuple[pd.Series, dict] | None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._load_spilled(key)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        self.put(key, entry)
+        return entry
+
+    def put(self, key: str, entry: tuple[pd.Series, dict]):
+        """
+        Caches an entry, evicting the least recently used entries if the cache is full.
+
+        :param key: The cache key.
+        :type key: str
+        :param entry: A tuple of the result and the columns the series added to the frame.
+        :type entry: tuple[pd.Series, dict]
+        """
+        result, columns = entry
+        size = result.memory_usage(index=False) + sum(column.memory_usage(index=False) for column in columns.values())
+        evicted = []
+
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._sizes[key]
+
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._total_bytes += size
+
+            # Keep at least the newest entry
+            while self.max_bytes is not None and self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                evicted_key, evicted_entry = self._entries.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(evicted_key)
+                evicted.append((evicted_key, evicted_entry))
+
+        for evicted_key, evicted_entry in evicted:
+            self._spill(evicted_key, evicted_entry)
+
+    def prime(self, series, data: pd.DataFrame, values: pd.Series):
+        """
+        Caches an already computed result of a trading series evaluated on its own downloaded data.
+
+        Batch computations use this to store one slice of their result per parameter combination, so
+        the `get_data` calls of the individual series are served from the cache without computing.
+
+        :param series: The trading series the values belong to.
+        :type series: TradingSeries
+        :param data: The downloaded data the values are computed from.
+        :type data: pd.DataFrame
+        :param values: The values of the series, aligned to the index of the data.
+        :type values: pd.Series
+        """
+        if not self.enabled or not series.cacheable:
+            return
+
+        result = pd.Series(values.to_numpy(), index=data.index, name=series.get_name())
+        self.put(self.make_key(series, data, data.index), (result, {series.get_name(): result.copy()}))
+
+    def clear(self):
+        """
+        Removes all cached and spilled entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+        if self.spill_path is not None:
+            for filename in os.listdir(self.spill_path):
+                if filename.endswith('.pkl'):
+                    os.remove(os.path.join(self.spill_path, filename))
+
+    def stats(self) -> dict:
+        """
+        Returns the hit and miss counters of the cache.
+
+        :return: A dictionary with the number of hits, misses, entries in memory and their size in bytes.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes
+            }
+
+    def _spill(self, key: str, entry: tuple[pd.Series, dict]):
+        """
+        Writes an evicted entry to the spill directory, replacing the file atomically.
+        """
+        if self.spill_path is None:
+            return
+
+        tmp_path = os.path.join(self.spill_path, f'.tmp-{uuid.uuid4().hex}')
+        with open(tmp_path, 'wb') as file:
+            pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(self.spill_path, f'{key}.pkl'))
+
+    def _load_spilled(self, key: str) -> tuple[pd.Series, dict] | None:
+        """
+        Reads a spilled entry, or returns None if the key was never spilled.
+        """
+        if self.spill_path is None:
+            return None
+
+        try:
+            with open(os.path.join(self.spill_path, f'{key}.pkl'), 'rb') as file:
+                return pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+
+# Cache consulted by all trading series of the process
+shared_indicator_cache = IndicatorCache()
+
+
+def cached_get_data(get_data):
+    """
+    Wraps the `get_data` method of a trading series, so its results are served from `shared_indicator_cache`.
+
+    On a miss the series is computed as usual and its result is cached together with the columns it added
+    to the frame. On a hit these columns are added to the frame again and a copy of the result is returned,
+    so callers see the same result and frame as after a computation. Series that are not `cacheable`,
+    have no ticker or are evaluated without a downloader are always computed, and series whose column the
+    frame already holds return it without looking up the cache.
+
+    :param get_data: The `get_data` method to wrap.
+    :type get_data: Callable
+    :return: The wrapped method.
+    :rtype: Callable
+    """
+
+    @functools.wraps(get_data)
+    def wrapper(self, downloader, df: pd.DataFrame) -> pd.Series:
+        cache = shared_indicator_cache
+
+        if not cache.enabled or not self.cacheable or downloader is None or not self._ticker:
+            return get_data(self, downloader, df)
+
+        # The series was already computed into this frame, `get_data` returns the column directly
+        if self.get_name() in df.columns:
+            return get_data(self, downloader, df)
+
+        key = cache.make_key(self, downloader.download_ticker(self._ticker), df.index)
+        entry = cache.get(key)
+
+        if entry is None:
+            columns_before = set(df.columns)
+            result = get_data(self, downloader, df)
+            added_columns = {column: df[column].copy() for column in df.columns if column not in columns_before}
+
+            cache.put(key, (result.copy(), added_columns))
+            return result
+
+        result, added_columns = entry
+
+        for column, values in added_columns.items():
+            if column not in df.columns:
+                df[column] = values.copy()
+
+        return result.copy()
+
+    return wrapper
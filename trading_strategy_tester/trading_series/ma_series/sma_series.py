@@ -3,8 +3,9 @@ import pandas as pd
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.source_enum import SourceType
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
-from trading_strategy_tester.indicators.overlap.sma import sma
-from trading_strategy_tester.utils.parameter_validations import get_base_sources
+from trading_strategy_tester.indicators.overlap.sma import sma, sma_batch
+from trading_strategy_tester.trading_series.indicator_cache import shared_indicator_cache
+from trading_strategy_tester.utils.parameter_validations import get_base_sources, get_length, get_offset
 
 
 class SMA(TradingSeries):
@@ -70,6 +71,45 @@ class SMA(TradingSeries):
         # Return the SMA series as a pandas Series
         return pd.Series(df[self.name], name=self.name)
 
+    @classmethod
+    def batch(cls, downloader: DownloadModule, ticker: str, source: SourceType = SourceType.CLOSE,
+              lengths: list[int] = (9,), offset: int = 0) -> list['SMA']:
+        """
+        Create SMA series for many lengths and compute all of them in one batch.
+
+        The SMA of all lengths is calculated by `sma_batch` and every column of the result is stored in the
+        shared indicator cache, so the `get_data` calls of the returned series read their slice of the batch.
+
+        :param downloader: An instance of DownloadModule used to download the latest data for the ticker.
+        :type downloader: DownloadModule
+        :param ticker: The ticker symbol for the financial instrument (e.g., 'AAPL' for Apple Inc.).
+        :type ticker: str
+        :param source: The column in the DataFrame on which the SMA is calculated (e.g., 'Close'). Default is 'Close'.
+        :type source: SourceType, optional
+        :param lengths: The numbers of periods over which to calculate the SMA. Default is [9].
+        :type lengths: list[int], optional
+        :param offset: The number of periods by which to shift the SMA. Default is 0.
+        :type offset: int, optional
+        :return: One SMA series per length, in the order of the lengths.
+        :rtype: list[SMA]
+        """
+        # Download the latest data for the ticker and calculate the SMA of all lengths
+        new_df = downloader.download_ticker(ticker)
+        sma_df = sma_batch(
+            series=new_df[get_base_sources(source=source, default=SourceType.CLOSE).value],
+            lengths=lengths,
+            offset=offset
+        )
+
+        series_list = []
+        for length in lengths:
+            series = cls(ticker, source, length, offset)
+            column = f'SMA_{get_length(length=length, default=9)}_{get_offset(offset=offset)}'
+            shared_indicator_cache.prime(series, new_df, sma_df[column])
+            series_list.append(series)
+
+        return series_list
+
     def get_name(self) -> str:
         """
         Get the name of the SMA series.
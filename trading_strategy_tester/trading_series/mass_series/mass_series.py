@@ -27,6 +27,7 @@ class MASS_INDEX(TradingSeries):
         # Define the name of the Mass Index series, including parameters for easy identification
         self.name = f'{self._ticker}_MASS-INDEX_{length}'
 
+    @property
     def ticker(self) -> str:
         """
         Retrieve the ticker symbol associated with this Mass Index instance.
@@ -2,8 +2,9 @@ import pandas as pd
 from trading_strategy_tester.download.download_module import DownloadModule
 from trading_strategy_tester.enums.source_enum import SourceType
 from trading_strategy_tester.trading_series.trading_series import TradingSeries
-from trading_strategy_tester.indicators.momentum.rsi import rsi
-from trading_strategy_tester.utils.parameter_validations import get_base_sources
+from trading_strategy_tester.indicators.momentum.rsi import rsi, rsi_batch
+from trading_strategy_tester.trading_series.indicator_cache import shared_indicator_cache
+from trading_strategy_tester.utils.parameter_validations import get_base_sources, get_length
 
 
 class RSI(TradingSeries):
@@ -69,6 +70,38 @@ class RSI(TradingSeries):
         # Return the RSI series as a pandas Series
         return pd.Series(df[self.name], name=self.name)
 
+    @classmethod
+    def batch(cls, downloader: DownloadModule, ticker: str, source: SourceType = SourceType.CLOSE,
+              lengths: list[int] = (14,)) -> list['RSI']:
+        """
+        Create RSI series for many lengths and compute all of them in one batch.
+
+        The RSI of all lengths is calculated by `rsi_batch` and every column of the result is stored in the
+        shared indicator cache, so the `get_data` calls of the returned series read their slice of the batch.
+
+        :param downloader: An instance of DownloadModule used to download the latest data for the ticker.
+        :type downloader: DownloadModule
+        :param ticker: The ticker symbol for the financial instrument (e.g., 'AAPL' for Apple Inc.).
+        :type ticker: str
+        :param source: The column in the DataFrame on which the RSI is calculated (e.g., 'Close'). Default is 'Close'.
+        :type source: SourceType, optional
+        :param lengths: The numbers of periods over which to calculate the RSI. Default is [14].
+        :type lengths: list[int], optional
+        :return: One RSI series per length, in the order of the lengths.
+        :rtype: list[RSI]
+        """
+        # Download the latest data for the ticker and calculate the RSI of all lengths
+        new_df = downloader.download_ticker(ticker)
+        rsi_df = rsi_batch(series=new_df[get_base_sources(source=source, default=SourceType.CLOSE).value], lengths=lengths)
+
+        series_list = []
+        for length in lengths:
+            series = cls(ticker, source, length)
+            shared_indicator_cache.prime(series, new_df, rsi_df[f'RSI_{get_length(length=length, default=14)}'])
+            series_list.append(series)
+
+        return series_list
+
     def get_name(self) -> str:
         """
         Get the name of the RSI series.
@@ -5,6 +5,8 @@ from trading_strategy_tester.trading_series.trading_series import TradingSeries
 
 
 class TestingSeries(TradingSeries):
+    # The result depends on the passed series, which is not part of `to_dict`
+    cacheable = False
 
     def __init__(self, ticker: str, series: pd.Series, test_parameter: int):
         super().__init__(ticker)
@@ -1,6 +1,8 @@
 import pandas as pd
 from abc import ABC, abstractmethod
 from trading_strategy_tester.download.download_module import DownloadModule
+from trading_strategy_tester.trading_series.indicator_cache import cached_get_data
+from trading_strategy_tester.utils.precision import precision_get_data
 
 
 class TradingSeries(ABC):
@@ -9,8 +11,26 @@ class TradingSeries(ABC):
 
     The TradingSeries class serves as a template for defining trading data series associated with a specific ticker.
     It enforces the implementation of methods for retrieving the ticker symbol and for obtaining data from a DataFrame.
+
+    Every implementation of `get_data` is wrapped by `cached_get_data`, so results computed by one strategy are
+    served from the process-wide `shared_indicator_cache` to all other strategies with the same data and parameters.
+    Subclasses whose results are cheaper to compute than to cache set `cacheable` to False.
+    Inside the cache, `precision_get_data` keeps the results in the precision of the downloader.
     """
 
+    # Whether results of the series are kept in the shared indicator cache
+    cacheable = True
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Wraps the `get_data` method of every concrete subclass with the indicator cache and the precision.
+        """
+        super().__init_subclass__(**kwargs)
+
+        get_data = cls.__dict__.get('get_data')
+        if get_data is not None and not getattr(get_data, '__isabstractmethod__', False):
+            cls.get_data = cached_get_data(precision_get_data(get_data))
+
     def __init__(self, ticker: str):
         """
         Initializes the TradingSeries with the specified ticker symbol.
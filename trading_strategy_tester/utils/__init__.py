@@ -1 +1,3 @@
-__all__ = ['fib_utils', 'plot_utils', 'sources', 'parameter_validations', 'strategy_validator']
\ No newline at end of file
+__all__ = ['fib_utils', 'plot_utils', 'sources', 'parameter_validations', 'strategy_validator', 'rolling_kernels', 'panel',
+           'intermediate_store',
+           'compiled_kernels', 'precision']
\ No newline at end of file
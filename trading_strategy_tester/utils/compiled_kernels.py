@@ -0,0 +1,285 @@
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.backend_enum import Backend
+
+try:
+    import numba
+except ImportError:
+    # Numba is optional, the NumPy backend is used without it
+    numba = None
+
+# The backend selected for the current process
+_backend = Backend.NUMPY
+
+
+def numba_available() -> bool:
+    """
+    Returns True if Numba is installed and the compiled backend can be used.
+
+    :return: True if Numba can be imported.
+    :rtype: bool
+    """
+    return numba is not None
+
+
+def set_backend(backend: Backend) -> Backend:
+    """
+    Selects the backend of the smoothings and recursive indicators for the current process.
+
+    The NUMBA backend falls back to the NUMPY backend if Numba is not installed, so the same code runs
+    with and without the optional dependency.
+
+    :param backend: The requested backend.
+    :type backend: Backend
+    :return: The backend that is used, NUMPY if NUMBA was requested without Numba installed.
+    :rtype: Backend
+    """
+    global _backend
+
+    if backend == Backend.NUMBA and not numba_available():
+        backend = Backend.NUMPY
+
+    _backend = backend
+    return _backend
+
+
+def get_backend() -> Backend:
+    """
+    Returns the backend of the smoothings and recursive indicators for the current process.
+
+    :return: The selected backend.
+    :rtype: Backend
+    """
+    return _backend
+
+
+def use_compiled_kernels() -> bool:
+    """
+    Returns True if the compiled kernels should be used instead of the NumPy and pandas implementations.
+
+    :return: True if the NUMBA backend is selected.
+    :rtype: bool
+    """
+    return _backend == Backend.NUMBA
+
+
+def _ewm_mean_loop(values: np.ndarray, com: float, min_periods: int) -> np.ndarray:
+    """
+    Calculates the exponentially weighted mean with `adjust=False` of every column in one loop.
+
+    The loop repeats the recursion of `pandas.Series.ewm(...).mean()` operation by operation, including the
+    decay of the weight over missing values, so the results are equal bit for bit. It is written for Numba
+    and is only fast once compiled.
+    """
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    new_wt = alpha
+    min_periods = max(min_periods, 1)
+
+    rows, columns = values.shape
+    result = np.empty((rows, columns))
+
+    for column in range(columns):
+        weighted = np.nan
+        old_wt = 1.0
+        nobs = 0
+
+        for row in range(rows):
+            value = values[row, column]
+            is_observation = value == value
+            nobs += is_observation
+
+            if weighted == weighted:
+                old_wt *= old_wt_factor
+
+                if is_observation:
+                    # Avoids rounding errors on constant series like pandas
+                    if weighted != value:
+                        weighted = old_wt * weighted + new_wt * value
+                        weighted /= old_wt + new_wt
+                    old_wt = 1.0
+            elif is_observation:
+                weighted = value
+
+            result[row, column] = weighted if nobs >= min_periods else np.nan
+
+    return result
+
+
+def _window_extrema_loop(first: np.ndarray, second: np.ndarray, length: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds, for every bar i, the position of the minimum of `first` in the window of the `length` bars
+    before i, and the position of the minimum of `second` between that position and i.
+
+    Both minima are kept in monotonic queues of positions, so every position is added and removed once
+    and the loop is O(n) for any length. Ties are resolved to the first position and missing values are
+    skipped like in `pandas.Series.argmin`. The positions are relative to the start of the window, -1 for
+    the first `length` bars and for windows without values. Maxima are found by passing negated values.
+    It is written for Numba and runs as plain Python without it.
+    """
+    n = len(first)
+    first_positions = np.full(n, -1, dtype=np.int64)
+    second_positions = np.full(n, -1, dtype=np.int64)
+
+    # Monotonic queues of positions, the values at the positions increase from head to tail
+    first_queue = np.empty(n, dtype=np.int64)
+    second_queue = np.empty(n, dtype=np.int64)
+    first_head = first_tail = second_head = second_tail = 0
+
+    for position in range(n - 1):
+        # Add the bar to both queues, removing the bars it makes irrelevant
+        value = first[position]
+        if value == value:
+            while first_tail > first_head and first[first_queue[first_tail - 1]] > value:
+                first_tail -= 1
+            first_queue[first_tail] = position
+            first_tail += 1
+
+        value = second[position]
+        if value == value:
+            while second_tail > second_head and second[second_queue[second_tail - 1]] > value:
+                second_tail -= 1
+            second_queue[second_tail] = position
+            second_tail += 1
+
+        # The window of bar i holds the bars i - length to i - 1
+        bar = position + 1
+        start = bar - length
+        if start < 0:
+            continue
+
+        while first_head < first_tail and first_queue[first_head] < start:
+            first_head += 1
+        if first_head == first_tail:
+            continue
+        first_position = first_queue[first_head]
+
+        # The second window starts at the first extreme, whose position never decreases
+        while second_head < second_tail and second_queue[second_head] < first_position:
+            second_head += 1
+        if second_head == second_tail:
+            continue
+
+        first_positions[bar] = first_position - start
+        second_positions[bar] = second_queue[second_head] - start
+
+    return first_positions, second_positions
+
+
+# The compiled loops, None without Numba
+_compiled_ewm_mean = numba.njit(cache=True, nogil=True)(_ewm_mean_loop) if numba is not None else None
+_compiled_window_extrema = numba.njit(cache=True, nogil=True)(_window_extrema_loop) if numba is not None else None
+
+
+def ewm_mean(series: pd.Series | pd.DataFrame, com: float, min_periods: int) -> pd.Series | pd.DataFrame:
+    """
+    Calculates the exponentially weighted mean with `adjust=False` using the compiled loop.
+
+    The result equals `series.ewm(com=com, adjust=False, min_periods=min_periods).mean()` bit for bit, without
+    the overhead pandas has on every call. Without Numba, the pandas implementation is used.
+
+    :param series: The values to average, or a DataFrame with one column per ticker.
+    :type series: pd.Series | pd.DataFrame
+    :param com: The center of mass of the weights, calculated like in pandas.
+    :type com: float
+    :param min_periods: The number of observations needed for a value.
+    :type min_periods: int
+    :return: The exponentially weighted mean with the index and name or columns of the input.
+    :rtype: pd.Series | pd.DataFrame
+    """
+    if _compiled_ewm_mean is None:
+        return series.ewm(com=com, adjust=False, min_periods=min_periods).mean()
+
+    values = series.to_numpy(dtype=np.float64)
+    result = _compiled_ewm_mean(values.reshape(len(values), -1), float(com), int(min_periods))
+
+    if isinstance(series, pd.DataFrame):
+        return pd.DataFrame(result, index=series.index, columns=series.columns)
+
+    return pd.Series(result[:, 0], index=series.index, name=series.name)
+
+
+def window_extrema_positions(first: np.ndarray, second: np.ndarray, length: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the positions of the window minima described in `_window_extrema_loop`.
+
+    The compiled loop is used with the NUMBA backend, otherwise the same loop runs as plain Python.
+
+    :param first: The values whose minimum is searched in the window of `length` bars before every bar.
+    :type first: np.ndarray
+    :param second: The values whose minimum is searched between the first minimum and every bar.
+    :type second: np.ndarray
+    :param length: The length of the window.
+    :type length: int
+    :return: The positions of both minima relative to the start of the window, -1 where there is none.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    if use_compiled_kernels() and _compiled_window_extrema is not None:
+        return _compiled_window_extrema(first, second, int(length))
+
+    return _window_extrema_loop(first, second, int(length))
+
+
+# The number of window values scanned at once by `window_extrema_positions_at`
+WINDOW_CHUNK_SIZE = 2 ** 20
+
+
+def _first_minimum_positions(windows: np.ndarray) -> np.ndarray:
+    """
+    Returns the position of the first minimum of every row of windows, skipping NaN, -1 for rows of NaN.
+    """
+    minima = np.where(np.isnan(windows), np.inf, windows).min(axis=1)
+    is_minimum = windows == minima[:, None]  # NaN is never equal to the minimum
+
+    return np.where(is_minimum.any(axis=1), is_minimum.argmax(axis=1), -1)
+
+
+def window_extrema_positions_at(first: np.ndarray, second: np.ndarray, length: int,
+                                rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the positions of the window minima described in `_window_extrema_loop` for the given bars only.
+
+    The windows of the bars are scanned with vectorized NumPy operations in O(len(rows) * length) time,
+    which is faster than the loop over all bars when only a few bars are needed.
+
+    :param first: The values whose minimum is searched in the window of `length` bars before every bar.
+    :type first: np.ndarray
+    :param second: The values whose minimum is searched between the first minimum and every bar.
+    :type second: np.ndarray
+    :param length: The length of the window.
+    :type length: int
+    :param rows: The positions of the bars.
+    :type rows: np.ndarray
+    :return: The positions of both minima of the given bars relative to the start of their windows,
+             -1 where there is none.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    first_positions = np.full(len(rows), -1, dtype=np.int64)
+    second_positions = np.full(len(rows), -1, dtype=np.int64)
+
+    length = int(length)
+    if length <= 0:
+        return first_positions, second_positions
+
+    # Only bars with a whole window before them have positions
+    selected = np.flatnonzero(rows >= length)
+    offsets = np.arange(length)
+    chunk_size = max(WINDOW_CHUNK_SIZE // length, 1)
+
+    for begin in range(0, len(selected), chunk_size):
+        chunk = selected[begin:begin + chunk_size]
+        windows = rows[chunk, None] - length + offsets
+
+        first_minima = _first_minimum_positions(np.asarray(first[windows], dtype=np.float64))
+
+        # The second window starts at the first minimum
+        second_windows = np.where(offsets >= first_minima[:, None], second[windows], np.nan)
+        second_minima = _first_minimum_positions(np.asarray(second_windows, dtype=np.float64))
+
+        found = (first_minima >= 0) & (second_minima >= 0)
+        first_positions[chunk] = np.where(found, first_minima, -1)
+        second_positions[chunk] = np.where(found, second_minima, -1)
+
+    return first_positions, second_positions
@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 
 from trading_strategy_tester.enums.fibonacci_levels_enum import FibonacciLevels
 from trading_strategy_tester.enums.source_enum import SourceType
+from trading_strategy_tester.utils.compiled_kernels import window_extrema_positions, window_extrema_positions_at
 
 
 def is_in_fib_interval(high: float, low: float, row: pd.Series, fib_level: FibonacciLevels, uptrend: bool) -> bool:
@@ -63,3 +65,205 @@ def is_in_fib_interval(high: float, low: float, row: pd.Series, fib_level: Fibon
 
         # Check if the current high price is within the Fibonacci retracement level
         return high > row[SourceType.HIGH.value] > fib_value
+
+
+# The retracement ratio of every level below 100 %
+FIB_RATIOS = {
+    FibonacciLevels.LEVEL_0: 0,
+    FibonacciLevels.LEVEL_23_6: 0.236,
+    FibonacciLevels.LEVEL_38_2: 0.382,
+    FibonacciLevels.LEVEL_50: 0.5,
+    FibonacciLevels.LEVEL_61_8: 0.618,
+}
+
+# The cost of a Fibonacci retracement condition relative to a comparison of two series (see `Condition.evaluation_cost`)
+FIB_RETRACEMENT_COST = 100
+
+
+def fib_level_prices(high: np.ndarray, low: np.ndarray, uptrend: bool) -> dict[FibonacciLevels, np.ndarray]:
+    """
+    Calculates the prices of the Fibonacci retracement levels below 100 % for arrays of highs and lows.
+
+    The prices are calculated with the same operations as in `is_in_fib_interval`.
+
+    :param high: The highest prices of the evaluated ranges.
+    :type high: np.ndarray
+    :param low: The lowest prices of the evaluated ranges.
+    :type low: np.ndarray
+    :param uptrend: A boolean indicating if the trend is uptrend (True) or downtrend (False).
+    :type uptrend: bool
+    :return: The prices of every level.
+    :rtype: dict[FibonacciLevels, np.ndarray]
+    """
+    diff = high - low
+    levels = {FibonacciLevels.LEVEL_0: high if uptrend else low}
+
+    for fib_level, ratio in FIB_RATIOS.items():
+        if fib_level != FibonacciLevels.LEVEL_0:
+            levels[fib_level] = high - ratio * diff if uptrend else low + ratio * diff
+
+    return levels
+
+
+def fib_interval_mask(high: np.ndarray, low: np.ndarray, price_low: np.ndarray, price_high: np.ndarray,
+                      levels: dict[FibonacciLevels, np.ndarray], fib_level: FibonacciLevels,
+                      uptrend: bool) -> np.ndarray:
+    """
+    The vectorized `is_in_fib_interval`, checking for every bar if its price is within the Fibonacci level.
+
+    :param high: The highest prices of the evaluated ranges.
+    :type high: np.ndarray
+    :param low: The lowest prices of the evaluated ranges.
+    :type low: np.ndarray
+    :param price_low: The low prices of the checked bars.
+    :type price_low: np.ndarray
+    :param price_high: The high prices of the checked bars.
+    :type price_high: np.ndarray
+    :param levels: The prices of the levels calculated by `fib_level_prices` from `high` and `low`.
+    :type levels: dict[FibonacciLevels, np.ndarray]
+    :param fib_level: The Fibonacci level to evaluate against.
+    :type fib_level: FibonacciLevels
+    :param uptrend: A boolean indicating if the trend is uptrend (True) or downtrend (False).
+    :type uptrend: bool
+    :return: A boolean array where True indicates that the price is within the Fibonacci interval.
+    :rtype: np.ndarray
+    """
+    with np.errstate(invalid='ignore'):
+        if uptrend:
+            if fib_level == FibonacciLevels.LEVEL_100:
+                return low < price_low
+            return (low < price_low) & (price_low < levels[fib_level])
+
+        if fib_level == FibonacciLevels.LEVEL_100:
+            return high > price_high
+        return (high > price_high) & (price_high > levels[fib_level])
+
+
+def _extrema_positions(first: np.ndarray, second: np.ndarray, length: int,
+                       rows: np.ndarray | None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the window minima of every bar, or of the given bars only.
+    """
+    if rows is None:
+        return window_extrema_positions(first, second, length)
+
+    return window_extrema_positions_at(first, second, length, rows)
+
+
+def _trend_windows(low_values: np.ndarray, high_values: np.ndarray, length: int, uptrend: bool,
+                   rows: np.ndarray = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns whether the window of every bar (or of the given bars) is in a trend and the high and low prices
+    of the window passed to the level calculation, see `fib_retracement_batch`.
+    """
+    if uptrend:
+        low_positions, high_positions = _extrema_positions(low_values, -high_values, length, rows)
+        in_trend = low_positions < high_positions
+    else:
+        high_positions, low_positions = _extrema_positions(-high_values, low_values, length, rows)
+        in_trend = high_positions < low_positions
+
+    # Bars outside a trend have the position -1, their prices are masked out by `in_trend`
+    window_low = low_values[low_positions]
+    window_high = high_values[high_positions]
+
+    if not uptrend:
+        window_low, window_high = window_high, window_low
+
+    return in_trend, window_high, window_low
+
+
+def fib_retracement_batch(low: pd.Series, high: pd.Series, fib_levels: list[FibonacciLevels],
+                          lengths: list[int], uptrend: bool) -> pd.DataFrame:
+    """
+    Evaluates the Fibonacci retracement level conditions for all combinations of levels and lengths.
+
+    For every length, one pass over the prices finds the extremes of the window of `length` bars before
+    every bar with monotonic queues (see `window_extrema_positions`), and all levels of that length share
+    the pass. In an uptrend, the window has to contain its lowest low before the highest high after it;
+    in a downtrend its highest high before the lowest low after it. Windows without prices never match.
+
+    As in the original per-row implementation of the conditions, the extreme prices are read at the
+    positions of the extremes relative to the start of the window, and the downtrend condition passes
+    its lowest low and highest high in swapped order, so the results are unchanged.
+
+    :param low: The low prices.
+    :type low: pd.Series
+    :param high: The high prices.
+    :type high: pd.Series
+    :param fib_levels: The Fibonacci levels to evaluate.
+    :type fib_levels: list[FibonacciLevels]
+    :param lengths: The lengths of the price windows.
+    :type lengths: list[int]
+    :param uptrend: A boolean indicating if the trend is uptrend (True) or downtrend (False).
+    :type uptrend: bool
+    :return: A DataFrame with one boolean column per combination, with the columns indexed by `(fib_level, length)`.
+    :rtype: pd.DataFrame
+    """
+    low_values, high_values = low.to_numpy(), high.to_numpy()
+
+    columns, results = [], []
+    for length in lengths:
+        in_trend, window_high, window_low = _trend_windows(low_values, high_values, length, uptrend)
+
+        levels = fib_level_prices(window_high, window_low, uptrend)
+        for fib_level in fib_levels:
+            columns.append((fib_level, length))
+            results.append(in_trend & fib_interval_mask(window_high, window_low, low_values, high_values,
+                                                        levels, fib_level, uptrend))
+
+    return pd.DataFrame(np.column_stack(results) if results else np.empty((len(low), 0), dtype=bool),
+                        index=low.index, columns=pd.MultiIndex.from_tuples(columns, names=['fib_level', 'length']))
+
+
+def fib_retracement_mask(low: pd.Series, high: pd.Series, fib_level: FibonacciLevels, length: int,
+                         uptrend: bool) -> pd.Series:
+    """
+    Evaluates the Fibonacci retracement level condition of one level and length, see `fib_retracement_batch`.
+
+    :param low: The low prices.
+    :type low: pd.Series
+    :param high: The high prices.
+    :type high: pd.Series
+    :param fib_level: The Fibonacci level to evaluate.
+    :type fib_level: FibonacciLevels
+    :param length: The length of the price window.
+    :type length: int
+    :param uptrend: A boolean indicating if the trend is uptrend (True) or downtrend (False).
+    :type uptrend: bool
+    :return: A boolean Series where True indicates that the condition is met.
+    :rtype: pd.Series
+    """
+    return fib_retracement_batch(low, high, [fib_level], [length], uptrend).iloc[:, 0].rename(None)
+
+
+def fib_retracement_mask_at(low: pd.Series, high: pd.Series, fib_level: FibonacciLevels, length: int,
+                            uptrend: bool, rows: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the Fibonacci retracement level condition of one level and length for the given bars only.
+
+    The windows of the bars are scanned directly (see `window_extrema_positions_at`) instead of passing
+    over all bars, which is faster when only a few bars are candidates, e.g. in an AND condition.
+
+    :param low: The low prices.
+    :type low: pd.Series
+    :param high: The high prices.
+    :type high: pd.Series
+    :param fib_level: The Fibonacci level to evaluate.
+    :type fib_level: FibonacciLevels
+    :param length: The length of the price window.
+    :type length: int
+    :param uptrend: A boolean indicating if the trend is uptrend (True) or downtrend (False).
+    :type uptrend: bool
+    :param rows: The positions of the evaluated bars.
+    :type rows: np.ndarray
+    :return: A boolean array with the result of every given bar.
+    :rtype: np.ndarray
+    """
+    low_values, high_values = low.to_numpy(), high.to_numpy()
+
+    in_trend, window_high, window_low = _trend_windows(low_values, high_values, length, uptrend, rows)
+    levels = fib_level_prices(window_high, window_low, uptrend)
+
+    return in_trend & fib_interval_mask(window_high, window_low, low_values[rows], high_values[rows],
+                                        levels, fib_level, uptrend)
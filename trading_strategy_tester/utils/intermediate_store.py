@@ -0,0 +1,149 @@
+import contextvars
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+
+class IntermediateStore:
+    """
+    A store of intermediate results shared by the indicators of one evaluation.
+
+    Indicators look up building blocks such as the true range, directional movement, rolling standard
+    deviations, moving averages and ROC in the active store before computing them, so e.g. the upper and
+    lower Bollinger Band or +DI, -DI and ADX of the same data compute them only once. Entries are keyed by
+    the identity of the data they are computed from: the memory of the values and the index object of a
+    Series, which shallow copies of a downloaded frame share. The inputs of every entry are kept alive by
+    the store, so their memory cannot be reused for other data while the store exists.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty store.
+        """
+        self.hits = 0
+        self.misses = 0
+        self._entries = dict()
+
+    def get_or_compute(self, name: str, inputs: tuple, parameters: tuple, compute):
+        """
+        Returns the stored intermediate result, computing and storing it if it is not stored yet.
+
+        :param name: The name of the intermediate result (e.g. 'true_range').
+        :type name: str
+        :param inputs: The Series or DataFrames the result is computed from.
+        :type inputs: tuple
+        :param parameters: The hashable parameters of the computation.
+        :type parameters: tuple
+        :param compute: A function without arguments computing the result.
+        :type compute: Callable
+        :return: The intermediate result, which callers must not modify.
+        """
+        key = (name, tuple(_identity(data) for data in inputs), parameters)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = compute()
+        self._entries[key] = (inputs, result)
+
+        return result
+
+    def clear(self):
+        """
+        Removes all intermediate results and resets the counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored intermediate results.
+        """
+        return len(self._entries)
+
+
+def _identity(data) -> tuple:
+    """
+    Returns a key identifying the data by the memory of its values rather than by the Python object.
+    """
+    if isinstance(data, pd.Series):
+        values = data.to_numpy()
+        if isinstance(values, np.ndarray):
+            return (
+                'series',
+                values.__array_interface__['data'][0],
+                values.shape,
+                values.strides,
+                values.dtype.str,
+                id(data.index)
+            )
+
+    return 'object', id(data)
+
+
+# The store of the current evaluation, None if intermediate results are not shared
+_active_store = contextvars.ContextVar('active_intermediate_store', default=None)
+
+
+@contextmanager
+def intermediate_store(store: IntermediateStore = None):
+    """
+    Activates an intermediate store for the indicators computed while the context is active.
+
+    Without an explicit store, an already active store is reused, so nested evaluations share it,
+    and otherwise a new store is created for the context.
+
+    :param store: The store to activate. Default is the active store or a new one.
+    :type store: IntermediateStore, optional
+    :return: The active store.
+    :rtype: IntermediateStore
+    """
+    if store is None:
+        store = _active_store.get()
+
+    if store is None:
+        store = IntermediateStore()
+
+    token = _active_store.set(store)
+
+    try:
+        yield store
+    finally:
+        _active_store.reset(token)
+
+
+def active_intermediate_store() -> IntermediateStore | None:
+    """
+    Returns the intermediate store active in the current context.
+
+    :return: The active store, None if no store is active.
+    :rtype: IntermediateStore | None
+    """
+    return _active_store.get()
+
+
+def shared_intermediate(name: str, inputs: tuple, parameters: tuple, compute):
+    """
+    Returns an intermediate result from the active store, or computes it directly if no store is active.
+
+    :param name: The name of the intermediate result (e.g. 'true_range').
+    :type name: str
+    :param inputs: The Series or DataFrames the result is computed from.
+    :type inputs: tuple
+    :param parameters: The hashable parameters of the computation.
+    :type parameters: tuple
+    :param compute: A function without arguments computing the result.
+    :type compute: Callable
+    :return: The intermediate result, which callers must not modify.
+    """
+    store = _active_store.get()
+
+    if store is None:
+        return compute()
+
+    return store.get_or_compute(name, inputs, parameters, compute)
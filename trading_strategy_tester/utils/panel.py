@@ -0,0 +1,61 @@
+import functools
+
+import numpy as np
+import pandas as pd
+
+
+def panel_indicator(indicator):
+    """
+    Lets an indicator function compute a whole panel of tickers in one call.
+
+    The wrapped function accepts a wide DataFrame with one column per ticker wherever it accepts a Series.
+    Its pandas operations then work on all columns at once and the result is a DataFrame with the same
+    columns. Two-dimensional NumPy arrays with one column per ticker are converted to DataFrames before the
+    call and the result is returned as an array again.
+
+    :param indicator: The indicator function to wrap.
+    :type indicator: Callable
+    :return: The wrapped function.
+    :rtype: Callable
+    """
+
+    @functools.wraps(indicator)
+    def wrapper(*args, **kwargs):
+        is_array = any(isinstance(arg, np.ndarray) and arg.ndim == 2 for arg in [*args, *kwargs.values()])
+
+        if not is_array:
+            return indicator(*args, **kwargs)
+
+        args = [_as_frame(arg) for arg in args]
+        kwargs = {key: _as_frame(value) for key, value in kwargs.items()}
+
+        return indicator(*args, **kwargs).to_numpy()
+
+    return wrapper
+
+
+def _as_frame(value):
+    """
+    Converts a two-dimensional NumPy array to a DataFrame and returns all other values unchanged.
+    """
+    if isinstance(value, np.ndarray) and value.ndim == 2:
+        return pd.DataFrame(value)
+
+    return value
+
+
+def named(result: pd.Series | pd.DataFrame, name: str) -> pd.Series | pd.DataFrame:
+    """
+    Returns a Series result with the given name, a DataFrame result of a panel keeps its ticker columns.
+
+    :param result: The result of an indicator.
+    :type result: pd.Series | pd.DataFrame
+    :param name: The name of the indicator.
+    :type name: str
+    :return: The named Series or the unchanged DataFrame.
+    :rtype: pd.Series | pd.DataFrame
+    """
+    if isinstance(result, pd.DataFrame):
+        return result
+
+    return pd.Series(result, name=name)
@@ -0,0 +1,108 @@
+import functools
+
+import numpy as np
+import pandas as pd
+
+from trading_strategy_tester.enums.precision_enum import Precision
+
+
+def _is_castable(values) -> bool:
+    """
+    Returns True for numeric values other than booleans, which keep their type in every precision.
+    """
+    dtype = values.dtype
+    return isinstance(dtype, np.dtype) and dtype.kind in 'fiu'
+
+
+def to_precision(data: pd.Series | pd.DataFrame, precision: Precision) -> pd.Series | pd.DataFrame:
+    """
+    Converts the numeric values of a Series or the numeric columns of a DataFrame to the given precision.
+
+    Only FLOAT32 converts values, FLOAT64 returns the data unchanged, so the default precision never adds
+    a copy. Boolean, nullable and object columns are kept as they are.
+
+    :param data: The data to convert.
+    :type data: pd.Series | pd.DataFrame
+    :param precision: The precision of the result.
+    :type precision: Precision
+    :return: The data with numeric values in the given precision.
+    :rtype: pd.Series | pd.DataFrame
+    """
+    if precision != Precision.FLOAT32:
+        return data
+
+    dtype = np.dtype(precision.value)
+
+    if isinstance(data, pd.DataFrame):
+        columns = [column for column in data.columns if _is_castable(data[column]) and data[column].dtype != dtype]
+
+        if not columns:
+            return data
+
+        return data.astype({column: dtype for column in columns})
+
+    if isinstance(data, pd.Series) and _is_castable(data) and data.dtype != dtype:
+        return data.astype(dtype)
+
+    return data
+
+
+def precision_get_data(get_data):
+    """
+    Wraps the `get_data` method of a trading series, so its result is kept in the precision of the downloader.
+
+    Indicators compute in float32 wherever pandas does, but rolling windows and exponential smoothings
+    always return float64. With a FLOAT32 downloader, the result and the columns the series added to the
+    frame are converted back to float32. With a FLOAT64 downloader the method runs unchanged.
+
+    :param get_data: The `get_data` method to wrap.
+    :type get_data: Callable
+    :return: The wrapped method.
+    :rtype: Callable
+    """
+
+    @functools.wraps(get_data)
+    def wrapper(self, downloader, df: pd.DataFrame) -> pd.Series:
+        precision = getattr(downloader, 'precision', Precision.FLOAT64)
+
+        if precision != Precision.FLOAT32:
+            return get_data(self, downloader, df)
+
+        columns_before = set(df.columns)
+        result = get_data(self, downloader, df)
+
+        for column in df.columns:
+            if column not in columns_before:
+                df[column] = to_precision(df[column], precision)
+
+        return to_precision(result, precision)
+
+    return wrapper
+
+
+def to_float64(data: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    """
+    Converts float32 values of a Series or float32 columns of a DataFrame to float64.
+
+    Used where float32 data would lose too much precision: cumulative sums over the whole history, like
+    OBV, PVI, PVT and the accumulation/distribution line, whose float32 increments would be rounded away
+    once the total grows large, and the capital and profits carried from trade to trade. Data without
+    float32 values is returned unchanged.
+
+    :param data: The data to convert.
+    :type data: pd.Series | pd.DataFrame
+    :return: The data with float32 values converted to float64.
+    :rtype: pd.Series | pd.DataFrame
+    """
+    if isinstance(data, pd.DataFrame):
+        columns = [column for column in data.columns if data[column].dtype == np.float32]
+
+        if not columns:
+            return data
+
+        return data.astype({column: np.float64 for column in columns})
+
+    if data.dtype == np.float32:
+        return data.astype(np.float64)
+
+    return data
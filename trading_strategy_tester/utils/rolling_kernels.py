@@ -0,0 +1,217 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Number of windows processed at once, bounds the temporary memory of the window kernels
+CHUNK_SIZE = 65_536
+
+
+def _validate_window(window: int):
+    """
+    Raises a ValueError if the window is not a positive integer.
+    """
+    if window < 1:
+        raise ValueError(f'The rolling window must be positive, got {window}.')
+
+
+def _full_windows(values: np.ndarray, window: int, kernel) -> np.ndarray:
+    """
+    Applies a vectorized kernel to all full windows in chunks and aligns the results to the window ends.
+
+    The kernel gets a view of consecutive windows along the last axis without copying the data and reduces
+    that axis. Two-dimensional values hold one series per column and all columns are processed together.
+    Windows containing NaN are NaN, like in `pandas.Series.rolling` with the default `min_periods`.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(values.shape, np.nan)
+
+    if len(values) < window:
+        return result
+
+    windows = sliding_window_view(values, window, axis=0)
+    chunk_size = max(1, CHUNK_SIZE // max(1, values[0].size))
+
+    for start in range(0, len(windows), chunk_size):
+        chunk = windows[start:start + chunk_size]
+        result[start + window - 1:start + window - 1 + len(chunk)] = kernel(chunk)
+
+    # A window with any NaN has fewer valid observations than the window length
+    nan_cumsum = np.concatenate([np.zeros((1, *values.shape[1:]), dtype=np.int64), np.cumsum(np.isnan(values), axis=0)])
+    nan_count = nan_cumsum[window:] - nan_cumsum[:-window]
+    result[window - 1:][nan_count > 0] = np.nan
+
+    return result
+
+
+def rolling_wma(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Calculates the linearly weighted moving average, with the newest value weighted by `window` and the oldest by 1.
+
+    All windows are multiplied with the weights in one matrix-vector product instead of a Python call per window.
+    Two-dimensional values are averaged along the first axis, with one series per column.
+
+    :param values: The values to average.
+    :type values: np.ndarray
+    :param window: The window length.
+    :type window: int
+    :return: The weighted averages, NaN for the first `window - 1` values and windows containing NaN.
+    :rtype: np.ndarray
+    """
+    _validate_window(window)
+    weights = np.arange(1, window + 1, dtype=np.float64)
+
+    return _full_windows(values, window, lambda windows: windows @ weights / weights.sum())
+
+
+def rolling_mean_absolute_deviation(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Calculates the exact mean absolute deviation of every window from the window mean.
+
+    :param values: The values.
+    :type values: np.ndarray
+    :param window: The window length.
+    :type window: int
+    :return: The mean absolute deviations, NaN for the first `window - 1` values and windows containing NaN.
+    :rtype: np.ndarray
+    """
+    _validate_window(window)
+
+    def kernel(windows: np.ndarray) -> np.ndarray:
+        means = windows.mean(axis=-1, keepdims=True)
+        return np.abs(windows - means).mean(axis=-1)
+
+    return _full_windows(values, window, kernel)
+
+
+def rolling_bars_since_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Returns how many bars ago the highest value of every window occurred, preferring the most recent one on ties.
+
+    :param values: The values.
+    :type values: np.ndarray
+    :param window: The window length.
+    :type window: int
+    :return: The offsets from the window end, NaN for the first `window - 1` values and windows containing NaN.
+    :rtype: np.ndarray
+    """
+    _validate_window(window)
+
+    # Reversing the windows makes argmax return the most recent of equal values
+    return _full_windows(values, window, lambda windows: windows[..., ::-1].argmax(axis=-1))
+
+
+def rolling_bars_since_min(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Returns how many bars ago the lowest value of every window occurred, preferring the most recent one on ties.
+
+    :param values: The values.
+    :type values: np.ndarray
+    :param window: The window length.
+    :type window: int
+    :return: The offsets from the window end, NaN for the first `window - 1` values and windows containing NaN.
+    :rtype: np.ndarray
+    """
+    _validate_window(window)
+
+    return _full_windows(values, window, lambda windows: windows[..., ::-1].argmin(axis=-1))
+
+
+def trend_for_window(values: np.ndarray, window: int, uptrend: bool = True) -> np.ndarray:
+    """
+    Returns for every value whether the last `window` values never fell (uptrend) or never rose (downtrend).
+
+    The check is a run-length computation over the signs of consecutive differences: a window ends in a trend
+    if the run of non-falling (or non-rising) steps ending at it spans the whole window. This takes O(n) time
+    independently of the window length.
+
+    :param values: The values.
+    :type values: np.ndarray
+    :param window: The number of values in the trend.
+    :type window: int
+    :param uptrend: If True, checks for an uptrend, otherwise for a downtrend. Default is True.
+    :type uptrend: bool, optional
+    :return: A boolean array, False for the first `window - 1` values and windows containing NaN.
+    :rtype: np.ndarray
+    """
+    if window < 0:
+        raise ValueError(f'The rolling window must not be negative, got {window}.')
+
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+
+    # An empty window is always in a trend
+    if window == 0:
+        return np.ones(n, dtype=bool)
+
+    if window == 1:
+        return ~np.isnan(values)
+
+    # Comparisons with NaN are False, so NaN values break every run they are part of
+    steps = np.zeros(n, dtype=bool)
+    steps[1:] = values[1:] >= values[:-1] if uptrend else values[1:] <= values[:-1]
+
+    # Length of the run of trend steps ending at every position
+    positions = np.arange(n)
+    last_break = np.maximum.accumulate(np.where(steps, 0, positions))
+    run_length = positions - last_break
+
+    return run_length >= window - 1
+
+
+def rolling_mean_batch(values: np.ndarray, windows: list[int]) -> np.ndarray:
+    """
+    Calculates the rolling means of many window lengths from shared cumulative sums.
+
+    The sum of every window is the difference of two cumulative sums, so each additional window length
+    costs one vectorized subtraction. The cumulative sums restart in blocks at least as long as the
+    longest window, which keeps them small and the rounding errors of the differences close to those
+    of `pandas.Series.rolling` even for long series.
+
+    :param values: The values to average.
+    :type values: np.ndarray
+    :param windows: The window lengths.
+    :type windows: list[int]
+    :return: A 2-D array with one row per value and one column per window, NaN for incomplete windows
+        and windows containing NaN.
+    :rtype: np.ndarray
+    """
+    for window in windows:
+        _validate_window(window)
+
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    result = np.full((n, len(windows)), np.nan)
+
+    if n == 0 or len(windows) == 0:
+        return result
+
+    nan_mask = np.isnan(values)
+    nan_counts = np.concatenate([[0], np.cumsum(nan_mask)])
+
+    # Sums of the values before every position within its block, a window spans at most two blocks
+    block_size = max(max(windows), 1024)
+    n_blocks = -(-n // block_size)
+    blocks = np.zeros(n_blocks * block_size)
+    blocks[:n] = np.where(nan_mask, 0.0, values)
+    block_sums = np.cumsum(blocks.reshape(n_blocks, block_size), axis=1)
+
+    prefix = np.zeros(n_blocks * block_size + 1)
+    prefix[1:] = block_sums.ravel()
+    prefix[::block_size] = 0.0
+    prefix = prefix[:n + 1]
+
+    # Block of every prefix position and its total, added when a window starts in the previous block
+    block_index = np.arange(n + 1) // block_size
+    block_totals = np.append(block_sums[:, -1], 0.0)[block_index]
+
+    for column, window in enumerate(windows):
+        if n < window:
+            continue
+
+        crosses_block = block_index[window:] != block_index[:-window]
+        sums = prefix[window:] - prefix[:-window] + np.where(crosses_block, block_totals[:-window], 0.0)
+
+        means = sums / window
+        means[(nan_counts[window:] - nan_counts[:-window]) > 0] = np.nan
+        result[window - 1:, column] = means
+
+    return result